@@ -6,10 +6,18 @@ import json
 import time
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import aiohttp
 import pytz
 import traceback
+import copy
+
+from rate_limiter import get_rate_limiter, current_priority, PRIORITY_LOW
+from http_pool import get_http_pool
+from trade_ledger import TradeLedger
+from pnl_engine import PnlEngine
+from kline_store import KlineStore, as_columns
+from derivatives_series import DerivativesDataStore
 
 logger = logging.getLogger(__name__)
 
@@ -28,19 +36,37 @@ class BitgetClient:
         # API 키 검증 상태
         self.api_keys_validated = False
         
+        # 같은 계정을 쓰는 클라이언트와 공유하는 요청 예산 (리포트용 조회는 낮은 우선순위)
+        self.rate_limiter = get_rate_limiter('bitget', config.bitget_api_key)
+        self.default_priority = PRIORITY_LOW
+        
+        # 동일 GET 요청 병합 (single-flight) + 짧은 TTL 결과 재사용
+        self.REQUEST_COALESCE_TTL = getattr(config, 'request_coalesce_ttl', 1.0)
+        self._inflight_requests: Dict[str, asyncio.Future] = {}
+        self._response_cache: Dict[str, Tuple[float, Any]] = {}
+        self.coalesce_stats = {'requests': 0, 'coalesced': 0, 'cache_hits': 0}
+        
+        # 체결/입출금 로컬 원장 (첫 사용 시 생성)
+        self.ledger = None
+        self.ledger_disabled = False
+        self.HISTORY_PAGE_LIMIT = 100
+        self.HISTORY_MAX_PAGES = 50
+        self.HISTORY_MAX_WINDOW_MS = 90 * 24 * 60 * 60 * 1000  # 조회 구간 최대 90일
+        
+        # 체결 손익 집계 (정규화된 체결 배열 보관)
+        self.pnl_engine = PnlEngine()
+        
+        # K라인 로컬 저장소 (없는 봉만 조회, 상위 봉은 리샘플링)
+        self.kline_store = KlineStore(self._fetch_candles)
+        
+        # 미결제약정 / 롱숏 비율 / 테이커 거래량 시계열
+        self.derivatives = DerivativesDataStore()
+        self.DERIVATIVES_PERIOD = '5m'
+        
     def _initialize_session(self):
         if not self.session:
             timeout = aiohttp.ClientTimeout(total=30, connect=10)
-            connector = aiohttp.TCPConnector(
-                limit=100,
-                limit_per_host=30,
-                ttl_dns_cache=300,
-                use_dns_cache=True
-            )
-            self.session = aiohttp.ClientSession(
-                timeout=timeout,
-                connector=connector
-            )
+            self.session = get_http_pool().get_session('bitget', timeout=timeout)
             logger.info("Bitget 클라이언트 세션 초기화 완료")
         
     async def initialize(self):
@@ -97,7 +123,68 @@ class BitgetClient:
             'locale': 'en-US'
         }
     
-    async def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, data: Optional[Dict] = None, max_retries: int = 2) -> Dict:
+    @staticmethod
+    def _request_key(method: str, endpoint: str, params: Optional[Dict]) -> str:
+        if not params:
+            return f"{method.upper()} {endpoint}"
+        query = '&'.join(f"{k}={params[k]}" for k in sorted(params))
+        return f"{method.upper()} {endpoint}?{query}"
+    
+    async def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, data: Optional[Dict] = None, max_retries: int = 2, priority: Optional[int] = None) -> Dict:
+        # 주문 등 상태 변경 요청은 병합하지 않음
+        if method.upper() != 'GET' or self.REQUEST_COALESCE_TTL <= 0:
+            return await self._send_request(method, endpoint, params, data, max_retries, priority)
+        
+        key = self._request_key(method, endpoint, params)
+        self.coalesce_stats['requests'] += 1
+        
+        cached = self._response_cache.get(key)
+        if cached and time.monotonic() - cached[0] <= self.REQUEST_COALESCE_TTL:
+            self.coalesce_stats['cache_hits'] += 1
+            return copy.deepcopy(cached[1])
+        
+        inflight = self._inflight_requests.get(key)
+        if inflight is not None:
+            self.coalesce_stats['coalesced'] += 1
+            try:
+                result = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # 선행 요청만 취소된 경우 직접 요청
+                if not inflight.cancelled():
+                    raise
+                return await self._send_request(method, endpoint, params, data, max_retries, priority)
+            return copy.deepcopy(result)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_requests[key] = future
+        try:
+            result = await self._send_request(method, endpoint, params, data, max_retries, priority)
+            # 실패(빈 응답)는 재사용하지 않음
+            if result:
+                self._response_cache[key] = (time.monotonic(), result)
+                self._prune_response_cache()
+            future.set_result(result)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 대기자가 없으면 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        finally:
+            self._inflight_requests.pop(key, None)
+        
+        return copy.deepcopy(result)
+    
+    def _prune_response_cache(self):
+        if len(self._response_cache) < 256:
+            return
+        now = time.monotonic()
+        for key in [k for k, (ts, _) in self._response_cache.items() if now - ts > self.REQUEST_COALESCE_TTL]:
+            del self._response_cache[key]
+    
+    async def _send_request(self, method: str, endpoint: str, params: Optional[Dict] = None, data: Optional[Dict] = None, max_retries: int = 2, priority: Optional[int] = None) -> Dict:
         if not self.session:
             self._initialize_session()
             
@@ -111,15 +198,27 @@ class BitgetClient:
             request_path = endpoint
         
         body = json.dumps(data) if data else ''
-        headers = self._get_headers(method, request_path, body)
+        request_priority = self.rate_limiter.priority_for(method, current_priority(self.default_priority) if priority is None else priority)
         
         for attempt in range(max_retries):
             try:
+                limit_group = await self.rate_limiter.acquire(method, endpoint, request_priority)
+                headers = self._get_headers(method, request_path, body)
+                
                 logger.debug(f"비트겟 API 요청 (시도 {attempt + 1}/{max_retries}): {method} {endpoint}")
                 
                 async with self.session.request(method, url, headers=headers, data=body) as response:
                     response_text = await response.text()
                     
+                    if response.status == 429:
+                        # 버킷이 백오프 시간 동안 차단되므로 다음 acquire에서 대기
+                        self.rate_limiter.on_throttled(limit_group, response.headers)
+                        if attempt < max_retries - 1:
+                            continue
+                        else:
+                            self._record_failure("HTTP 429: 요청 제한")
+                            return {}
+                    
                     if not response_text.strip():
                         error_msg = f"빈 응답 받음 (상태: {response.status})"
                         logger.warning(error_msg)
@@ -162,6 +261,7 @@ class BitgetClient:
                             self._record_failure(error_msg)
                             return {}
                     
+                    self.rate_limiter.on_success(limit_group, response.headers)
                     self._record_success()
                     return response_data.get('data', {})
                     
@@ -361,6 +461,132 @@ class BitgetClient:
                 '_error': str(e)
             }
     
+    async def _fetch_candles(self, symbol: str, granularity: str, start_time: int, end_time: int, limit: int) -> Optional[List[list]]:
+        """캔들 원본 조회 - 실패 시 None"""
+        params = {
+            'symbol': symbol,
+            'productType': 'USDT-FUTURES',
+            'granularity': granularity,
+            'startTime': str(start_time),
+            'endTime': str(end_time),
+            'limit': str(limit)
+        }
+        response = await self._request('GET', "/api/v2/mix/market/candles", params=params)
+        if isinstance(response, list):
+            return response
+        return None
+    
+    async def get_kline(self, symbol: str = None, granularity: str = '1H', limit: int = 100) -> List[list]:
+        """K라인 조회 - [[ts, open, high, low, close, volume, quote_volume], ...] 오래된 순"""
+        symbol = symbol or self.config.symbol
+        try:
+            candles = await self.kline_store.get(symbol, granularity, limit)
+            return candles.tolist()
+        except Exception as e:
+            logger.error(f"K라인 조회 실패 ({granularity}): {e}")
+            return []
+    
+    async def get_kline_arrays(self, symbol: str = None, granularity: str = '1H', limit: int = 100) -> Dict:
+        """K라인 조회 - 열별 NumPy 배열 {'ts', 'open', 'high', 'low', 'close', 'volume', 'quote_volume'}"""
+        symbol = symbol or self.config.symbol
+        try:
+            return as_columns(await self.kline_store.get(symbol, granularity, limit))
+        except Exception as e:
+            logger.error(f"K라인 조회 실패 ({granularity}): {e}")
+            return {}
+    
+    async def get_open_interest(self, symbol: str = None) -> Dict:
+        """현재 미결제약정 조회 후 시계열에 기록 - change24h는 저장된 이력 기준(%)"""
+        symbol = symbol or self.config.symbol
+        try:
+            params = {'symbol': symbol, 'productType': 'USDT-FUTURES'}
+            response = await self._request('GET', "/api/v2/mix/market/open-interest", params=params)
+            if not isinstance(response, dict):
+                return {}
+            
+            oi_list = response.get('openInterestList') or []
+            if not oi_list:
+                return {}
+            size = float(oi_list[0].get('size', 0))
+            ts = int(response.get('ts') or time.time() * 1000)
+            
+            self.derivatives.record(symbol, 'open_interest', ts, [size])
+            series = self.derivatives.series(symbol, 'open_interest')
+            
+            return {
+                'symbol': symbol,
+                'openInterest': size,
+                'change1h': series.change_percent('size', 3600) or 0,
+                'change4h': series.change_percent('size', 4 * 3600) or 0,
+                'change24h': series.change_percent('size', 24 * 3600) or 0,
+                'ts': ts
+            }
+        except Exception as e:
+            logger.error(f"미결제약정 조회 실패: {e}")
+            return {}
+    
+    async def get_account_long_short(self, symbol: str = None, period: str = None) -> List[Dict]:
+        """계정 롱/숏 비율 이력 조회 후 시계열에 기록"""
+        symbol = symbol or self.config.symbol
+        try:
+            params = {'symbol': symbol, 'period': period or self.DERIVATIVES_PERIOD}
+            response = await self._request('GET', "/api/v2/mix/market/account-long-short", params=params)
+            rows = self._extract_list(response, ['list'])
+            
+            samples = []
+            for row in rows:
+                try:
+                    samples.append((int(row['ts']), [
+                        float(row.get('longAccountRatio', 0)),
+                        float(row.get('shortAccountRatio', 0)),
+                        float(row.get('longShortAccountRatio', 0))
+                    ]))
+                except (KeyError, ValueError, TypeError):
+                    continue
+            self.derivatives.record_many(symbol, 'account_long_short', samples)
+            return rows
+        except Exception as e:
+            logger.error(f"롱/숏 비율 조회 실패: {e}")
+            return []
+    
+    async def get_taker_buy_sell_volume(self, symbol: str = None, period: str = None) -> List[Dict]:
+        """테이커 매수/매도 거래량 이력 조회 후 시계열에 기록"""
+        symbol = symbol or self.config.symbol
+        try:
+            params = {'symbol': symbol, 'period': period or self.DERIVATIVES_PERIOD}
+            response = await self._request('GET', "/api/v2/mix/market/taker-buy-sell", params=params)
+            rows = self._extract_list(response, ['list'])
+            
+            samples = []
+            for row in rows:
+                try:
+                    samples.append((int(row['ts']), [
+                        float(row.get('buyVolume', 0)),
+                        float(row.get('sellVolume', 0))
+                    ]))
+                except (KeyError, ValueError, TypeError):
+                    continue
+            self.derivatives.record_many(symbol, 'taker_volume', samples)
+            return rows
+        except Exception as e:
+            logger.error(f"테이커 거래량 조회 실패: {e}")
+            return []
+    
+    async def update_derivatives_data(self, symbol: str = None) -> Dict:
+        """파생상품 지표 3종 갱신 (주기 실행용) 후 요약 반환"""
+        symbol = symbol or self.config.symbol
+        await asyncio.gather(
+            self.get_open_interest(symbol),
+            self.get_account_long_short(symbol),
+            self.get_taker_buy_sell_volume(symbol),
+            return_exceptions=True
+        )
+        return self.derivatives.get_summary(symbol)
+    
+    def get_derivatives_summary(self, symbol: str = None) -> Dict:
+        """저장된 시계열 요약 (네트워크 호출 없음)"""
+        return self.derivatives.get_summary(symbol or self.config.symbol)
+    
     async def get_positions(self, symbol: str = None) -> List[Dict]:
         symbol = symbol or self.config.symbol
         
@@ -463,6 +689,125 @@ class BitgetClient:
             logger.error(f"계정 정보 조회 실패: {e}")
             return {}
 
+    def _get_ledger(self) -> Optional[TradeLedger]:
+        """로컬 원장 (생성 실패 시 원장 없이 API 직접 조회)"""
+        if self.ledger is None and not self.ledger_disabled:
+            try:
+                self.ledger = TradeLedger(getattr(self.config, 'trade_ledger_db', 'trade_ledger.db'))
+                logger.info(f"📒 거래 원장 사용: {self.ledger.db_path}")
+            except Exception as e:
+                logger.error(f"거래 원장 초기화 실패 (API 직접 조회 사용): {e}")
+                self.ledger_disabled = True
+        return self.ledger
+    
+    @staticmethod
+    def _extract_list(response, fields: List[str]) -> List[Dict]:
+        if isinstance(response, list):
+            return response
+        if isinstance(response, dict):
+            for field in fields:
+                if isinstance(response.get(field), list):
+                    return response[field]
+        return []
+    
+    async def _fetch_paginated(self, endpoint: str, params: Dict, list_fields: List[str],
+                               id_field: str, start_time: int, end_time: int) -> Optional[List[Dict]]:
+        """idLessThan 커서로 구간 전체 조회 (90일 단위로 나눠서) - 실패 시 None
+
+        한 구간에서 페이지 한도에 닿으면 받은 가장 오래된 기록 시각까지로 구간을 좁혀 이어서 조회
+        (잘린 구간을 받은 것으로 넘기지 않음, 좁힐 수 없으면 None)
+        """
+        records = []
+        seen_ids = set()
+        window_end = end_time
+        while window_end > start_time:
+            window_start = max(start_time, window_end - self.HISTORY_MAX_WINDOW_MS)
+            cursor = None
+            oldest_ts = None
+            
+            for _ in range(self.HISTORY_MAX_PAGES):
+                page_params = dict(params)
+                page_params['startTime'] = str(window_start)
+                page_params['endTime'] = str(window_end)
+                page_params['limit'] = str(self.HISTORY_PAGE_LIMIT)
+                if cursor:
+                    page_params['idLessThan'] = str(cursor)
+                
+                response = await self._request('GET', endpoint, params=page_params)
+                # _request는 실패 시 빈 dict 반환 (정상 응답은 목록 또는 필드가 있는 dict)
+                if isinstance(response, dict) and not response:
+                    return None
+                
+                page = self._extract_list(response, list_fields)
+                for record in page:
+                    # 구간을 좁혀 다시 조회하면 경계 시각 기록이 겹침
+                    record_id = record.get(id_field)
+                    if record_id is not None:
+                        if record_id in seen_ids:
+                            continue
+                        seen_ids.add(record_id)
+                    records.append(record)
+                    try:
+                        ts = int(record.get('cTime') or record.get('uTime') or 0)
+                    except (TypeError, ValueError):
+                        ts = 0
+                    if ts and (oldest_ts is None or ts < oldest_ts):
+                        oldest_ts = ts
+                
+                next_cursor = response.get('endId') if isinstance(response, dict) else None
+                if not next_cursor and page:
+                    next_cursor = page[-1].get(id_field)
+                if len(page) < self.HISTORY_PAGE_LIMIT or not next_cursor or next_cursor == cursor:
+                    break
+                cursor = next_cursor
+            else:
+                # 같은 시각 기록이 잘리지 않도록 가장 오래된 시각 포함해서 이어서 조회
+                if oldest_ts is None or oldest_ts + 1 >= window_end:
+                    logger.warning(f"페이지 한도 도달, 구간을 좁힐 수 없어 조회 실패 ({endpoint}): {window_start} ~ {window_end}")
+                    return None
+                logger.info(f"페이지 한도 도달 ({endpoint}): {self.HISTORY_MAX_PAGES}페이지, {oldest_ts}까지로 좁혀 계속 조회")
+                window_end = oldest_ts + 1
+                continue
+            
+            window_end = window_start
+        
+        return records
+    
+    async def _ledger_history(self, kind: str, scope: str, start_time: int, end_time: int,
+                              fetch_range) -> Optional[List[Dict]]:
+        """원장 증분 동기화 후 구간 기록 반환 - 원장을 못 쓰면 None"""
+        ledger = self._get_ledger()
+        if not ledger:
+            return None
+        try:
+            if not await ledger.sync(kind, scope, start_time, end_time, fetch_range):
+                return None
+            return ledger.query(kind, scope, start_time, end_time)
+        except Exception as e:
+            logger.error(f"거래 원장 조회 실패 ({kind}): {e}")
+            return None
+    
+    async def get_fill_history(self, symbol: str = None, start_time: int = None, end_time: int = None) -> List[Dict]:
+        """구간 전체 체결 내역 - 로컬 원장에서 새 체결만 받아서 반환 (500건 제한 없음)"""
+        symbol = symbol or self.config.symbol
+        end_time = end_time or int(time.time() * 1000)
+        start_time = start_time or end_time - 7 * 24 * 60 * 60 * 1000
+        
+        async def fetch_range(range_start: int, range_end: int):
+            return await self._fetch_paginated(
+                "/api/v2/mix/order/fill-history",
+                {'symbol': symbol, 'productType': 'USDT-FUTURES'},
+                ['fillList', 'list', 'data', 'fills'], 'tradeId',
+                range_start, range_end
+            )
+        
+        fills = await self._ledger_history('fill', symbol, start_time, end_time, fetch_range)
+        if fills is None:
+            fills = await fetch_range(start_time, end_time) or []
+        
+        logger.info(f"✅ 체결 내역: {len(fills)}건")
+        return fills
+    
     async def get_account_bills(self, coin: str = "USDT", start_time: int = None, end_time: int = None, limit: int = 100) -> List[Dict]:
         """계정 변동 내역 조회 - 입출금 및 거래 내역"""
         try:
@@ -500,7 +845,12 @@ class BitgetClient:
             return []
 
     async def get_deposit_withdraw_history(self, coin: str = "USDT", start_time: int = None, end_time: int = None) -> Dict:
-        """입출금 내역 조회"""
+        """입출금 내역 조회 - 구간이 있으면 로컬 원장에서 새 기록만 받아서 반환"""
+        if start_time:
+            history = await self._get_deposit_withdraw_from_ledger(coin, start_time, end_time or int(time.time() * 1000))
+            if history is not None:
+                return history
+        
         try:
             # 입금 내역 조회
             deposit_endpoint = "/api/v2/spot/wallet/deposit-records"
@@ -567,6 +917,32 @@ class BitgetClient:
             logger.error(f"Bitget 입출금 내역 조회 실패: {e}")
             return {'deposits': [], 'withdrawals': []}
 
+    async def _get_deposit_withdraw_from_ledger(self, coin: str, start_time: int, end_time: int) -> Optional[Dict]:
+        async def fetch_deposits(range_start: int, range_end: int):
+            return await self._fetch_paginated(
+                "/api/v2/spot/wallet/deposit-records", {'coin': coin},
+                ['list'], 'orderId', range_start, range_end
+            )
+        
+        async def fetch_withdrawals(range_start: int, range_end: int):
+            return await self._fetch_paginated(
+                "/api/v2/spot/wallet/withdrawal-records", {'coin': coin},
+                ['list'], 'orderId', range_start, range_end
+            )
+        
+        deposits, withdrawals = await asyncio.gather(
+            self._ledger_history('deposit', coin, start_time, end_time, fetch_deposits),
+            self._ledger_history('withdrawal', coin, start_time, end_time, fetch_withdrawals)
+        )
+        if deposits is None or withdrawals is None:
+            return None
+        
+        logger.info(f"✅ Bitget 입출금 내역 (원장): 입금 {len(deposits)}건, 출금 {len(withdrawals)}건")
+        return {
+            'deposits': deposits,
+            'withdrawals': withdrawals
+        }
+    
     async def get_real_cumulative_profit_analysis(self) -> Dict:
         """실제 누적 수익 분석 - 입금액 제외"""
         try:
@@ -769,11 +1145,10 @@ class BitgetClient:
             logger.info(f"  - 시작: {datetime.fromtimestamp(start_time/1000)}")
             logger.info(f"  - 종료: {datetime.fromtimestamp(end_time/1000)}")
             
-            fills = await self.get_trade_fills(
+            fills = await self.get_fill_history(
                 symbol=symbol,
                 start_time=start_time,
-                end_time=end_time,
-                limit=500
+                end_time=end_time
             )
             
             logger.info(f"거래 내역 조회 결과: {len(fills)}건")
@@ -788,62 +1163,15 @@ class BitgetClient:
                     'source': 'no_fills_found'
                 }
             
-            total_position_pnl = 0.0
-            total_trading_fees = 0.0
-            total_funding_fees = 0.0
-            trade_count = 0
-            
-            for fill in fills:
-                try:
-                    position_pnl = 0.0
-                    pnl_fields = ['pnl', 'profit', 'realizedPnl', 'closedPnl']
-                    
-                    for field in pnl_fields:
-                        if field in fill and fill[field] is not None:
-                            try:
-                                position_pnl = float(fill[field])
-                                if position_pnl != 0:
-                                    break
-                            except (ValueError, TypeError):
-                                continue
-                    
-                    trading_fee = 0.0
-                    fee_fields = ['fee', 'tradingFee', 'totalFee']
-                    
-                    for field in fee_fields:
-                        if field in fill and fill[field] is not None:
-                            try:
-                                fee_value = float(fill[field])
-                                if fee_value != 0:
-                                    trading_fee = abs(fee_value)
-                                    break
-                            except (ValueError, TypeError):
-                                continue
-                    
-                    funding_fee = 0.0
-                    funding_fields = ['fundingFee', 'funding', 'fundFee']
-                    
-                    for field in funding_fields:
-                        if field in fill and fill[field] is not None:
-                            try:
-                                funding_value = float(fill[field])
-                                if funding_value != 0:
-                                    funding_fee = funding_value
-                                    break
-                            except (ValueError, TypeError):
-                                continue
-                    
-                    if position_pnl != 0 or trading_fee != 0 or funding_fee != 0:
-                        total_position_pnl += position_pnl
-                        total_trading_fees += trading_fee
-                        total_funding_fees += funding_fee
-                        trade_count += 1
-                
-                except Exception as fill_error:
-                    logger.debug(f"거래 내역 처리 오류: {fill_error}")
-                    continue
+            # 새 체결만 정규화해서 누적 후 구간 합계
+            self.pnl_engine.update(fills, symbol)
+            summary = self.pnl_engine.summarize(start_time, end_time, symbol)
             
-            net_profit = total_position_pnl + total_funding_fees - total_trading_fees
+            total_position_pnl = summary['position_pnl']
+            total_trading_fees = summary['trading_fees']
+            total_funding_fees = summary['funding_fees']
+            net_profit = summary['net_profit']
+            trade_count = summary['trade_count']
             
             logger.info(f"✅ Position PnL 기준 손익 계산 완료:")
             logger.info(f"  - Position PnL: ${total_position_pnl:.4f}")
@@ -935,6 +1263,12 @@ class BitgetClient:
             position_pnl = result.get('position_pnl', 0.0)
             daily_average = position_pnl / duration_days if duration_days > 0 else 0
             
+            # 일별 Position PnL (KST 기준)
+            daily_pnl = {
+                date: day['pnl'] for date, day in
+                self.pnl_engine.daily(start_timestamp, end_timestamp, self.config.symbol).items()
+            }
+            
             logger.info(f"✅ 비트겟 7일 Position PnL 계산 완료:")
             logger.info(f"  - 실제 기간: {duration_days:.1f}일")
             logger.info(f"  - Position PnL: ${position_pnl:.4f}")
@@ -942,7 +1276,7 @@ class BitgetClient:
             
             return {
                 'total_pnl': position_pnl,
-                'daily_pnl': {},
+                'daily_pnl': daily_pnl,
                 'average_daily': daily_average,
                 'trade_count': result.get('trade_count', 0),
                 'actual_days': duration_days,
@@ -1168,3 +1502,5 @@ class BitgetClient:
         if self.session:
             await self.session.close()
             logger.info("Bitget 클라이언트 세션 종료")
+        if self.ledger:
+            self.ledger.close()
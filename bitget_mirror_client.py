@@ -5,12 +5,19 @@ import base64
 import json
 import time
 import logging
+import re
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple
 import aiohttp
 import pytz
 import traceback
 
+from rate_limiter import get_rate_limiter, current_priority, PRIORITY_NORMAL
+from http_pool import get_http_pool
+
+# 엔드포인트 자체를 쓸 수 없다는 응답 (폐기/미지원) - 일시적 오류와 구분
+TRIGGER_SOURCE_DEAD_KEYWORDS = ['decommission', 'deprecated', 'offline', 'no longer', 'not support']
+
 logger = logging.getLogger(__name__)
 
 class BitgetMirrorClient:
@@ -37,21 +44,24 @@ class BitgetMirrorClient:
         # API 키 검증 상태
         self.api_keys_validated = False
         
+        # 같은 계정을 쓰는 리포트용 클라이언트와 요청 예산 공유 (미러링 조회가 리포트보다 우선)
+        self.rate_limiter = get_rate_limiter('bitget', config.bitget_api_key)
+        self.default_priority = PRIORITY_NORMAL
+        
+        # 트리거 주문 조회: 엔드포인트 동시 조회 (빈 응답도 매번 조회 - V1 주문은 V2에 나오지 않음)
+        # 4xx/폐기 응답이 연속된 V1 엔드포인트만 잠시 건너뛰고 주기적으로 다시 확인
+        self.TRIGGER_FETCH_CONCURRENT = True
+        self.TRIGGER_SOURCE_DEAD_AFTER = 3
+        self.TRIGGER_SOURCE_REPROBE_SECONDS = 600
+        self.trigger_source_state: Dict[str, Dict] = {}
+        self.last_trigger_order_count = -1
+        
     def _initialize_session(self):
         """세션 초기화"""
         if not self.session:
             # 🔥🔥🔥 연결 타임아웃 및 재시도 설정 강화
             timeout = aiohttp.ClientTimeout(total=30, connect=10)
-            connector = aiohttp.TCPConnector(
-                limit=100,
-                limit_per_host=30,
-                ttl_dns_cache=300,
-                use_dns_cache=True
-            )
-            self.session = aiohttp.ClientSession(
-                timeout=timeout,
-                connector=connector
-            )
+            self.session = get_http_pool().get_session('bitget_mirror', timeout=timeout)
             logger.info("Bitget 미러링 클라이언트 세션 초기화 완료")
         
     async def initialize(self):
@@ -116,7 +126,7 @@ class BitgetMirrorClient:
             'locale': 'en-US'
         }
     
-    async def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, data: Optional[Dict] = None, max_retries: int = 3) -> Dict:
+    async def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, data: Optional[Dict] = None, max_retries: int = 3, priority: Optional[int] = None) -> Dict:
         """🔥🔥🔥 API 요청 - 강화된 오류 처리"""
         if not self.session:
             self._initialize_session()
@@ -131,11 +141,14 @@ class BitgetMirrorClient:
             request_path = endpoint
         
         body = json.dumps(data) if data else ''
-        headers = self._get_headers(method, request_path, body)
+        request_priority = self.rate_limiter.priority_for(method, current_priority(self.default_priority) if priority is None else priority)
         
         # 🔥🔥🔥 재시도 로직
         for attempt in range(max_retries):
             try:
+                limit_group = await self.rate_limiter.acquire(method, endpoint, request_priority)
+                headers = self._get_headers(method, request_path, body)
+                
                 logger.debug(f"비트겟 미러링 API 요청 (시도 {attempt + 1}/{max_retries}): {method} {endpoint}")
                 
                 async with self.session.request(method, url, headers=headers, data=body) as response:
@@ -146,6 +159,15 @@ class BitgetMirrorClient:
                     logger.debug(f"비트겟 미러링 API 응답 헤더: {dict(response.headers)}")
                     logger.debug(f"비트겟 미러링 API 응답 내용: {response_text[:500]}...")
                     
+                    # 요청 제한 - 버킷이 백오프 시간 동안 차단되므로 다음 acquire에서 대기
+                    if response.status == 429:
+                        self.rate_limiter.on_throttled(limit_group, response.headers)
+                        if attempt < max_retries - 1:
+                            continue
+                        else:
+                            self._record_failure("HTTP 429: 요청 제한")
+                            raise Exception("HTTP 429: 요청 제한")
+                    
                     # 빈 응답 체크
                     if not response_text.strip():
                         error_msg = f"빈 응답 받음 (상태: {response.status})"
@@ -193,6 +215,7 @@ class BitgetMirrorClient:
                             raise Exception(error_msg)
                     
                     # 🔥🔥🔥 성공 기록
+                    self.rate_limiter.on_success(limit_group, response.headers)
                     self._record_success()
                     return response_data.get('data', {})
                     
@@ -521,7 +544,7 @@ class BitgetMirrorClient:
         try:
             symbol = symbol or self.config.symbol
             
-            logger.info(f"🔍 미러링 V2 API 예약 주문 조회 시작: {symbol}")
+            logger.debug(f"🔍 미러링 V2 API 예약 주문 조회 시작: {symbol}")
             
             all_found_orders = []
             
@@ -537,7 +560,7 @@ class BitgetMirrorClient:
                         'productType': 'USDT-FUTURES'
                     }
                     
-                    logger.info(f"🔍 미러링 예약 주문 조회: {endpoint}")
+                    logger.debug(f"🔍 미러링 예약 주문 조회: {endpoint}")
                     response = await self._request('GET', endpoint, params=params)
                     
                     if response is None:
@@ -552,14 +575,14 @@ class BitgetMirrorClient:
                             orders_raw = response['entrustedList']
                             if isinstance(orders_raw, list):
                                 orders = orders_raw
-                                logger.info(f"✅ 미러링 {endpoint}: entrustedList에서 {len(orders)}개 주문 발견")
+                                logger.debug(f"✅ 미러링 {endpoint}: entrustedList에서 {len(orders)}개 주문 발견")
                     elif isinstance(response, list):
                         orders = response
-                        logger.info(f"✅ 미러링 {endpoint}: 직접 리스트에서 {len(orders)}개 주문 발견")
+                        logger.debug(f"✅ 미러링 {endpoint}: 직접 리스트에서 {len(orders)}개 주문 발견")
                     
                     if orders:
                         all_found_orders.extend(orders)
-                        logger.info(f"🎯 미러링 {endpoint}에서 발견: {len(orders)}개 주문")
+                        logger.debug(f"🎯 미러링 {endpoint}에서 발견: {len(orders)}개 주문")
                         
                         # 발견된 주문들 상세 로깅 - 🔥🔥🔥 TP/SL 정보 특별 체크
                         for i, order in enumerate(orders):
@@ -576,12 +599,12 @@ class BitgetMirrorClient:
                             tp_price = order.get('presetStopSurplusPrice', order.get('stopSurplusPrice', order.get('takeProfitPrice')))
                             sl_price = order.get('presetStopLossPrice', order.get('stopLossPrice'))
                             
-                            logger.info(f"  📝 미러링 주문 {i+1}: ID={order_id}, 타입={order_type}, 방향={side}, 크기={size}, 트리거가={trigger_price}")
+                            logger.debug(f"  📝 미러링 주문 {i+1}: ID={order_id}, 타입={order_type}, 방향={side}, 크기={size}, 트리거가={trigger_price}")
                             
                             if tp_price:
-                                logger.info(f"      🎯 TP 설정 발견: {tp_price}")
+                                logger.debug(f"      🎯 TP 설정 발견: {tp_price}")
                             if sl_price:
-                                logger.info(f"      🛡️ SL 설정 발견: {sl_price}")
+                                logger.debug(f"      🛡️ SL 설정 발견: {sl_price}")
                             
                             # 🔥🔥🔥 모든 필드 확인하여 TP/SL 관련 필드 찾기
                             tp_sl_fields = {}
@@ -591,7 +614,7 @@ class BitgetMirrorClient:
                                         tp_sl_fields[field_name] = field_value
                             
                             if tp_sl_fields:
-                                logger.info(f"      🔍 TP/SL 관련 필드들: {tp_sl_fields}")
+                                logger.debug(f"      🔍 TP/SL 관련 필드들: {tp_sl_fields}")
                         
                         # 첫 번째 성공한 엔드포인트에서 주문을 찾았으면 종료
                         break
@@ -619,7 +642,7 @@ class BitgetMirrorClient:
                     unique_orders.append(order)
                     logger.debug(f"📝 미러링 V2 고유 예약 주문 추가: {order_id}")
             
-            logger.info(f"🔥 미러링 V2 API에서 최종 발견된 고유한 예약 주문: {len(unique_orders)}건")
+            logger.debug(f"🔥 미러링 V2 API에서 최종 발견된 고유한 예약 주문: {len(unique_orders)}건")
             return unique_orders
             
         except Exception as e:
@@ -627,13 +650,13 @@ class BitgetMirrorClient:
             return []
     
     async def get_plan_orders_v1_working(self, symbol: str = None, plan_type: str = None) -> List[Dict]:
-        """🔥 V1 API로 예약 주문 조회 - 실제 작동하는 엔드포인트만 사용"""
+        """🔥 V1 API로 예약 주문 조회 - 실제 작동하는 엔드포인트만 사용, 조회 실패는 예외로 (빈 목록과 구분)"""
         try:
             # V1 API는 다른 심볼 형식을 사용
             symbol = symbol or self.config.symbol
             v1_symbol = f"{symbol}_UMCBL"
             
-            logger.info(f"🔍 미러링 V1 API 예약 주문 조회 시작: {v1_symbol}")
+            logger.debug(f"🔍 미러링 V1 API 예약 주문 조회 시작: {v1_symbol}")
             
             all_found_orders = []
             
@@ -656,7 +679,7 @@ class BitgetMirrorClient:
                         else:
                             params['planType'] = plan_type
                     
-                    logger.info(f"🔍 미러링 V1 예약 주문 조회: {endpoint}")
+                    logger.debug(f"🔍 미러링 V1 예약 주문 조회: {endpoint}")
                     response = await self._request('GET', endpoint, params=params)
                     
                     if response is None:
@@ -672,15 +695,15 @@ class BitgetMirrorClient:
                                 orders_raw = response[field_name]
                                 if isinstance(orders_raw, list):
                                     orders = orders_raw
-                                    logger.info(f"✅ 미러링 {endpoint}: {field_name}에서 {len(orders)}개 주문 발견")
+                                    logger.debug(f"✅ 미러링 {endpoint}: {field_name}에서 {len(orders)}개 주문 발견")
                                     break
                     elif isinstance(response, list):
                         orders = response
-                        logger.info(f"✅ 미러링 {endpoint}: 직접 리스트에서 {len(orders)}개 주문 발견")
+                        logger.debug(f"✅ 미러링 {endpoint}: 직접 리스트에서 {len(orders)}개 주문 발견")
                     
                     if orders:
                         all_found_orders.extend(orders)
-                        logger.info(f"🎯 미러링 {endpoint}에서 발견: {len(orders)}개 주문")
+                        logger.debug(f"🎯 미러링 {endpoint}에서 발견: {len(orders)}개 주문")
                         
                         # 발견된 주문들 상세 로깅 - 🔥🔥🔥 TP/SL 정보 특별 체크
                         for i, order in enumerate(orders):
@@ -697,12 +720,12 @@ class BitgetMirrorClient:
                             tp_price = order.get('presetStopSurplusPrice', order.get('stopSurplusPrice', order.get('takeProfitPrice')))
                             sl_price = order.get('presetStopLossPrice', order.get('stopLossPrice'))
                             
-                            logger.info(f"  📝 미러링 V1 주문 {i+1}: ID={order_id}, 타입={order_type}, 방향={side}, 크기={size}, 트리거가={trigger_price}")
+                            logger.debug(f"  📝 미러링 V1 주문 {i+1}: ID={order_id}, 타입={order_type}, 방향={side}, 크기={size}, 트리거가={trigger_price}")
                             
                             if tp_price:
-                                logger.info(f"      🎯 V1 TP 설정 발견: {tp_price}")
+                                logger.debug(f"      🎯 V1 TP 설정 발견: {tp_price}")
                             if sl_price:
-                                logger.info(f"      🛡️ V1 SL 설정 발견: {sl_price}")
+                                logger.debug(f"      🛡️ V1 SL 설정 발견: {sl_price}")
                         
                         # 첫 번째 성공한 엔드포인트에서 주문을 찾았으면 종료
                         break
@@ -711,7 +734,7 @@ class BitgetMirrorClient:
                         
                 except Exception as e:
                     logger.debug(f"미러링 {endpoint} 조회 실패: {e}")
-                    continue
+                    raise
             
             # 중복 제거
             seen = set()
@@ -730,88 +753,108 @@ class BitgetMirrorClient:
                     unique_orders.append(order)
                     logger.debug(f"📝 미러링 V1 고유 예약 주문 추가: {order_id}")
             
-            logger.info(f"🔥 미러링 V1 API에서 최종 발견된 고유한 예약 주문: {len(unique_orders)}건")
+            logger.debug(f"🔥 미러링 V1 API에서 최종 발견된 고유한 예약 주문: {len(unique_orders)}건")
             return unique_orders
             
         except Exception as e:
             logger.error(f"미러링 V1 예약 주문 조회 실패: {e}")
-            return []
+            raise
     
-    async def get_all_trigger_orders(self, symbol: str = None) -> List[Dict]:
-        """🔥 모든 트리거 주문 조회 - 작동하는 엔드포인트만 사용"""
-        all_orders = []
-        symbol = symbol or self.config.symbol
+    @staticmethod
+    def _trigger_order_id(order: Dict) -> str:
+        return (order.get('orderId') or 
+                order.get('planOrderId') or 
+                order.get('id') or
+                str(order.get('cTime', '')))
+    
+    @staticmethod
+    def _is_dead_source_error(error: Exception) -> bool:
+        """엔드포인트를 쓸 수 없다는 오류인지 (4xx, 폐기/미지원 응답) - 429, 타임아웃, 5xx는 일시적 오류"""
+        message = str(error).lower()
+        if 'http 429' in message:
+            return False
+        if re.search(r'http 4\d\d', message):
+            return True
+        return any(keyword in message for keyword in TRIGGER_SOURCE_DEAD_KEYWORDS)
+    
+    def _is_trigger_source_skipped(self, name: str) -> bool:
+        state = self.trigger_source_state.get(name)
+        return bool(state) and time.monotonic() < state['skip_until']
+    
+    def _update_trigger_source(self, name: str, error: Optional[Exception] = None):
+        """엔드포인트별 조회 결과 기록 - 성공(빈 응답 포함)이면 초기화, 엔드포인트 오류가 연속되면 잠시 건너뜀
         
-        logger.info(f"🔍 미러링 모든 트리거 주문 조회 시작: {symbol}")
+        재확인에서도 같은 오류면 바로 다시 건너뜀 (일시적 오류는 횟수에 넣지 않음)
+        """
+        state = self.trigger_source_state.setdefault(name, {'failures': 0, 'skip_until': 0.0, 'skips': 0})
+        if error is None:
+            if state['failures'] >= self.TRIGGER_SOURCE_DEAD_AFTER:
+                logger.info(f"미러링 트리거 주문 엔드포인트 {name}: 다시 응답 → 조회 재개")
+            state['failures'] = 0
+            return
+        if name == 'v2' or not self._is_dead_source_error(error):
+            return
         
-        # 🔥 1. V2 API 조회 (우선)
-        try:
-            v2_orders = await self.get_plan_orders_v2_working(symbol)
-            if v2_orders:
-                all_orders.extend(v2_orders)
-                logger.info(f"✅ 미러링 V2에서 {len(v2_orders)}개 예약 주문 발견")
-        except Exception as e:
-            logger.warning(f"미러링 V2 예약 주문 조회 실패: {e}")
+        state['failures'] += 1
+        if state['failures'] >= self.TRIGGER_SOURCE_DEAD_AFTER:
+            state['skip_until'] = time.monotonic() + self.TRIGGER_SOURCE_REPROBE_SECONDS
+            state['skips'] += 1
+            logger.warning(f"미러링 트리거 주문 엔드포인트 {name}: 오류 {state['failures']}회 연속 → "
+                           f"{self.TRIGGER_SOURCE_REPROBE_SECONDS}초 동안 건너뜀 ({str(error)[:100]})")
+    
+    async def get_all_trigger_orders(self, symbol: str = None) -> List[Dict]:
+        """🔥 모든 트리거 주문 조회 - V2/V1/V1 TP/SL 동시 조회 후 ID 기준 병합"""
+        symbol = symbol or self.config.symbol
         
-        # 🔥 2. V1 일반 예약 주문
-        try:
-            v1_orders = await self.get_plan_orders_v1_working(symbol)
-            if v1_orders:
-                all_orders.extend(v1_orders)
-                logger.info(f"✅ 미러링 V1 일반에서 {len(v1_orders)}개 예약 주문 발견")
-        except Exception as e:
-            logger.warning(f"미러링 V1 일반 예약 주문 조회 실패: {e}")
+        sources = [
+            ('v2', lambda: self.get_plan_orders_v2_working(symbol)),
+            ('v1', lambda: self.get_plan_orders_v1_working(symbol)),
+            ('v1_tp_sl', lambda: self.get_plan_orders_v1_working(symbol, 'profit_loss'))
+        ]
+        active = [(name, fetch) for name, fetch in sources if not self._is_trigger_source_skipped(name)]
         
-        # 🔥 3. V1 TP/SL 주문
-        try:
-            v1_tp_sl = await self.get_plan_orders_v1_working(symbol, 'profit_loss')
-            if v1_tp_sl:
-                all_orders.extend(v1_tp_sl)
-                logger.info(f"✅ 미러링 V1 TP/SL에서 {len(v1_tp_sl)}개 주문 발견")
-        except Exception as e:
-            logger.warning(f"미러링 V1 TP/SL 주문 조회 실패: {e}")
+        if self.TRIGGER_FETCH_CONCURRENT:
+            results = await asyncio.gather(*(fetch() for _, fetch in active), return_exceptions=True)
+        else:
+            results = []
+            for _, fetch in active:
+                try:
+                    results.append(await fetch())
+                except Exception as e:
+                    results.append(e)
         
-        # 중복 제거
-        seen = set()
-        unique_orders = []
-        for order in all_orders:
-            if order is None:
+        # ID 인덱스로 병합 (V2 결과 우선)
+        orders_by_id: Dict[str, Dict] = {}
+        for (name, _), result in zip(active, results):
+            if isinstance(result, Exception):
+                logger.warning(f"미러링 {name} 예약 주문 조회 실패: {result}")
+                self._update_trigger_source(name, result)
                 continue
-                
-            order_id = (order.get('orderId') or 
-                       order.get('planOrderId') or 
-                       order.get('id') or
-                       str(order.get('cTime', '')))
-            
-            if order_id and order_id not in seen:
-                seen.add(order_id)
-                unique_orders.append(order)
-                logger.debug(f"📝 미러링 최종 고유 예약 주문 추가: {order_id}")
+            
+            self._update_trigger_source(name)
+            orders = [o for o in (result or []) if o is not None]
+            for order in orders:
+                order_id = self._trigger_order_id(order)
+                if order_id and order_id not in orders_by_id:
+                    orders_by_id[order_id] = order
         
-        logger.info(f"🔥 미러링 최종 발견된 고유한 트리거 주문: {len(unique_orders)}건")
+        unique_orders = list(orders_by_id.values())
         
-        # 🔥🔥🔥 수정: 예약 주문이 없을 때 경고 로그 제거
-        if unique_orders:
-            logger.info("📋 미러링 발견된 예약 주문 목록:")
-            for i, order in enumerate(unique_orders, 1):
-                order_id = order.get('orderId', order.get('planOrderId', order.get('id', 'unknown')))
-                side = order.get('side', order.get('tradeSide', 'unknown'))
-                trigger_price = order.get('triggerPrice', order.get('executePrice', order.get('price', 'unknown')))
-                size = order.get('size', order.get('volume', 'unknown'))
-                order_type = order.get('orderType', order.get('planType', order.get('type', 'unknown')))
-                
-                # 🔥🔥🔥 TP/SL 정보도 로깅
-                tp_price = order.get('presetStopSurplusPrice', order.get('stopSurplusPrice', order.get('takeProfitPrice')))
-                sl_price = order.get('presetStopLossPrice', order.get('stopLossPrice'))
-                
-                logger.info(f"  {i}. ID: {order_id}, 방향: {side}, 수량: {size}, 트리거가: {trigger_price}, 타입: {order_type}")
-                if tp_price:
-                    logger.info(f"     🎯 TP: {tp_price}")
-                if sl_price:
-                    logger.info(f"     🛡️ SL: {sl_price}")
-        else:
-            # 🔥🔥🔥 수정: WARNING → DEBUG로 변경하여 빨간 로그 제거
-            logger.debug("📝 미러링 현재 예약 주문이 없습니다.")
+        # 개수가 바뀔 때만 INFO, 나머지는 DEBUG
+        if len(unique_orders) != self.last_trigger_order_count:
+            logger.info(f"🔥 미러링 트리거 주문: {self.last_trigger_order_count}건 → {len(unique_orders)}건 "
+                        f"(조회: {', '.join(name for name, _ in active)})")
+            self.last_trigger_order_count = len(unique_orders)
+        
+        for i, order in enumerate(unique_orders, 1):
+            order_id = order.get('orderId', order.get('planOrderId', order.get('id', 'unknown')))
+            side = order.get('side', order.get('tradeSide', 'unknown'))
+            trigger_price = order.get('triggerPrice', order.get('executePrice', order.get('price', 'unknown')))
+            size = order.get('size', order.get('volume', 'unknown'))
+            order_type = order.get('orderType', order.get('planType', order.get('type', 'unknown')))
+            tp_price = order.get('presetStopSurplusPrice', order.get('stopSurplusPrice', order.get('takeProfitPrice')))
+            sl_price = order.get('presetStopLossPrice', order.get('stopLossPrice'))
+            logger.debug(f"  {i}. ID: {order_id}, 방향: {side}, 수량: {size}, 트리거가: {trigger_price}, 타입: {order_type}, TP: {tp_price}, SL: {sl_price}")
         
         return unique_orders
     
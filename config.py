@@ -1,6 +1,8 @@
 import os
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+
+from mirror_contracts import symbol_to_contract
 
 logger = logging.getLogger(__name__)
 
@@ -107,6 +109,50 @@ class Config:
         # ENABLE_MIRROR_TRADING이 없으면 MIRROR_TRADING_MODE 확인
         return self._parse_mirror_trading_mode(self.mirror_trading_mode)
 
+    def _parse_mirror_followers(self, raw: str) -> List[Dict[str, Any]]:
+        """팔로워 계정 목록 파싱 - API 키가 없거나 형식이 잘못된 항목은 건너뜀"""
+        followers = []
+        for item in raw.split(','):
+            item = item.strip()
+            if not item:
+                continue
+            name, _, ratio = item.partition(':')
+            name = name.strip()
+            try:
+                ratio = float(ratio) if ratio.strip() else 1.0
+            except ValueError:
+                self.logger.warning(f"⚠️ 팔로워 복제 비율 형식 오류, 건너뜀: '{item}'")
+                continue
+            
+            api_key = os.getenv(f'GATE_API_KEY_{name.upper()}', '')
+            api_secret = os.getenv(f'GATE_API_SECRET_{name.upper()}', '')
+            if not name or not api_key or not api_secret:
+                self.logger.warning(f"⚠️ 팔로워 API 키 미설정, 건너뜀: '{name}'")
+                continue
+            followers.append({'name': name, 'ratio': ratio, 'api_key': api_key, 'api_secret': api_secret})
+        return followers
+
+    def _parse_mirror_symbols(self, raw: str) -> List[Dict[str, str]]:
+        """추가 미러링 심볼 목록 파싱 - 기본 심볼/중복/변환할 수 없는 항목은 건너뜀"""
+        symbols = []
+        seen = {self.symbol}
+        for item in raw.split(','):
+            item = item.strip().upper()
+            if not item:
+                continue
+            symbol, _, contract = item.partition(':')
+            symbol = symbol.strip()
+            try:
+                contract = contract.strip() or symbol_to_contract(symbol)
+            except ValueError as e:
+                self.logger.warning(f"⚠️ 미러링 심볼 형식 오류, 건너뜀: {e}")
+                continue
+            if symbol in seen:
+                continue
+            seen.add(symbol)
+            symbols.append({'symbol': symbol, 'contract': contract})
+        return symbols
+
     def _parse_mirror_trading_mode(self, mode_str: str) -> bool:
         """미러링 모드 파싱"""
         if isinstance(mode_str, bool):
@@ -155,6 +201,49 @@ class Config:
         self.api_rate_limit = 10
         self.api_retry_count = 3
         self.api_timeout = 30
+        # 동일 GET 요청 병합 및 결과 재사용 시간(초) - 0이면 비활성화
+        self.request_coalesce_ttl = float(os.getenv('REQUEST_COALESCE_TTL', '1.0'))
+        
+        # 체결/입출금 로컬 원장 파일
+        self.trade_ledger_db = os.getenv('TRADE_LEDGER_DB', 'trade_ledger.db')
+        
+        # 미러링 상태 저널 (재시작 시 주문 매핑 복원, 빈 값이면 비활성화)
+        self.mirror_journal_db = os.getenv('MIRROR_JOURNAL_DB', 'mirror_state.db')
+        
+        # 미러링 단계별 지연 시간 내보내기 파일 (.prom/.txt는 Prometheus 텍스트, 그 외 JSON, 빈 값이면 비활성화)
+        self.mirror_latency_export = os.getenv('MIRROR_LATENCY_EXPORT', '')
+        self.mirror_latency_export_interval = float(os.getenv('MIRROR_LATENCY_EXPORT_INTERVAL', '60'))
+        
+        # 게이트 레버리지/마진 모드 캐시 감사 주기(초) - 이 시간이 지나면 캐시 대신 실제 조회
+        self.gate_account_state_audit_interval = float(os.getenv('GATE_ACCOUNT_STATE_AUDIT_INTERVAL', '300'))
+        
+        # 주문 사이징용 계정 자산 스냅샷 - 갱신 주기(초), 사이징에 허용하는 최대 경과 시간(초)
+        self.mirror_account_snapshot_interval = float(os.getenv('MIRROR_ACCOUNT_SNAPSHOT_INTERVAL', '5'))
+        self.mirror_account_snapshot_max_age = float(os.getenv('MIRROR_ACCOUNT_SNAPSHOT_MAX_AGE', '10'))
+        
+        # 웹소켓 스트리밍 (기본 비활성화, 폴링이 항상 폴백으로 동작)
+        self.ws_stream_enabled = os.getenv('ENABLE_WS_STREAM', 'false').lower() in ['true', '1', 'yes', 'on']
+        self.bitget_ws_public_url = os.getenv('BITGET_WS_PUBLIC_URL', 'wss://ws.bitget.com/v2/ws/public')
+        self.bitget_ws_private_url = os.getenv('BITGET_WS_PRIVATE_URL', 'wss://ws.bitget.com/v2/ws/private')
+        self.gate_ws_url = os.getenv('GATE_WS_URL', 'wss://fx-ws.gateio.ws/v4/ws/usdt')
+        self.ws_fallback_poll_interval = float(os.getenv('WS_FALLBACK_POLL_INTERVAL', '5'))
+        
+        # 미러 조정 엔진 (비활성화 시 기존 개별 모니터링 루프 사용)
+        self.mirror_event_engine = os.getenv('MIRROR_EVENT_ENGINE', 'true').lower() in ['true', '1', 'yes', 'on']
+        self.mirror_engine_tick_interval = float(os.getenv('MIRROR_ENGINE_TICK_INTERVAL', '0.5'))
+        
+        # 미러링 작업 차선별 동시 실행 수 (주문 처리 > 동기화 > 리포트/상태 순으로 우선)
+        self.mirror_lane_critical_limit = int(os.getenv('MIRROR_LANE_CRITICAL_LIMIT', '5'))
+        self.mirror_lane_reconcile_limit = int(os.getenv('MIRROR_LANE_RECONCILE_LIMIT', '1'))
+        self.mirror_lane_reporting_limit = int(os.getenv('MIRROR_LANE_REPORTING_LIMIT', '1'))
+        
+        # 추가 게이트 팔로워 계정 - "이름:복제비율" 쉼표 구분 (예: sub1:1.0,sub2:0.5)
+        # 계정별 API 키는 GATE_API_KEY_<이름>, GATE_API_SECRET_<이름> (이름은 대문자)
+        self.mirror_followers = self._parse_mirror_followers(os.getenv('MIRROR_FOLLOWERS', ''))
+        
+        # 추가 미러링 심볼 - 비트겟 심볼 쉼표 구분, 게이트 계약명이 다르면 "심볼:계약" (예: ETHUSDT,SOLUSDT)
+        # 심볼별 상태는 계약별로 분리 저장, 기본 심볼(BTCUSDT)은 항상 포함
+        self.mirror_symbols = self._parse_mirror_symbols(os.getenv('MIRROR_SYMBOLS', ''))
 
     @property
     def bitget_credentials(self) -> Dict[str, str]:
@@ -213,7 +302,11 @@ class Config:
             'gate_contract': self.gate_contract,
             'price_sync_threshold': self.price_sync_threshold,
             'position_sync_interval': self.position_sync_interval,
-            'order_sync_interval': self.order_sync_interval
+            'order_sync_interval': self.order_sync_interval,
+            'ws_stream_enabled': self.ws_stream_enabled,
+            'mirror_event_engine': self.mirror_event_engine,
+            'mirror_followers': [f"{follower['name']}:{follower['ratio']}x" for follower in self.mirror_followers],
+            'mirror_symbols': [self.symbol] + [item['symbol'] for item in self.mirror_symbols]
         }
 
     def get_trading_limits(self) -> Dict[str, float]:
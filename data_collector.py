@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from enum import Enum
 import json
 
+from http_pool import get_http_pool
+
 logger = logging.getLogger(__name__)
 
 class EventSeverity(Enum):
@@ -36,6 +38,7 @@ class RealTimeDataCollector:
         self.last_price = None
         self.price_history = []
         self.bitget_client = None
+        self.market_hub = None
         
         # 추가 API 키들
         self.coingecko_key = getattr(config, 'COINGECKO_API_KEY', None)
@@ -72,7 +75,7 @@ class RealTimeDataCollector:
     async def start(self):
         """데이터 수집 시작 - 뉴스 우선도 높임"""
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            self.session = get_http_pool().get_session('data_collector')
         
         logger.info("🚀 실시간 데이터 수집 시작 (Claude 번역 강화)")
         
@@ -148,7 +151,10 @@ class RealTimeDataCollector:
                     await asyncio.sleep(30)
                     continue
                 
-                ticker_data = await self.bitget_client.get_ticker('BTCUSDT')
+                if self.market_hub:
+                    ticker_data = await self.market_hub.get_ticker('BTCUSDT', max_age=30)
+                else:
+                    ticker_data = await self.bitget_client.get_ticker('BTCUSDT')
                 
                 if isinstance(ticker_data, dict):
                     current_price = float(ticker_data.get('last', 0))
@@ -480,6 +486,11 @@ class RealTimeDataCollector:
         self.bitget_client = bitget_client
         logger.info("✅ Bitget 클라이언트 설정 완료")
     
+    def set_market_hub(self, market_hub):
+        """시장 데이터 허브 설정"""
+        self.market_hub = market_hub
+        logger.info("✅ 시장 데이터 허브 설정 완료")
+    
     def update_news_stats(self, event_type: str, translation_type: str = None):
         """뉴스 처리 통계 업데이트"""
         self.news_stats['total_processed'] += 1
@@ -0,0 +1,164 @@
+import logging
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 지표별 필드
+METRIC_FIELDS = {
+    'open_interest': ('size',),
+    'account_long_short': ('long_ratio', 'short_ratio', 'long_short_ratio'),
+    'taker_volume': ('buy_volume', 'sell_volume')
+}
+
+
+class RingSeries:
+    """고정 크기 시계열 링 버퍼 - 시각(ms) 오름차순으로 쌓고 구간 조회는 이진 탐색"""
+
+    def __init__(self, fields: Sequence[str], capacity: int = 2016):
+        self.fields = tuple(fields)
+        self.capacity = capacity
+        self._ts = np.zeros(capacity, dtype=np.int64)
+        self._values = np.zeros((capacity, len(self.fields)), dtype=float)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _index(self, i: int) -> int:
+        return (self._start + i) % self.capacity
+
+    def last_ts(self) -> Optional[int]:
+        return int(self._ts[self._index(self._size - 1)]) if self._size else None
+
+    def append(self, ts: int, values: Sequence[float]) -> bool:
+        """새 샘플 추가 - 마지막보다 오래된 샘플은 무시, 같은 시각이면 덮어씀"""
+        last = self.last_ts()
+        if last is not None:
+            if ts < last:
+                return False
+            if ts == last:
+                self._values[self._index(self._size - 1)] = values
+                return True
+
+        if self._size < self.capacity:
+            pos = self._index(self._size)
+            self._size += 1
+        else:
+            pos = self._start
+            self._start = (self._start + 1) % self.capacity
+        self._ts[pos] = ts
+        self._values[pos] = values
+        return True
+
+    def extend(self, samples: List[Tuple[int, Sequence[float]]]) -> int:
+        """여러 샘플 추가 (시각 순 정렬 후) - 추가/갱신된 수 반환"""
+        return sum(1 for ts, values in sorted(samples, key=lambda s: s[0]) if self.append(ts, values))
+
+    def _ordered(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._size == 0:
+            return np.empty(0, dtype=np.int64), np.empty((0, len(self.fields)))
+        order = (self._start + np.arange(self._size)) % self.capacity
+        return self._ts[order], self._values[order]
+
+    def window(self, seconds: float, now_ms: int = None) -> Tuple[np.ndarray, np.ndarray]:
+        """최근 seconds 구간 (ts 배열, 값 배열)"""
+        ts, values = self._ordered()
+        now_ms = now_ms or int(time.time() * 1000)
+        lo = np.searchsorted(ts, now_ms - int(seconds * 1000), side='left')
+        return ts[lo:], values[lo:]
+
+    def latest(self, field: str) -> Optional[float]:
+        if self._size == 0:
+            return None
+        return float(self._values[self._index(self._size - 1), self.fields.index(field)])
+
+    def value_at(self, when_ms: int, field: str, tolerance_ms: int = None) -> Optional[float]:
+        """when_ms 시각 이전의 가장 가까운 값"""
+        ts, values = self._ordered()
+        i = np.searchsorted(ts, when_ms, side='right') - 1
+        if i < 0:
+            return None
+        if tolerance_ms is not None and when_ms - ts[i] > tolerance_ms:
+            return None
+        return float(values[i, self.fields.index(field)])
+
+    def change_percent(self, field: str, seconds: float, now_ms: int = None) -> Optional[float]:
+        """seconds 전 대비 변화율(%) - 이력이 부족하면 None"""
+        latest = self.latest(field)
+        now_ms = now_ms or int(time.time() * 1000)
+        # 창 길이의 25% 이내 오차만 허용
+        past = self.value_at(now_ms - int(seconds * 1000), field, tolerance_ms=int(seconds * 250))
+        if latest is None or not past:
+            return None
+        return (latest - past) / past * 100
+
+    def window_sum(self, field: str, seconds: float, now_ms: int = None) -> float:
+        _, values = self.window(seconds, now_ms)
+        return float(values[:, self.fields.index(field)].sum()) if len(values) else 0.0
+
+
+class DerivativesDataStore:
+    """미결제약정 / 롱숏 비율 / 테이커 매수·매도 거래량 시계열 (심볼별)"""
+
+    def __init__(self, capacity: int = 2016):
+        # 5분 간격 기준 7일
+        self.capacity = capacity
+        self._series: Dict[Tuple[str, str], RingSeries] = {}
+
+    def series(self, symbol: str, metric: str) -> RingSeries:
+        key = (symbol, metric)
+        if key not in self._series:
+            self._series[key] = RingSeries(METRIC_FIELDS[metric], self.capacity)
+        return self._series[key]
+
+    def record(self, symbol: str, metric: str, ts: int, values: Sequence[float]) -> bool:
+        return self.series(symbol, metric).append(ts, values)
+
+    def record_many(self, symbol: str, metric: str, samples: List[Tuple[int, Sequence[float]]]) -> int:
+        return self.series(symbol, metric).extend(samples)
+
+    def has_data(self, symbol: str, metric: str) -> bool:
+        return len(self._series.get((symbol, metric), ())) > 0
+
+    def get_summary(self, symbol: str) -> Dict:
+        """지표 계산용 요약 (Δ1h/Δ4h/Δ24h 등) - 데이터가 없는 항목은 생략"""
+        summary = {}
+
+        if self.has_data(symbol, 'open_interest'):
+            oi = self.series(symbol, 'open_interest')
+            summary['open_interest'] = {
+                'current': oi.latest('size'),
+                'change_1h': oi.change_percent('size', 3600),
+                'change_4h': oi.change_percent('size', 4 * 3600),
+                'change_24h': oi.change_percent('size', 24 * 3600),
+                'samples': len(oi)
+            }
+
+        if self.has_data(symbol, 'account_long_short'):
+            ls = self.series(symbol, 'account_long_short')
+            summary['long_short'] = {
+                'long_ratio': ls.latest('long_ratio'),
+                'short_ratio': ls.latest('short_ratio'),
+                'ratio': ls.latest('long_short_ratio'),
+                'ratio_change_4h': ls.change_percent('long_short_ratio', 4 * 3600),
+                'ratio_change_24h': ls.change_percent('long_short_ratio', 24 * 3600)
+            }
+
+        if self.has_data(symbol, 'taker_volume'):
+            taker = self.series(symbol, 'taker_volume')
+            summary['taker_volume'] = {}
+            for label, seconds in (('1h', 3600), ('4h', 4 * 3600), ('24h', 24 * 3600)):
+                buy = taker.window_sum('buy_volume', seconds)
+                sell = taker.window_sum('sell_volume', seconds)
+                summary['taker_volume'][label] = {
+                    'buy': buy,
+                    'sell': sell,
+                    'delta': buy - sell,
+                    'buy_ratio': buy / (buy + sell) if buy + sell > 0 else 0.5
+                }
+
+        return summary
@@ -10,9 +10,10 @@ logger = logging.getLogger(__name__)
 class ExceptionDetector:
     """예외 상황 감지 및 알림 - 비트코인 전용 강화 + 크리티컬 뉴스 필터링 강화"""
     
-    def __init__(self, bitget_client=None, telegram_bot=None):
+    def __init__(self, bitget_client=None, telegram_bot=None, market_hub=None):
         self.bitget_client = bitget_client
         self.telegram_bot = telegram_bot
+        self.market_hub = market_hub
         self.logger = logging.getLogger('exception_detector')
         
         # 임계값 설정 - 현실적으로
@@ -274,6 +275,18 @@ class ExceptionDetector:
             self.logger.error(f"가격 데이터 검증 중 오류: {e}")
             return self.last_valid_price  # 오류 시 마지막 유효 가격 반환
     
+    async def _get_ticker(self) -> Dict:
+        """티커 조회 - 시장 데이터 허브가 있으면 공유 캐시 사용"""
+        if self.market_hub:
+            return await self.market_hub.get_ticker('BTCUSDT', max_age=10)
+        return await self.bitget_client.get_ticker('BTCUSDT')
+    
+    async def _get_funding_rate(self) -> Dict:
+        """펀딩비 조회 - 시장 데이터 허브가 있으면 공유 캐시 사용"""
+        if self.market_hub:
+            return await self.market_hub.get_funding_rate('BTCUSDT', max_age=300)
+        return await self.bitget_client.get_funding_rate('BTCUSDT')
+    
     async def detect_all_anomalies(self) -> List[Dict]:
         """모든 이상 징후 감지"""
         anomalies = []
@@ -310,7 +323,7 @@ class ExceptionDetector:
             if not self.bitget_client:
                 return None
             
-            ticker = await self.bitget_client.get_ticker('BTCUSDT')
+            ticker = await self._get_ticker()
             if not ticker:
                 return None
             
@@ -383,7 +396,7 @@ class ExceptionDetector:
             if not self.bitget_client:
                 return None
             
-            ticker = await self.bitget_client.get_ticker('BTCUSDT')
+            ticker = await self._get_ticker()
             if not ticker:
                 return None
             
@@ -422,7 +435,7 @@ class ExceptionDetector:
             if not self.bitget_client:
                 return None
             
-            ticker = await self.bitget_client.get_ticker('BTCUSDT')
+            ticker = await self._get_ticker()
             if not ticker:
                 return None
             
@@ -461,7 +474,7 @@ class ExceptionDetector:
             if not self.bitget_client:
                 return None
             
-            funding_data = await self.bitget_client.get_funding_rate('BTCUSDT')
+            funding_data = await self._get_funding_rate()
             if not funding_data:
                 return None
             
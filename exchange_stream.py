@@ -0,0 +1,345 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import random
+import time
+from typing import Callable, Dict, List, Optional
+
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 스트림 이벤트 토픽 (거래소 공통)
+TOPIC_TICKER = 'ticker'
+TOPIC_ORDER = 'order'
+TOPIC_PLAN_ORDER = 'plan_order'
+TOPIC_POSITION = 'position'
+
+
+class ExchangeStreamClient:
+    """재연결 웹소켓 스트림 기본 클래스 - 거래소별 구독/인증/파싱만 하위 클래스에서 구현"""
+
+    name = 'exchange'
+
+    def __init__(self, url: str, ping_interval: float = 20.0):
+        self.url = url
+        self.ping_interval = ping_interval
+
+        self.handlers: Dict[str, List[Callable]] = {}
+        self.connected = False
+        self.running = False
+        self.last_message_time: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._ws = None
+
+        # 재연결 백오프
+        self.RECONNECT_BASE_DELAY = 1.0
+        self.RECONNECT_MAX_DELAY = 60.0
+        self.STALE_TIMEOUT = 60.0
+
+        self.stats = {
+            'connects': 0,
+            'disconnects': 0,
+            'messages': 0,
+            'events': 0,
+            'errors': 0
+        }
+
+    # ===== 핸들러 =====
+
+    def on(self, topic: str, handler: Callable):
+        """토픽별 이벤트 핸들러 등록 (동기/비동기 모두 가능)"""
+        self.handlers.setdefault(topic, []).append(handler)
+
+    async def _dispatch(self, topic: str, data: Dict):
+        self.stats['events'] += 1
+        for handler in self.handlers.get(topic, []):
+            try:
+                result = handler(data)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self.stats['errors'] += 1
+                logger.error(f"{self.name} 스트림 핸들러 오류 ({topic}): {e}")
+
+    # ===== 수명 주기 =====
+
+    def is_healthy(self) -> bool:
+        """연결되어 있고 최근 메시지를 받았는지"""
+        if not self.connected or self.last_message_time is None:
+            return False
+        return time.monotonic() - self.last_message_time < self.STALE_TIMEOUT
+
+    async def start(self):
+        if not WEBSOCKETS_AVAILABLE:
+            logger.warning(f"⚠️ websockets 모듈이 없어 {self.name} 스트림을 시작할 수 없습니다 (폴링 사용)")
+            return
+        if self._task and not self._task.done():
+            return
+        self.running = True
+        self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self):
+        self.running = False
+        if self._ws is not None:
+            try:
+                await self._ws.close()
+            except Exception:
+                pass
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.connected = False
+
+    async def _run_forever(self):
+        attempt = 0
+        while self.running:
+            try:
+                async with websockets.connect(self.url, ping_interval=None, close_timeout=5) as ws:
+                    self._ws = ws
+                    await self._on_connect(ws)
+                    self.connected = True
+                    self.last_message_time = time.monotonic()
+                    self.stats['connects'] += 1
+                    attempt = 0
+                    logger.info(f"✅ {self.name} 웹소켓 연결됨: {self.url}")
+
+                    ping_task = asyncio.create_task(self._ping_loop(ws))
+                    try:
+                        async for raw in ws:
+                            self.last_message_time = time.monotonic()
+                            self.stats['messages'] += 1
+                            await self._handle_raw(raw)
+                    finally:
+                        ping_task.cancel()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats['errors'] += 1
+                logger.warning(f"{self.name} 웹소켓 오류: {e}")
+
+            if self.connected:
+                self.stats['disconnects'] += 1
+            self.connected = False
+            self._ws = None
+
+            if not self.running:
+                break
+
+            # 지수 백오프 + 지터
+            delay = min(self.RECONNECT_BASE_DELAY * (2 ** attempt), self.RECONNECT_MAX_DELAY)
+            delay = delay * (0.5 + random.random() / 2)
+            attempt += 1
+            logger.info(f"🔄 {self.name} 웹소켓 재연결 대기 {delay:.1f}초 ({attempt}회)")
+            await asyncio.sleep(delay)
+
+    async def _ping_loop(self, ws):
+        try:
+            while True:
+                await asyncio.sleep(self.ping_interval)
+                await ws.send(self._ping_message())
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.debug(f"{self.name} 핑 전송 실패: {e}")
+
+    async def _handle_raw(self, raw):
+        if raw == 'pong':
+            return
+        try:
+            message = json.loads(raw)
+        except (ValueError, TypeError):
+            logger.debug(f"{self.name} 파싱 불가 메시지: {str(raw)[:100]}")
+            return
+
+        for topic, data in self._parse_message(message):
+            await self._dispatch(topic, data)
+
+    # ===== 하위 클래스 구현 =====
+
+    async def _on_connect(self, ws):
+        raise NotImplementedError
+
+    def _ping_message(self) -> str:
+        raise NotImplementedError
+
+    def _parse_message(self, message: Dict) -> List[tuple]:
+        raise NotImplementedError
+
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            'connected': self.connected,
+            'healthy': self.is_healthy(),
+            'url': self.url
+        }
+
+
+class BitgetStreamClient(ExchangeStreamClient):
+    """Bitget V2 웹소켓 - 공개(ticker) + 비공개(orders, orders-algo, positions)"""
+
+    name = 'Bitget'
+
+    CHANNEL_TOPICS = {
+        'ticker': TOPIC_TICKER,
+        'orders': TOPIC_ORDER,
+        'orders-algo': TOPIC_PLAN_ORDER,
+        'positions': TOPIC_POSITION
+    }
+
+    def __init__(self, config, url: str, private: bool = False, symbol: str = None):
+        super().__init__(url, ping_interval=25.0)
+        self.config = config
+        self.private = private
+        self.symbol = symbol or config.symbol
+        self.name = 'Bitget-private' if private else 'Bitget-public'
+        self.LOGIN_TIMEOUT = 10.0
+
+    def _login_args(self) -> Dict:
+        timestamp = str(int(time.time()))
+        message = timestamp + 'GET' + '/user/verify'
+        sign = base64.b64encode(
+            hmac.new(
+                self.config.bitget_api_secret.encode('utf-8'),
+                message.encode('utf-8'),
+                hashlib.sha256
+            ).digest()
+        ).decode()
+        return {
+            'apiKey': self.config.bitget_api_key,
+            'passphrase': self.config.bitget_passphrase,
+            'timestamp': timestamp,
+            'sign': sign
+        }
+
+    async def _on_connect(self, ws):
+        if self.private:
+            await ws.send(json.dumps({'op': 'login', 'args': [self._login_args()]}))
+            reply = json.loads(await asyncio.wait_for(ws.recv(), timeout=self.LOGIN_TIMEOUT))
+            if reply.get('event') != 'login' or str(reply.get('code', '0')) != '0':
+                raise ConnectionError(f"Bitget 웹소켓 로그인 실패: {reply}")
+
+            args = [
+                {'instType': 'USDT-FUTURES', 'channel': channel, 'instId': 'default'}
+                for channel in ('orders', 'orders-algo', 'positions')
+            ]
+        else:
+            args = [{'instType': 'USDT-FUTURES', 'channel': 'ticker', 'instId': self.symbol}]
+
+        await ws.send(json.dumps({'op': 'subscribe', 'args': args}))
+
+    def _ping_message(self) -> str:
+        return 'ping'
+
+    def _parse_message(self, message: Dict) -> List[tuple]:
+        if 'event' in message:
+            if message['event'] == 'error':
+                logger.warning(f"{self.name} 이벤트 오류: {message}")
+            return []
+
+        channel = message.get('arg', {}).get('channel')
+        topic = self.CHANNEL_TOPICS.get(channel)
+        if not topic:
+            return []
+
+        events = []
+        for item in message.get('data', []) or []:
+            if topic == TOPIC_TICKER:
+                item = self._normalize_ticker(item)
+            events.append((topic, item))
+        return events
+
+    @staticmethod
+    def _normalize_ticker(item: Dict) -> Dict:
+        """REST 티커와 같은 형태로 정규화 (BitgetClient._normalize_ticker_data 참고)"""
+        normalized = {'_original': item, '_source': 'ws'}
+        try:
+            normalized['last'] = float(item.get('lastPr', item.get('last', 0)) or 0)
+            normalized['high'] = float(item.get('high24h', 0) or 0)
+            normalized['low'] = float(item.get('low24h', 0) or 0)
+            normalized['volume'] = float(item.get('baseVolume', 0) or 0)
+            change = float(item.get('change24h', 0) or 0)
+            normalized['changeUtc'] = change / 100 if abs(change) > 1 else change
+        except (ValueError, TypeError):
+            normalized.setdefault('last', 0)
+            normalized.setdefault('changeUtc', 0)
+            normalized.setdefault('volume', 0)
+        return normalized
+
+
+class GateStreamClient(ExchangeStreamClient):
+    """Gate.io 선물 V4 웹소켓 - tickers + (user_id 있을 때) orders, autoorders, positions"""
+
+    name = 'Gate'
+
+    CHANNEL_TOPICS = {
+        'futures.tickers': TOPIC_TICKER,
+        'futures.orders': TOPIC_ORDER,
+        'futures.autoorders': TOPIC_PLAN_ORDER,
+        'futures.positions': TOPIC_POSITION
+    }
+
+    def __init__(self, config, url: str, contract: str = "BTC_USDT", user_id: str = None):
+        super().__init__(url, ping_interval=20.0)
+        self.config = config
+        self.contract = contract
+        self.user_id = user_id
+
+    def _sign(self, channel: str, event: str, t: int) -> str:
+        message = f"channel={channel}&event={event}&time={t}"
+        return hmac.new(
+            self.config.gate_api_secret.encode('utf-8'),
+            message.encode('utf-8'),
+            hashlib.sha512
+        ).hexdigest()
+
+    async def _on_connect(self, ws):
+        t = int(time.time())
+        await ws.send(json.dumps({
+            'time': t, 'channel': 'futures.tickers', 'event': 'subscribe', 'payload': [self.contract]
+        }))
+
+        if not self.user_id:
+            return
+
+        for channel in ('futures.orders', 'futures.autoorders', 'futures.positions'):
+            await ws.send(json.dumps({
+                'time': t,
+                'channel': channel,
+                'event': 'subscribe',
+                'payload': [str(self.user_id), self.contract],
+                'auth': {
+                    'method': 'api_key',
+                    'KEY': self.config.gate_api_key,
+                    'SIGN': self._sign(channel, 'subscribe', t)
+                }
+            }))
+
+    def _ping_message(self) -> str:
+        return json.dumps({'time': int(time.time()), 'channel': 'futures.ping'})
+
+    def _parse_message(self, message: Dict) -> List[tuple]:
+        if message.get('event') != 'update':
+            if message.get('error'):
+                logger.warning(f"{self.name} 이벤트 오류: {message}")
+            return []
+
+        topic = self.CHANNEL_TOPICS.get(message.get('channel'))
+        if not topic:
+            return []
+
+        result = message.get('result')
+        items = result if isinstance(result, list) else [result]
+        return [(topic, item) for item in items if item]
@@ -0,0 +1,157 @@
+"""
+오프라인 테스트용 가짜 거래소 웹소켓 서버 (Bitget V2 / Gate.io 선물 V4 프로토콜 최소 구현)
+
+실행:
+    python fake_exchange_ws.py --port 8765
+
+봇 연결:
+    ENABLE_WS_STREAM=true
+    BITGET_WS_PUBLIC_URL=ws://127.0.0.1:8765
+    BITGET_WS_PRIVATE_URL=ws://127.0.0.1:8765
+    GATE_WS_URL=ws://127.0.0.1:8765
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import time
+from typing import Dict, List, Set, Tuple
+
+import websockets
+
+logger = logging.getLogger(__name__)
+
+
+class FakeExchangeWebSocketServer:
+    """로그인/구독/핑을 응답하고, 테스트 코드가 원하는 이벤트를 구독자에게 푸시"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765):
+        self.host = host
+        self.port = port
+        self._server = None
+        # 연결별 구독: ws -> {('bitget', channel) | ('gate', channel)}
+        self.subscriptions: Dict[object, Set[Tuple[str, str]]] = {}
+        self.received: List[Dict] = []
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    async def start(self):
+        self._server = await websockets.serve(self._handler, self.host, self.port)
+        # 포트 0으로 띄운 경우 실제 포트 반영
+        sockets = self._server.sockets or []
+        if sockets:
+            self.port = sockets[0].getsockname()[1]
+        logger.info(f"가짜 거래소 웹소켓 서버 시작: {self.url}")
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handler(self, ws, path=None):
+        self.subscriptions[ws] = set()
+        try:
+            async for raw in ws:
+                if raw == 'ping':
+                    await ws.send('pong')
+                    continue
+                try:
+                    message = json.loads(raw)
+                except ValueError:
+                    continue
+                self.received.append(message)
+                await self._handle_message(ws, message)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self.subscriptions.pop(ws, None)
+
+    async def _handle_message(self, ws, message: Dict):
+        # Bitget
+        op = message.get('op')
+        if op == 'login':
+            await ws.send(json.dumps({'event': 'login', 'code': 0}))
+            return
+        if op == 'subscribe':
+            for arg in message.get('args', []):
+                self.subscriptions[ws].add(('bitget', arg.get('channel')))
+                await ws.send(json.dumps({'event': 'subscribe', 'arg': arg}))
+            return
+
+        # Gate.io
+        channel = message.get('channel')
+        if channel == 'futures.ping':
+            await ws.send(json.dumps({'time': int(time.time()), 'channel': 'futures.pong', 'event': '', 'result': None}))
+            return
+        if message.get('event') == 'subscribe' and channel:
+            self.subscriptions[ws].add(('gate', channel))
+            await ws.send(json.dumps({
+                'time': int(time.time()), 'channel': channel, 'event': 'subscribe',
+                'error': None, 'result': {'status': 'success'}
+            }))
+
+    async def _broadcast(self, key: Tuple[str, str], payload: str) -> int:
+        sent = 0
+        for ws, subs in list(self.subscriptions.items()):
+            if key in subs:
+                try:
+                    await ws.send(payload)
+                    sent += 1
+                except websockets.ConnectionClosed:
+                    pass
+        return sent
+
+    async def push_bitget(self, channel: str, data: List[Dict], inst_id: str = 'default', action: str = 'update') -> int:
+        """Bitget 형식 푸시 (channel: ticker/orders/orders-algo/positions)"""
+        payload = json.dumps({
+            'action': action,
+            'arg': {'instType': 'USDT-FUTURES', 'channel': channel, 'instId': inst_id},
+            'data': data,
+            'ts': int(time.time() * 1000)
+        })
+        return await self._broadcast(('bitget', channel), payload)
+
+    async def push_gate(self, channel: str, result) -> int:
+        """Gate.io 형식 푸시 (channel: futures.tickers/orders/autoorders/positions)"""
+        payload = json.dumps({
+            'time': int(time.time()), 'channel': channel, 'event': 'update', 'result': result
+        })
+        return await self._broadcast(('gate', channel), payload)
+
+    async def disconnect_all(self):
+        """모든 연결 강제 종료 (재연결 테스트용)"""
+        for ws in list(self.subscriptions.keys()):
+            await ws.close()
+
+
+async def _run_demo(host: str, port: int, interval: float):
+    server = FakeExchangeWebSocketServer(host, port)
+    await server.start()
+
+    price = 100000.0
+    while True:
+        price *= 1 + random.uniform(-0.0005, 0.0005)
+        await server.push_bitget('ticker', [{
+            'instId': 'BTCUSDT', 'lastPr': f"{price:.1f}", 'high24h': f"{price * 1.01:.1f}",
+            'low24h': f"{price * 0.99:.1f}", 'change24h': '0.0012', 'baseVolume': '12345.6',
+            'ts': str(int(time.time() * 1000))
+        }], inst_id='BTCUSDT', action='snapshot')
+        await server.push_gate('futures.tickers', [{
+            'contract': 'BTC_USDT', 'last': f"{price + random.uniform(-5, 5):.1f}"
+        }])
+        await asyncio.sleep(interval)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='가짜 거래소 웹소켓 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--interval', type=float, default=1.0, help='티커 푸시 간격(초)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run_demo(args.host, args.port, args.interval))
@@ -9,6 +9,9 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import pytz
 
+from rate_limiter import get_rate_limiter, current_priority, PRIORITY_NORMAL
+from http_pool import get_http_pool
+
 logger = logging.getLogger(__name__)
 
 class GateioMirrorClient:
@@ -21,6 +24,10 @@ class GateioMirrorClient:
         self.session = None
         self._initialize_session()
         
+        # 계정 단위 요청 예산 (같은 API 키를 쓰는 클라이언트끼리 공유)
+        self.rate_limiter = get_rate_limiter('gate', self.api_key)
+        self.default_priority = PRIORITY_NORMAL
+        
         # TP/SL 설정 상수
         self.TP_SL_TIMEOUT = 10
         self.MAX_TP_SL_RETRIES = 3
@@ -49,16 +56,7 @@ class GateioMirrorClient:
     def _initialize_session(self):
         if not self.session:
             timeout = aiohttp.ClientTimeout(total=30, connect=10)
-            connector = aiohttp.TCPConnector(
-                limit=100,
-                limit_per_host=30,
-                ttl_dns_cache=300,
-                use_dns_cache=True
-            )
-            self.session = aiohttp.ClientSession(
-                timeout=timeout,
-                connector=connector
-            )
+            self.session = get_http_pool().get_session('gate', timeout=timeout)
             logger.info("Gate.io 미러링 클라이언트 세션 초기화 완료")
     
     async def initialize(self):
@@ -311,7 +309,7 @@ class GateioMirrorClient:
             'Content-Type': 'application/json'
         }
     
-    async def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, data: Optional[Dict] = None, max_retries: int = 3) -> Dict:
+    async def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, data: Optional[Dict] = None, max_retries: int = 3, priority: Optional[int] = None) -> Dict:
         if not self.session:
             self._initialize_session()
         
@@ -326,8 +324,12 @@ class GateioMirrorClient:
         if data:
             payload = json.dumps(data)
         
+        request_priority = self.rate_limiter.priority_for(method, current_priority(self.default_priority) if priority is None else priority)
+        
         for attempt in range(max_retries):
             try:
+                # 토큰 획득 후 서명 생성 (대기 중 타임스탬프 만료 방지)
+                limit_group = await self.rate_limiter.acquire(method, endpoint, request_priority)
                 headers = self._generate_signature(method, endpoint, query_string, payload)
                 
                 logger.debug(f"Gate.io API 요청 (시도 {attempt + 1}/{max_retries}): {method} {endpoint}")
@@ -335,6 +337,13 @@ class GateioMirrorClient:
                 async with self.session.request(method, url, headers=headers, data=payload) as response:
                     response_text = await response.text()
                     
+                    if response.status == 429:
+                        self.rate_limiter.on_throttled(limit_group, response.headers)
+                        if attempt < max_retries - 1:
+                            continue
+                        else:
+                            raise Exception("HTTP 429: 요청 제한")
+                    
                     if response.status != 200:
                         error_msg = f"HTTP {response.status}: {response_text}"
                         logger.error(f"Gate.io API HTTP 오류: {error_msg}")
@@ -351,6 +360,8 @@ class GateioMirrorClient:
                         else:
                             raise Exception("빈 응답")
                     
+                    self.rate_limiter.on_success(limit_group, response.headers)
+                    
                     try:
                         return json.loads(response_text)
                     except json.JSONDecodeError as e:
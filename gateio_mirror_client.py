@@ -5,10 +5,14 @@ import hashlib
 import time
 import json
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import pytz
 
+from rate_limiter import get_rate_limiter, current_priority, PRIORITY_NORMAL
+from http_pool import get_http_pool
+from mirror_contracts import ContractSpec, default_contract_spec
+
 logger = logging.getLogger(__name__)
 
 class GateioMirrorClient:
@@ -21,20 +25,40 @@ class GateioMirrorClient:
         self.session = None
         self._initialize_session()
         
+        # 계정 단위 요청 예산 (같은 API 키를 쓰는 클라이언트끼리 공유)
+        self.rate_limiter = get_rate_limiter('gate', self.api_key)
+        self.default_priority = PRIORITY_NORMAL
+        
         self.TP_SL_TIMEOUT = 10
         self.MAX_TP_SL_RETRIES = 3
         
+        # 여러 주문 생성/취소 시 동시 요청 수 (요청 예산은 rate_limiter가 관리)
+        self.BATCH_CONCURRENCY = 5
+        
         self.DEFAULT_LEVERAGE = 30
         self.MAX_LEVERAGE = 100
         self.MIN_LEVERAGE = 1
-        self.current_leverage_cache = {}
+        
+        # 미러링 대상 계약 (계약 인자를 생략한 호출의 기본값) - 명세는 mirror_trading에서 조회 후 적용
+        self.GATE_CONTRACT = getattr(config, 'gate_contract', 'BTC_USDT')
+        self.contract_spec: Optional[ContractSpec] = default_contract_spec(self.GATE_CONTRACT)
         
         # 마진 모드 강제 설정 - 무조건 Cross 강제
         self.FORCE_CROSS_MARGIN = True
         self.DEFAULT_MARGIN_MODE = "cross"
+        
+        # 계정 설정(레버리지/마진 모드) 캐시 {contract: (확인 시각, 값)}
+        # 변경 호출, 포지션 이벤트 시 무효화되고 감사 주기가 지나면 다시 실제 조회
+        self.ACCOUNT_STATE_AUDIT_INTERVAL = getattr(config, 'gate_account_state_audit_interval', 300)
+        self.current_leverage_cache = {}
+        # 계약별 레버리지 설정 직렬화 - 동시에 들어온 주문들이 같은 설정을 중복 요청하지 않고 첫 결과(캐시)를 사용
+        self.leverage_locks: Dict[str, asyncio.Lock] = {}
         self.current_margin_mode_cache = {}
+        self.account_state_stats = {'cache_hits': 0, 'probes': 0, 'invalidations': 0}
         self.margin_mode_force_attempts = 0
         self.max_margin_mode_attempts = 10
+        # Cross 강제 설정 진행 중인 계약 (포지션 없을 때 마진 모드 조회 ↔ 강제 설정 재귀 방지)
+        self.cross_mode_forcing = set()
         
         # 지원되는 마진 모드 매핑 - 무조건 Cross 모드만 지원
         self.MARGIN_MODE_MAPPING = {
@@ -47,66 +71,73 @@ class GateioMirrorClient:
     def _initialize_session(self):
         if not self.session:
             timeout = aiohttp.ClientTimeout(total=30, connect=10)
-            connector = aiohttp.TCPConnector(
-                limit=100,
-                limit_per_host=30,
-                ttl_dns_cache=300,
-                use_dns_cache=True)
-            self.session = aiohttp.ClientSession(
-                timeout=timeout,
-                connector=connector)
+            self.session = get_http_pool().get_session('gate_mirror', timeout=timeout)
             logger.info("Gate.io 미러링 클라이언트 세션 초기화 완료")
     
     async def initialize(self):
         self._initialize_session()
         
         # 🔥 비트겟 실제 레버리지를 가져와서 게이트에 강제 동기화
-        try:        logger.info("🔍 비트겟 실제 레버리지 조회하여 게이트에 동기화 시작")
+        try:
+            logger.info("🔍 비트겟 실제 레버리지 조회하여 게이트에 동기화 시작")
             
             # 비트겟의 실제 레버리지를 가져오는 임시 코드 (정확한 클라이언트 참조 필요)
             # 이 부분은 mirror_trading.py에서 실제 비트겟 레버리지를 전달받아야 합니다.
             target_leverage = self.DEFAULT_LEVERAGE  # 일단 기본값 사용
             
             # 현재 게이트 레버리지 확인
-            current_leverage = await self.get_current_leverage("BTC_USDT")        logger.info(f"🔍 현재 게이트 레버리지: {current_leverage}x")
+            current_leverage = await self.get_current_leverage(self.GATE_CONTRACT)
+            logger.info(f"🔍 현재 게이트 레버리지: {current_leverage}x")
             
             # 레버리지 동기화 필요 시 강제 설정
-            if current_leverage != target_leverage:        logger.info(f"🔄 레버리지 동기화 필요: {current_leverage}x → {target_leverage}x")
-                await self.set_leverage("BTC_USDT", target_leverage)        logger.info(f"✅ 레버리지 동기화 완료: {target_leverage}x")
-            else:        logger.info(f"✅ 레버리지 이미 동기화됨: {target_leverage}x")
+            if current_leverage != target_leverage:
+                logger.info(f"🔄 레버리지 동기화 필요: {current_leverage}x → {target_leverage}x")
+                await self.set_leverage(self.GATE_CONTRACT, target_leverage)
+                logger.info(f"✅ 레버리지 동기화 완료: {target_leverage}x")
+            else:
+                logger.info(f"✅ 레버리지 이미 동기화됨: {target_leverage}x")
                 
         except Exception as e:
             logger.error(f"레버리지 동기화 실패: {e}")
         
-        # 🔥 무조건 Cross 마진 모드 강제 설정 (Isolated 관련 코드 완전 제거)        logger.info("🔥 Gate.io Cross 마진 모드 강제 설정 시작 (Isolated 지원 안 함)")
+        # 🔥 무조건 Cross 마진 모드 강제 설정 (Isolated 관련 코드 완전 제거)
+        logger.info("🔥 Gate.io Cross 마진 모드 강제 설정 시작 (Isolated 지원 안 함)")
         
         # 먼저 실제 상태 확인
-        current_margin_mode = await self.get_current_margin_mode("BTC_USDT")        logger.info(f"🔍 현재 실제 마진 모드: {current_margin_mode}")
+        current_margin_mode = await self.get_current_margin_mode(self.GATE_CONTRACT)
+        logger.info(f"🔍 현재 실제 마진 모드: {current_margin_mode}")
         
         # 상태가 isolated인 경우 강제 변경
         if current_margin_mode == "isolated":
             logger.warning("⚠️ 마진 모드가 ISOLATED로 확인됨! 강제 변경 필요")
             
-        cross_success = await self.force_cross_margin_mode_aggressive("BTC_USDT")
+        cross_success = await self.force_cross_margin_mode_aggressive(self.GATE_CONTRACT)
         
-        if cross_success:        logger.info("✅ Gate.io Cross 마진 모드 강제 설정 완료 (Isolated 지원 안 함)")
+        if cross_success:
+            logger.info("✅ Gate.io Cross 마진 모드 강제 설정 완료 (Isolated 지원 안 함)")
         else:
-            logger.warning("⚠️ Gate.io Cross 마진 모드 자동 설정 실패 - 수동 설정 필요 (Isolated 지원 안 함)")        logger.info("Gate.io 미러링 클라이언트 초기화 완료")
+            logger.warning("⚠️ Gate.io Cross 마진 모드 자동 설정 실패 - 수동 설정 필요 (Isolated 지원 안 함)")
+        logger.info("Gate.io 미러링 클라이언트 초기화 완료")
     
-    async def sync_leverage_with_bitget(self, bitget_leverage: int, contract: str = "BTC_USDT") -> bool:
+    async def sync_leverage_with_bitget(self, bitget_leverage: int, contract: str = None) -> bool:
         """🔥 비트겟 레버리지와 동기화"""
-        try:        logger.info(f"🔄 비트겟 레버리지와 동기화 시작: {bitget_leverage}x → {contract}")
+        contract = contract or self.GATE_CONTRACT
+        try:
+            logger.info(f"🔄 비트겟 레버리지와 동기화 시작: {bitget_leverage}x → {contract}")
             
             # 현재 게이트 레버리지 확인
-            current_gate_leverage = await self.get_current_leverage(contract)        logger.info(f"🔍 현재 게이트 레버리지: {current_gate_leverage}x")
+            current_gate_leverage = await self.get_current_leverage(contract)
+            logger.info(f"🔍 현재 게이트 레버리지: {current_gate_leverage}x")
             
-            if current_gate_leverage == bitget_leverage:        logger.info(f"✅ 레버리지 이미 동기화됨: {bitget_leverage}x")
+            if current_gate_leverage == bitget_leverage:
+                logger.info(f"✅ 레버리지 이미 동기화됨: {bitget_leverage}x")
                 return True
             
             # 레버리지 동기화 실행
             sync_result = await self.mirror_bitget_leverage(bitget_leverage, contract)
             
-            if sync_result:        logger.info(f"✅ 레버리지 동기화 완료: {current_gate_leverage}x → {bitget_leverage}x")
+            if sync_result:
+                logger.info(f"✅ 레버리지 동기화 완료: {current_gate_leverage}x → {bitget_leverage}x")
                 return True
             else:
                 logger.error(f"❌ 레버리지 동기화 실패: {current_gate_leverage}x → {bitget_leverage}x")
@@ -116,7 +147,8 @@ class GateioMirrorClient:
             logger.error(f"레버리지 동기화 중 오류: {e}")
             return False
     
-    async def ensure_cross_margin_mode_before_order(self, contract: str = "BTC_USDT") -> bool:
+    async def ensure_cross_margin_mode_before_order(self, contract: str = None) -> bool:
+        contract = contract or self.GATE_CONTRACT
         # 주문 생성 전 마진 모드 실시간 체크 및 강제 설정
         try:
             current_mode = await self.get_current_margin_mode(contract)
@@ -127,7 +159,8 @@ class GateioMirrorClient:
             logger.warning(f"주문 생성 전 마진 모드 확인: {current_mode} → Cross로 강제 변경 시도")
             success = await self.force_cross_margin_mode_aggressive(contract)
             
-            if success:        logger.info(f"주문 생성 전 마진 모드 강제 변경 성공: Cross")
+            if success:
+                logger.info(f"주문 생성 전 마진 모드 강제 변경 성공: Cross")
                 return True
             else:
                 logger.error(f"주문 생성 전 마진 모드 강제 변경 실패")
@@ -137,33 +170,55 @@ class GateioMirrorClient:
             logger.error(f"주문 생성 전 마진 모드 체크 실패: {e}")
             return False
     
-    async def force_cross_margin_mode_aggressive(self, contract: str = "BTC_USDT") -> bool:
+    async def force_cross_margin_mode_aggressive(self, contract: str = None) -> bool:
+        """🔥 Gate.io Cross 마진 모드 강제 설정 - 이미 진행 중이면 바로 실패 반환 (마진 모드 조회에서 다시 호출되는 경우)"""
+        contract = contract or self.GATE_CONTRACT
+        if contract in self.cross_mode_forcing:
+            logger.debug(f"Cross 마진 모드 강제 설정 진행 중 - 중복 호출 건너뜀: {contract}")
+            return False
+        
+        self.cross_mode_forcing.add(contract)
+        try:
+            return await self._force_cross_margin_mode_aggressive(contract)
+        finally:
+            self.cross_mode_forcing.discard(contract)
+    
+    async def _force_cross_margin_mode_aggressive(self, contract: str) -> bool:
         """🔥 Gate.io Cross 마진 모드 강제 설정 - Isolated 관련 코드 완전 제거"""
-        try:        logger.info(f"🔥 Gate.io Cross 마진 모드 강제 설정 시작: {contract} (Isolated 지원 안 함)")
+        try:
+            logger.info(f"🔥 Gate.io Cross 마진 모드 강제 설정 시작: {contract} (Isolated 지원 안 함)")
             
-            current_mode = await self.get_current_margin_mode(contract)        logger.info(f"🔍 현재 마진 모드: {current_mode} (무조건 Cross로 강제 변경)")
+            current_mode = await self.get_current_margin_mode(contract)
+            logger.info(f"🔍 현재 마진 모드: {current_mode} (무조건 Cross로 강제 변경)")
             
-            if current_mode == "cross":        logger.info("✅ 이미 Cross 마진 모드입니다 (Isolated 지원 안 함)")
+            if current_mode == "cross":
+                logger.info("✅ 이미 Cross 마진 모드입니다 (Isolated 지원 안 함)")
                 return True
             
             # 방법 1: Cross 모드 전환 API 직접 호출
             success_method1 = await self._try_cross_mode_api(contract)
-            if success_method1:        logger.info("방법 1 성공: Cross 모드 API 호출")
+            if success_method1:
+                logger.info("방법 1 성공: Cross 모드 API 호출")
                 return True
             
             # 방법 2: 포지션 기반 마진 모드 변경
             success_method2 = await self._try_position_margin_mode_change(contract)
-            if success_method2:        logger.info("방법 2 성공: 포지션 기반 마진 모드 변경")
+            if success_method2:
+                logger.info("방법 2 성공: 포지션 기반 마진 모드 변경")
                 return True
             
             # 방법 3: 계정 설정 기반 마진 모드 변경
             success_method3 = await self._try_account_margin_mode_change(contract)
-            if success_method3:        logger.info("방법 3 성공: 계정 설정 기반 마진 모드 변경")
+            if success_method3:
+                logger.info("방법 3 성공: 계정 설정 기반 마진 모드 변경")
                 return True
             
             # 방법 4: 포지션 종료 후 Cross 모드로 재생성
             success_method4 = await self._try_position_reset_for_cross(contract)
-            if success_method4:        logger.info("방법 4 성공: 포지션 리셋 후 Cross 모드 설정")
+            if success_method4:
+                logger.info("방법 4 성공: 포지션 리셋 후 Cross 모드 설정")
+                # 포지션이 없어 확인할 수 없으므로 감사 주기까지 Cross로 간주 (매 주문마다 재시도 방지)
+                self.current_margin_mode_cache[contract] = (datetime.now(), 'cross')
                 return True
             
             logger.warning(f"모든 방법 실패 - 수동으로 Cross 마진 모드 설정 필요")
@@ -175,18 +230,23 @@ class GateioMirrorClient:
     
     async def _try_cross_mode_api(self, contract: str) -> bool:
         # 방법 1: Gate.io 공식 Cross 모드 전환 API
-        try:        logger.info("방법 1: Cross 모드 전환 API 호출 시도")
+        try:
+            logger.info("방법 1: Cross 모드 전환 API 호출 시도")
             
             endpoint = f"/api/v4/futures/usdt/positions/cross_mode"
-            data = {}  # Cross 모드로 전환하는 API        logger.info(f"Cross 모드 전환 API 호출")
+            data = {}  # Cross 모드로 전환하는 API
+            logger.info(f"Cross 모드 전환 API 호출")
             response = await self._request('POST', endpoint, data=data)
+            self.invalidate_account_state(contract)
             
             await asyncio.sleep(2)
-            new_mode = await self.get_current_margin_mode(contract)
+            new_mode = await self.get_current_margin_mode(contract, use_cache=False)
             
-            if new_mode == "cross":        logger.info("Cross 모드 전환 API 성공")
+            if new_mode == "cross":
+                logger.info("Cross 모드 전환 API 성공")
                 return True
-            else:        logger.info(f"Cross 모드 전환 API 실패: {new_mode}")
+            else:
+                logger.info(f"Cross 모드 전환 API 실패: {new_mode}")
                 return False
             
         except Exception as e:
@@ -194,11 +254,13 @@ class GateioMirrorClient:
             return False
     
     async def _try_position_margin_mode_change(self, contract: str) -> bool:
-        try:        logger.info("방법 2: 포지션 기반 마진 모드 변경 시도")
+        try:
+            logger.info("방법 2: 포지션 기반 마진 모드 변경 시도")
             
             positions = await self.get_positions(contract)
             
-            if not positions:        logger.info("포지션이 없어 포지션 기반 변경 불가")
+            if not positions:
+                logger.info("포지션이 없어 포지션 기반 변경 불가")
                 return False
             
             position = positions[0]
@@ -206,15 +268,19 @@ class GateioMirrorClient:
             endpoint = f"/api/v4/futures/usdt/positions/{contract}/margin_mode"
             data = {
                 "margin_mode": "cross"
-            }        logger.info(f"포지션 마진 모드 변경 API 호출: {data}")
+            }
+            logger.info(f"포지션 마진 모드 변경 API 호출: {data}")
             response = await self._request('POST', endpoint, data=data)
+            self.invalidate_account_state(contract)
             
             await asyncio.sleep(2)
-            new_mode = await self.get_current_margin_mode(contract)
+            new_mode = await self.get_current_margin_mode(contract, use_cache=False)
             
-            if new_mode == "cross":        logger.info("포지션 기반 마진 모드 변경 성공")
+            if new_mode == "cross":
+                logger.info("포지션 기반 마진 모드 변경 성공")
                 return True
-            else:        logger.info(f"포지션 기반 변경 실패: {new_mode}")
+            else:
+                logger.info(f"포지션 기반 변경 실패: {new_mode}")
                 return False
             
         except Exception as e:
@@ -222,21 +288,26 @@ class GateioMirrorClient:
             return False
     
     async def _try_account_margin_mode_change(self, contract: str) -> bool:
-        try:        logger.info("방법 3: 계정 설정 기반 마진 모드 변경 시도")
+        try:
+            logger.info("방법 3: 계정 설정 기반 마진 모드 변경 시도")
             
             endpoint = "/api/v4/futures/usdt/account/margin_mode"
             data = {
                 "margin_mode": "cross",
                 "contract": contract
-            }        logger.info(f"계정 마진 모드 변경 API 호출: {data}")
+            }
+            logger.info(f"계정 마진 모드 변경 API 호출: {data}")
             response = await self._request('POST', endpoint, data=data)
+            self.invalidate_account_state(contract)
             
             await asyncio.sleep(2)
-            new_mode = await self.get_current_margin_mode(contract)
+            new_mode = await self.get_current_margin_mode(contract, use_cache=False)
             
-            if new_mode == "cross":        logger.info("계정 기반 마진 모드 변경 성공")
+            if new_mode == "cross":
+                logger.info("계정 기반 마진 모드 변경 성공")
                 return True
-            else:        logger.info(f"계정 기반 변경 실패: {new_mode}")
+            else:
+                logger.info(f"계정 기반 변경 실패: {new_mode}")
                 return False
             
         except Exception as e:
@@ -244,17 +315,20 @@ class GateioMirrorClient:
             return False
     
     async def _try_position_reset_for_cross(self, contract: str) -> bool:
-        try:        logger.info("방법 4: 포지션 리셋을 통한 Cross 모드 설정 시도")
+        try:
+            logger.info("방법 4: 포지션 리셋을 통한 Cross 모드 설정 시도")
             
             positions = await self.get_positions(contract)
             
-            if not positions:        logger.info("포지션이 없어 리셋 불가, 새 포지션은 Cross로 생성될 예정")
+            if not positions:
+                logger.info("포지션이 없어 리셋 불가, 새 포지션은 Cross로 생성될 예정")
                 return True
             
             position = positions[0]
             current_size = int(position.get('size', 0))
             
-            if current_size == 0:        logger.info("포지션 크기가 0, 새 포지션은 Cross로 생성될 예정")
+            if current_size == 0:
+                logger.info("포지션 크기가 0, 새 포지션은 Cross로 생성될 예정")
                 return True
             
             logger.warning(f"활성 포지션({current_size}) 있음 - 리셋 건너뛰기")
@@ -283,7 +357,7 @@ class GateioMirrorClient:
             'Content-Type': 'application/json'
         }
     
-    async def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, data: Optional[Dict] = None, max_retries: int = 3) -> Dict:
+    async def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, data: Optional[Dict] = None, max_retries: int = 3, priority: Optional[int] = None) -> Dict:
         if not self.session:
             self._initialize_session()
         
@@ -298,8 +372,12 @@ class GateioMirrorClient:
         if data:
             payload = json.dumps(data)
         
+        request_priority = self.rate_limiter.priority_for(method, current_priority(self.default_priority) if priority is None else priority)
+        
         for attempt in range(max_retries):
             try:
+                # 토큰 획득 후 서명 생성 (대기 중 타임스탬프 만료 방지)
+                limit_group = await self.rate_limiter.acquire(method, endpoint, request_priority)
                 headers = self._generate_signature(method, endpoint, query_string, payload)
                 
                 logger.debug(f"Gate.io API 요청 (시도 {attempt + 1}/{max_retries}): {method} {endpoint}")
@@ -307,6 +385,13 @@ class GateioMirrorClient:
                 async with self.session.request(method, url, headers=headers, data=payload) as response:
                     response_text = await response.text()
                     
+                    if response.status == 429:
+                        self.rate_limiter.on_throttled(limit_group, response.headers)
+                        if attempt < max_retries - 1:
+                            continue
+                        else:
+                            raise Exception("HTTP 429: 요청 제한")
+                    
                     if response.status != 200:
                         error_msg = f"HTTP {response.status}: {response_text}"
                         logger.error(f"Gate.io API HTTP 오류: {error_msg}")
@@ -323,6 +408,8 @@ class GateioMirrorClient:
                         else:
                             raise Exception("빈 응답")
                     
+                    self.rate_limiter.on_success(limit_group, response.headers)
+                    
                     try:
                         return json.loads(response_text)
                     except json.JSONDecodeError as e:
@@ -353,23 +440,33 @@ class GateioMirrorClient:
                 else:
                     raise
     
-    async def get_current_margin_mode(self, contract: str = "BTC_USDT") -> str:
-        """🔥 실제 Gate.io 마진 모드 조회 - 실제 상태 확인 후 강제 변경"""
+    async def get_current_margin_mode(self, contract: str = None, use_cache: bool = True) -> str:
+        """🔥 Gate.io 마진 모드 - 확인된 Cross 상태는 캐시 사용, 아니면 실제 상태 확인 후 강제 변경"""
+        contract = contract or self.GATE_CONTRACT
         try:
-            # 🔥 캐시 사용 안 함 - 실시간 상태 확인        logger.info(f"🔍 Gate.io 실제 마진 모드 조회 시작: {contract}")
+            if use_cache:
+                cached_mode = self._get_cached_account_state(self.current_margin_mode_cache, contract)
+                if cached_mode is not None:
+                    return cached_mode
+            
+            logger.info(f"🔍 Gate.io 실제 마진 모드 조회 시작: {contract}")
+            self.account_state_stats['probes'] += 1
             
             positions = await self.get_positions(contract)
             
             if positions:
                 position = positions[0]
-                actual_margin_mode = position.get('mode', '').lower()        logger.info(f"🔍 포지션에서 발견한 실제 마진 모드: {actual_margin_mode}")
+                self._remember_position_state(contract, position)
+                actual_margin_mode = position.get('mode', '').lower()
+                logger.info(f"🔍 포지션에서 발견한 실제 마진 모드: {actual_margin_mode}")
                 
                 # 🔥 실제 상태가 isolated인 경우 즉시 강제 변경
                 if actual_margin_mode == 'isolated':
                     logger.warning(f"⚠️ 실제 마진 모드가 ISOLATED로 발견됨! 즉시 Cross로 강제 변경 시도")
                     await self.force_cross_margin_mode_aggressive(contract)
                     return "isolated"  # 실제 상태 반환 (강제 변경은 별도로)
-                elif actual_margin_mode == 'cross':        logger.info(f"✅ 실제 마진 모드가 CROSS로 정상 확인됨")
+                elif actual_margin_mode == 'cross':
+                    logger.info(f"✅ 실제 마진 모드가 CROSS로 정상 확인됨")
                     return "cross"
                 else:
                     logger.warning(f"🔍 알 수 없는 마진 모드: {actual_margin_mode} → Cross로 강제 변경 시도")
@@ -377,7 +474,8 @@ class GateioMirrorClient:
                     return actual_margin_mode or "unknown"
             else:
                 # 포지션이 없을 때 계정 설정 확인 시도
-                try:        logger.info(f"🔍 포지션이 없어 계정 정보에서 마진 모드 확인")
+                try:
+                    logger.info(f"🔍 포지션이 없어 계정 정보에서 마진 모드 확인")
                     endpoint = "/api/v4/futures/usdt/account"
                     account_info = await self._request('GET', endpoint)
                     logger.debug(f"계정 정보 응답: {account_info}")
@@ -395,6 +493,41 @@ class GateioMirrorClient:
             logger.error(f"현재 마진 모드 조회 실패: {e}")
             return "unknown"
     
+    def _get_cached_account_state(self, cache: Dict, contract: str):
+        entry = cache.get(contract)
+        if entry and (datetime.now() - entry[0]).total_seconds() < self.ACCOUNT_STATE_AUDIT_INTERVAL:
+            self.account_state_stats['cache_hits'] += 1
+            return entry[1]
+        return None
+    
+    def _remember_position_state(self, contract: str, position: Dict):
+        """포지션 조회 결과의 레버리지/마진 모드 캐시 (Cross가 확인된 경우만 마진 모드 기록)"""
+        now = datetime.now()
+        if str(position.get('mode', '')).lower() == 'cross':
+            self.current_margin_mode_cache[contract] = (now, 'cross')
+        else:
+            self.current_margin_mode_cache.pop(contract, None)
+        try:
+            self.current_leverage_cache[contract] = (now, int(float(position.get('leverage'))))
+        except (ValueError, TypeError):
+            pass
+    
+    def invalidate_account_state(self, contract: str = None):
+        """레버리지/마진 모드 캐시 무효화 - 다음 조회는 실제 상태 확인"""
+        for cache in (self.current_leverage_cache, self.current_margin_mode_cache):
+            if contract is None:
+                cache.clear()
+            else:
+                cache.pop(contract, None)
+        self.account_state_stats['invalidations'] += 1
+    
+    def get_account_state_stats(self) -> Dict:
+        return {
+            **self.account_state_stats,
+            'leverage': {contract: value for contract, (_, value) in self.current_leverage_cache.items()},
+            'margin_mode': {contract: value for contract, (_, value) in self.current_margin_mode_cache.items()}
+        }
+    
     def _normalize_margin_mode(self, mode: str) -> str:
         """🔥 마진 모드 정규화 - 무조건 Cross 모드만 반환 (Isolated 관련 코드 완전 제거)"""
         try:
@@ -410,10 +543,12 @@ class GateioMirrorClient:
     
     async def set_margin_mode(self, contract: str, mode: str = "cross") -> Dict:
         """🔥 마진 모드 설정 - 무조건 Cross 모드만 설정 (Isolated 관련 코드 완전 제거)"""
-        try:        logger.info(f"Gate.io 마진 모드 설정 요청: {contract} - Cross 모드 강제")
+        try:
+            logger.info(f"Gate.io 마진 모드 설정 요청: {contract} - Cross 모드 강제")
             
             # 🔥 무조건 Cross로 강제 - Isolated 관련 코드 완전 제거
-            mode = "cross"        logger.info(f"🔥 강제 Cross 모드 적용: {mode} (Isolated 지원 안 함)")
+            mode = "cross"
+            logger.info(f"🔥 강제 Cross 모드 적용: {mode} (Isolated 지원 안 함)")
             
             # Cross 모드만 지원하는 검증
             if mode not in self.SUPPORTED_MARGIN_MODES:
@@ -448,12 +583,15 @@ class GateioMirrorClient:
                 "recommendation": "수동으로 Cross 마진 모드 설정을 권장합니다 (Isolated 지원 안 함)"
             }
     
-    async def ensure_cross_margin_mode(self, contract: str = "BTC_USDT") -> bool:
-        try:        logger.info(f"Cross 마진 모드 보장 시작: {contract}")
+    async def ensure_cross_margin_mode(self, contract: str = None) -> bool:
+        contract = contract or self.GATE_CONTRACT
+        try:
+            logger.info(f"Cross 마진 모드 보장 시작: {contract}")
             
             success = await self.force_cross_margin_mode_aggressive(contract)
             
-            if success:        logger.info(f"Cross 마진 모드 보장 성공: {contract}")
+            if success:
+                logger.info(f"Cross 마진 모드 보장 성공: {contract}")
                 return True
             else:
                 logger.warning(f"Cross 마진 모드 자동 설정 실패: {contract}")
@@ -463,7 +601,8 @@ class GateioMirrorClient:
             logger.error(f"Cross 마진 모드 확인 실패: {e}")
             return False
     
-    async def get_current_price(self, contract: str = "BTC_USDT") -> float:
+    async def get_current_price(self, contract: str = None) -> float:
+        contract = contract or self.GATE_CONTRACT
         try:
             ticker = await self.get_ticker(contract)
             if ticker:
@@ -474,7 +613,8 @@ class GateioMirrorClient:
             logger.error(f"현재가 조회 실패: {e}")
             return 0.0
     
-    async def get_ticker(self, contract: str = "BTC_USDT") -> Dict:
+    async def get_ticker(self, contract: str = None) -> Dict:
+        contract = contract or self.GATE_CONTRACT
         try:
             endpoint = f"/api/v4/futures/usdt/tickers"
             params = {'contract': contract}
@@ -496,6 +636,17 @@ class GateioMirrorClient:
             logger.error(f"Gate.io 티커 조회 실패: {e}")
             return {}
     
+    async def get_contract_spec(self, contract: str = None) -> Dict:
+        """계약 명세 (quanto_multiplier, order_price_round, leverage_min/max 등)"""
+        contract = contract or self.GATE_CONTRACT
+        return await self._request('GET', f"/api/v4/futures/usdt/contracts/{contract}")
+    
+    def _format_price(self, price: float) -> str:
+        """주문 가격 문자열 - 계약 명세가 있으면 가격 단위로 반올림"""
+        if self.contract_spec:
+            price = self.contract_spec.round_price(price)
+        return str(price)
+    
     async def get_account_balance(self) -> Dict:
         try:
             endpoint = "/api/v4/futures/usdt/accounts"
@@ -505,7 +656,8 @@ class GateioMirrorClient:
             logger.error(f"계정 잔고 조회 실패: {e}")
             raise
     
-    async def get_positions(self, contract: str = "BTC_USDT") -> List[Dict]:
+    async def get_positions(self, contract: str = None) -> List[Dict]:
+        contract = contract or self.GATE_CONTRACT
         try:
             endpoint = f"/api/v4/futures/usdt/positions/{contract}"
             response = await self._request('GET', endpoint)
@@ -518,23 +670,33 @@ class GateioMirrorClient:
             logger.error(f"포지션 조회 실패: {e}")
             return []
     
-    async def get_current_leverage(self, contract: str) -> int:
-        """🔥 실제 Gate.io 레버리지 조회 - 실시간 상태 확인"""
+    async def get_current_leverage(self, contract: str, use_cache: bool = True) -> int:
+        """🔥 Gate.io 레버리지 - 캐시가 유효하면 캐시, 아니면 실제 상태 확인"""
         try:
-            # 🔥 캐시 사용 안 함 - 실시간 상태 확인        logger.info(f"🔍 Gate.io 실제 레버리지 조회 시작: {contract}")
+            if use_cache:
+                cached_leverage = self._get_cached_account_state(self.current_leverage_cache, contract)
+                if cached_leverage is not None:
+                    return cached_leverage
+            
+            logger.info(f"🔍 Gate.io 실제 레버리지 조회 시작: {contract}")
+            self.account_state_stats['probes'] += 1
             
             positions = await self.get_positions(contract)
             
             if positions:
                 position = positions[0]
-                leverage_str = position.get('leverage', str(self.DEFAULT_LEVERAGE))        logger.info(f"🔍 포지션에서 발견한 실제 레버리지: {leverage_str}")
+                self._remember_position_state(contract, position)
+                leverage_str = position.get('leverage', str(self.DEFAULT_LEVERAGE))
+                logger.info(f"🔍 포지션에서 발견한 실제 레버리지: {leverage_str}")
                 try:
-                    leverage = int(float(leverage_str))        logger.info(f"✅ 실제 레버리지 확인됨: {leverage}x")
+                    leverage = int(float(leverage_str))
+                    logger.info(f"✅ 실제 레버리지 확인됨: {leverage}x")
                     return leverage
                 except (ValueError, TypeError):
                     logger.warning(f"레버리지 값 변환 실패: {leverage_str}")
                     return self.DEFAULT_LEVERAGE
-            else:        logger.info(f"🔍 포지션이 없어 계정 설정에서 레버리지 확인 시도")
+            else:
+                logger.info(f"🔍 포지션이 없어 계정 설정에서 레버리지 확인 시도")
                 
                 # 🔥 포지션이 없을 때 계정 설정에서 레버리지 확인 시도
                 try:
@@ -553,10 +715,15 @@ class GateioMirrorClient:
                         
                         if leverage_value:
                             try:
-                                leverage = int(float(leverage_value))        logger.info(f"✅ 계정 정보에서 레버리지 확인됨: {leverage}x")
+                                leverage = int(float(leverage_value))
+                                logger.info(f"✅ 계정 정보에서 레버리지 확인됨: {leverage}x")
+                                self.current_leverage_cache[contract] = (datetime.now(), leverage)
                                 return leverage
                             except (ValueError, TypeError):
-                                logger.warning(f"계정 레버리지 값 변환 실패: {leverage_value}")        logger.info(f"🔍 계정 정보에서 레버리지 찾을 수 없음, 기본값 반환: {self.DEFAULT_LEVERAGE}x")
+                                logger.warning(f"계정 레버리지 값 변환 실패: {leverage_value}")
+                    logger.info(f"🔍 계정 정보에서 레버리지 찾을 수 없음, 기본값 반환: {self.DEFAULT_LEVERAGE}x")
+                    # 확인되지 않은 값 - 캐시에 남은 이전 값도 제거해 set_leverage가 한 번 설정해 확정하도록
+                    self.current_leverage_cache.pop(contract, None)
                     return self.DEFAULT_LEVERAGE
                     
                 except Exception as e:
@@ -569,15 +736,23 @@ class GateioMirrorClient:
     
     async def set_leverage(self, contract: str, leverage: int, cross_leverage_limit: int = 0, 
                           retry_count: int = 5) -> Dict:
+        lock = self.leverage_locks.setdefault(contract, asyncio.Lock())
+        async with lock:
+            return await self._set_leverage(contract, leverage, cross_leverage_limit, retry_count)
+    
+    async def _set_leverage(self, contract: str, leverage: int, cross_leverage_limit: int, retry_count: int) -> Dict:
         if leverage < self.MIN_LEVERAGE or leverage > self.MAX_LEVERAGE:
             logger.warning(f"레버리지 범위 초과 ({leverage}x), 기본값 사용: {self.DEFAULT_LEVERAGE}x")
             leverage = self.DEFAULT_LEVERAGE
         
         for attempt in range(retry_count):
             try:
-                current_leverage = await self.get_current_leverage(contract)
+                # 첫 시도는 캐시 사용 (우리가 설정/확인한 값이면 조회 생략), 재시도는 실제 조회
+                current_leverage = await self.get_current_leverage(contract, use_cache=(attempt == 0))
                 
-                if current_leverage == leverage:        logger.info(f"레버리지 이미 설정됨: {contract} - {leverage}x")
+                # 확인된 값만 캐시에 있음 - 포지션이 없어 기본값을 받은 경우는 한 번 설정해서 확정 (이후 캐시 사용)
+                if current_leverage == leverage and contract in self.current_leverage_cache:
+                    logger.info(f"레버리지 이미 설정됨: {contract} - {leverage}x")
                     return {"status": "already_set", "leverage": leverage}
                 
                 endpoint = f"/api/v4/futures/usdt/positions/{contract}/leverage"
@@ -587,15 +762,18 @@ class GateioMirrorClient:
                 }
                 
                 if cross_leverage_limit > 0:
-                    params["cross_leverage_limit"] = str(cross_leverage_limit)        logger.info(f"Gate.io 레버리지 설정 시도 {attempt + 1}/{retry_count}: {contract} - {current_leverage}x → {leverage}x")
+                    params["cross_leverage_limit"] = str(cross_leverage_limit)
+                logger.info(f"Gate.io 레버리지 설정 시도 {attempt + 1}/{retry_count}: {contract} - {current_leverage}x → {leverage}x")
                 
                 response = await self._request('POST', endpoint, params=params)
+                self.current_leverage_cache.pop(contract, None)
                 
                 await asyncio.sleep(1.0)
                 
                 verify_success = await self._verify_leverage_setting(contract, leverage, max_attempts=3)
                 if verify_success:
-                    self.current_leverage_cache[contract] = (datetime.now(), leverage)        logger.info(f"Gate.io 레버리지 설정 완료: {contract} - {leverage}x")
+                    self.current_leverage_cache[contract] = (datetime.now(), leverage)
+                    logger.info(f"Gate.io 레버리지 설정 완료: {contract} - {leverage}x")
                     return response
                 else:
                     if attempt < retry_count - 1:
@@ -611,7 +789,9 @@ class GateioMirrorClient:
                 
                 if any(keyword in error_msg.lower() for keyword in [
                     "leverage not changed", "same leverage", "already set"
-                ]):        logger.info(f"레버리지가 이미 설정되어 있음: {contract} - {leverage}x")
+                ]):
+                    logger.info(f"레버리지가 이미 설정되어 있음: {contract} - {leverage}x")
+                    self.current_leverage_cache[contract] = (datetime.now(), leverage)
                     return {"status": "already_set", "leverage": leverage}
                 
                 if attempt < retry_count - 1:
@@ -640,7 +820,8 @@ class GateioMirrorClient:
                     if current_leverage:
                         try:
                             current_lev_int = int(float(current_leverage))
-                            if current_lev_int == expected_leverage:        logger.info(f"레버리지 설정 검증 성공: {current_lev_int}x")
+                            if current_lev_int == expected_leverage:
+                                logger.info(f"레버리지 설정 검증 성공: {current_lev_int}x")
                                 return True
                             else:
                                 logger.debug(f"레버리지 검증: 현재 {current_lev_int}x ≠ 예상 {expected_leverage}x")
@@ -669,12 +850,15 @@ class GateioMirrorClient:
         
         return False
     
-    async def mirror_bitget_leverage(self, bitget_leverage: int, contract: str = "BTC_USDT") -> bool:
-        try:        logger.info(f"레버리지 미러링 시작: 비트겟 {bitget_leverage}x → 게이트 {contract}")
+    async def mirror_bitget_leverage(self, bitget_leverage: int, contract: str = None) -> bool:
+        contract = contract or self.GATE_CONTRACT
+        try:
+            logger.info(f"레버리지 미러링 시작: 비트겟 {bitget_leverage}x → 게이트 {contract}")
             
             current_gate_leverage = await self.get_current_leverage(contract)
             
-            if current_gate_leverage == bitget_leverage:        logger.info(f"레버리지 이미 동일: {bitget_leverage}x")
+            if current_gate_leverage == bitget_leverage:
+                logger.info(f"레버리지 이미 동일: {bitget_leverage}x")
                 return True
             
             result = await self.set_leverage(contract, bitget_leverage)
@@ -682,7 +866,8 @@ class GateioMirrorClient:
             if result.get("warning"):
                 logger.warning(f"레버리지 미러링 실패: {result}")
                 return False
-            else:        logger.info(f"레버리지 미러링 성공: {current_gate_leverage}x → {bitget_leverage}x")
+            else:
+                logger.info(f"레버리지 미러링 성공: {current_gate_leverage}x → {bitget_leverage}x")
                 return True
             
         except Exception as e:
@@ -693,11 +878,11 @@ class GateioMirrorClient:
                                        leverage: int, current_gate_price: float) -> Dict:
         try:
             # 주문 생성 전 마진 모드 강제 체크
-            margin_success = await self.ensure_cross_margin_mode_before_order("BTC_USDT")
+            margin_success = await self.ensure_cross_margin_mode_before_order(self.GATE_CONTRACT)
             if not margin_success:
                 logger.warning("주문 생성 전 마진 모드 강제 변경 실패하지만 계속 진행")
             
-            leverage_success = await self.mirror_bitget_leverage(leverage, "BTC_USDT")
+            leverage_success = await self.mirror_bitget_leverage(leverage, self.GATE_CONTRACT)
             if not leverage_success:
                 logger.warning("레버리지 미러링 실패하지만 주문 계속 진행")
             
@@ -722,7 +907,8 @@ class GateioMirrorClient:
                 if value and str(value) not in ['0', '0.0', '', 'null', 'None']:
                     try:
                         tp_price = float(value)
-                        if tp_price > 0:        logger.info(f"비트겟 TP 추출: {field} = ${tp_price:.2f}")
+                        if tp_price > 0:
+                            logger.info(f"비트겟 TP 추출: {field} = ${tp_price:.2f}")
                             break
                     except:
                         continue
@@ -733,7 +919,8 @@ class GateioMirrorClient:
                 if value and str(value) not in ['0', '0.0', '', 'null', 'None']:
                     try:
                         sl_price = float(value)
-                        if sl_price > 0:        logger.info(f"비트겟 SL 추출: {field} = ${sl_price:.2f}")
+                        if sl_price > 0:
+                            logger.info(f"비트겟 SL 추출: {field} = ${sl_price:.2f}")
                             break
                     except:
                         continue
@@ -746,27 +933,43 @@ class GateioMirrorClient:
                 reduce_only_flag = True
                 
                 if 'close_long' in side or side == 'close long':
-                    final_size = -abs(gate_size)        logger.info(f"클로즈 롱: 롱 포지션 종료 → 게이트 매도 (음수 사이즈: {final_size})")
+                    final_size = -abs(gate_size)
+                    logger.info(f"클로즈 롱: 롱 포지션 종료 → 게이트 매도 (음수 사이즈: {final_size})")
                 elif 'close_short' in side or side == 'close short':
-                    final_size = abs(gate_size)        logger.info(f"클로즈 숏: 숏 포지션 종료 → 게이트 매수 (양수 사이즈: {final_size})")
+                    final_size = abs(gate_size)
+                    logger.info(f"클로즈 숏: 숏 포지션 종료 → 게이트 매수 (양수 사이즈: {final_size})")
                 else:
                     if 'sell' in side or 'short' in side:
-                        final_size = -abs(gate_size)        logger.info(f"클로즈 매도: 포지션 종료 → 게이트 매도 (음수 사이즈: {final_size})")
+                        final_size = -abs(gate_size)
+                        logger.info(f"클로즈 매도: 포지션 종료 → 게이트 매도 (음수 사이즈: {final_size})")
                     else:
-                        final_size = abs(gate_size)        logger.info(f"클로즈 매수: 포지션 종료 → 게이트 매수 (양수 사이즈: {final_size})")
+                        final_size = abs(gate_size)
+                        logger.info(f"클로즈 매수: 포지션 종료 → 게이트 매수 (양수 사이즈: {final_size})")
             else:
                 reduce_only_flag = False
                 if 'short' in side or 'sell' in side:
-                    final_size = -abs(gate_size)        logger.info(f"오픈 숏: 새 숏 포지션 생성 → 게이트 매도 (음수 사이즈: {final_size})")
+                    final_size = -abs(gate_size)
+                    logger.info(f"오픈 숏: 새 숏 포지션 생성 → 게이트 매도 (음수 사이즈: {final_size})")
                 else:
-                    final_size = abs(gate_size)        logger.info(f"오픈 롱: 새 롱 포지션 생성 → 게이트 매수 (양수 사이즈: {final_size})")
+                    final_size = abs(gate_size)
+                    logger.info(f"오픈 롱: 새 롱 포지션 생성 → 게이트 매수 (양수 사이즈: {final_size})")
             
-            gate_trigger_type = "ge" if trigger_price > current_gate_price else "le"        logger.info(f"완벽 미러링 주문 생성:")        logger.info(f"   - 비트겟 ID: {order_id}")        logger.info(f"   - 방향: {side} ({'클로즈' if is_close_order else '오픈'})")        logger.info(f"   - 트리거가: ${trigger_price:.2f}")        logger.info(f"   - 레버리지: {leverage}x {'✅' if leverage_success else '⚠️'}")        logger.info(f"   - 마진 모드: Cross {'✅' if margin_success else '⚠️'}")
+            gate_trigger_type = "ge" if trigger_price > current_gate_price else "le"
+            logger.info(f"완벽 미러링 주문 생성:")
+            logger.info(f"   - 비트겟 ID: {order_id}")
+            logger.info(f"   - 방향: {side} ({'클로즈' if is_close_order else '오픈'})")
+            logger.info(f"   - 트리거가: ${trigger_price:.2f}")
+            logger.info(f"   - 레버리지: {leverage}x {'✅' if leverage_success else '⚠️'}")
+            logger.info(f"   - 마진 모드: Cross {'✅' if margin_success else '⚠️'}")
             
             tp_display = f"${tp_price:.2f}" if tp_price is not None else "없음"
-            sl_display = f"${sl_price:.2f}" if sl_price is not None else "없음"        logger.info(f"   - TP: {tp_display}")        logger.info(f"   - SL: {sl_display}")        logger.info(f"   - 게이트 사이즈: {final_size}")
+            sl_display = f"${sl_price:.2f}" if sl_price is not None else "없음"
+            logger.info(f"   - TP: {tp_display}")
+            logger.info(f"   - SL: {sl_display}")
+            logger.info(f"   - 게이트 사이즈: {final_size}")
             
-            if tp_price or sl_price:        logger.info(f"TP/SL 포함 통합 주문 생성")
+            if tp_price or sl_price:
+                logger.info(f"TP/SL 포함 통합 주문 생성")
                 
                 gate_order = await self.create_conditional_order_with_tp_sl_v3(
                     trigger_price=trigger_price,
@@ -797,7 +1000,8 @@ class GateioMirrorClient:
                     'margin_mode_forced': margin_success
                 }
                 
-            else:        logger.info(f"일반 예약 주문 생성 (TP/SL 없음)")
+            else:
+                logger.info(f"일반 예약 주문 생성 (TP/SL 없음)")
                 
                 gate_order = await self.create_price_triggered_order_v3(
                     trigger_price=trigger_price,
@@ -837,13 +1041,13 @@ class GateioMirrorClient:
                                                    trigger_type: str = "ge") -> Dict:
         try:
             # 주문 생성 전 마진 모드 강제 체크
-            await self.ensure_cross_margin_mode_before_order("BTC_USDT")
+            await self.ensure_cross_margin_mode_before_order(self.GATE_CONTRACT)
             
             endpoint = "/api/v4/futures/usdt/price_orders"
             
             data = {
                 "initial": {
-                    "contract": "BTC_USDT",
+                    "contract": self.GATE_CONTRACT,
                     "size": order_size,
                     "price": "0",
                     "tif": "ioc"
@@ -851,7 +1055,7 @@ class GateioMirrorClient:
                 "trigger": {
                     "strategy_type": 0,
                     "price_type": 0,
-                    "price": str(trigger_price),
+                    "price": self._format_price(trigger_price),
                     "rule": 1 if trigger_type == "ge" else 2
                 }
             }
@@ -860,12 +1064,16 @@ class GateioMirrorClient:
                 data["initial"]["reduce_only"] = True
             
             if tp_price and tp_price > 0:
-                data["stop_profit_price"] = str(tp_price)        logger.info(f"TP 설정: ${tp_price:.2f}")
+                data["stop_profit_price"] = self._format_price(tp_price)
+                logger.info(f"TP 설정: ${tp_price:.2f}")
             
             if sl_price and sl_price > 0:
-                data["stop_loss_price"] = str(sl_price)        logger.info(f"SL 설정: ${sl_price:.2f}")        logger.info(f"Gate.io TP/SL 주문 데이터 (Cross 마진): {json.dumps(data, indent=2)}")
+                data["stop_loss_price"] = self._format_price(sl_price)
+                logger.info(f"SL 설정: ${sl_price:.2f}")
+            logger.info(f"Gate.io TP/SL 주문 데이터 (Cross 마진): {json.dumps(data, indent=2)}")
             
-            response = await self._request('POST', endpoint, data=data)        logger.info(f"Gate.io TP/SL 통합 주문 생성 성공 (Cross 마진): {response.get('id')}")
+            response = await self._request('POST', endpoint, data=data)
+            logger.info(f"Gate.io TP/SL 통합 주문 생성 성공 (Cross 마진): {response.get('id')}")
             
             return response
             
@@ -877,13 +1085,13 @@ class GateioMirrorClient:
                                             reduce_only: bool = False, trigger_type: str = "ge") -> Dict:
         try:
             # 주문 생성 전 마진 모드 강제 체크
-            await self.ensure_cross_margin_mode_before_order("BTC_USDT")
+            await self.ensure_cross_margin_mode_before_order(self.GATE_CONTRACT)
             
             endpoint = "/api/v4/futures/usdt/price_orders"
             
             data = {
                 "initial": {
-                    "contract": "BTC_USDT",
+                    "contract": self.GATE_CONTRACT,
                     "size": order_size,
                     "price": "0",
                     "tif": "ioc"
@@ -891,15 +1099,17 @@ class GateioMirrorClient:
                 "trigger": {
                     "strategy_type": 0,
                     "price_type": 0,
-                    "price": str(trigger_price),
+                    "price": self._format_price(trigger_price),
                     "rule": 1 if trigger_type == "ge" else 2
                 }
             }
             
             if reduce_only:
-                data["initial"]["reduce_only"] = True        logger.info(f"Gate.io 일반 주문 데이터 (Cross 마진): {json.dumps(data, indent=2)}")
+                data["initial"]["reduce_only"] = True
+            logger.info(f"Gate.io 일반 주문 데이터 (Cross 마진): {json.dumps(data, indent=2)}")
             
-            response = await self._request('POST', endpoint, data=data)        logger.info(f"Gate.io 일반 트리거 주문 생성 성공 (Cross 마진): {response.get('id')}")
+            response = await self._request('POST', endpoint, data=data)
+            logger.info(f"Gate.io 일반 트리거 주문 생성 성공 (Cross 마진): {response.get('id')}")
             
             return response
             
@@ -956,10 +1166,82 @@ class GateioMirrorClient:
             logger.error(f"가격 트리거 주문 조회 실패: {e}")
             return []
     
+    async def submit_batch(self, jobs: Dict[str, Callable[[], Awaitable]], concurrency: int = None) -> Dict[str, Dict]:
+        """여러 주문 작업을 제한된 동시성으로 실행 - 키별 {'success', 'result' 또는 'error', 'elapsed'}"""
+        semaphore = asyncio.Semaphore(concurrency or self.BATCH_CONCURRENCY)
+        
+        async def run(key: str, job: Callable[[], Awaitable]) -> Tuple[str, Dict]:
+            async with semaphore:
+                started = time.monotonic()
+                try:
+                    result = await job()
+                    return key, {'success': True, 'result': result, 'elapsed': time.monotonic() - started}
+                except Exception as e:
+                    return key, {'success': False, 'error': str(e), 'elapsed': time.monotonic() - started}
+        
+        started = time.monotonic()
+        results = dict(await asyncio.gather(*(run(key, job) for key, job in jobs.items())))
+        if len(jobs) > 1:
+            failed = sum(1 for result in results.values() if not result['success'])
+            logger.info(f"Gate.io 일괄 처리 {len(jobs)}건 완료 (실패 {failed}건, {time.monotonic() - started:.2f}초)")
+        return results
+    
+    async def cancel_all_price_triggered_orders(self, contract: str = None) -> List[Dict]:
+        """계약의 열린 가격 트리거 주문 전체를 한 번에 취소 - 취소된 주문 목록"""
+        contract = contract or self.GATE_CONTRACT
+        endpoint = "/api/v4/futures/usdt/price_orders"
+        response = await self._request('DELETE', endpoint, params={"contract": contract})
+        cancelled = response if isinstance(response, list) else []
+        logger.info(f"Gate.io 가격 트리거 주문 일괄 취소: {contract} {len(cancelled)}건")
+        return cancelled
+    
+    async def cancel_price_triggered_orders(self, order_ids: List[str], contract: str = None,
+                                            open_order_ids: List[str] = None) -> Dict[str, Dict]:
+        """여러 가격 트리거 주문 취소 - 열린 주문 전체를 취소하는 경우 계약 단위 일괄 취소 사용, 주문 ID별 결과
+        
+        이미 없는 주문(not found)은 성공으로 보고 'already_gone'으로 표시
+        일괄 취소는 직전에 다시 조회한 열린 주문이 모두 선택된 주문일 때만 사용 (그 사이 생긴 주문 보호),
+        그래도 함께 취소된 선택 밖 주문은 'unexpected'로 결과에 포함 (호출 측에서 매핑 정리)
+        """
+        order_ids = [order_id for order_id in order_ids if order_id]
+        if not order_ids:
+            return {}
+        selected_ids = {str(order_id) for order_id in order_ids}
+        
+        if contract and open_order_ids and len(order_ids) > 1 and set(map(str, open_order_ids)) <= selected_ids:
+            try:
+                fresh_ids = {str(order.get('id')) for order in await self.get_price_triggered_orders(contract, "open")}
+                if fresh_ids and fresh_ids <= selected_ids:
+                    cancelled = await self.cancel_all_price_triggered_orders(contract)
+                    cancelled_ids = {str(order.get('id')) for order in cancelled}
+                    results = {
+                        order_id: {'success': True, 'result': None, 'already_gone': str(order_id) not in cancelled_ids}
+                        for order_id in order_ids
+                    }
+                    for order in cancelled:
+                        if str(order.get('id')) not in selected_ids:
+                            logger.warning(f"일괄 취소에 선택하지 않은 주문 포함: {order.get('id')}")
+                            results[order.get('id')] = {'success': True, 'result': order, 'unexpected': True}
+                    return results
+                logger.info(f"열린 주문이 바뀌어 일괄 취소 대신 개별 취소: {contract}")
+            except Exception as e:
+                logger.warning(f"가격 트리거 주문 일괄 취소 실패, 개별 취소로 진행: {e}")
+        
+        results = await self.submit_batch({
+            order_id: (lambda order_id=order_id: self.cancel_price_triggered_order(order_id))
+            for order_id in order_ids
+        })
+        for result in results.values():
+            error = str(result.get('error', '')).lower()
+            if not result['success'] and any(keyword in error for keyword in ["not found", "order not exist", "invalid order"]):
+                result.update({'success': True, 'already_gone': True})
+        return results
+    
     async def cancel_price_triggered_order(self, order_id: str) -> Dict:
         try:
             endpoint = f"/api/v4/futures/usdt/price_orders/{order_id}"
-            response = await self._request('DELETE', endpoint)        logger.info(f"Gate.io 가격 트리거 주문 취소 성공: {order_id}")
+            response = await self._request('DELETE', endpoint)
+            logger.info(f"Gate.io 가격 트리거 주문 취소 성공: {order_id}")
             return response
             
         except Exception as e:
@@ -973,7 +1255,8 @@ class GateioMirrorClient:
             await self.ensure_cross_margin_mode_before_order(contract)
             
             current_leverage = await self.get_current_leverage(contract)
-            if current_leverage < self.DEFAULT_LEVERAGE:        logger.info(f"레버리지가 낮음 ({current_leverage}x), 기본값으로 설정: {self.DEFAULT_LEVERAGE}x")
+            if current_leverage < self.DEFAULT_LEVERAGE:
+                logger.info(f"레버리지가 낮음 ({current_leverage}x), 기본값으로 설정: {self.DEFAULT_LEVERAGE}x")
                 await self.set_leverage(contract, self.DEFAULT_LEVERAGE)
             
             endpoint = "/api/v4/futures/usdt/orders"
@@ -995,7 +1278,10 @@ class GateioMirrorClient:
             if iceberg > 0:
                 data["iceberg"] = iceberg
             
-            response = await self._request('POST', endpoint, data=data)        logger.info(f"Gate.io 주문 생성 성공 (Cross 마진): {response.get('id')} (레버리지: {current_leverage}x)")
+            response = await self._request('POST', endpoint, data=data)
+            logger.info(f"Gate.io 주문 생성 성공 (Cross 마진): {response.get('id')} (레버리지: {current_leverage}x)")
+            # 포지션이 바뀌었으므로 다음 주문 전 실제 상태 확인
+            self.invalidate_account_state(contract)
             return response
             
         except Exception as e:
@@ -1027,7 +1313,8 @@ class GateioMirrorClient:
                 contract=contract,
                 size=close_size,
                 price=None,
-                reduce_only=True)        logger.info(f"Gate.io 포지션 종료 성공 (Cross 마진): {close_size}")
+                reduce_only=True)
+            logger.info(f"Gate.io 포지션 종료 성공 (Cross 마진): {close_size}")
             return result
             
         except Exception as e:
@@ -1036,4 +1323,5 @@ class GateioMirrorClient:
     
     async def close(self):
         if self.session:
-            await self.session.close()        logger.info("Gate.io 미러링 클라이언트 세션 종료")
+            await self.session.close()
+            logger.info("Gate.io 미러링 클라이언트 세션 종료")
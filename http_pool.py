@@ -0,0 +1,136 @@
+import logging
+from collections import defaultdict
+from typing import Dict, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class HttpSessionPool:
+    """프로세스 공용 HTTP 연결 풀 - 모든 모듈의 세션이 하나의 커넥터(keep-alive, DNS 캐시)를 공유"""
+
+    def __init__(self):
+        # 커넥터 설정 (모듈별 커넥터 6개를 하나로 합친 값)
+        self.LIMIT = 200
+        self.LIMIT_PER_HOST = 30
+        self.KEEPALIVE_TIMEOUT = 60
+        self.DNS_CACHE_TTL = 300
+
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._sessions: Dict[str, list] = defaultdict(list)
+
+        self.stats = {
+            'connections_created': 0,
+            'connections_reused': 0,
+            'dns_cache_hits': 0,
+            'dns_cache_misses': 0,
+            'requests': 0,
+            'request_errors': 0
+        }
+        self.session_stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {'requests': 0, 'errors': 0})
+
+    def _get_connector(self) -> aiohttp.TCPConnector:
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(
+                limit=self.LIMIT,
+                limit_per_host=self.LIMIT_PER_HOST,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=self.DNS_CACHE_TTL,
+                use_dns_cache=True,
+                enable_cleanup_closed=True
+            )
+            logger.info(f"🔌 공용 HTTP 연결 풀 생성 - 전체 {self.LIMIT}, 호스트당 {self.LIMIT_PER_HOST}, keep-alive {self.KEEPALIVE_TIMEOUT}초")
+        return self._connector
+
+    def _trace_config(self, name: str) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            self.stats['requests'] += 1
+            self.session_stats[name]['requests'] += 1
+
+        async def on_request_exception(session, ctx, params):
+            self.stats['request_errors'] += 1
+            self.session_stats[name]['errors'] += 1
+
+        async def on_connection_create_end(session, ctx, params):
+            self.stats['connections_created'] += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self.stats['connections_reused'] += 1
+
+        async def on_dns_cache_hit(session, ctx, params):
+            self.stats['dns_cache_hits'] += 1
+
+        async def on_dns_cache_miss(session, ctx, params):
+            self.stats['dns_cache_misses'] += 1
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_exception.append(on_request_exception)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace
+
+    def get_session(self, name: str, timeout: Optional[aiohttp.ClientTimeout] = None,
+                    headers: Optional[Dict[str, str]] = None) -> aiohttp.ClientSession:
+        """공용 커넥터 위의 세션 생성 - 세션을 닫아도 풀의 연결은 유지됨"""
+        session = aiohttp.ClientSession(
+            connector=self._get_connector(),
+            connector_owner=False,
+            timeout=timeout or aiohttp.ClientTimeout(total=30, connect=10),
+            headers=headers,
+            trace_configs=[self._trace_config(name)]
+        )
+        sessions = self._sessions[name]
+        sessions[:] = [s for s in sessions if not s.closed]
+        sessions.append(session)
+        return session
+
+    async def close(self):
+        """모든 세션과 공용 커넥터 종료"""
+        for sessions in self._sessions.values():
+            for session in sessions:
+                if not session.closed:
+                    await session.close()
+        self._sessions.clear()
+
+        if self._connector is not None and not self._connector.closed:
+            await self._connector.close()
+        self._connector = None
+        logger.info("🔌 공용 HTTP 연결 풀 종료")
+
+    def get_stats(self) -> Dict:
+        """연결 재사용률 등 풀 통계"""
+        created = self.stats['connections_created']
+        reused = self.stats['connections_reused']
+        total = created + reused
+
+        open_connections = 0
+        if self._connector is not None and not self._connector.closed:
+            # 유휴 연결 수 (aiohttp 내부 구조라 실패해도 무시)
+            try:
+                open_connections = sum(len(conns) for conns in self._connector._conns.values())
+            except Exception:
+                open_connections = 0
+
+        return {
+            **self.stats,
+            'reuse_ratio': reused / total if total > 0 else 0.0,
+            'idle_connections': open_connections,
+            'active_sessions': {name: sum(1 for s in sessions if not s.closed) for name, sessions in self._sessions.items()},
+            'per_session': {name: dict(stats) for name, stats in self.session_stats.items()}
+        }
+
+
+_pool: Optional[HttpSessionPool] = None
+
+
+def get_http_pool() -> HttpSessionPool:
+    """프로세스 공용 연결 풀"""
+    global _pool
+    if _pool is None:
+        _pool = HttpSessionPool()
+    return _pool
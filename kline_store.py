@@ -0,0 +1,215 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 캔들 간격 (ms)
+GRANULARITY_MS = {
+    '1m': 60 * 1000,
+    '3m': 3 * 60 * 1000,
+    '5m': 5 * 60 * 1000,
+    '15m': 15 * 60 * 1000,
+    '30m': 30 * 60 * 1000,
+    '1H': 60 * 60 * 1000,
+    '4H': 4 * 60 * 60 * 1000,
+    '6H': 6 * 60 * 60 * 1000,
+    '12H': 12 * 60 * 60 * 1000,
+    '1D': 24 * 60 * 60 * 1000
+}
+
+# 로컬 리샘플링으로 만드는 상위 봉 -> 기준 봉
+RESAMPLE_BASE = {
+    '3m': '1m',
+    '5m': '1m',
+    '15m': '1m',
+    '30m': '1m',
+    '4H': '1H',
+    '6H': '1H',
+    '12H': '1H',
+    '1D': '1H'
+}
+
+# 배열 열 순서 (Bitget 캔들 응답과 동일)
+COLUMNS = ('ts', 'open', 'high', 'low', 'close', 'volume', 'quote_volume')
+
+CandleFetcher = Callable[[str, str, int, int, int], Awaitable[Optional[List[list]]]]
+
+
+def _to_array(rows: List[list]) -> np.ndarray:
+    """캔들 응답 [[ts, o, h, l, c, vol, quoteVol], ...] -> (N, 7) float 배열"""
+    parsed = []
+    for row in rows or []:
+        try:
+            values = [float(v) for v in row[:7]]
+        except (ValueError, TypeError, IndexError):
+            continue
+        if len(values) == 6:
+            values.append(0.0)
+        if len(values) == 7:
+            parsed.append(values)
+    if not parsed:
+        return np.empty((0, 7))
+    return np.array(parsed, dtype=float)
+
+
+def _merge(existing: np.ndarray, new: np.ndarray) -> np.ndarray:
+    """시각 기준 병합 - 같은 시각이면 새 값 사용 (진행 중인 봉 갱신)"""
+    if len(new) == 0:
+        return existing
+    combined = np.concatenate([new, existing]) if len(existing) else new
+    _, first = np.unique(combined[:, 0], return_index=True)
+    return combined[first]
+
+
+def resample(candles: np.ndarray, base_ms: int, target_ms: int) -> np.ndarray:
+    """기준 봉을 상위 봉으로 합침 (UTC 정렬) - 기준 봉이 빠진 구간은 버림, 마지막 봉은 진행 중으로 허용"""
+    if len(candles) == 0:
+        return np.empty((0, 7))
+
+    buckets = (candles[:, 0] // target_ms) * target_ms
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    counts = np.diff(np.r_[starts, len(candles)])
+
+    result = np.empty((len(starts), 7))
+    result[:, 0] = buckets[starts]
+    result[:, 1] = candles[starts, 1]
+    result[:, 2] = np.maximum.reduceat(candles[:, 2], starts)
+    result[:, 3] = np.minimum.reduceat(candles[:, 3], starts)
+    result[:, 4] = candles[np.r_[starts[1:], len(candles)] - 1, 4]
+    result[:, 5] = np.add.reduceat(candles[:, 5], starts)
+    result[:, 6] = np.add.reduceat(candles[:, 6], starts)
+
+    expected = target_ms // base_ms
+    complete = counts == expected
+    complete[-1] = candles[starts[-1], 0] == buckets[starts[-1]]  # 진행 중인 마지막 봉은 시작 봉만 확인
+    # 앞쪽에서 잘린 버킷 등 불완전한 봉 제외
+    return result[complete]
+
+
+class KlineStore:
+    """심볼/간격별 OHLCV 로컬 저장소 - 없는 봉만 조회하고, 상위 봉은 기준 봉을 리샘플링"""
+
+    def __init__(self, fetcher: CandleFetcher):
+        self.fetcher = fetcher
+
+        self.PAGE_LIMIT = 1000
+        self.MAX_CANDLES = 5000
+        self.REFRESH_SECONDS = 30
+        # 리샘플링에 필요한 기준 봉이 이보다 많으면 해당 간격을 직접 조회
+        self.MAX_RESAMPLE_BASE = 1000
+
+        self._series: Dict[Tuple[str, str], np.ndarray] = {}
+        self._synced_at: Dict[Tuple[str, str], float] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        # 조회해도 비어 있던 구간 (거래소 점검 등) - 반복 조회 방지
+        self._empty_gaps: Dict[Tuple[str, str], set] = {}
+
+        self.stats = {'requests': 0, 'fetches': 0, 'fetched_candles': 0, 'resampled': 0, 'gaps_filled': 0}
+
+    async def get(self, symbol: str, granularity: str, limit: int) -> np.ndarray:
+        """최근 limit개 봉 (N, 7) 배열 - 오래된 순"""
+        self.stats['requests'] += 1
+
+        base = RESAMPLE_BASE.get(granularity)
+        if base:
+            factor = GRANULARITY_MS[granularity] // GRANULARITY_MS[base]
+            # 앞쪽 잘린 버킷 대비 한 봉 여유
+            base_needed = (limit + 1) * factor
+            if base_needed <= self.MAX_RESAMPLE_BASE:
+                base_candles = await self._get_series(symbol, base, base_needed)
+                derived = resample(base_candles, GRANULARITY_MS[base], GRANULARITY_MS[granularity])
+                if len(derived) >= limit:
+                    self.stats['resampled'] += 1
+                    return derived[-limit:]
+
+        candles = await self._get_series(symbol, granularity, limit)
+        return candles[-limit:]
+
+    async def _get_series(self, symbol: str, granularity: str, count: int) -> np.ndarray:
+        key = (symbol, granularity)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            step = GRANULARITY_MS[granularity]
+            series = self._series.get(key, np.empty((0, 7)))
+            now_ms = int(time.time() * 1000)
+
+            # 1) 최신 구간: 마지막 저장 봉(진행 중일 수 있음)부터 현재까지
+            fresh = time.monotonic() - self._synced_at.get(key, 0) < self.REFRESH_SECONDS
+            if len(series) == 0:
+                start = now_ms - count * step
+                series = _merge(series, await self._fetch_range(symbol, granularity, start, now_ms))
+                self._synced_at[key] = time.monotonic()
+            elif not fresh:
+                series = _merge(series, await self._fetch_range(symbol, granularity, int(series[-1, 0]), now_ms))
+                self._synced_at[key] = time.monotonic()
+
+            # 2) 과거 구간: 요청 개수에 모자라는 만큼
+            if 0 < len(series) < count:
+                missing = count - len(series)
+                end = int(series[0, 0]) - step
+                older = await self._fetch_range(symbol, granularity, end - missing * step, end)
+                series = _merge(series, older)
+
+            # 3) 중간에 빠진 봉
+            series = await self._fill_gaps(key, series)
+
+            if len(series) > self.MAX_CANDLES:
+                series = series[-self.MAX_CANDLES:]
+            self._series[key] = series
+            return series
+
+    async def _fill_gaps(self, key: Tuple[str, str], series: np.ndarray) -> np.ndarray:
+        if len(series) < 2:
+            return series
+        symbol, granularity = key
+        step = GRANULARITY_MS[granularity]
+        empty_gaps = self._empty_gaps.setdefault(key, set())
+
+        gap_indices = np.flatnonzero(np.diff(series[:, 0]) > step)
+        for i in gap_indices[:10]:
+            start = int(series[i, 0]) + step
+            end = int(series[i + 1, 0]) - step
+            if (start, end) in empty_gaps:
+                continue
+            filled = await self._fetch_range(symbol, granularity, start, end)
+            if len(filled):
+                self.stats['gaps_filled'] += 1
+                series = _merge(series, filled)
+            else:
+                empty_gaps.add((start, end))
+        return series
+
+    async def _fetch_range(self, symbol: str, granularity: str, start: int, end: int) -> np.ndarray:
+        """[start, end] 구간을 PAGE_LIMIT 단위로 나눠 조회"""
+        step = GRANULARITY_MS[granularity]
+        chunks = []
+        page_start = start
+        while page_start <= end:
+            page_end = min(end, page_start + (self.PAGE_LIMIT - 1) * step)
+            rows = await self.fetcher(symbol, granularity, page_start, page_end, self.PAGE_LIMIT)
+            self.stats['fetches'] += 1
+            if rows is None:
+                break
+            chunk = _to_array(rows)
+            self.stats['fetched_candles'] += len(chunk)
+            chunks.append(chunk)
+            page_start = page_end + step
+
+        if not chunks:
+            return np.empty((0, 7))
+        return _merge(np.empty((0, 7)), np.concatenate(chunks))
+
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            'series': {f"{symbol}:{granularity}": len(series) for (symbol, granularity), series in self._series.items()}
+        }
+
+
+def as_columns(candles: np.ndarray) -> Dict[str, np.ndarray]:
+    """(N, 7) 배열 -> {'ts', 'open', 'high', 'low', 'close', 'volume', 'quote_volume'}"""
+    return {name: candles[:, i] for i, name in enumerate(COLUMNS)}
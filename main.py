@@ -20,6 +20,8 @@ from exception_detector import ExceptionDetector
 from data_collector import RealTimeDataCollector
 from trading_indicators import AdvancedTradingIndicators
 from report_generators import ReportGeneratorManager
+from market_data_hub import MarketDataHub
+from http_pool import get_http_pool
 
 # 미러 트레이딩 관련 임포트
 try:
@@ -205,6 +207,9 @@ class BitcoinPredictionSystem:
             self.bitget_client = BitgetClient(self.config)
             self.logger.info("✅ Bitget 클라이언트 초기화 완료 (V2 API 정확한 구현)")
             
+            # 공용 시장 데이터 허브 - 티커/펀딩비 조회를 한 곳으로 모음
+            self.market_hub = MarketDataHub(self.bitget_client, self.config.symbol)
+            
             # Telegram 봇
             self.telegram_bot = TelegramBot(self.config)
             self.logger.info("✅ Telegram 봇 초기화 완료")
@@ -226,6 +231,7 @@ class BitcoinPredictionSystem:
                         self.gate_client,
                         self.telegram_bot
                     )
+                    self.mirror_trading.set_market_hub(self.market_hub)
                     self.logger.info("✅ 미러 트레이딩 시스템 생성 완료")
                     
                 except Exception as e:
@@ -257,6 +263,7 @@ class BitcoinPredictionSystem:
             # 데이터 수집기
             self.data_collector = RealTimeDataCollector(self.config)
             self.data_collector.set_bitget_client(self.bitget_client)
+            self.data_collector.set_market_hub(self.market_hub)
             self.logger.info("✅ 데이터 수집기 초기화 완료")
             
             # 지표 시스템
@@ -270,6 +277,7 @@ class BitcoinPredictionSystem:
                 self.indicator_system
             )
             self.report_manager.set_bitget_client(self.bitget_client)
+            self.report_manager.set_market_hub(self.market_hub)
             
             # Gate.io 클라이언트 설정 (실제 미러 모드일 때만)
             if self.can_use_mirror_trading() and self.gate_client:
@@ -288,7 +296,8 @@ class BitcoinPredictionSystem:
             # 예외 감지기
             self.exception_detector = ExceptionDetector(
                 bitget_client=self.bitget_client,
-                telegram_bot=self.telegram_bot
+                telegram_bot=self.telegram_bot,
+                market_hub=self.market_hub
             )
             self.logger.info("✅ 예외 감지기 초기화 완료")
             
@@ -342,6 +351,16 @@ class BitcoinPredictionSystem:
         )
         self.logger.info("📅 급속 변동 감지 스케줄 등록: 1분마다")
         
+        # 파생상품 지표 수집 (5분마다) - 미결제약정/롱숏 비율/테이커 거래량 시계열
+        self.scheduler.add_job(
+            func=self.update_derivatives_data,
+            trigger="interval",
+            minutes=5,
+            timezone=timezone,
+            id="derivatives_data",
+            replace_existing=True
+        )
+        
         # 시스템 상태 체크 (2시간마다)
         self.scheduler.add_job(
             func=self.system_health_check,
@@ -518,7 +537,7 @@ class BitcoinPredictionSystem:
             # ML 예측 기록 (ML 모드일 때만)
             if self.ml_mode and self.ml_predictor and event_data.get('type') == 'critical_news':
                 try:
-                    ticker = await self.bitget_client.get_ticker('BTCUSDT')
+                    ticker = await self.market_hub.get_ticker('BTCUSDT', max_age=10)
                     if ticker:
                         current_price = float(ticker.get('last', 0))
                         if current_price > 0:
@@ -1048,7 +1067,7 @@ class BitcoinPredictionSystem:
             await update.message.reply_text(report, parse_mode='HTML')
             
             # 추가 정보 제공
-            current_data = await self.bitget_client.get_ticker(self.config.symbol)
+            current_data = await self.market_hub.get_ticker(self.config.symbol, max_age=10)
             if current_data:
                 current_price = float(current_data.get('last', 0))
                 change_24h = float(current_data.get('changeUtc', 0)) * 100
@@ -1219,6 +1238,9 @@ class BitcoinPredictionSystem:
             if self.can_use_mirror_trading():
                 stats_msg += f"\n- 미러 명령: <b>{self.command_stats['mirror']}회</b>"
                 stats_msg += f"\n- 배율 조정: <b>{self.command_stats['ratio']}회</b>"
+                
+                if self.mirror_trading and hasattr(self.mirror_trading, 'get_latency_report'):
+                    stats_msg += f"\n\n<b>⏱️ 미러링 지연 시간 (p50 / p95 / p99):</b>\n{self.mirror_trading.get_latency_report()}"
             
             stats_msg += f"""
 
@@ -1485,7 +1507,7 @@ class BitcoinPredictionSystem:
         try:
             # 현재 가격 정보
             if self.bitget_client:
-                ticker = await self.bitget_client.get_ticker('BTCUSDT')
+                ticker = await self.market_hub.get_ticker('BTCUSDT', max_age=10)
                 if ticker:
                     # 24시간 변화율로 트렌드 판단
                     change_24h = float(ticker.get('changeUtc', 0))
@@ -1503,6 +1525,13 @@ class BitcoinPredictionSystem:
         
         return market_data
     
+    async def update_derivatives_data(self):
+        """파생상품 지표 시계열 갱신"""
+        try:
+            await self.bitget_client.update_derivatives_data(self.config.symbol)
+        except Exception as e:
+            self.logger.error(f"파생상품 지표 갱신 실패: {e}")
+    
     async def verify_ml_predictions(self):
         """ML 예측 검증"""
         if not self.ml_mode or not self.ml_predictor:
@@ -1633,6 +1662,9 @@ class BitcoinPredictionSystem:
             # 명령어 통계
             health_status['command_stats'] = self.command_stats.copy()
             
+            # 공용 HTTP 연결 풀 통계 (연결 재사용률)
+            health_status['http_pool'] = get_http_pool().get_stats()
+            
             # 현재 배율 정보 추가
             if self.can_use_mirror_trading() and self.mirror_trading and hasattr(self.mirror_trading, 'get_current_ratio_info'):
                 try:
@@ -2138,6 +2170,11 @@ class BitcoinPredictionSystem:
                 self.logger.info("Gate.io 클라이언트 종료 중...")
                 await self.gate_client.close()
             
+            # 공용 HTTP 연결 풀 종료 (모든 세션 종료 후)
+            pool_stats = get_http_pool().get_stats()
+            self.logger.info(f"HTTP 연결 풀: 요청 {pool_stats['requests']}건, 연결 재사용률 {pool_stats['reuse_ratio']:.1%}")
+            await get_http_pool().close()
+            
             # ML 예측기 데이터 저장
             if self.ml_mode and self.ml_predictor:
                 self.logger.info("ML 예측 데이터 저장 중...")
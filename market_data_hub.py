@@ -0,0 +1,202 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class MarketDataHub:
+    """프로세스 공용 시장 데이터 허브 - 티커/펀딩비/가격 이력을 한 번 조회해 모든 모듈에 공유"""
+
+    TOPIC_TICKER = 'ticker'
+    TOPIC_FUNDING = 'funding'
+
+    def __init__(self, bitget_client=None, symbol: str = 'BTCUSDT', history_minutes: int = 60):
+        self.bitget_client = bitget_client
+        self.symbol = symbol
+
+        # 기본 허용 지연 (초)
+        self.DEFAULT_TICKER_MAX_AGE = 5.0
+        self.DEFAULT_FUNDING_MAX_AGE = 60.0
+        self.HISTORY_MIN_SPACING = 1.0
+
+        # 최신 값 캐시: {(topic, symbol): {'data': ..., 'fetched_at': monotonic}}
+        self._cache: Dict[tuple, Dict] = {}
+
+        # 진행 중인 조회 (동시 요청 병합)
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+        # 가격 이력 (심볼별)
+        self.history_window = timedelta(minutes=history_minutes)
+        self._price_history: Dict[str, Deque[Dict]] = {}
+
+        self.stats = {
+            'fetches': 0,
+            'fetch_failures': 0,
+            'cache_hits': 0,
+            'coalesced': 0
+        }
+
+        logger.info(f"✅ 시장 데이터 허브 초기화 완료 - {symbol}, 가격 이력 {history_minutes}분")
+
+    def set_bitget_client(self, bitget_client):
+        """Bitget 클라이언트 설정"""
+        self.bitget_client = bitget_client
+
+    # ===== 조회 API =====
+
+    async def get_ticker(self, symbol: str = None, max_age: float = None) -> Dict:
+        """정규화된 티커 조회 - max_age 이내 캐시가 있으면 재사용"""
+        symbol = symbol or self.symbol
+        if max_age is None:
+            max_age = self.DEFAULT_TICKER_MAX_AGE
+        return await self._get(self.TOPIC_TICKER, symbol, max_age)
+
+    async def get_funding_rate(self, symbol: str = None, max_age: float = None) -> Dict:
+        """펀딩비 조회 - max_age 이내 캐시가 있으면 재사용"""
+        symbol = symbol or self.symbol
+        if max_age is None:
+            max_age = self.DEFAULT_FUNDING_MAX_AGE
+        return await self._get(self.TOPIC_FUNDING, symbol, max_age)
+
+    async def get_current_price(self, symbol: str = None, max_age: float = None) -> float:
+        """현재가만 조회"""
+        ticker = await self.get_ticker(symbol, max_age)
+        try:
+            return float(ticker.get('last', 0)) if ticker else 0.0
+        except (ValueError, TypeError):
+            return 0.0
+
+    def get_cached(self, topic: str, symbol: str = None) -> Optional[Dict]:
+        """네트워크 호출 없이 마지막 값 반환"""
+        entry = self._cache.get((topic, symbol or self.symbol))
+        return entry['data'] if entry else None
+
+    def get_age(self, topic: str, symbol: str = None) -> Optional[float]:
+        """마지막 값의 경과 시간(초)"""
+        entry = self._cache.get((topic, symbol or self.symbol))
+        if not entry:
+            return None
+        return time.monotonic() - entry['fetched_at']
+
+    def get_price_history(self, symbol: str = None, minutes: int = None) -> List[Dict]:
+        """가격 이력 반환 - [{'price', 'volume', 'timestamp'}] 오래된 순"""
+        history = self._price_history.get(symbol or self.symbol)
+        if not history:
+            return []
+        if minutes is None:
+            return list(history)
+        cutoff = datetime.now() - timedelta(minutes=minutes)
+        return [p for p in history if p['timestamp'] >= cutoff]
+
+    def get_price_at(self, when: datetime, symbol: str = None, tolerance_seconds: int = 120) -> Optional[Dict]:
+        """특정 시점에 가장 가까운 이력 반환 (허용 오차 밖이면 None)"""
+        history = self._price_history.get(symbol or self.symbol)
+        if not history:
+            return None
+
+        closest = min(history, key=lambda p: abs((p['timestamp'] - when).total_seconds()))
+        if abs((closest['timestamp'] - when).total_seconds()) > tolerance_seconds:
+            return None
+        return closest
+
+    def publish(self, topic: str, data: Dict, symbol: str = None):
+        """외부 소스(웹소켓 등)에서 받은 값을 캐시에 반영 - 이후 조회는 REST 없이 응답"""
+        if not data:
+            return
+        symbol = symbol or self.symbol
+        self._cache[(topic, symbol)] = {'data': data, 'fetched_at': time.monotonic()}
+        if topic == self.TOPIC_TICKER:
+            self._record_price(symbol, data)
+
+    # ===== 내부 조회 (single-flight) =====
+
+    async def _get(self, topic: str, symbol: str, max_age: float) -> Dict:
+        key = (topic, symbol)
+
+        entry = self._cache.get(key)
+        if entry and time.monotonic() - entry['fetched_at'] <= max_age:
+            self.stats['cache_hits'] += 1
+            return entry['data']
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats['coalesced'] += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            data = await self._fetch(topic, symbol)
+            future.set_result(data)
+        except Exception as e:
+            # 조회 실패 시 마지막 값(있으면)으로 응답
+            logger.warning(f"시장 데이터 조회 실패 ({topic}/{symbol}): {e}")
+            self.stats['fetch_failures'] += 1
+            data = entry['data'] if entry else {}
+            future.set_result(data)
+        finally:
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(key, None)
+
+        return data
+
+    async def _fetch(self, topic: str, symbol: str) -> Dict:
+        if not self.bitget_client:
+            raise RuntimeError("Bitget 클라이언트가 설정되지 않음")
+
+        self.stats['fetches'] += 1
+
+        if topic == self.TOPIC_TICKER:
+            data = await self.bitget_client.get_ticker(symbol)
+        elif topic == self.TOPIC_FUNDING:
+            data = await self.bitget_client.get_funding_rate(symbol)
+            if isinstance(data, list):
+                data = data[0] if data else {}
+        else:
+            raise ValueError(f"알 수 없는 토픽: {topic}")
+
+        if not data:
+            raise ValueError("빈 응답")
+
+        self._cache[(topic, symbol)] = {'data': data, 'fetched_at': time.monotonic()}
+
+        if topic == self.TOPIC_TICKER:
+            self._record_price(symbol, data)
+
+        return data
+
+    def _record_price(self, symbol: str, ticker: Dict):
+        try:
+            price = float(ticker.get('last', 0))
+            if price <= 0:
+                return
+            volume = float(ticker.get('baseVolume', ticker.get('volume', 0)) or 0)
+        except (ValueError, TypeError):
+            return
+
+        now = datetime.now()
+        history = self._price_history.setdefault(symbol, deque())
+
+        # 스트림 틱이 몰려도 이력은 1초에 1개만 유지
+        if history and (now - history[-1]['timestamp']).total_seconds() < self.HISTORY_MIN_SPACING:
+            history[-1] = {'price': price, 'volume': volume, 'timestamp': history[-1]['timestamp']}
+            return
+
+        history.append({'price': price, 'volume': volume, 'timestamp': now})
+
+        cutoff = now - self.history_window
+        while history and history[0]['timestamp'] < cutoff:
+            history.popleft()
+
+    def get_stats(self) -> Dict:
+        """허브 통계"""
+        total = self.stats['fetches'] + self.stats['cache_hits'] + self.stats['coalesced']
+        return {
+            **self.stats,
+            'saved_ratio': (total - self.stats['fetches']) / total if total > 0 else 0.0
+        }
@@ -0,0 +1,121 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+QUOTE_ASSET = 'USDT'
+
+# 계약 명세 조회 실패 시 사용 (계약 1개 기초 자산 수량, 가격 단위) - 기존 BTC 고정값
+DEFAULT_CONTRACT_SPECS = {
+    'BTC_USDT': (0.0001, 0.1)
+}
+
+
+def symbol_to_contract(symbol: str) -> str:
+    """비트겟 심볼 → 게이트 계약 (ETHUSDT → ETH_USDT)"""
+    symbol = symbol.strip().upper()
+    if '_' in symbol:
+        return symbol
+    if symbol.endswith(QUOTE_ASSET) and len(symbol) > len(QUOTE_ASSET):
+        return f"{symbol[:-len(QUOTE_ASSET)]}_{QUOTE_ASSET}"
+    raise ValueError(f"게이트 계약으로 변환할 수 없는 심볼: {symbol}")
+
+
+def contract_to_symbol(contract: str) -> str:
+    """게이트 계약 → 비트겟 심볼 (ETH_USDT → ETHUSDT)"""
+    return contract.strip().upper().replace('_', '')
+
+
+@dataclass
+class ContractSpec:
+    symbol: str                # 비트겟 심볼
+    contract: str              # 게이트 계약
+    quanto_multiplier: float   # 게이트 계약 1개당 기초 자산 수량
+    price_tick: float          # 게이트 주문 가격 단위
+    leverage_min: int = 1
+    leverage_max: int = 100
+    fetched_at: float = field(default_factory=time.monotonic)
+
+    def contracts_for(self, base_amount: float) -> int:
+        """기초 자산 수량 → 게이트 계약 수 (내림)"""
+        return int(base_amount / self.quanto_multiplier)
+
+    def base_amount(self, contracts: float) -> float:
+        return contracts * self.quanto_multiplier
+
+    @property
+    def price_decimals(self) -> int:
+        """가격 단위의 소수 자릿수 (0.1 → 1, 0.00001 → 5)"""
+        if not self.price_tick or self.price_tick <= 0:
+            return 2
+        return max(0, -Decimal(str(self.price_tick)).normalize().as_tuple().exponent)
+
+    def format_price(self, price: float) -> str:
+        """가격 단위로 반올림한 문자열 (주문 해시 등 비교용 키)"""
+        return f"{self.round_price(price):.{self.price_decimals}f}"
+
+    def round_price(self, price: float) -> float:
+        """가격 단위로 반올림"""
+        if not self.price_tick or self.price_tick <= 0:
+            return price
+        tick = Decimal(str(self.price_tick))
+        return float((Decimal(str(price)) / tick).quantize(Decimal(1)) * tick)
+
+
+def default_contract_spec(contract: str, symbol: str = None) -> Optional[ContractSpec]:
+    default = DEFAULT_CONTRACT_SPECS.get(contract)
+    if default is None:
+        return None
+    quanto_multiplier, price_tick = default
+    return ContractSpec(symbol or contract_to_symbol(contract), contract, quanto_multiplier, price_tick)
+
+
+class ContractSpecCache:
+    """게이트 계약 명세 캐시 - 계약별로 한 번 조회해 TTL 동안 재사용, 조회 실패 시 이전 값 또는 기본값"""
+
+    def __init__(self, fetch: Callable[[str], Awaitable[Dict]], ttl: float = 6 * 60 * 60):
+        self.fetch = fetch
+        self.TTL = ttl
+        self.specs: Dict[str, ContractSpec] = {}
+        self.stats = {'hits': 0, 'fetches': 0, 'fetch_failures': 0}
+
+    def get_cached(self, contract: str) -> Optional[ContractSpec]:
+        return self.specs.get(contract)
+
+    async def get(self, contract: str, symbol: str = None) -> ContractSpec:
+        """계약 명세 - 알 수 없는 계약을 조회하지 못하면 ValueError"""
+        cached = self.specs.get(contract)
+        if cached and time.monotonic() - cached.fetched_at < self.TTL:
+            self.stats['hits'] += 1
+            return cached
+
+        self.stats['fetches'] += 1
+        try:
+            data = await self.fetch(contract)
+            spec = ContractSpec(
+                symbol=symbol or contract_to_symbol(contract),
+                contract=contract,
+                quanto_multiplier=float(data['quanto_multiplier']),
+                price_tick=float(data.get('order_price_round') or 0),
+                leverage_min=int(float(data.get('leverage_min') or 1)),
+                leverage_max=int(float(data.get('leverage_max') or 100))
+            )
+            if spec.quanto_multiplier <= 0:
+                raise ValueError(f"잘못된 계약 단위: {data.get('quanto_multiplier')}")
+        except Exception as e:
+            self.stats['fetch_failures'] += 1
+            spec = cached or default_contract_spec(contract, symbol)
+            if spec is None:
+                raise ValueError(f"게이트 계약 명세 조회 실패: {contract} - {e}")
+            logger.warning(f"게이트 계약 명세 조회 실패, {'이전 값' if cached else '기본값'} 사용: {contract} - {e}")
+            return spec
+
+        self.specs[contract] = spec
+        logger.info(f"게이트 계약 명세: {contract} 계약당 {spec.quanto_multiplier} {contract.split('_')[0]}, 가격 단위 {spec.price_tick}")
+        return spec
+
+    def get_stats(self) -> Dict:
+        return {**self.stats, 'contracts': sorted(self.specs)}
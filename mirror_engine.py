@@ -0,0 +1,350 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional, Set
+
+from mirror_latency import STAGE_POLL
+
+logger = logging.getLogger(__name__)
+
+# 엔진 입력 이벤트 (스트림 → 엔진)
+EVENT_TICK = 'tick'
+EVENT_PLAN_ORDER = 'plan_order'
+EVENT_ORDER_FILL = 'order_fill'
+EVENT_POSITION = 'position'
+
+# 스냅샷 차이 종류 (엔진 → 핸들러)
+DIFF_PLAN_ORDERS = 'plan_orders'      # 예약 주문 신규/취소 (+ 주기 작업)
+DIFF_FILLS = 'fills'                  # 신규 체결
+DIFF_POSITIONS = 'positions'          # 포지션 신규/변경/종료
+DIFF_LEVERAGE = 'leverage'            # 레버리지 조회 결과 (변경 여부 포함)
+DIFF_MARGIN_MODE = 'margin_mode'      # 마진 모드 점검 주기
+
+
+def _order_id(order: Dict) -> str:
+    return str(order.get('orderId') or order.get('planOrderId') or order.get('id') or '')
+
+
+def _position_state(position: Dict) -> tuple:
+    """포지션 변경 비교용 값"""
+    return (
+        str(position.get('holdSide', '')),
+        str(position.get('total', '')),
+        str(position.get('openPriceAvg', position.get('averageOpenPrice', ''))),
+        str(position.get('leverage', ''))
+    )
+
+
+class MirrorReconcileEngine:
+    """미러링 조정 엔진 - 틱마다 거래소 상태를 한 번씩 조회해 캐시와 비교하고, 차이 종류별 핸들러를 실행"""
+
+    def __init__(self, system, config=None):
+        self.system = system
+        config = config or system.config
+
+        self.TICK_INTERVAL = getattr(config, 'mirror_engine_tick_interval', 0.5)
+        self.FETCH_TIMEOUT = 10.0
+        # 이 시간(초)을 넘는 틱은 경고 로그
+        self.CYCLE_BUDGET = 3.0
+        self.FILL_LOOKBACK_MS = 60 * 1000
+        self.LATENCY_SAMPLES = 500
+
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.handlers: Dict[str, List[Callable]] = {}
+        self.running = False
+
+        # 마지막 스냅샷 기준 캐시
+        self.plan_order_ids: Optional[Set[str]] = None
+        self.positions: Dict[str, tuple] = {}
+        # 추가 심볼 캐시 {심볼: ...}
+        self.symbol_plan_order_ids: Dict[str, Set[str]] = {}
+        self.symbol_positions: Dict[str, Dict[str, tuple]] = {}
+        self.bitget_leverage: Optional[int] = None
+        self.last_fetch_times = {'leverage': 0.0, 'margin_mode': 0.0}
+
+        self.latencies = deque(maxlen=self.LATENCY_SAMPLES)
+        self.stats = {
+            'ticks': 0,
+            'events': {},
+            'fetches': {},
+            'fetch_failures': {},
+            'diffs': {},
+            'handler_errors': 0,
+            'over_budget': 0,
+            'last_cycle_ms': 0.0,
+            'max_cycle_ms': 0.0
+        }
+
+    # ===== 핸들러 / 이벤트 =====
+
+    def on(self, diff_type: str, handler: Callable):
+        """차이 종류별 핸들러 등록 (동기/비동기 모두 가능)"""
+        self.handlers.setdefault(diff_type, []).append(handler)
+
+    def notify(self, event: str):
+        """스트림 이벤트 등 외부 신호 - 다음 틱을 바로 실행"""
+        self.stats['events'][event] = self.stats['events'].get(event, 0) + 1
+        self.queue.put_nowait(event)
+
+    async def _next_events(self, timeout: float) -> Set[str]:
+        """이벤트가 오거나 timeout이 지날 때까지 대기 후 쌓인 이벤트를 한 번에 꺼냄"""
+        events = set()
+        try:
+            events.add(await asyncio.wait_for(self.queue.get(), timeout=timeout))
+        except asyncio.TimeoutError:
+            events.add(EVENT_TICK)
+        while not self.queue.empty():
+            events.add(self.queue.get_nowait())
+        return events
+
+    async def _dispatch(self, diff_type: str, payload: Dict):
+        self.stats['diffs'][diff_type] = self.stats['diffs'].get(diff_type, 0) + 1
+        for handler in self.handlers.get(diff_type, []):
+            try:
+                result = handler(payload)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self.stats['handler_errors'] += 1
+                logger.error(f"미러 엔진 핸들러 오류 ({diff_type}): {e}")
+
+    # ===== 조회 =====
+
+    async def _fetch(self, name: str, coro):
+        """단일 조회 (시간 제한) - 실패 시 None, 해당 항목은 이번 틱에서 비교하지 않음"""
+        self.stats['fetches'][name] = self.stats['fetches'].get(name, 0) + 1
+        try:
+            return await asyncio.wait_for(coro, timeout=self.FETCH_TIMEOUT)
+        except Exception as e:
+            self.stats['fetch_failures'][name] = self.stats['fetch_failures'].get(name, 0) + 1
+            logger.warning(f"미러 엔진 조회 실패 ({name}): {e}")
+            return None
+
+    def _due(self, name: str, interval: float, now: float) -> bool:
+        return now - self.last_fetch_times.get(name, 0.0) >= interval
+
+    async def _take_snapshot(self, events: Set[str]) -> Dict:
+        """이번 틱에 필요한 조회를 동시에 한 번씩 실행"""
+        system = self.system
+        bitget = system.bitget_mirror
+        now = time.monotonic()
+
+        jobs = {
+            'plan_orders': bitget.get_all_plan_orders_with_tp_sl(system.SYMBOL),
+            'filled_orders': bitget.get_recent_filled_orders(symbol=system.SYMBOL, minutes=5),
+            'positions': bitget.get_positions(system.SYMBOL)
+        }
+        # 추가 심볼도 같은 틱에 동시에 조회 (키: "항목:심볼")
+        for symbol in system.extra_symbols:
+            jobs[f'plan_orders:{symbol}'] = bitget.get_all_plan_orders_with_tp_sl(symbol)
+            jobs[f'filled_orders:{symbol}'] = bitget.get_recent_filled_orders(symbol=symbol, minutes=5)
+            jobs[f'positions:{symbol}'] = bitget.get_positions(symbol)
+        # 레버리지는 주기마다, 포지션 이벤트가 오면 바로 확인
+        if system.leverage_monitoring_enabled and (
+                EVENT_POSITION in events or self._due('leverage', system.leverage_check_interval, now)):
+            jobs['account'] = bitget.get_account_info()
+            self.last_fetch_times['leverage'] = now
+
+        names = list(jobs)
+        results = await asyncio.gather(
+            system._update_current_prices(),
+            system._update_symbol_prices(),
+            *(self._fetch(name, jobs[name]) for name in names)
+        )
+        return dict(zip(names, results[2:]))
+
+    # ===== 비교 =====
+
+    def _diff_plan_orders(self, plan_data: Optional[Dict], symbol: str = None) -> Optional[Dict]:
+        if not isinstance(plan_data, dict):
+            return None
+        orders = list(plan_data.get('plan_orders', []) or []) + list(plan_data.get('tp_sl_orders', []) or [])
+        current_ids = {oid for oid in (_order_id(order) for order in orders) if oid}
+        if symbol is None:
+            previous_ids = self.plan_order_ids if self.plan_order_ids is not None else current_ids
+            self.plan_order_ids = current_ids
+        else:
+            previous_ids = self.symbol_plan_order_ids.get(symbol, current_ids)
+            self.symbol_plan_order_ids[symbol] = current_ids
+        return {
+            'orders': orders,
+            'new_ids': current_ids - previous_ids,
+            'removed_ids': previous_ids - current_ids
+        }
+
+    def _diff_fills(self, filled_orders: Optional[List[Dict]], processed: Set[str] = None) -> Optional[Dict]:
+        """신규 체결 - 추가 심볼은 processed 없이 시간으로만 거르고, 단위별 처리 기록으로 중복 제외"""
+        if filled_orders is None:
+            return None
+        if processed is None:
+            processed = self.system.position_manager.processed_orders
+        cutoff = int(time.time() * 1000) - self.FILL_LOOKBACK_MS
+        new_fills = []
+        for order in filled_orders:
+            order_id = _order_id(order)
+            if not order_id or order_id in processed:
+                continue
+            try:
+                filled_at = int(order.get('uTime') or order.get('cTime') or 0)
+            except (ValueError, TypeError):
+                filled_at = 0
+            # 최근 1분 이내 체결만 신규로 처리 (시작 전 체결 재처리 방지)
+            if filled_at and filled_at < cutoff:
+                continue
+            new_fills.append(order)
+        return {'all': filled_orders, 'new': new_fills}
+
+    def _active_positions(self, positions: List[Dict]) -> tuple:
+        """보유 중인 포지션 {포지션 ID: 비교용 값}, {포지션 ID: 포지션}"""
+        utils = self.system.utils
+        current = {}
+        active = {}
+        for position in positions:
+            try:
+                if float(position.get('total', 0)) <= 0:
+                    continue
+            except (ValueError, TypeError):
+                continue
+            pos_id = utils.generate_position_id(position)
+            current[pos_id] = _position_state(position)
+            active[pos_id] = position
+        return current, active
+
+    def _diff_positions(self, positions: Optional[List[Dict]]) -> Optional[Dict]:
+        if positions is None:
+            return None
+        current, active = self._active_positions(positions)
+
+        changed = [active[pos_id] for pos_id, state in current.items() if self.positions.get(pos_id) != state]
+        # 종료 판단은 미러링 기록 기준 (기존 루프와 동일)
+        mirrored = set(self.system.mirrored_positions.keys())
+        closed = [pos_id for pos_id in mirrored - set(current) if pos_id not in self.system.startup_positions]
+        self.positions = current
+        return {'active': list(active.values()), 'changed': changed, 'closed': closed}
+
+    def _diff_symbol_positions(self, symbol: str, positions: Optional[List[Dict]]) -> Optional[Dict]:
+        """추가 심볼 포지션 - 종료 판단은 단위별 미러링 기록으로 하므로 보유 목록 변화 여부만 표시"""
+        if positions is None:
+            return None
+        current, active = self._active_positions(positions)
+        previous = self.symbol_positions.get(symbol, {})
+        self.symbol_positions[symbol] = current
+        changed = [active[pos_id] for pos_id, state in current.items() if previous.get(pos_id) != state]
+        return {'active': list(active.values()), 'changed': changed, 'dirty': bool(changed) or set(previous) != set(current)}
+
+    def _diff_symbols(self, snapshot: Dict, with_positions: bool) -> Dict[str, Dict]:
+        """추가 심볼별 차이 {심볼: {'fills', 'plan_orders', 'positions'}} - 조회 실패 항목은 None"""
+        diffs = {}
+        for symbol in self.system.extra_symbols:
+            filled_orders = snapshot.get(f'filled_orders:{symbol}')
+            plan_orders = self._diff_plan_orders(snapshot.get(f'plan_orders:{symbol}'), symbol)
+            if plan_orders is not None:
+                plan_orders['filled_orders'] = filled_orders
+            diffs[symbol] = {
+                'fills': self._diff_fills(filled_orders, processed=set()),
+                'plan_orders': plan_orders,
+                'positions': self._diff_symbol_positions(symbol, snapshot.get(f'positions:{symbol}')) if with_positions else None
+            }
+        return diffs
+
+    @staticmethod
+    def _by_symbol(symbol_diffs: Dict[str, Dict], kind: str) -> Dict[str, Dict]:
+        return {symbol: diffs[kind] for symbol, diffs in symbol_diffs.items() if diffs[kind] is not None}
+
+    async def _diff_leverage(self, account: Optional[Dict]) -> Optional[Dict]:
+        if not account:
+            return None
+        leverage = await self.system.utils.extract_bitget_leverage_enhanced(account_data=account)
+        previous = self.bitget_leverage if self.bitget_leverage is not None else self.system.current_bitget_leverage
+        self.bitget_leverage = leverage
+        return {'account': account, 'old': previous, 'new': leverage, 'changed': leverage != previous}
+
+    # ===== 틱 =====
+
+    async def run_tick(self, events: Set[str]):
+        started = time.monotonic()
+        self.stats['ticks'] += 1
+
+        with self.system.position_manager.latency.span(STAGE_POLL):
+            snapshot = await self._take_snapshot(events)
+
+        fills = self._diff_fills(snapshot.get('filled_orders'))
+        plan_orders = self._diff_plan_orders(snapshot.get('plan_orders'))
+        positions = self._diff_positions(snapshot.get('positions'))
+        leverage = await self._diff_leverage(snapshot.get('account'))
+        # 추가 심볼 포지션은 기본 심볼 포지션과 함께 전달되므로 기본 조회가 실패하면 캐시를 갱신하지 않음
+        symbol_diffs = self._diff_symbols(snapshot, with_positions=positions is not None)
+
+        # 체결 → 예약 주문 → 포지션 순으로 처리 (체결 기록을 예약 주문 분석보다 먼저 반영)
+        # 추가 심볼 결과는 payload['symbols'][심볼]로 함께 전달 (기본 심볼과 같은 형태)
+        if fills is not None:
+            await self._dispatch(DIFF_FILLS, {**fills, 'symbols': self._by_symbol(symbol_diffs, 'fills')})
+        if plan_orders is not None:
+            await self._dispatch(DIFF_PLAN_ORDERS, {
+                **plan_orders,
+                'filled_orders': snapshot.get('filled_orders'),
+                'symbols': self._by_symbol(symbol_diffs, 'plan_orders')
+            })
+        symbol_positions = self._by_symbol(symbol_diffs, 'positions')
+        if positions is not None and (positions['changed'] or positions['closed']
+                                      or any(diff['dirty'] for diff in symbol_positions.values())):
+            await self._dispatch(DIFF_POSITIONS, {**positions, 'symbols': symbol_positions})
+        if leverage is not None:
+            await self._dispatch(DIFF_LEVERAGE, leverage)
+
+        now = time.monotonic()
+        if self.system.margin_mode_enforcement_enabled and self._due('margin_mode', self.system.margin_mode_check_interval, now):
+            self.last_fetch_times['margin_mode'] = now
+            await self._dispatch(DIFF_MARGIN_MODE, {})
+
+        self._record_latency(time.monotonic() - started)
+
+    def _record_latency(self, seconds: float):
+        elapsed_ms = seconds * 1000
+        self.latencies.append(elapsed_ms)
+        self.stats['last_cycle_ms'] = elapsed_ms
+        self.stats['max_cycle_ms'] = max(self.stats['max_cycle_ms'], elapsed_ms)
+        if seconds > self.CYCLE_BUDGET:
+            self.stats['over_budget'] += 1
+            logger.warning(f"미러 엔진 틱 지연: {elapsed_ms:.0f}ms (기준 {self.CYCLE_BUDGET * 1000:.0f}ms)")
+
+    def _wait_timeout(self) -> float:
+        """비공개 스트림이 정상이면 이벤트 위주로, 아니면 기본 주기로 조회"""
+        stream = self.system.bitget_private_stream
+        if stream is not None and stream.is_healthy():
+            return max(self.TICK_INTERVAL, self.system.STREAM_FALLBACK_POLL_INTERVAL)
+        return self.TICK_INTERVAL
+
+    async def run(self):
+        self.running = True
+        logger.info(f"미러 조정 엔진 시작 (틱 {self.TICK_INTERVAL}초)")
+        consecutive_errors = 0
+
+        while self.system.monitoring:
+            try:
+                if not self.system.mirror_trading_enabled:
+                    await asyncio.sleep(self.TICK_INTERVAL * 5)
+                    continue
+
+                events = await self._next_events(self._wait_timeout())
+                await self.run_tick(events)
+                consecutive_errors = 0
+
+            except Exception as e:
+                consecutive_errors += 1
+                logger.error(f"미러 조정 엔진 오류 (연속 {consecutive_errors}회): {e}")
+                if consecutive_errors >= 5:
+                    await self.system.notify_engine_failure(consecutive_errors, e)
+                await asyncio.sleep(self.TICK_INTERVAL * 2)
+
+        self.running = False
+
+    def get_stats(self) -> Dict:
+        samples = sorted(self.latencies)
+        count = len(samples)
+        return {
+            **self.stats,
+            'avg_cycle_ms': round(sum(samples) / count, 1) if count else 0.0,
+            'p95_cycle_ms': round(samples[min(count - 1, int(count * 0.95))], 1) if count else 0.0
+        }
@@ -0,0 +1,263 @@
+import logging
+import os
+from typing import Dict, Optional
+
+from mirror_contracts import ContractSpecCache
+from mirror_trading_utils import MirrorTradingUtils
+from mirror_position_manager import MirrorPositionManager
+from mirror_reconcile import PlanOrderReconciler
+
+logger = logging.getLogger(__name__)
+
+
+def _with_suffix(path: str, name: str) -> str:
+    """계정별 파일 경로 (mirror_state.db → mirror_state.sub1.db), 빈 값이면 그대로 비활성화"""
+    if not path:
+        return ''
+    root, ext = os.path.splitext(path)
+    return f"{root}.{name}{ext}"
+
+
+class FollowerConfig:
+    """팔로워 계정/계약 설정 - 게이트 API 키, 심볼/계약, 파일 경로만 바꾸고 나머지는 기본 설정을 그대로 사용"""
+
+    def __init__(self, base, **overrides):
+        self._base = base
+        self.__dict__.update(overrides)
+
+    def __getattr__(self, name):
+        return getattr(self._base, name)
+
+
+class FollowerTelegram:
+    """팔로워 알림 - 메시지 앞에 계정 이름 표시"""
+
+    def __init__(self, telegram_bot, name: str):
+        self.telegram = telegram_bot
+        self.name = name
+
+    async def send_message(self, text: str, *args, **kwargs):
+        return await self.telegram.send_message(f"[{self.name}] {text}", *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.telegram, name)
+
+
+class _SourceAccountView:
+    """팔로워 계정 스냅샷용 비트겟 계정 조회 - 기본 계정 스냅샷의 비트겟 계정을 재사용 (비트겟 조회 중복 방지)"""
+
+    def __init__(self, source_snapshots):
+        self.source = source_snapshots
+
+    async def get_account_info(self) -> Dict:
+        return (await self.source.get()).bitget_account
+
+
+class MirrorFollower:
+    """게이트 미러링 단위 1개 (계정 × 계약) - 자체 게이트 클라이언트, 포지션 매니저(주문 상태 저장소), 복제 비율
+
+    팔로워 계정은 기본 심볼을, 추가 심볼 단위는 해당 계약을 미러링 (상태는 단위별 파일로 분리)
+    비트겟은 직접 폴링하지 않고 조정 엔진이 틱마다 한 번 조회한 결과를 받아 처리
+    """
+
+    def __init__(self, name: str, config, bitget_mirror, gate_client, telegram_bot,
+                 ratio: float = 1.0, api_key: Optional[str] = None, api_secret: Optional[str] = None,
+                 source_snapshots=None, gate_mirror_client=None, symbol: str = None, contract: str = None,
+                 account_snapshots=None, contract_specs: Optional[ContractSpecCache] = None):
+        self.name = name
+        self.logger = logging.getLogger(f'mirror_follower.{name}')
+
+        overrides = {
+            'mirror_journal_db': _with_suffix(getattr(config, 'mirror_journal_db', ''), name),
+            'mirror_latency_export': _with_suffix(getattr(config, 'mirror_latency_export', ''), name)
+        }
+        # API 키를 생략하면 기본 계정 (추가 심볼 단위)
+        if api_key is not None:
+            overrides.update(gate_api_key=api_key, gate_api_secret=api_secret,
+                             GATE_API_KEY=api_key, GATE_API_SECRET=api_secret)
+        if symbol:
+            overrides.update(symbol=symbol, gate_contract=contract)
+        self.config = FollowerConfig(config, **overrides)
+        self.PRIMARY_SYMBOL = getattr(config, 'symbol', 'BTCUSDT')
+        self.contract_specs = contract_specs
+        self.disabled = False
+
+        # 게이트 클라이언트는 계정별 (요청 예산은 API 키 단위로 분리됨)
+        if gate_mirror_client is None:
+            from gateio_mirror_client import GateioMirrorClient
+            gate_mirror_client = GateioMirrorClient(self.config)
+        self.gate_mirror = gate_mirror_client
+
+        self.utils = MirrorTradingUtils(self.config, bitget_mirror, gate_client, self.gate_mirror)
+        # 같은 게이트 계정의 다른 계약 단위는 계정 자산 스냅샷을 공유 (갱신 루프는 소유 단위만 실행)
+        self.owns_snapshots = account_snapshots is None
+        if account_snapshots is not None:
+            self.utils.account_snapshots = account_snapshots
+        elif source_snapshots is not None and self.utils.account_snapshots:
+            self.utils.account_snapshots.bitget = _SourceAccountView(source_snapshots)
+
+        self.position_manager = MirrorPositionManager(
+            self.config, bitget_mirror, gate_client, self.gate_mirror, FollowerTelegram(telegram_bot, name), self.utils
+        )
+        self.position_manager.mirror_ratio_multiplier = ratio
+        self.utils.current_ratio_multiplier = ratio
+        self.SYMBOL = self.position_manager.SYMBOL
+        self.GATE_CONTRACT = self.position_manager.GATE_CONTRACT
+        # 예약 주문 동기화 분석은 단위별 (매핑/게이트 주문이 계정·계약마다 다름)
+        self.plan_order_reconciler = PlanOrderReconciler(
+            self.position_manager, lambda: self.position_manager._get_all_current_plan_orders_enhanced(raise_on_error=True)
+        )
+
+        self.gate_leverage: Optional[int] = None
+        self.stats = {'plan_order_cycles': 0, 'fills': 0, 'leverage_syncs': 0, 'errors': 0}
+
+    @property
+    def ratio(self) -> float:
+        return self.position_manager.mirror_ratio_multiplier
+
+    @property
+    def is_extra_symbol(self) -> bool:
+        return self.SYMBOL != self.PRIMARY_SYMBOL
+
+    def set_ratio(self, ratio: float):
+        self.position_manager.mirror_ratio_multiplier = ratio
+        self.utils.current_ratio_multiplier = ratio
+
+    async def _load_contract_spec(self) -> bool:
+        """계약 명세 조회 후 적용 - 알 수 없는 계약이면 이 단위는 비활성화"""
+        if self.contract_specs is None:
+            return True
+        try:
+            self.position_manager.set_contract_spec(await self.contract_specs.get(self.GATE_CONTRACT, self.SYMBOL))
+            return True
+        except ValueError as e:
+            self.disabled = True
+            self.position_manager.mirror_trading_enabled = False
+            self.logger.error(f"계약 명세 없음, 미러링 제외: {self.name} - {e}")
+            return False
+
+    async def initialize(self, bitget_leverage: int, mirror_enabled: bool):
+        try:
+            self.logger.info(f"팔로워 초기화 시작: {self.name} ({self.SYMBOL} → {self.GATE_CONTRACT}, 복제 비율 {self.ratio}x)")
+            if not await self._load_contract_spec():
+                return
+            await self.gate_mirror.initialize()
+            await self.sync_leverage(bitget_leverage)
+
+            self.position_manager.mirror_trading_enabled = mirror_enabled
+            await self.position_manager.initialize()
+            self.logger.info(f"팔로워 초기화 완료: {self.name}")
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error(f"팔로워 초기화 실패: {self.name} - {e}")
+
+    def set_enabled(self, enable: bool):
+        self.position_manager.mirror_trading_enabled = enable and not self.disabled
+
+    def update_prices(self, bitget_price: float, gate_price: float, price_diff_percent: float):
+        self.position_manager.update_prices(bitget_price, gate_price, price_diff_percent)
+
+    # ===== 조정 엔진 결과 처리 =====
+
+    def _select(self, diff: Dict) -> Optional[Dict]:
+        """이 단위 심볼의 조회 결과 - 기본 심볼은 diff 그대로, 추가 심볼은 diff['symbols'] (이번 틱 조회 실패/비활성화 시 None)"""
+        if self.disabled:
+            return None
+        if not self.is_extra_symbol:
+            return diff
+        return (diff.get('symbols') or {}).get(self.SYMBOL)
+
+    async def on_fills(self, diff: Dict):
+        pm = self.position_manager
+        data = self._select(diff)
+        if data is None:
+            return
+        try:
+            for order in data['new']:
+                order_id = order.get('orderId', order.get('id', ''))
+                reduce_only = order.get('reduceOnly', 'false')
+                if reduce_only == 'true' or reduce_only is True or order_id in pm.processed_orders:
+                    continue
+                await pm.process_filled_order(order)
+                pm.processed_orders.add(order_id)
+                self.stats['fills'] += 1
+
+            if len(pm.processed_orders) > 1000:
+                pm.processed_orders = set(list(pm.processed_orders)[-500:])
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error(f"팔로워 체결 처리 실패: {self.name} - {e}")
+
+    async def on_plan_orders(self, diff: Dict):
+        data = self._select(diff)
+        if data is None:
+            return
+        try:
+            self.stats['plan_order_cycles'] += 1
+            await self.position_manager.monitor_plan_orders_cycle(
+                plan_orders=data['orders'], filled_orders=data['filled_orders']
+            )
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error(f"팔로워 예약 주문 처리 실패: {self.name} - {e}")
+
+    async def on_positions(self, diff: Dict):
+        pm = self.position_manager
+        data = self._select(diff)
+        if data is None:
+            return
+        try:
+            for pos in data['changed']:
+                await pm.process_position(pos)
+            active_ids = {self.utils.generate_position_id(pos) for pos in data['active']}
+            for pos_id in list(pm.mirrored_positions.keys()):
+                if pos_id not in active_ids and pos_id not in pm.startup_positions:
+                    await pm.handle_position_close(pos_id)
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error(f"팔로워 포지션 처리 실패: {self.name} - {e}")
+
+    async def sync_leverage(self, bitget_leverage: int):
+        """비트겟 레버리지를 이 계정 게이트에 반영 (변경 시에만)"""
+        if self.disabled or not bitget_leverage or bitget_leverage == self.gate_leverage:
+            return
+        try:
+            if await self.gate_mirror.mirror_bitget_leverage(bitget_leverage, self.GATE_CONTRACT):
+                self.logger.info(f"팔로워 레버리지 동기화: {self.name} {self.gate_leverage}x → {bitget_leverage}x")
+                self.gate_leverage = bitget_leverage
+                self.stats['leverage_syncs'] += 1
+            else:
+                self.logger.warning(f"팔로워 레버리지 동기화 실패: {self.name} {bitget_leverage}x")
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error(f"팔로워 레버리지 동기화 오류: {self.name} - {e}")
+
+    async def ensure_cross_margin(self):
+        if self.disabled:
+            return
+        try:
+            await self.position_manager._ensure_cross_margin_mode(f"팔로워 점검({self.name})")
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error(f"팔로워 마진 모드 점검 실패: {self.name} - {e}")
+
+    async def stop(self):
+        try:
+            await self.position_manager.stop()
+            await self.gate_mirror.close()
+        except Exception as e:
+            self.logger.error(f"팔로워 중지 실패: {self.name} - {e}")
+
+    def get_stats(self) -> Dict:
+        pm = self.position_manager
+        return {
+            **self.stats,
+            'symbol': self.SYMBOL,
+            'contract': self.GATE_CONTRACT,
+            'disabled': self.disabled,
+            'ratio': self.ratio,
+            'mirrored_plan_orders': len(pm.mirrored_plan_orders),
+            'reconcile': self.plan_order_reconciler.get_stats(),
+            'daily_stats': {key: value for key, value in pm.daily_stats.items() if value},
+            'rate_limiter': self.gate_mirror.rate_limiter.get_stats()
+        }
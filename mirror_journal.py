@@ -0,0 +1,126 @@
+import json
+import logging
+import sqlite3
+import time
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class MirrorJournal:
+    """미러링 상태 저널 (SQLite WAL) - 주문 매핑은 변경 즉시 기록, 나머지 상태는 주기 스냅샷, 재시작 시 복원"""
+
+    def __init__(self, db_path: str = 'mirror_state.db'):
+        self.db_path = db_path
+        self.stats = {'order_writes': 0, 'order_removes': 0, 'snapshots': 0, 'write_errors': 0}
+
+        self._conn = sqlite3.connect(db_path)
+        self._conn.row_factory = sqlite3.Row
+        # 쓰기 중 종료되어도 마지막 커밋까지 보존, 커밋마다 fsync는 하지 않음
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_tables()
+
+    def _create_tables(self):
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS mirror_orders (
+                    bitget_order_id TEXT PRIMARY KEY,
+                    gate_order_id TEXT,
+                    record TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS mirror_state (
+                    name TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    saved_at REAL NOT NULL
+                )
+            """)
+
+    # ===== 주문 매핑 (즉시 기록) =====
+
+    def save_order(self, bitget_order_id: str, gate_order_id: Optional[str], record: Dict):
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO mirror_orders (bitget_order_id, gate_order_id, record, updated_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (bitget_order_id, gate_order_id, json.dumps(record, default=str), time.time())
+                )
+            self.stats['order_writes'] += 1
+        except Exception as e:
+            self.stats['write_errors'] += 1
+            logger.error(f"미러 저널 주문 기록 실패 ({bitget_order_id}): {e}")
+
+    def remove_order(self, bitget_order_id: str):
+        try:
+            with self._conn:
+                self._conn.execute("DELETE FROM mirror_orders WHERE bitget_order_id = ?", (bitget_order_id,))
+            self.stats['order_removes'] += 1
+        except Exception as e:
+            self.stats['write_errors'] += 1
+            logger.error(f"미러 저널 주문 삭제 실패 ({bitget_order_id}): {e}")
+
+    def remove_orders(self, bitget_order_ids: Iterable[str]):
+        ids = [(order_id,) for order_id in bitget_order_ids]
+        if not ids:
+            return
+        try:
+            with self._conn:
+                self._conn.executemany("DELETE FROM mirror_orders WHERE bitget_order_id = ?", ids)
+            self.stats['order_removes'] += len(ids)
+        except Exception as e:
+            self.stats['write_errors'] += 1
+            logger.error(f"미러 저널 주문 일괄 삭제 실패: {e}")
+
+    def load_orders(self) -> Dict[str, Dict]:
+        """{비트겟 주문 ID: 미러링 기록}"""
+        orders = {}
+        for row in self._conn.execute("SELECT bitget_order_id, record FROM mirror_orders"):
+            try:
+                orders[row['bitget_order_id']] = json.loads(row['record'])
+            except ValueError:
+                continue
+        return orders
+
+    # ===== 상태 스냅샷 =====
+
+    def save_snapshot(self, state: Dict[str, object]):
+        """여러 상태를 한 트랜잭션으로 저장 {이름: JSON 직렬화 가능한 값}"""
+        now = time.time()
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO mirror_state (name, payload, saved_at) VALUES (?, ?, ?)",
+                    [(name, json.dumps(value, default=str), now) for name, value in state.items()]
+                )
+            self.stats['snapshots'] += 1
+        except Exception as e:
+            self.stats['write_errors'] += 1
+            logger.error(f"미러 저널 스냅샷 저장 실패: {e}")
+
+    def load_snapshot(self, max_age: float = None) -> Dict[str, object]:
+        """저장된 상태 {이름: 값} - max_age(초)보다 오래된 항목 제외"""
+        state = {}
+        now = time.time()
+        for row in self._conn.execute("SELECT name, payload, saved_at FROM mirror_state"):
+            if max_age is not None and now - row['saved_at'] > max_age:
+                continue
+            try:
+                state[row['name']] = json.loads(row['payload'])
+            except ValueError:
+                continue
+        return state
+
+    def get_stats(self) -> Dict:
+        row = self._conn.execute("SELECT COUNT(*) AS cnt FROM mirror_orders").fetchone()
+        return {**self.stats, 'orders': row['cnt']}
+
+    def close(self):
+        try:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.close()
+        except Exception:
+            pass
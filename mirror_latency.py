@@ -0,0 +1,197 @@
+import bisect
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# 미러링 단계
+STAGE_POLL = 'poll'                   # 엔진 틱 거래소 조회 (비트겟/게이트 동시 조회)
+STAGE_CYCLE = 'cycle'                 # monitor_plan_orders_cycle 1회
+STAGE_DETECT = 'detect'               # 비트겟 주문 생성(cTime) → 사이클에서 신규 감지
+STAGE_DEDUPE = 'dedupe'               # 중복/처리 여부 확인
+STAGE_MARGIN_CALC = 'margin_calc'     # 복제 비율 적용 마진 계산
+STAGE_MARGIN_MODE = 'gate_margin_mode'  # 게이트 마진 모드 확인/강제
+STAGE_LEVERAGE = 'gate_leverage'      # 게이트 레버리지 설정
+STAGE_SUBMIT = 'submit'               # 게이트 주문 생성 요청
+STAGE_MIRROR = 'mirror_total'         # 주문 1건 미러링 처리 전체
+STAGE_END_TO_END = 'end_to_end'       # 비트겟 주문 생성 → 게이트 주문 생성 완료
+
+STAGE_LABELS = {
+    STAGE_POLL: '거래소 조회',
+    STAGE_CYCLE: '예약 주문 사이클',
+    STAGE_DETECT: '신규 주문 감지',
+    STAGE_DEDUPE: '중복 확인',
+    STAGE_MARGIN_CALC: '마진 계산',
+    STAGE_MARGIN_MODE: '마진 모드 확인',
+    STAGE_LEVERAGE: '레버리지 설정',
+    STAGE_SUBMIT: '게이트 주문 생성',
+    STAGE_MIRROR: '주문 미러링 전체',
+    STAGE_END_TO_END: '생성→복제 완료'
+}
+
+# 히스토그램 버킷 상한 (ms)
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 시간 히스토그램 - 백분위는 버킷 안 선형 보간"""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float):
+        ms = max(ms, 0.0)
+        self.counts[bisect.bisect_left(self.buckets, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for i, n in enumerate(self.counts):
+            if n and cumulative + n >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max_ms
+                return min(lower + (upper - lower) * (rank - cumulative) / n, self.max_ms)
+            cumulative += n
+        return self.max_ms
+
+    def summary(self) -> Dict:
+        return {
+            'count': self.count,
+            'avg_ms': round(self.total_ms / self.count, 1) if self.count else 0.0,
+            'p50_ms': round(self.percentile(0.50), 1),
+            'p95_ms': round(self.percentile(0.95), 1),
+            'p99_ms': round(self.percentile(0.99), 1),
+            'max_ms': round(self.max_ms, 1)
+        }
+
+
+class LatencyTracker:
+    """미러링 단계별 지연 시간 - 단계별 히스토그램과 최근 주문별 단계 기록"""
+
+    def __init__(self, max_traces: int = 200):
+        self.max_traces = max_traces
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        # 주문 ID -> {단계: ms} (최근 max_traces개)
+        self.traces: 'OrderedDict[str, Dict[str, float]]' = OrderedDict()
+        self.started_at = time.time()
+
+    def observe(self, stage: str, ms: float, order_id: str = None):
+        if stage not in self.histograms:
+            self.histograms[stage] = LatencyHistogram()
+        self.histograms[stage].observe(ms)
+
+        if order_id:
+            trace = self.traces.get(order_id)
+            if trace is None:
+                trace = self.traces[order_id] = {}
+                while len(self.traces) > self.max_traces:
+                    self.traces.popitem(last=False)
+            # 같은 단계가 여러 번이면 합산 (재시도 등)
+            trace[stage] = round(trace.get(stage, 0.0) + ms, 1)
+
+    @contextmanager
+    def span(self, stage: str, order_id: str = None):
+        """with 블록 소요 시간 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, (time.perf_counter() - started) * 1000, order_id)
+
+    def observe_since(self, stage: str, started_ms, order_id: str = None):
+        """거래소 시각(ms) 이후 경과 시간 기록 - 시각이 없거나 잘못되면 무시"""
+        try:
+            started_ms = int(started_ms)
+        except (ValueError, TypeError):
+            return
+        if started_ms <= 0:
+            return
+        elapsed = time.time() * 1000 - started_ms
+        # 시계 오차로 음수가 되거나 재시작 전 주문(하루 이상)은 제외
+        if 0 <= elapsed <= 24 * 60 * 60 * 1000:
+            self.observe(stage, elapsed, order_id)
+
+    def get_trace(self, order_id: str) -> Optional[Dict[str, float]]:
+        return self.traces.get(order_id)
+
+    def recent_traces(self, limit: int = 10) -> List[Dict]:
+        items = list(self.traces.items())[-limit:]
+        return [{'order_id': order_id, **trace} for order_id, trace in items]
+
+    def summary(self) -> Dict[str, Dict]:
+        return {stage: histogram.summary() for stage, histogram in self.histograms.items()}
+
+    def reset(self):
+        self.histograms.clear()
+        self.traces.clear()
+        self.started_at = time.time()
+
+    # ===== 출력 =====
+
+    def format_report(self) -> str:
+        """텔레그램 리포트용 단계별 요약"""
+        if not self.histograms:
+            return "- 기록 없음"
+        lines = []
+        ordered = [stage for stage in STAGE_LABELS if stage in self.histograms]
+        ordered += [stage for stage in self.histograms if stage not in STAGE_LABELS]
+        for stage in ordered:
+            s = self.histograms[stage].summary()
+            lines.append(
+                f"- {STAGE_LABELS.get(stage, stage)}: p50 {_format_ms(s['p50_ms'])} / "
+                f"p95 {_format_ms(s['p95_ms'])} / p99 {_format_ms(s['p99_ms'])} ({s['count']}건)"
+            )
+        return "\n".join(lines)
+
+    def to_json(self) -> str:
+        return json.dumps({
+            'since': self.started_at,
+            'generated_at': time.time(),
+            'stages': self.summary(),
+            'recent_orders': self.recent_traces()
+        }, ensure_ascii=False)
+
+    def to_prometheus(self, name: str = 'mirror_stage_latency_seconds') -> str:
+        """Prometheus 텍스트 형식 히스토그램 (초 단위)"""
+        lines = [
+            f"# HELP {name} Bitget to Gate mirror pipeline stage latency",
+            f"# TYPE {name} histogram"
+        ]
+        for stage, histogram in self.histograms.items():
+            cumulative = 0
+            for upper, n in zip(histogram.buckets, histogram.counts):
+                cumulative += n
+                lines.append(f'{name}_bucket{{stage="{stage}",le="{upper / 1000:g}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {histogram.count}')
+            lines.append(f'{name}_sum{{stage="{stage}"}} {histogram.total_ms / 1000:.6f}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str):
+        """파일로 내보내기 - .prom/.txt는 Prometheus 텍스트, 그 외는 JSON (임시 파일 후 교체)"""
+        try:
+            content = self.to_prometheus() if path.endswith(('.prom', '.txt')) else self.to_json()
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.error(f"미러링 지연 시간 내보내기 실패 ({path}): {e}")
+
+
+def _format_ms(ms: float) -> str:
+    return f"{ms / 1000:.2f}s" if ms >= 1000 else f"{ms:.0f}ms"
@@ -1,11 +1,22 @@
 import os
 import asyncio
 import logging
+import time
 from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 import json
 
 from mirror_trading_utils import MirrorTradingUtils, PositionInfo, MirrorResult
+from order_state_store import (
+    OrderStateStore, PlanOrderSnapshot, MARK_PROCESSED, MARK_ORDER_HASH, MARK_FILLED, HASH_GATE_EXISTING
+)
+from mirror_journal import MirrorJournal
+from mirror_scheduler import MirrorWorkScheduler, LANE_CRITICAL
+from mirror_contracts import ContractSpec, default_contract_spec
+from mirror_latency import (
+    LatencyTracker, STAGE_CYCLE, STAGE_DETECT, STAGE_DEDUPE, STAGE_MARGIN_CALC,
+    STAGE_MARGIN_MODE, STAGE_LEVERAGE, STAGE_SUBMIT, STAGE_MIRROR, STAGE_END_TO_END
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +45,7 @@ class MirrorPositionManager:
         self.mirrored_positions: Dict[str, PositionInfo] = {}
         self.startup_positions: Set[str] = set()
         self.startup_gate_positions: Set[str] = set()
+        self.startup_gate_order_ids: Set[str] = set()
         self.failed_mirrors: List[MirrorResult] = []
         
         # 포지션 크기 추적
@@ -42,15 +54,18 @@ class MirrorPositionManager:
         # 주문 체결 추적
         self.processed_orders: Set[str] = set()
         
+        # 주문 상태 저장소 - 비트겟/게이트 ID, 트리거 가격, 해시 인덱스와 만료 관리
+        self.price_tolerance = 5.0  # 가격 기반 중복 판단 허용 범위 (시세 갱신 시 계약 가격대에 맞춰 재계산)
+        self.trigger_price_ttl = 24 * 60 * 60  # 트리거 가격 중복 기록 최대 유지 시간 (초)
+        self.order_state = OrderStateStore()
+        
         # 예약 주문 추적 관리 - 체결/취소 구분 강화
-        self.mirrored_plan_orders: Dict[str, Dict] = {}
+        self.mirrored_plan_orders: Dict[str, Dict] = self.order_state.plan_orders
         self.processed_plan_orders: Set[str] = set()
         self.startup_plan_orders: Set[str] = set()
         self.startup_plan_orders_processed: bool = False
         
-        # 체결된 주문 추적 - 취소와 구분하기 위함
-        self.recently_filled_order_ids: Set[str] = set()
-        self.filled_order_timestamps: Dict[str, datetime] = {}
+        # 체결된 주문 추적 - 취소와 구분하기 위함 (order_state MARK_FILLED)
         self.filled_order_check_window = 300  # 5분간 체결 기록 유지
         
         # 시세 차이 대응 체결 시스템
@@ -60,7 +75,7 @@ class MirrorPositionManager:
         self.backup_fill_mechanism_enabled = True
         
         # 시세 차이 기반 체결 설정
-        self.price_diff_threshold_for_immediate_fill = 50.0  # 50달러 차이시 즉시 체결
+        self.price_diff_threshold_for_immediate_fill = 50.0  # 이 차이 이상이면 즉시 체결
         self.max_wait_time_for_fill = 120  # 최대 2분 대기
         self.adaptive_wait_multiplier = 1.5  # 시세 차이에 따른 대기 시간 배수
         self.market_fill_retry_count = 3  # 시장가 체결 재시도 횟수
@@ -78,22 +93,27 @@ class MirrorPositionManager:
         # 시세 차이 고려한 체결/취소 구분 강화
         self.price_based_fill_detection = True
         self.price_diff_threshold = 100.0
+        
+        # 가격 기반 임계값의 시세 대비 비율 - 계약마다 가격대가 달라 달러 값은 시세로 환산 (BTC 10만 달러 기준 기존 값)
+        self.PRICE_TOLERANCE_RATIO = 0.00005             # 중복 판단 ±5달러
+        self.IMMEDIATE_FILL_DIFF_RATIO = 0.0005          # 즉시 체결 50달러
+        self.PRICE_DIFF_THRESHOLD_RATIO = 0.001          # 체결/취소 판단 100달러
+        self.PRICE_SYNC_THRESHOLD_RATIO = 0.001          # 예약 주문 처리 지연 100달러
         self.safe_cancel_window = 60  # 안전한 취소 판단을 위한 대기 시간 (초)
         self.order_fill_analysis_cache: Dict[str, Dict] = {}
         
         # 중복 복제 방지 시스템 - 완화된 버전
         self.order_processing_locks: Dict[str, asyncio.Lock] = {}
-        self.recently_processed_orders: Dict[str, datetime] = {}
-        self.order_deduplication_window = 15  # 30초 → 15초로 단축
+        self.order_deduplication_window = 15  # 30초 → 15초로 단축 (order_state MARK_PROCESSED)
         
-        # 해시 기반 중복 방지 - 더 정확한 버전
-        self.processed_order_hashes: Set[str] = set()
-        self.order_hash_timestamps: Dict[str, datetime] = {}
+        # 해시 기반 중복 방지 - 더 정확한 버전 (order_state MARK_ORDER_HASH)
         self.hash_cleanup_interval = 180  # 300초 → 180초로 단축
         
         # 예약 주문 취소 감지 시스템 강화 - 시세 차이 고려
-        self.last_plan_order_ids: Set[str] = set()
-        self.plan_order_snapshot: Dict[str, Dict] = {}
+        # 마지막 사이클의 비트겟 예약 주문 (주문별 지문으로 추가/삭제/변경 비교)
+        self.plan_order_snapshot = PlanOrderSnapshot()
+        # 내용 변경으로 게이트 주문을 교체 중인 비트겟 주문 (지연 측정 기준을 수정 시각으로)
+        self.replacing_plan_orders: Set[str] = set()
         self.cancel_retry_count: Dict[str, int] = {}
         self.max_cancel_retries = 5  # 3회 → 5회로 증가
         self.cancel_force_cleanup_threshold = 10  # 10회 실패 시 강제 정리
@@ -107,24 +127,19 @@ class MirrorPositionManager:
         self.bitget_current_price: float = 0.0
         self.gate_current_price: float = 0.0
         self.price_diff_percent: float = 0.0
-        self.price_sync_threshold: float = 100.0
+        self.price_sync_threshold: float = 100.0  # 시세 갱신 시 PRICE_SYNC_THRESHOLD_RATIO로 재계산
         self.position_wait_timeout: int = 60
         
-        # 가격 기반 중복 방지 시스템 - 완화된 버전
-        self.mirrored_trigger_prices: Set[str] = set()
-        self.price_tolerance = 5.0  # ±5달러 허용
-        
         # 렌더 재구동 시 기존 게이트 포지션 확인
         self.existing_gate_positions: Dict = {}
         self.render_restart_detected: bool = False
         
-        # 게이트 기존 예약 주문 중복 방지 - 개선된 버전
-        self.gate_existing_order_hashes: Set[str] = set()
+        # 게이트 기존 예약 주문 중복 방지 - 개선된 버전 (해시는 order_state HASH_GATE_EXISTING)
         self.gate_existing_orders_detailed: Dict[str, Dict] = {}
         
-        # 주문 ID 매핑 추적
-        self.bitget_to_gate_order_mapping: Dict[str, str] = {}
-        self.gate_to_bitget_order_mapping: Dict[str, str] = {}
+        # 주문 ID 매핑 추적 (조회용 - 변경은 order_state.link / remove_order)
+        self.bitget_to_gate_order_mapping: Dict[str, str] = self.order_state.gate_by_bitget
+        self.gate_to_bitget_order_mapping: Dict[str, str] = self.order_state.bitget_by_gate
         
         # 클로즈 주문 처리 강화
         self.close_order_processing: bool = True
@@ -154,12 +169,32 @@ class MirrorPositionManager:
         self.max_margin_mode_failures = 3
         
         # 설정
-        self.SYMBOL = "BTCUSDT"
-        self.GATE_CONTRACT = "BTC_USDT"
+        self.SYMBOL = getattr(config, 'symbol', 'BTCUSDT')
+        self.GATE_CONTRACT = getattr(config, 'gate_contract', 'BTC_USDT')
+        # 게이트 계약 명세 (계약 수/가격 단위) - 초기화 시 조회한 값으로 교체
+        self.contract_spec: Optional[ContractSpec] = default_contract_spec(self.GATE_CONTRACT, self.SYMBOL)
+        if self.contract_spec:
+            self.order_state.set_price_decimals(self.contract_spec.price_decimals)
         self.MIN_POSITION_SIZE = 0.00001
         self.MIN_MARGIN = 1.0
         self.MAX_RETRIES = 3
         
+        # 미러링 상태 저널 - 재시작 시 주문 매핑/처리 기록/통계 복원
+        self.journal: Optional[MirrorJournal] = None
+        self.journal_disabled = not getattr(config, 'mirror_journal_db', '')
+        self.JOURNAL_CHECKPOINT_INTERVAL = 30  # 스냅샷 저장 주기 (초)
+        self.JOURNAL_MAX_AGE = 24 * 60 * 60  # 이보다 오래된 스냅샷은 복원하지 않음
+        self.last_journal_checkpoint = 0.0
+        
+        # 미러링 단계별 지연 시간 (/stats, 일일 리포트, 선택적 파일 내보내기)
+        self.latency = LatencyTracker()
+        self.latency_export_path = getattr(config, 'mirror_latency_export', '')
+        self.LATENCY_EXPORT_INTERVAL = getattr(config, 'mirror_latency_export_interval', 60)
+        self.last_latency_export = 0.0
+        
+        # 작업 우선순위 스케줄러 - 주문 처리가 동기화/리포트 작업보다 먼저 실행
+        self.scheduler = MirrorWorkScheduler(config)
+        
         # 성과 추적
         self.daily_stats = {
             'total_mirrored': 0,
@@ -203,10 +238,31 @@ class MirrorPositionManager:
         self.logger.info(f"마진 모드 강제 설정: {self.margin_mode_enforcement_enabled}")
         self.logger.info(f"주문 생성 전 마진 모드 체크: {self.margin_mode_check_before_order}")
 
+    def set_contract_spec(self, spec: ContractSpec):
+        """조회한 게이트 계약 명세 적용 (포지션 매니저/유틸리티/게이트 클라이언트 공통)"""
+        self.contract_spec = spec
+        self.utils.contract_spec = spec
+        self.gate_mirror.contract_spec = spec
+        self.order_state.set_price_decimals(spec.price_decimals)
+        self._apply_price_thresholds()
+
+    def _apply_price_thresholds(self):
+        """가격 기반 임계값을 이 계약 시세 기준 값으로 - 가격 단위보다 작아지지 않게, 시세를 모르면 가격 단위 기준"""
+        reference_price = self.bitget_current_price or self.gate_current_price
+        tick = self.contract_spec.price_tick if self.contract_spec else 0.0
+        if reference_price <= 0 and not tick:
+            return
+        reference_price = max(reference_price, 0.0)
+        self.price_tolerance = max(reference_price * self.PRICE_TOLERANCE_RATIO, tick / 2)
+        self.price_diff_threshold_for_immediate_fill = max(reference_price * self.IMMEDIATE_FILL_DIFF_RATIO, tick)
+        self.price_diff_threshold = max(reference_price * self.PRICE_DIFF_THRESHOLD_RATIO, tick)
+        self.price_sync_threshold = max(reference_price * self.PRICE_SYNC_THRESHOLD_RATIO, tick)
+
     def update_prices(self, bitget_price: float, gate_price: float, price_diff_percent: float):
         self.bitget_current_price = bitget_price
         self.gate_current_price = gate_price
         self.price_diff_percent = price_diff_percent
+        self._apply_price_thresholds()
 
     async def initialize(self):
         try:
@@ -234,8 +290,8 @@ class MirrorPositionManager:
             await self._record_startup_plan_orders()
             await self._record_startup_gate_positions()
             
-            # 예약 주문 초기 스냅샷 생성
-            await self._create_initial_plan_order_snapshot()
+            # 저널에서 이전 미러링 상태 복원 (양쪽 거래소에 아직 있는 주문만)
+            self._restore_from_journal()
             
             # 시작 시 기존 예약 주문 복제 - 강화된 재시도 로직
             await self._mirror_startup_plan_orders_with_retry()
@@ -284,7 +340,8 @@ class MirrorPositionManager:
             self.logger.error(f"{context} - 마진 모드 체크 실패: {e}")
             return False
 
-    async def monitor_plan_orders_cycle(self):
+    async def monitor_plan_orders_cycle(self, plan_orders: List[Dict] = None, filled_orders: List[Dict] = None):
+        """예약 주문 동기화 1회 - 미러 엔진이 이번 틱에 조회한 예약/체결 주문을 넘기면 다시 조회하지 않음"""
         try:
             if not self.mirror_trading_enabled:
                 await asyncio.sleep(1.0)
@@ -300,14 +357,13 @@ class MirrorPositionManager:
                 self.logger.debug(f"극도로 큰 시세 차이 ({price_diff_abs:.2f}$), 예약 주문 처리 지연")
                 return
             
-            # 만료된 타임스탬프 정리
-            await self._cleanup_expired_timestamps()
+            cycle_started = time.perf_counter()
             
-            # 해시 기반 중복 방지 시스템 정리
-            await self._cleanup_expired_hashes()
+            # 만료된 타임스탬프/해시 기록 정리
+            await self._cleanup_expired_timestamps()
             
-            # 체결된 주문 기록 업데이트
-            await self._update_recently_filled_orders()
+            # 체결된 주문 기록 업데이트 (사라진 주문 분석에도 재사용)
+            recent_filled = await self._update_recently_filled_orders(filled_orders)
             
             # 시세 차이 대응 즉시 체결 처리
             await self._process_immediate_fill_queue()
@@ -315,79 +371,31 @@ class MirrorPositionManager:
             # 강화된 취소 감지 - 더 빠른 주기
             current_time = datetime.now()
             if (current_time - self.last_cancel_detection_time).total_seconds() >= self.cancel_detection_interval:
-                await self._enhanced_cancel_detection()
+                await self._enhanced_cancel_detection(plan_orders)
                 self.last_cancel_detection_time = current_time
             
             # 포지션 종료 시 클로즈 주문 자동 정리
             await self._check_and_cleanup_close_orders_if_no_position()
             
             # 모든 예약 주문 조회 - 클로즈 주문 포함
-            all_current_orders = await self._get_all_current_plan_orders_enhanced()
-            
-            # 현재 존재하는 예약주문 ID 집합
-            current_order_ids = set()
-            current_snapshot = {}
+            if plan_orders is not None:
+                all_current_orders = plan_orders
+            else:
+                all_current_orders = await self._get_all_current_plan_orders_enhanced()
             
-            for order in all_current_orders:
-                order_id = order.get('orderId', order.get('planOrderId', ''))
-                if order_id:
-                    current_order_ids.add(order_id)
-                    current_snapshot[order_id] = {
-                        'order_data': order.copy(),
-                        'timestamp': datetime.now().isoformat(),
-                        'status': 'active'
-                    }
+            # 이전 사이클과 비교 (추가/삭제/내용 변경) - 반영은 사이클 끝에서
+            plan_diff = self.plan_order_snapshot.diff(all_current_orders)
             
             # 사라진 예약 주문 분석 - 시세 차이 대응 강화
-            disappeared_order_ids = self.last_plan_order_ids - current_order_ids
+            disappeared_order_ids = set(plan_diff['removed'])
             
             if disappeared_order_ids:
                 self.logger.info(f"📋 {len(disappeared_order_ids)}개의 예약 주문이 사라짐 - 시세 차이 대응 강화된 체결/취소 분석 시작")
                 
-                canceled_count = 0
-                filled_count = 0
-                immediate_fill_count = 0
-                
-                for disappeared_id in disappeared_order_ids:
-                    try:
-                        # 시세 차이를 고려한 개선된 체결/취소 구분 로직
-                        analysis_result = await self._analyze_order_disappearance_with_price_context_enhanced(disappeared_id)
-                        
-                        if analysis_result['is_filled']:
-                            filled_count += 1
-                            self.daily_stats['filled_detection_successes'] += 1
-                            if analysis_result.get('price_based_detection'):
-                                self.daily_stats['price_based_fill_detections'] += 1
-                            
-                            self.logger.info(f"체결 감지: {disappeared_id} - 게이트 주문 처리 시작 (방법: {analysis_result['detection_method']})")
-                            
-                            # 비트겟 체결 시 게이트 즉시 대응 처리
-                            immediate_success = await self._handle_bitget_filled_gate_immediate_action(disappeared_id, analysis_result)
-                            if immediate_success:
-                                immediate_fill_count += 1
-                                self.daily_stats['immediate_market_fills'] += 1
-                                self.daily_stats['price_diff_resolved_fills'] += 1
-                            
-                            # 체결된 주문은 미러링 기록에서 제거만 하고 게이트 주문은 처리됨
-                            await self._cleanup_mirror_records_for_filled_order(disappeared_id)
-                        else:
-                            # 실제 취소된 주문만 처리 - 시세 차이 고려한 안전한 처리
-                            if analysis_result.get('safe_to_cancel', True):
-                                success = await self._handle_plan_order_cancel_enhanced_v2(disappeared_id)
-                                if success:
-                                    canceled_count += 1
-                                    self.daily_stats['cancel_successes'] += 1
-                                else:
-                                    self.daily_stats['cancel_failures'] += 1
-                            else:
-                                # 안전하지 않은 취소 - 대기
-                                self.daily_stats['safe_cancel_preventions'] += 1
-                                self.logger.warning(f"시세 차이로 인한 안전 대기: {disappeared_id} (이유: {analysis_result['reason']})")
-                                continue
-                                
-                    except Exception as e:
-                        self.logger.error(f"사라진 주문 분석 중 예외: {disappeared_id} - {e}")
-                        self.daily_stats['cancel_failures'] += 1
+                counts = await self._process_disappeared_orders(disappeared_order_ids, recent_filled)
+                filled_count = counts['filled']
+                canceled_count = counts['canceled']
+                immediate_fill_count = counts['immediate_fills']
                 
                 self.daily_stats['plan_order_cancels'] += canceled_count
                 
@@ -406,12 +414,18 @@ class MirrorPositionManager:
                         f"🎯 더 이상 시세 차이로 인한 미체결 손실이 없습니다!"
                     )
             
+            # 내용이 바뀐 예약 주문 (트리거가/TP/SL 등) - 게이트 주문 교체
+            if plan_diff['modified']:
+                await self._process_modified_plan_orders(plan_diff)
+            
             # 새로운 예약 주문 감지 - 복제 비율 적용 강화
             new_orders_count = 0
             new_close_orders_count = 0
             perfect_mirrors = 0
             forced_close_mirrors = 0
             
+            # 1) 중복/검증은 순서대로 (같은 가격대 사다리 주문 중복 판단 유지)
+            candidates = []
             for order in all_current_orders:
                 order_id = order.get('orderId', order.get('planOrderId', ''))
                 if not order_id:
@@ -430,100 +444,123 @@ class MirrorPositionManager:
                     self.processed_plan_orders.add(order_id)
                     continue
                 
-                # 주문 처리 락 확보
-                if order_id not in self.order_processing_locks:
-                    self.order_processing_locks[order_id] = asyncio.Lock()
+                # 개선된 중복 복제 확인
+                with self.latency.span(STAGE_DEDUPE, order_id):
+                    is_duplicate = await self._is_duplicate_order_improved(order)
+                if is_duplicate:
+                    self.daily_stats['duplicate_orders_prevented'] += 1
+                    self.logger.info(f"중복 감지로 스킵: {order_id}")
+                    self.processed_plan_orders.add(order_id)
+                    continue
                 
-                async with self.order_processing_locks[order_id]:
-                    # 락 내에서 다시 중복 체크
-                    if order_id in self.processed_plan_orders:
-                        continue
+                try:
+                    # 클로즈 주문 상세 분석
+                    close_details = await self.utils.determine_close_order_details_enhanced(order)
+                    is_close_order = close_details['is_close_order']
                     
-                    # 개선된 중복 복제 확인
-                    is_duplicate = await self._is_duplicate_order_improved(order)
-                    if is_duplicate:
-                        self.daily_stats['duplicate_orders_prevented'] += 1
-                        self.logger.info(f"중복 감지로 스킵: {order_id}")
-                        self.processed_plan_orders.add(order_id)
-                        continue
+                    # 복제 비율 확인 로깅 추가
+                    self.logger.info(f"새로운 예약 주문 감지: {order_id} (클로즈: {is_close_order})")
+                    self.logger.info(f"   📊 현재 복제 비율: {self.mirror_ratio_multiplier}x")
+                    self.logger.debug(f"   주문 상세: side={order.get('side')}, reduceOnly={order.get('reduceOnly')}")
                     
-                    # 새로운 예약 주문 처리 - 시세 차이 대응 강화 + 마진 모드 체크 강화
+                    # 클로즈 주문인 경우 강화된 검증
+                    if is_close_order:
+                        validation_result = await self._validate_close_order_enhanced(order, close_details)
+                        if validation_result == "force_mirror":
+                            self.logger.warning(f"클로즈 주문 강제 미러링: {order_id}")
+                            forced_close_mirrors += 1
+                            self.daily_stats['close_order_forced'] += 1
+                        elif validation_result == "skip":
+                            self.logger.warning(f"클로즈 주문 스킵: {order_id}")
+                            self.processed_plan_orders.add(order_id)
+                            self.daily_stats['close_order_skipped'] += 1
+                            continue
+                    
+                    # 같은 배치의 다음 주문 중복 판단에 반영되도록 가격 선점
+                    await self._record_order_processing_hash(order_id, order)
+                    candidates.append((order_id, order, close_details))
+                    self.latency.observe_since(STAGE_DETECT, self._latency_origin(order_id, order), order_id)
+                    
+                except Exception as e:
+                    self.logger.error(f"새로운 예약 주문 분석 실패: {order_id} - {e}")
+                    self.processed_plan_orders.add(order_id)
+                    self.daily_stats['failed_mirrors'] += 1
+            
+            # 2) 게이트 주문 생성은 동시에 (제한된 동시성)
+            async def mirror_candidate(order_id: str, order: Dict, close_details: Dict) -> Optional[str]:
+                lock = self.order_processing_locks.setdefault(order_id, asyncio.Lock())
+                async with lock:
+                    # 락 내에서 다시 중복 체크
+                    if order_id in self.processed_plan_orders:
+                        return None
                     try:
-                        # 클로즈 주문 상세 분석
-                        close_details = await self.utils.determine_close_order_details_enhanced(order)
-                        is_close_order = close_details['is_close_order']
-                        
-                        # 복제 비율 확인 로깅 추가
-                        self.logger.info(f"새로운 예약 주문 감지: {order_id} (클로즈: {is_close_order})")
-                        self.logger.info(f"   📊 현재 복제 비율: {self.mirror_ratio_multiplier}x")
-                        self.logger.debug(f"   주문 상세: side={order.get('side')}, reduceOnly={order.get('reduceOnly')}")
-                        
-                        # 클로즈 주문인 경우 강화된 검증
-                        process_order = True
-                        validation_result = "proceed"
-                        
-                        if is_close_order:
-                            validation_result = await self._validate_close_order_enhanced(order, close_details)
-                            if validation_result == "force_mirror":
-                                self.logger.warning(f"클로즈 주문 강제 미러링: {order_id}")
-                                forced_close_mirrors += 1
-                                self.daily_stats['close_order_forced'] += 1
-                            elif validation_result == "skip":
-                                self.logger.warning(f"클로즈 주문 스킵: {order_id}")
-                                self.processed_plan_orders.add(order_id)
-                                self.daily_stats['close_order_skipped'] += 1
-                                continue
-                        
                         # 시세 차이 대응 완벽한 미러링 처리 - 강화된 버전 (마진 모드 체크 포함)
-                        result = await self._process_perfect_mirror_order_with_price_diff_handling(order, close_details, self.mirror_ratio_multiplier)
-                        
-                        # 모든 성공 케이스 처리
-                        success_results = ["perfect_success", "partial_success", "force_success", "close_order_forced", "price_diff_handled"]
-                        
-                        if result in success_results:
-                            new_orders_count += 1
-                            if result == "perfect_success":
-                                perfect_mirrors += 1
-                                self.daily_stats['perfect_mirrors'] += 1
-                            elif result == "price_diff_handled":
-                                perfect_mirrors += 1
-                                self.daily_stats['perfect_mirrors'] += 1
-                                self.daily_stats['adaptive_price_adjustments'] += 1
-                            elif result in ["force_success", "close_order_forced"]:
-                                forced_close_mirrors += 1
-                                self.daily_stats['close_order_forced'] += 1
-                            else:
-                                self.daily_stats['partial_mirrors'] += 1
-                                
-                            if is_close_order:
-                                new_close_orders_count += 1
-                                self.daily_stats['close_order_mirrors'] += 1
-                                
-                            self.logger.info(f"예약 주문 복제 성공: {order_id} (결과: {result}, 비율: {self.mirror_ratio_multiplier}x)")
-                            
-                        elif result == "skipped" and is_close_order:
-                            self.daily_stats['close_order_skipped'] += 1
-                            self.logger.info(f"클로즈 주문 스킵됨: {order_id}")
-                        else:
-                            # 실패한 경우
-                            self.daily_stats['failed_mirrors'] += 1
-                            self.logger.error(f"예약 주문 복제 실패: {order_id} (결과: {result})")
-                        
+                        with self.latency.span(STAGE_MIRROR, order_id):
+                            return await self._process_perfect_mirror_order_with_price_diff_handling(
+                                order, close_details, self.mirror_ratio_multiplier
+                            )
+                    finally:
                         self.processed_plan_orders.add(order_id)
+            
+            batch_results = {}
+            if candidates:
+                batch_results = await self.gate_mirror.submit_batch({
+                    order_id: (lambda o=order_id, d=order, c=close_details: self.scheduler.run(
+                        LANE_CRITICAL, lambda: mirror_candidate(o, d, c), name=f"미러링 {o}"
+                    ))
+                    for order_id, order, close_details in candidates
+                })
+            
+            # 3) 결과 집계
+            success_results = ["perfect_success", "partial_success", "force_success", "close_order_forced", "price_diff_handled"]
+            for order_id, order, close_details in candidates:
+                is_close_order = close_details['is_close_order']
+                outcome = batch_results.get(order_id, {})
+                
+                if not outcome.get('success'):
+                    self.logger.error(f"새로운 예약 주문 복제 실패: {order_id} - {outcome.get('error')}")
+                    self.daily_stats['failed_mirrors'] += 1
+                    
+                    await self.telegram.send_message(
+                        f"❌ 예약 주문 복제 실패\n"
+                        f"비트겟 ID: {order_id}\n"
+                        f"오류: {str(outcome.get('error'))[:200]}"
+                    )
+                    continue
+                
+                result = outcome.get('result')
+                if result is None:
+                    continue
+                
+                # 모든 성공 케이스 처리
+                if result in success_results:
+                    new_orders_count += 1
+                    if result == "perfect_success":
+                        perfect_mirrors += 1
+                        self.daily_stats['perfect_mirrors'] += 1
+                    elif result == "price_diff_handled":
+                        perfect_mirrors += 1
+                        self.daily_stats['perfect_mirrors'] += 1
+                        self.daily_stats['adaptive_price_adjustments'] += 1
+                    elif result in ["force_success", "close_order_forced"]:
+                        forced_close_mirrors += 1
+                        self.daily_stats['close_order_forced'] += 1
+                    else:
+                        self.daily_stats['partial_mirrors'] += 1
                         
-                        # 주문 처리 해시 기록 (중복 방지)
-                        await self._record_order_processing_hash(order_id, order)
-                        
-                    except Exception as e:
-                        self.logger.error(f"새로운 예약 주문 복제 실패: {order_id} - {e}")
-                        self.processed_plan_orders.add(order_id)
-                        self.daily_stats['failed_mirrors'] += 1
+                    if is_close_order:
+                        new_close_orders_count += 1
+                        self.daily_stats['close_order_mirrors'] += 1
                         
-                        await self.telegram.send_message(
-                            f"❌ 예약 주문 복제 실패\n"
-                            f"비트겟 ID: {order_id}\n"
-                            f"오류: {str(e)[:200]}"
-                        )
+                    self.logger.info(f"예약 주문 복제 성공: {order_id} (결과: {result}, 비율: {self.mirror_ratio_multiplier}x)")
+                    
+                elif result == "skipped" and is_close_order:
+                    self.daily_stats['close_order_skipped'] += 1
+                    self.logger.info(f"클로즈 주문 스킵됨: {order_id}")
+                else:
+                    # 실패한 경우
+                    self.daily_stats['failed_mirrors'] += 1
+                    self.logger.error(f"예약 주문 복제 실패: {order_id} (결과: {result})")
             
             # 성공적인 미러링 결과 알림 - 시세 차이 대응 정보 포함
             if new_orders_count > 0:
@@ -550,13 +587,16 @@ class MirrorPositionManager:
                     )
             
             # 현재 상태를 다음 비교를 위해 저장
-            self.last_plan_order_ids = current_order_ids.copy()
-            self.plan_order_snapshot = current_snapshot.copy()
+            self.plan_order_snapshot.commit(plan_diff)
             
             # 오래된 주문 ID 정리
             if len(self.processed_plan_orders) > 500:
                 recent_orders = list(self.processed_plan_orders)[-250:]
                 self.processed_plan_orders = set(recent_orders)
+            
+            self.latency.observe(STAGE_CYCLE, (time.perf_counter() - cycle_started) * 1000)
+            self._export_latency()
+            self._checkpoint_journal()
                 
         except Exception as e:
             self.logger.error(f"예약 주문 모니터링 사이클 오류: {e}")
@@ -581,7 +621,8 @@ class MirrorPositionManager:
             
             # 🔥 주문 생성 전 마진 모드 강제 체크
             if self.margin_mode_check_before_order:
-                margin_check_success = await self._ensure_cross_margin_mode(f"주문생성({order_id})")
+                with self.latency.span(STAGE_MARGIN_MODE, order_id):
+                    margin_check_success = await self._ensure_cross_margin_mode(f"주문생성({order_id})")
                 if not margin_check_success and self.margin_mode_failures >= self.max_margin_mode_failures:
                     self.logger.error(f"마진 모드 강제 설정 실패로 주문 건너뜀: {order_id}")
                     return "margin_mode_failed"
@@ -634,9 +675,10 @@ class MirrorPositionManager:
             self.logger.info(f"   - 적용할 복제 비율: {ratio_multiplier}x")
             self.logger.info(f"   - 현재 시세 차이: ${price_diff_abs:.2f}")
             
-            margin_ratio_result = await self.utils.calculate_dynamic_margin_ratio_with_multiplier(
-                size, adjusted_trigger_price, bitget_order, ratio_multiplier
-            )
+            with self.latency.span(STAGE_MARGIN_CALC, order_id):
+                margin_ratio_result = await self.utils.calculate_dynamic_margin_ratio_with_multiplier(
+                    size, adjusted_trigger_price, bitget_order, ratio_multiplier
+                )
             
             if not margin_ratio_result['success']:
                 self.logger.error(f"복제 비율 적용 마진 비율 계산 실패: {order_id}")
@@ -657,14 +699,19 @@ class MirrorPositionManager:
             
             # 레버리지 설정
             try:
-                await self.gate_mirror.set_leverage("BTC_USDT", bitget_leverage)
+                with self.latency.span(STAGE_LEVERAGE, order_id):
+                    await self.gate_mirror.set_leverage(self.GATE_CONTRACT, bitget_leverage)
             except Exception as e:
                 self.logger.error(f"레버리지 설정 실패하지만 계속 진행: {e}")
             
-            # 게이트 계정 정보
-            gate_account = await self.gate_mirror.get_account_balance()
-            gate_total_equity = float(gate_account.get('total', 0))
-            gate_available = float(gate_account.get('available', 0))
+            # 게이트 계정 정보 (마진 계산에 쓴 계정 스냅샷 우선)
+            if margin_ratio_result.get('snapshot_version') is not None:
+                gate_total_equity = margin_ratio_result['gate_total_equity']
+                gate_available = margin_ratio_result['gate_available']
+            else:
+                gate_account = await self.gate_mirror.get_account_balance()
+                gate_total_equity = float(gate_account.get('total', 0))
+                gate_available = float(gate_account.get('available', 0))
             
             # 복제 비율 적용된 게이트 마진 계산
             gate_margin = gate_total_equity * margin_ratio
@@ -679,7 +726,7 @@ class MirrorPositionManager:
             
             # 게이트 계약 수 계산
             gate_notional_value = gate_margin * bitget_leverage
-            gate_size = int(gate_notional_value / (adjusted_trigger_price * 0.0001))
+            gate_size = self.contract_spec.contracts_for(gate_notional_value / adjusted_trigger_price)
             
             if gate_size == 0:
                 gate_size = 1
@@ -695,13 +742,14 @@ class MirrorPositionManager:
             self.logger.info(f"   - 시세 차이 대응: 완료")
             
             # 시세 차이 대응 완벽한 미러링 주문 생성 (마진 모드 체크 포함)
-            mirror_result = await self.gate_mirror.create_perfect_tp_sl_order(
-                bitget_order=bitget_order,
-                gate_size=gate_size,
-                gate_margin=gate_margin,
-                leverage=bitget_leverage,
-                current_gate_price=self.gate_current_price
-            )
+            with self.latency.span(STAGE_SUBMIT, order_id):
+                mirror_result = await self.gate_mirror.create_perfect_tp_sl_order(
+                    bitget_order=bitget_order,
+                    gate_size=gate_size,
+                    gate_margin=gate_margin,
+                    leverage=bitget_leverage,
+                    current_gate_price=self.gate_current_price
+                )
             
             if not mirror_result['success']:
                 self.daily_stats['failed_mirrors'] += 1
@@ -712,8 +760,7 @@ class MirrorPositionManager:
             
             # 주문 ID 매핑 기록
             if order_id and gate_order_id:
-                self.bitget_to_gate_order_mapping[order_id] = gate_order_id
-                self.gate_to_bitget_order_mapping[gate_order_id] = order_id
+                self.order_state.link(order_id, gate_order_id)
                 self.logger.info(f"주문 매핑 기록: {order_id} ↔ {gate_order_id}")
             
             # 시세 차이 대응 정보가 포함된 미러링 성공 기록
@@ -746,6 +793,12 @@ class MirrorPositionManager:
                 'price_diff_handled': adjusted_trigger_price != trigger_price,  # 가격 조정 여부
                 'adaptive_system_applied': True  # 적응형 시스템 적용 표시
             }
+            self._journal_order(order_id)
+            
+            # 시작 시 이미 있던 주문은 생성 시각 기준 지연에서 제외
+            if order_id not in self.startup_plan_orders:
+                self.latency.observe_since(STAGE_END_TO_END, self._latency_origin(order_id, bitget_order), order_id)
+            self.replacing_plan_orders.discard(order_id)
             
             self.daily_stats['plan_order_mirrors'] += 1
             
@@ -838,7 +891,8 @@ class MirrorPositionManager:
 
     # === 기존 메서드들 유지 (간소화) ===
     
-    async def _analyze_order_disappearance_with_price_context_enhanced(self, order_id: str) -> Dict:
+    async def _analyze_order_disappearance_with_price_context_enhanced(self, order_id: str,
+                                                                       recent_filled: List[Dict] = None) -> Dict:
         try:
             self.logger.info(f"시세 차이 대응 강화된 주문 사라짐 분석 시작: {order_id}")
             
@@ -858,10 +912,8 @@ class MirrorPositionManager:
             }
             
             # 캐시에서 주문 정보 조회
-            order_info = None
-            if order_id in self.plan_order_snapshot:
-                order_info = self.plan_order_snapshot[order_id]['order_data']
-            elif order_id in self.mirrored_plan_orders:
+            order_info = self.plan_order_snapshot.get(order_id)
+            if order_info is None and order_id in self.mirrored_plan_orders:
                 order_info = self.mirrored_plan_orders[order_id].get('bitget_order')
             
             if not order_info:
@@ -939,7 +991,7 @@ class MirrorPositionManager:
                 
             elif bitget_reached and gate_reached:
                 # 양쪽 모두 도달 → 기존 방식으로 체결 여부 확인
-                is_filled_traditional = await self._check_if_order_was_filled_traditional(order_id)
+                is_filled_traditional = await self._check_if_order_was_filled_traditional(order_id, recent_filled)
                 result['is_filled'] = is_filled_traditional
                 result['detection_method'] = 'traditional_check_both_reached'
                 result['safe_to_cancel'] = not is_filled_traditional
@@ -979,7 +1031,9 @@ class MirrorPositionManager:
                 'price_diff': abs(self.bitget_current_price - self.gate_current_price)
             }
 
-    async def _handle_bitget_filled_gate_immediate_action(self, bitget_order_id: str, analysis_result: Dict) -> bool:
+    async def _handle_bitget_filled_gate_immediate_action(self, bitget_order_id: str, analysis_result: Dict,
+                                                          lock_held: bool = False) -> bool:
+        """비트겟 체결 → 게이트 즉시 대응 - lock_held면 호출 측이 게이트 주문 락을 이미 보유"""
         try:
             if not analysis_result.get('immediate_action_needed', False):
                 return False
@@ -1003,35 +1057,126 @@ class MirrorPositionManager:
                 self.logger.warning(f"게이트 주문 ID가 없음: {bitget_order_id}")
                 return False
             
-            # 주문 처리 락 확보
-            if gate_order_id not in self.immediate_fill_processing_locks:
-                self.immediate_fill_processing_locks[gate_order_id] = asyncio.Lock()
+            if lock_held:
+                return await self._execute_gate_immediate_action(gate_order_id, mirror_info, analysis_result)
             
-            async with self.immediate_fill_processing_locks[gate_order_id]:
-                # 액션 타입별 처리
-                if gate_action_type == 'immediate_market_fill':
-                    success = await self._execute_immediate_market_fill(gate_order_id, mirror_info, analysis_result)
-                    if success:
-                        self.logger.info(f"즉시 시장가 체결 성공: {gate_order_id}")
-                        return True
-                    else:
-                        self.logger.error(f"즉시 시장가 체결 실패: {gate_order_id}")
-                        # 실패 시 백업 방법 시도
-                        backup_success = await self._execute_backup_fill_mechanism(gate_order_id, mirror_info, analysis_result)
-                        return backup_success
-                        
-                elif gate_action_type == 'adaptive_wait_or_adjust':
-                    success = await self._execute_adaptive_wait_or_adjust(gate_order_id, mirror_info, analysis_result)
-                    return success
-                    
-                else:
-                    self.logger.warning(f"알 수 없는 액션 타입: {gate_action_type}")
-                    return False
+            # 주문 처리 락 확보
+            async with self._get_immediate_fill_lock(gate_order_id):
+                return await self._execute_gate_immediate_action(gate_order_id, mirror_info, analysis_result)
             
         except Exception as e:
             self.logger.error(f"비트겟 체결 → 게이트 즉시 액션 처리 실패: {bitget_order_id} - {e}")
             return False
 
+    def _get_immediate_fill_lock(self, key: str) -> asyncio.Lock:
+        if key not in self.immediate_fill_processing_locks:
+            self.immediate_fill_processing_locks[key] = asyncio.Lock()
+        return self.immediate_fill_processing_locks[key]
+
+    async def _execute_gate_immediate_action(self, gate_order_id: str, mirror_info: Dict, analysis_result: Dict) -> bool:
+        # 액션 타입별 처리
+        gate_action_type = analysis_result.get('gate_action_type', 'none')
+        if gate_action_type == 'immediate_market_fill':
+            success = await self._execute_immediate_market_fill(gate_order_id, mirror_info, analysis_result)
+            if success:
+                self.logger.info(f"즉시 시장가 체결 성공: {gate_order_id}")
+                return True
+            else:
+                self.logger.error(f"즉시 시장가 체결 실패: {gate_order_id}")
+                # 실패 시 백업 방법 시도
+                backup_success = await self._execute_backup_fill_mechanism(gate_order_id, mirror_info, analysis_result)
+                return backup_success
+                
+        elif gate_action_type == 'adaptive_wait_or_adjust':
+            success = await self._execute_adaptive_wait_or_adjust(gate_order_id, mirror_info, analysis_result)
+            return success
+            
+        else:
+            self.logger.warning(f"알 수 없는 액션 타입: {gate_action_type}")
+            return False
+
+    async def _process_disappeared_orders(self, disappeared_order_ids: Set[str],
+                                          recent_filled: List[Dict] = None) -> Dict[str, int]:
+        """사라진 예약 주문 체결/취소 분석 - 체결 내역/게이트 주문은 한 번만 조회, 주문별 처리는 제한된 동시성"""
+        counts = {'filled': 0, 'canceled': 0, 'immediate_fills': 0}
+        
+        # 배치 공통 조회: 체결 내역은 이번 사이클 조회분 재사용, 게이트 열린 주문은 미러링된 주문이 있을 때만
+        if recent_filled is None:
+            try:
+                recent_filled = await self.bitget.get_recent_filled_orders(symbol=self.SYMBOL, minutes=5)
+            except Exception as e:
+                self.logger.error(f"사라진 주문 분석용 체결 내역 조회 실패: {e}")
+        
+        gate_orders = None
+        if any(order_id in self.mirrored_plan_orders for order_id in disappeared_order_ids):
+            # 🔥 취소 전 마진 모드 체크 (배치당 1회)
+            await self._ensure_cross_margin_mode(f"주문취소({len(disappeared_order_ids)}건)")
+            try:
+                gate_orders = await self.gate_mirror.get_price_triggered_orders(self.GATE_CONTRACT, "open")
+            except Exception as e:
+                self.logger.error(f"사라진 주문 분석용 게이트 주문 조회 실패: {e}")
+        
+        async def process(order_id: str) -> Dict:
+            mirror_info = self.mirrored_plan_orders.get(order_id) or {}
+            # 같은 게이트 주문의 즉시 체결/취소와 겹치지 않도록 게이트 주문 기준 락
+            async with self._get_immediate_fill_lock(mirror_info.get('gate_order_id') or order_id):
+                # 시세 차이를 고려한 개선된 체결/취소 구분 로직
+                analysis_result = await self._analyze_order_disappearance_with_price_context_enhanced(order_id, recent_filled)
+                
+                if analysis_result['is_filled']:
+                    self.logger.info(f"체결 감지: {order_id} - 게이트 주문 처리 시작 (방법: {analysis_result['detection_method']})")
+                    
+                    # 비트겟 체결 시 게이트 즉시 대응 처리
+                    immediate_success = await self._handle_bitget_filled_gate_immediate_action(
+                        order_id, analysis_result, lock_held=True
+                    )
+                    
+                    # 체결된 주문은 미러링 기록에서 제거만 하고 게이트 주문은 처리됨
+                    await self._cleanup_mirror_records_for_filled_order(order_id)
+                    return {'analysis': analysis_result, 'immediate_success': immediate_success}
+                
+                # 실제 취소된 주문만 처리 - 시세 차이 고려한 안전한 처리
+                if not analysis_result.get('safe_to_cancel', True):
+                    return {'analysis': analysis_result}
+                
+                cancel_success = await self._handle_plan_order_cancel_enhanced_v2(order_id, gate_orders)
+                return {'analysis': analysis_result, 'cancel_success': cancel_success}
+        
+        outcomes = await self.gate_mirror.submit_batch({
+            order_id: (lambda o=order_id: self.scheduler.run(LANE_CRITICAL, lambda: process(o), name=f"체결/취소 {o}"))
+            for order_id in disappeared_order_ids
+        })
+        
+        for order_id, outcome in outcomes.items():
+            if not outcome['success']:
+                self.logger.error(f"사라진 주문 분석 중 예외: {order_id} - {outcome.get('error')}")
+                self.daily_stats['cancel_failures'] += 1
+                continue
+            
+            result = outcome['result']
+            analysis_result = result['analysis']
+            
+            if analysis_result['is_filled']:
+                counts['filled'] += 1
+                self.daily_stats['filled_detection_successes'] += 1
+                if analysis_result.get('price_based_detection'):
+                    self.daily_stats['price_based_fill_detections'] += 1
+                if result.get('immediate_success'):
+                    counts['immediate_fills'] += 1
+                    self.daily_stats['immediate_market_fills'] += 1
+                    self.daily_stats['price_diff_resolved_fills'] += 1
+            elif 'cancel_success' not in result:
+                # 안전하지 않은 취소 - 대기
+                self.daily_stats['safe_cancel_preventions'] += 1
+                self.logger.warning(f"시세 차이로 인한 안전 대기: {order_id} (이유: {analysis_result['reason']})")
+            elif result['cancel_success']:
+                counts['canceled'] += 1
+                self.daily_stats['cancel_successes'] += 1
+            else:
+                self.daily_stats['cancel_failures'] += 1
+        
+        return counts
+
     async def _execute_immediate_market_fill(self, gate_order_id: str, mirror_info: Dict, analysis_result: Dict) -> bool:
         try:
             self.logger.info(f"즉시 시장가 체결 실행: {gate_order_id}")
@@ -1090,6 +1235,9 @@ class MirrorPositionManager:
                     if market_order_result and market_order_result.get('id'):
                         self.logger.info(f"즉시 시장가 체결 성공: {market_order_result.get('id')}")
                         
+                        if self.utils.account_snapshots:
+                            self.utils.account_snapshots.invalidate()
+                        
                         # 성공 통계 업데이트
                         self.daily_stats['immediate_market_fills'] += 1
                         self.daily_stats['price_diff_resolved_fills'] += 1
@@ -1239,10 +1387,13 @@ class MirrorPositionManager:
 
     # === 기존 메서드들 (간소화 버전) ===
 
-    async def _get_all_current_plan_orders_enhanced(self) -> List[Dict]:
+    async def _get_all_current_plan_orders_enhanced(self, raise_on_error: bool = False) -> List[Dict]:
+        """현재 비트겟 예약 주문 + TP/SL 주문 - raise_on_error면 조회 실패를 빈 목록 대신 예외로 (동기화 재확인용)"""
         try:
             all_orders = []
             plan_data = await self.bitget.get_all_plan_orders_with_tp_sl(self.SYMBOL)
+            if raise_on_error and plan_data.get('error'):
+                raise RuntimeError(plan_data['error'])
             
             general_orders = plan_data.get('plan_orders', [])
             if general_orders:
@@ -1256,31 +1407,26 @@ class MirrorPositionManager:
             
         except Exception as e:
             self.logger.error(f"현재 예약 주문 조회 실패: {e}")
+            if raise_on_error:
+                raise
             return []
 
-    async def _update_recently_filled_orders(self):
+    async def _update_recently_filled_orders(self, filled_orders: List[Dict] = None) -> Optional[List[Dict]]:
+        """최근 체결 주문 기록 - 사용한 체결 목록 반환 (조회 실패 시 None)"""
         try:
-            filled_orders = await self.bitget.get_recent_filled_orders(symbol=self.SYMBOL, minutes=5)
-            current_time = datetime.now()
+            if filled_orders is None:
+                filled_orders = await self.bitget.get_recent_filled_orders(symbol=self.SYMBOL, minutes=5)
             
             for order in filled_orders:
                 order_id = order.get('orderId', order.get('id', ''))
                 if order_id:
-                    self.recently_filled_order_ids.add(order_id)
-                    self.filled_order_timestamps[order_id] = current_time
-            
-            # 오래된 체결 기록 정리
-            expired_ids = []
-            for order_id, timestamp in self.filled_order_timestamps.items():
-                if (current_time - timestamp).total_seconds() > self.filled_order_check_window:
-                    expired_ids.append(order_id)
-            
-            for order_id in expired_ids:
-                self.recently_filled_order_ids.discard(order_id)
-                del self.filled_order_timestamps[order_id]
-                
+                    self.order_state.mark(MARK_FILLED, order_id, self.filled_order_check_window)
+            
+            return filled_orders
+            
         except Exception as e:
             self.logger.error(f"최근 체결 주문 업데이트 실패: {e}")
+            return None
 
     async def _process_immediate_fill_queue(self):
         try:
@@ -1320,40 +1466,22 @@ class MirrorPositionManager:
     # === 간소화된 기존 메서드들 ===
 
     async def _cleanup_expired_timestamps(self):
+        """만료된 처리/해시/체결 기록 정리 - 만료된 항목만 꺼냄"""
         try:
-            current_time = datetime.now()
-            expired_orders = []
-            for order_id, timestamp in self.recently_processed_orders.items():
-                if (current_time - timestamp).total_seconds() > self.order_deduplication_window:
-                    expired_orders.append(order_id)
-            
-            for order_id in expired_orders:
-                del self.recently_processed_orders[order_id]
-                if order_id in self.order_processing_locks:
+            expired = self.order_state.expire()
+            
+            for order_id in expired.get(MARK_PROCESSED, []):
+                lock = self.order_processing_locks.get(order_id)
+                if lock is not None and not lock.locked():
                     del self.order_processing_locks[order_id]
                 
         except Exception as e:
             self.logger.error(f"타임스탬프 정리 실패: {e}")
 
-    async def _cleanup_expired_hashes(self):
+    async def _enhanced_cancel_detection(self, current_bitget_orders: List[Dict] = None):
         try:
-            current_time = datetime.now()
-            expired_hashes = []
-            for order_hash, timestamp in self.order_hash_timestamps.items():
-                if (current_time - timestamp).total_seconds() > self.hash_cleanup_interval:
-                    expired_hashes.append(order_hash)
-            
-            for order_hash in expired_hashes:
-                del self.order_hash_timestamps[order_hash]
-                if order_hash in self.processed_order_hashes:
-                    self.processed_order_hashes.remove(order_hash)
-                    
-        except Exception as e:
-            self.logger.error(f"해시 정리 실패: {e}")
-
-    async def _enhanced_cancel_detection(self):
-        try:
-            current_bitget_orders = await self._get_all_current_plan_orders_enhanced()
+            if current_bitget_orders is None:
+                current_bitget_orders = await self._get_all_current_plan_orders_enhanced()
             current_bitget_ids = set()
             
             for order in current_bitget_orders:
@@ -1385,7 +1513,51 @@ class MirrorPositionManager:
         except Exception as e:
             self.logger.error(f"강화된 취소 감지 시스템 오류: {e}")
 
-    async def _handle_plan_order_cancel_enhanced_v2(self, bitget_order_id: str) -> bool:
+    async def _process_modified_plan_orders(self, plan_diff: Dict):
+        """내용이 바뀐 미러링 주문 - 기존 게이트 주문을 취소하고 같은 사이클의 신규 주문 처리에서 새 내용으로 다시 복제"""
+        for order_id in plan_diff['modified']:
+            try:
+                if order_id not in self.mirrored_plan_orders:
+                    continue
+                
+                self.logger.info(f"예약 주문 내용 변경 감지: {order_id} - 게이트 주문 교체")
+                
+                if not await self._handle_plan_order_cancel_enhanced_v2(order_id):
+                    # 취소 실패 - 다음 사이클에 다시 변경으로 감지
+                    self.plan_order_snapshot.defer(plan_diff, order_id)
+                    self.daily_stats['cancel_failures'] += 1
+                    continue
+                
+                # 처리 기록을 지워 신규 주문 처리에서 다시 복제되도록
+                await self._release_for_remirror(order_id)
+                self.replacing_plan_orders.add(order_id)
+                self.daily_stats['plan_order_modifications'] = self.daily_stats.get('plan_order_modifications', 0) + 1
+                
+            except Exception as e:
+                self.logger.error(f"예약 주문 변경 처리 실패: {order_id} - {e}")
+                self.plan_order_snapshot.defer(plan_diff, order_id)
+
+    async def _release_for_remirror(self, order_id: str):
+        """처리 기록 제거 - 다음 신규 주문 처리에서 다시 복제됨
+        (주 해시는 가격/수량만 포함하므로 TP/SL만 바뀐 주문은 해시 기록도 지워야 다시 복제됨)
+        """
+        self.processed_plan_orders.discard(order_id)
+        self.startup_plan_orders.discard(order_id)
+        self.order_state.unmark(MARK_PROCESSED, order_id)
+        old_order = self.plan_order_snapshot.get(order_id)
+        if old_order:
+            old_hash = await self._generate_primary_order_hash(old_order)
+            if old_hash:
+                self.order_state.unmark(MARK_ORDER_HASH, old_hash)
+
+    def _latency_origin(self, order_id: str, order: Dict):
+        """지연 측정 기준 시각 - 교체 중인 주문은 수정 시각(uTime), 그 외는 생성 시각(cTime)"""
+        if order_id in self.replacing_plan_orders:
+            return order.get('uTime') or order.get('cTime')
+        return order.get('cTime')
+
+    async def _handle_plan_order_cancel_enhanced_v2(self, bitget_order_id: str, gate_orders: List[Dict] = None) -> bool:
+        """미러링된 게이트 주문 취소 - gate_orders(열린 주문)를 넘기면 존재 확인 조회와 마진 모드 체크 생략"""
         try:
             if bitget_order_id not in self.mirrored_plan_orders:
                 return True
@@ -1394,7 +1566,7 @@ class MirrorPositionManager:
             gate_order_id = mirror_info.get('gate_order_id')
             
             if not gate_order_id:
-                del self.mirrored_plan_orders[bitget_order_id]
+                self._forget_mirror_order(bitget_order_id)
                 return True
             
             retry_count = self.cancel_retry_count.get(bitget_order_id, 0)
@@ -1408,11 +1580,13 @@ class MirrorPositionManager:
                 await self._force_remove_mirror_record_v2(bitget_order_id, gate_order_id)
                 return False
             
-            # 🔥 취소 전 마진 모드 체크
-            await self._ensure_cross_margin_mode(f"주문취소({gate_order_id})")
+            if gate_orders is None:
+                # 🔥 취소 전 마진 모드 체크
+                await self._ensure_cross_margin_mode(f"주문취소({gate_order_id})")
             
             try:
-                gate_orders = await self.gate_mirror.get_price_triggered_orders("BTC_USDT", "open")
+                if gate_orders is None:
+                    gate_orders = await self.gate_mirror.get_price_triggered_orders(self.GATE_CONTRACT, "open")
                 gate_order_exists = any(order.get('id') == gate_order_id for order in gate_orders)
                 
                 if not gate_order_exists:
@@ -1421,7 +1595,7 @@ class MirrorPositionManager:
                     await self.gate_mirror.cancel_price_triggered_order(gate_order_id)
                     await asyncio.sleep(2.0)
                     
-                    gate_orders_after = await self.gate_mirror.get_price_triggered_orders("BTC_USDT", "open")
+                    gate_orders_after = await self.gate_mirror.get_price_triggered_orders(self.GATE_CONTRACT, "open")
                     gate_order_still_exists = any(order.get('id') == gate_order_id for order in gate_orders_after)
                     
                     if gate_order_still_exists:
@@ -1463,35 +1637,42 @@ class MirrorPositionManager:
             except:
                 pass
             
-            # 미러링 기록에서 제거
-            if bitget_order_id in self.mirrored_plan_orders:
-                del self.mirrored_plan_orders[bitget_order_id]
-            
-            # 주문 매핑에서 제거
-            if bitget_order_id in self.bitget_to_gate_order_mapping:
-                del self.bitget_to_gate_order_mapping[bitget_order_id]
-            if gate_order_id in self.gate_to_bitget_order_mapping:
-                del self.gate_to_bitget_order_mapping[gate_order_id]
-            
-            # 재시도 카운터에서 제거
-            if bitget_order_id in self.cancel_retry_count:
-                del self.cancel_retry_count[bitget_order_id]
+            # 미러링 기록/주문 매핑/재시도 카운터에서 제거
+            self._forget_mirror_order(bitget_order_id, gate_order_id)
             
         except Exception as e:
             self.logger.error(f"강제 미러링 기록 제거 V2 실패: {e}")
 
+    def _forget_mirror_order(self, bitget_order_id: str = None, gate_order_id: str = None):
+        """미러링 기록, 양방향 주문 매핑, 취소 재시도 카운터 제거"""
+        record = self.order_state.remove_order(bitget_order_id, gate_order_id)
+        if bitget_order_id is None and record is not None:
+            bitget_order_id = record.get('bitget_order', {}).get('orderId')
+        if gate_order_id is None and record is not None:
+            gate_order_id = record.get('gate_order_id')
+        if bitget_order_id is not None:
+            self.cancel_retry_count.pop(bitget_order_id, None)
+            # 취소/체결된 주문 가격은 같은 가격의 새 주문을 막지 않도록 해제
+            self.order_state.remove_trigger_price(bitget_order_id)
+            journal = self._get_journal()
+            if journal:
+                journal.remove_order(bitget_order_id)
+        if gate_order_id:
+            self._release_gate_existing_order(gate_order_id)
+
+    def _release_gate_existing_order(self, gate_order_id):
+        """게이트 기존 주문 기록(가격/해시) 해제 - 우리가 미러링한 주문이거나 이미 취소된 주문은 새 주문을 막지 않도록"""
+        for existing_id in [key for key in self.gate_existing_orders_detailed if str(key) == str(gate_order_id)]:
+            existing = self.gate_existing_orders_detailed.pop(existing_id)
+            self.order_state.remove_trigger_price(f"gate:{existing_id}")
+            order_hash = existing.get('hash')
+            # 같은 내용의 다른 기존 주문이 남아 있으면 해시는 유지
+            if order_hash and not any(other.get('hash') == order_hash for other in self.gate_existing_orders_detailed.values()):
+                self.order_state.remove_hash(HASH_GATE_EXISTING, order_hash)
+
     async def _cleanup_mirror_records(self, bitget_order_id: str, gate_order_id: str):
         try:
-            if bitget_order_id in self.mirrored_plan_orders:
-                del self.mirrored_plan_orders[bitget_order_id]
-            
-            if bitget_order_id in self.bitget_to_gate_order_mapping:
-                del self.bitget_to_gate_order_mapping[bitget_order_id]
-            if gate_order_id in self.gate_to_bitget_order_mapping:
-                del self.gate_to_bitget_order_mapping[gate_order_id]
-            
-            if bitget_order_id in self.cancel_retry_count:
-                del self.cancel_retry_count[bitget_order_id]
+            self._forget_mirror_order(bitget_order_id, gate_order_id)
                 
         except Exception as e:
             self.logger.error(f"미러링 기록 정리 실패: {e}")
@@ -1508,13 +1689,18 @@ class MirrorPositionManager:
             size = float(order.get('size', 0))
             fill_price = float(order.get('fillPrice', order.get('price', 0)))
             
+            # 체결로 자산/가용 마진이 바뀌었으므로 계정 스냅샷 새로 조회
+            if self.utils.account_snapshots:
+                self.utils.account_snapshots.invalidate()
+            
             # 🔥 체결 주문 처리 전 마진 모드 강제 체크
             await self._ensure_cross_margin_mode(f"체결처리({order_id})")
             
             # 복제 비율 적용된 마진 비율 계산
-            margin_ratio_result = await self.utils.calculate_dynamic_margin_ratio_with_multiplier(
-                size, fill_price, order, self.mirror_ratio_multiplier
-            )
+            with self.latency.span(STAGE_MARGIN_CALC, order_id):
+                margin_ratio_result = await self.utils.calculate_dynamic_margin_ratio_with_multiplier(
+                    size, fill_price, order, self.mirror_ratio_multiplier
+                )
             
             if not margin_ratio_result['success']:
                 return
@@ -1552,7 +1738,7 @@ class MirrorPositionManager:
 
     def _generate_gate_position_id(self, gate_pos: Dict) -> str:
         try:
-            contract = gate_pos.get('contract', "BTC_USDT")
+            contract = gate_pos.get('contract', self.GATE_CONTRACT)
             size = gate_pos.get('size', 0)
             
             if isinstance(size, (int, float)) and size != 0:
@@ -1566,13 +1752,13 @@ class MirrorPositionManager:
             
         except Exception as e:
             self.logger.error(f"게이트 포지션 ID 생성 실패: {e}")
-            return f"BTC_USDT_unknown_unknown"
+            return f"{self.GATE_CONTRACT}_unknown_unknown"
 
     # === 필수 초기화 메서드들 (간소화) ===
 
     async def _check_existing_gate_positions(self):
         try:
-            gate_positions = await self.gate_mirror.get_positions("BTC_USDT")
+            gate_positions = await self.gate_mirror.get_positions(self.GATE_CONTRACT)
             
             self.existing_gate_positions = {
                 'has_long': False,
@@ -1609,23 +1795,24 @@ class MirrorPositionManager:
 
     async def _record_gate_existing_orders(self):
         try:
-            gate_orders = await self.gate_mirror.get_price_triggered_orders("BTC_USDT", "open")
+            gate_orders = await self.gate_mirror.get_price_triggered_orders(self.GATE_CONTRACT, "open")
             
             for i, gate_order in enumerate(gate_orders):
+                if gate_order.get('id'):
+                    self.startup_gate_order_ids.add(str(gate_order.get('id')))
                 try:
                     order_details = await self.utils.extract_gate_order_details(gate_order)
                     
                     if order_details:
                         trigger_price = order_details['trigger_price']
-                        price_key = f"BTC_USDT_{trigger_price:.2f}"
-                        self.mirrored_trigger_prices.add(price_key)
+                        order_id = gate_order.get('id', f'existing_{i}')
+                        self.order_state.add_trigger_price(f"gate:{order_id}", trigger_price, self.trigger_price_ttl)
                         
                         order_hash = await self._generate_primary_order_hash_from_details(order_details)
                         
                         if order_hash:
-                            self.gate_existing_order_hashes.add(order_hash)
+                            self.order_state.add_hash(HASH_GATE_EXISTING, order_hash)
                             
-                            order_id = gate_order.get('id', f'existing_{i}')
                             self.gate_existing_orders_detailed[order_id] = {
                                 'gate_order': gate_order,
                                 'order_details': order_details,
@@ -1664,7 +1851,8 @@ class MirrorPositionManager:
                 if order_id:
                     self.startup_plan_orders.add(order_id)
             
-            self.last_plan_order_ids = set(self.startup_plan_orders)
+            # 시작 시 예약 주문을 비교 기준 스냅샷으로 (시작 시 복제에도 사용)
+            self.plan_order_snapshot.reset(all_startup_orders)
             
             self.logger.info(f"시작 시 비트겟 예약 주문 {len(self.startup_plan_orders)}개 기록 (클로즈 주문 포함)")
             
@@ -1673,7 +1861,7 @@ class MirrorPositionManager:
 
     async def _record_startup_gate_positions(self):
         try:
-            gate_positions = await self.gate_mirror.get_positions("BTC_USDT")
+            gate_positions = await self.gate_mirror.get_positions(self.GATE_CONTRACT)
             
             for pos in gate_positions:
                 if pos.get('size', 0) != 0:
@@ -1685,24 +1873,6 @@ class MirrorPositionManager:
         except Exception as e:
             self.logger.error(f"시작 시 게이트 포지션 기록 실패: {e}")
 
-    async def _create_initial_plan_order_snapshot(self):
-        try:
-            all_orders = await self._get_all_current_plan_orders_enhanced()
-            
-            for order in all_orders:
-                order_id = order.get('orderId', order.get('planOrderId', ''))
-                if order_id:
-                    self.plan_order_snapshot[order_id] = {
-                        'order_data': order.copy(),
-                        'timestamp': datetime.now().isoformat(),
-                        'status': 'startup'
-                    }
-            
-            self.logger.info(f"초기 예약 주문 스냅샷 생성: {len(self.plan_order_snapshot)}개")
-            
-        except Exception as e:
-            self.logger.error(f"초기 예약 주문 스냅샷 생성 실패: {e}")
-
     async def _mirror_startup_plan_orders_with_retry(self):
         try:
             if not self.startup_plan_orders:
@@ -1721,9 +1891,15 @@ class MirrorPositionManager:
                     failed_count = 0
                     
                     for order_id in list(self.startup_plan_orders):
+                        # 저널에서 복원된 (이미 게이트에 복제된) 주문
+                        if order_id in self.mirrored_plan_orders:
+                            skipped_count += 1
+                            self.processed_plan_orders.add(order_id)
+                            continue
+                        
                         try:
                             if order_id in self.plan_order_snapshot:
-                                order_data = self.plan_order_snapshot[order_id]['order_data']
+                                order_data = self.plan_order_snapshot.get(order_id)
                                 
                                 # 클로즈 주문 상세 분석
                                 close_details = await self.utils.determine_close_order_details_enhanced(order_data)
@@ -1789,15 +1965,11 @@ class MirrorPositionManager:
 
     async def _is_order_recently_processed_improved(self, order_id: str, order: Dict) -> bool:
         try:
-            if order_id in self.recently_processed_orders:
-                time_diff = (datetime.now() - self.recently_processed_orders[order_id]).total_seconds()
-                if time_diff < self.order_deduplication_window:
-                    return True
-                else:
-                    del self.recently_processed_orders[order_id]
+            if self.order_state.is_marked(MARK_PROCESSED, order_id):
+                return True
             
             order_hash = await self._generate_primary_order_hash(order)
-            if order_hash and order_hash in self.processed_order_hashes:
+            if order_hash and self.order_state.is_marked(MARK_ORDER_HASH, order_hash):
                 return True
             
             return False
@@ -1817,20 +1989,11 @@ class MirrorPositionManager:
             if trigger_price <= 0:
                 return False
             
-            for existing_price_key in self.mirrored_trigger_prices:
-                try:
-                    if existing_price_key.startswith(f"{self.GATE_CONTRACT}_"):
-                        existing_price_str = existing_price_key.replace(f"{self.GATE_CONTRACT}_", "")
-                        existing_price = float(existing_price_str)
-                        
-                        price_diff = abs(trigger_price - existing_price)
-                        if price_diff <= self.price_tolerance:
-                            return True
-                except (ValueError, IndexError):
-                    continue
+            if self.order_state.has_trigger_price_near(trigger_price, self.price_tolerance):
+                return True
             
             order_hash = await self._generate_primary_order_hash(bitget_order)
-            if order_hash and order_hash in self.gate_existing_order_hashes:
+            if order_hash and self.order_state.has_hash(HASH_GATE_EXISTING, order_hash):
                 return True
             
             return False
@@ -1854,9 +2017,9 @@ class MirrorPositionManager:
             if size:
                 size = int(float(size))
                 abs_size = abs(size)
-                return f"{self.GATE_CONTRACT}_{trigger_price:.2f}_{abs_size}"
+                return f"{self.GATE_CONTRACT}_{self._format_hash_price(trigger_price)}_{abs_size}"
             else:
-                return f"{self.GATE_CONTRACT}_price_{trigger_price:.2f}"
+                return f"{self.GATE_CONTRACT}_price_{self._format_hash_price(trigger_price)}"
             
         except Exception as e:
             self.logger.error(f"주 해시 생성 실패: {e}")
@@ -1872,23 +2035,27 @@ class MirrorPositionManager:
                 return ""
             
             if abs_size > 0:
-                return f"BTC_USDT_{trigger_price:.2f}_{abs_size}"
+                return f"{self.GATE_CONTRACT}_{self._format_hash_price(trigger_price)}_{abs_size}"
             else:
-                return f"BTC_USDT_price_{trigger_price:.2f}"
+                return f"{self.GATE_CONTRACT}_price_{self._format_hash_price(trigger_price)}"
             
         except Exception as e:
             self.logger.error(f"상세정보 기반 해시 생성 실패: {e}")
             return ""
 
+    def _format_hash_price(self, price: float) -> str:
+        """해시용 가격 - 계약 가격 단위 자릿수 (1달러 미만 계약도 서로 다른 가격이 같은 해시가 되지 않도록)"""
+        if self.contract_spec:
+            return self.contract_spec.format_price(price)
+        return f"{price:.2f}"
+
     async def _record_order_processing_hash(self, order_id: str, order: Dict):
         try:
-            current_time = datetime.now()
-            self.recently_processed_orders[order_id] = current_time
+            self.order_state.mark(MARK_PROCESSED, order_id, self.order_deduplication_window)
             
             order_hash = await self._generate_primary_order_hash(order)
             if order_hash:
-                self.processed_order_hashes.add(order_hash)
-                self.order_hash_timestamps[order_hash] = current_time
+                self.order_state.mark(MARK_ORDER_HASH, order_hash, self.hash_cleanup_interval)
             
             # 가격 기반 중복 방지 기록
             trigger_price = 0
@@ -1898,24 +2065,23 @@ class MirrorPositionManager:
                     break
             
             if trigger_price > 0:
-                price_key = f"{self.GATE_CONTRACT}_{trigger_price:.2f}"
-                self.mirrored_trigger_prices.add(price_key)
+                self.order_state.add_trigger_price(order_id, trigger_price, self.trigger_price_ttl)
             
         except Exception as e:
             self.logger.error(f"주문 처리 해시 기록 실패: {e}")
 
-    async def _check_if_order_was_filled_traditional(self, order_id: str) -> bool:
+    async def _check_if_order_was_filled_traditional(self, order_id: str, recent_filled: List[Dict] = None) -> bool:
         try:
-            if order_id in self.recently_filled_order_ids:
+            if self.order_state.is_marked(MARK_FILLED, order_id):
                 return True
             
-            recent_filled = await self.bitget.get_recent_filled_orders(symbol=self.SYMBOL, minutes=2)
+            if recent_filled is None:
+                recent_filled = await self.bitget.get_recent_filled_orders(symbol=self.SYMBOL, minutes=2)
             
             for filled_order in recent_filled:
                 filled_id = filled_order.get('orderId', filled_order.get('id', ''))
                 if filled_id == order_id:
-                    self.recently_filled_order_ids.add(order_id)
-                    self.filled_order_timestamps[order_id] = datetime.now()
+                    self.order_state.mark(MARK_FILLED, order_id, self.filled_order_check_window)
                     return True
             
             return False
@@ -1927,18 +2093,8 @@ class MirrorPositionManager:
     async def _cleanup_mirror_records_for_filled_order(self, bitget_order_id: str):
         try:
             if bitget_order_id in self.mirrored_plan_orders:
-                mirror_info = self.mirrored_plan_orders[bitget_order_id]
-                gate_order_id = mirror_info.get('gate_order_id')
-                
-                del self.mirrored_plan_orders[bitget_order_id]
-                
-                if bitget_order_id in self.bitget_to_gate_order_mapping:
-                    del self.bitget_to_gate_order_mapping[bitget_order_id]
-                if gate_order_id and gate_order_id in self.gate_to_bitget_order_mapping:
-                    del self.gate_to_bitget_order_mapping[gate_order_id]
-                
-                if bitget_order_id in self.cancel_retry_count:
-                    del self.cancel_retry_count[bitget_order_id]
+                gate_order_id = self.mirrored_plan_orders[bitget_order_id].get('gate_order_id')
+                self._forget_mirror_order(bitget_order_id, gate_order_id)
             
         except Exception as e:
             self.logger.error(f"체결된 주문 미러링 기록 정리 실패: {e}")
@@ -1997,29 +2153,29 @@ class MirrorPositionManager:
                 # 🔥 클로즈 주문 정리 전 마진 모드 체크
                 await self._ensure_cross_margin_mode("클로즈주문정리")
                 
+                # 열린 주문이 모두 클로즈 주문이면 계약 단위 일괄 취소
+                cancel_results = await self.gate_mirror.cancel_price_triggered_orders(
+                    [close_order.get('id') for close_order in close_orders_to_delete],
+                    contract=self.GATE_CONTRACT,
+                    open_order_ids=[gate_order.get('id') for gate_order in gate_orders]
+                )
+                
                 deleted_count = 0
-                for close_order in close_orders_to_delete:
-                    try:
-                        gate_order_id = close_order.get('id')
-                        if gate_order_id:
-                            await self.gate_mirror.cancel_price_triggered_order(gate_order_id)
-                            deleted_count += 1
-                            
-                            # 미러링 기록에서도 제거
-                            bitget_order_id = self.gate_to_bitget_order_mapping.get(gate_order_id)
-                            if bitget_order_id:
-                                if bitget_order_id in self.mirrored_plan_orders:
-                                    del self.mirrored_plan_orders[bitget_order_id]
-                                del self.gate_to_bitget_order_mapping[gate_order_id]
-                                if bitget_order_id in self.bitget_to_gate_order_mapping:
-                                    del self.bitget_to_gate_order_mapping[bitget_order_id]
-                            
-                    except Exception as e:
-                        error_msg = str(e).lower()
-                        if any(keyword in error_msg for keyword in [
-                            "not found", "order not exist", "invalid order"
-                        ]):
-                            deleted_count += 1
+                for gate_order_id, result in cancel_results.items():
+                    if not result['success']:
+                        continue
+                    
+                    # 미러링 기록에서도 제거
+                    bitget_order_id = self.order_state.get_bitget_id(gate_order_id)
+                    if bitget_order_id:
+                        self._forget_mirror_order(bitget_order_id, gate_order_id)
+                    
+                    if result.get('unexpected'):
+                        # 정리 대상이 아니었는데 함께 취소된 주문 - 비트겟 주문이 남아 있으면 다시 복제
+                        if bitget_order_id:
+                            await self._release_for_remirror(bitget_order_id)
+                        continue
+                    deleted_count += 1
                 
                 if deleted_count > 0:
                     self.daily_stats['auto_close_order_cleanups'] += deleted_count
@@ -2038,8 +2194,101 @@ class MirrorPositionManager:
         """포지션 종료 처리"""
         pass
 
+    # === 상태 저널 ===
+
+    def _get_journal(self) -> Optional[MirrorJournal]:
+        """미러링 상태 저널 (생성 실패 시 저널 없이 동작)"""
+        if self.journal is None and not self.journal_disabled:
+            try:
+                self.journal = MirrorJournal(self.config.mirror_journal_db)
+                self.logger.info(f"📒 미러링 상태 저널 사용: {self.journal.db_path}")
+            except Exception as e:
+                self.logger.error(f"미러링 상태 저널 초기화 실패 (저널 없이 동작): {e}")
+                self.journal_disabled = True
+        return self.journal
+
+    def _journal_order(self, bitget_order_id: str):
+        journal = self._get_journal()
+        record = self.mirrored_plan_orders.get(bitget_order_id)
+        if journal and record is not None:
+            journal.save_order(bitget_order_id, record.get('gate_order_id'), record)
+
+    def _checkpoint_journal(self, force: bool = False):
+        """처리 기록/중복 방지 상태/일일 통계 스냅샷 저장"""
+        now = time.monotonic()
+        if not force and now - self.last_journal_checkpoint < self.JOURNAL_CHECKPOINT_INTERVAL:
+            return
+        journal = self._get_journal()
+        if not journal:
+            return
+        self.last_journal_checkpoint = now
+        journal.save_snapshot({
+            'order_state': self.order_state.export_state(),
+            'processed_plan_orders': list(self.processed_plan_orders)[-500:],
+            'daily_stats': {'date': datetime.now().strftime('%Y-%m-%d'), 'stats': self.daily_stats}
+        })
+
+    def _export_latency(self, force: bool = False):
+        """지연 시간 통계 파일 내보내기 (설정된 경우만)"""
+        if not self.latency_export_path:
+            return
+        now = time.monotonic()
+        if not force and now - self.last_latency_export < self.LATENCY_EXPORT_INTERVAL:
+            return
+        self.last_latency_export = now
+        self.latency.export(self.latency_export_path)
+
+    def _restore_from_journal(self):
+        try:
+            journal = self._get_journal()
+            if not journal:
+                return
+            
+            # 비트겟 예약 주문과 게이트 주문이 모두 남아 있는 매핑만 복원
+            restored = 0
+            stale_ids = []
+            for bitget_order_id, record in journal.load_orders().items():
+                gate_order_id = str(record.get('gate_order_id') or '')
+                if bitget_order_id in self.startup_plan_orders and gate_order_id in self.startup_gate_order_ids:
+                    self.mirrored_plan_orders[bitget_order_id] = record
+                    self.order_state.link(bitget_order_id, gate_order_id)
+                    self.processed_plan_orders.add(bitget_order_id)
+                    # 복원된 매핑의 게이트 주문은 우리 미러 주문 - 시작 시 기록한 "기존 주문"에서 제외
+                    self._release_gate_existing_order(gate_order_id)
+                    restored += 1
+                else:
+                    stale_ids.append(bitget_order_id)
+            journal.remove_orders(stale_ids)
+            
+            snapshot = journal.load_snapshot(max_age=self.JOURNAL_MAX_AGE)
+            
+            order_state = snapshot.get('order_state') or {}
+            # 트리거 가격은 복원된 주문 것만 (게이트 기존 주문 가격은 시작 시 다시 기록됨)
+            order_state['trigger_prices'] = {
+                owner: price for owner, price in (order_state.get('trigger_prices') or {}).items()
+                if owner in self.mirrored_plan_orders
+            }
+            self.order_state.restore_state(order_state)
+            
+            self.processed_plan_orders.update(snapshot.get('processed_plan_orders') or [])
+            
+            saved_stats = snapshot.get('daily_stats') or {}
+            if saved_stats.get('date') == datetime.now().strftime('%Y-%m-%d'):
+                # 미러 트레이딩 시스템과 같은 dict를 공유하므로 제자리 갱신
+                self.daily_stats.update(saved_stats.get('stats') or {})
+            
+            self.logger.info(f"📒 저널 복원: 주문 매핑 {restored}개 (정리 {len(stale_ids)}개), "
+                             f"처리 기록 {len(snapshot.get('processed_plan_orders') or [])}개")
+            
+        except Exception as e:
+            self.logger.error(f"저널 복원 실패 (처음부터 동기화): {e}")
+
     async def stop(self):
         try:
             self.logger.info("포지션 매니저 중지 중...")
+            self._checkpoint_journal(force=True)
+            self._export_latency(force=True)
+            if self.journal:
+                self.journal.close()
         except Exception as e:
             self.logger.error(f"포지션 매니저 중지 실패: {e}")
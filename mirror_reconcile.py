@@ -0,0 +1,174 @@
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# 누락 미러링 종류
+MISSING_UNMIRRORED = 'unmirrored'        # 미러링 기록 없음
+MISSING_GATE_ORDER = 'missing_mirror'    # 미러링 기록은 있으나 게이트 주문 없음
+
+# 보존 사유 종류
+SAFE_EXISTING = 'existing_gate_order'    # 시작 시 존재했던 게이트 주문
+SAFE_UNMAPPED = 'unmapped_unknown'       # 매핑 없는 미지의 주문
+SAFE_UNCERTAIN = 'uncertain_status'      # 재조회에서 비트겟 주문 발견
+SAFE_RECHECK_FAILED = 'recheck_failed'   # 재조회 실패
+
+
+def _bitget_order_id(order: Dict) -> str:
+    return order.get('orderId', order.get('planOrderId', ''))
+
+
+def _empty_analysis() -> Dict:
+    return {
+        'requires_action': False,
+        'missing_mirrors': [],
+        'confirmed_orphans': [],
+        'safe_orders': [],
+        'total_issues': 0,
+        'stats': {'bitget_orders': 0, 'gate_orders': 0, 'suspects': 0, 'refetches': 0}
+    }
+
+
+class PlanOrderReconciler:
+    """비트겟/게이트 예약 주문 동기화 분석 - 주문 ID 인덱스를 한 번 만들어 비교하고, 고아 의심 주문은 한 번의 재조회로 함께 확인"""
+
+    def __init__(self, position_manager, fetch_bitget_orders: Callable[[], Awaitable[List[Dict]]]):
+        self.position_manager = position_manager
+        self.fetch_bitget_orders = fetch_bitget_orders
+        self.stats = {'syncs': 0, 'suspects': 0, 'refetches': 0, 'refetch_failures': 0, 'confirmed_orphans': 0}
+
+    def analyze(self, bitget_orders: List[Dict], gate_orders: List[Dict]) -> Dict:
+        """재조회 없이 인덱스 비교만 - 고아 의심 주문은 'suspect_orphans'에 모음"""
+        pm = self.position_manager
+        analysis = _empty_analysis()
+        analysis['suspect_orphans'] = []
+        analysis['stats']['bitget_orders'] = len(bitget_orders)
+        analysis['stats']['gate_orders'] = len(gate_orders)
+
+        gate_order_ids: Set[str] = {order.get('id') for order in gate_orders if order.get('id')}
+        bitget_order_ids: Set[str] = set()
+
+        # 비트겟 주문 분석 - 누락된 미러링 찾기
+        for bitget_order in bitget_orders:
+            bitget_order_id = _bitget_order_id(bitget_order)
+            if not bitget_order_id:
+                continue
+            bitget_order_ids.add(bitget_order_id)
+
+            if bitget_order_id in pm.startup_plan_orders or bitget_order_id in pm.processed_plan_orders:
+                continue
+
+            mirror_info = pm.mirrored_plan_orders.get(bitget_order_id)
+            if mirror_info is None:
+                analysis['missing_mirrors'].append({
+                    'bitget_order_id': bitget_order_id,
+                    'bitget_order': bitget_order,
+                    'expected_gate_id': None,
+                    'type': MISSING_UNMIRRORED
+                })
+                continue
+
+            expected_gate_id = mirror_info.get('gate_order_id')
+            if expected_gate_id and expected_gate_id not in gate_order_ids:
+                analysis['missing_mirrors'].append({
+                    'bitget_order_id': bitget_order_id,
+                    'bitget_order': bitget_order,
+                    'expected_gate_id': expected_gate_id,
+                    'type': MISSING_GATE_ORDER
+                })
+
+        # 게이트 고아 주문 찾기 - 매핑 없는 주문은 보존, 매핑된 비트겟 주문이 없으면 의심
+        for gate_order in gate_orders:
+            gate_order_id = gate_order.get('id', '')
+            if not gate_order_id:
+                continue
+
+            bitget_order_id = pm.gate_to_bitget_order_mapping.get(gate_order_id)
+            if not bitget_order_id:
+                if gate_order_id in pm.gate_existing_orders_detailed:
+                    analysis['safe_orders'].append({
+                        'gate_order_id': gate_order_id,
+                        'type': SAFE_EXISTING,
+                        'reason': '시작 시 존재했던 게이트 주문'
+                    })
+                else:
+                    analysis['safe_orders'].append({
+                        'gate_order_id': gate_order_id,
+                        'type': SAFE_UNMAPPED,
+                        'reason': '매핑 없는 미지의 주문 - 안전상 보존'
+                    })
+                continue
+
+            if bitget_order_id not in bitget_order_ids:
+                analysis['suspect_orphans'].append({
+                    'gate_order_id': gate_order_id,
+                    'gate_order': gate_order,
+                    'mapped_bitget_id': bitget_order_id
+                })
+
+        analysis['stats']['suspects'] = len(analysis['suspect_orphans'])
+        return analysis
+
+    async def _refetch_bitget_order_ids(self) -> Optional[Set[str]]:
+        """고아 의심 주문 확인용 비트겟 예약 주문 재조회 (1회) - 실패 시 None
+
+        하위 조회가 오류를 삼키고 빈 목록을 돌려주는 경우가 있어, 의심 주문이 있는데 재조회가 비어 있으면 실패로 취급
+        (실제 전체 취소는 틱마다의 취소 감지가 처리)
+        """
+        self.stats['refetches'] += 1
+        try:
+            orders = await self.fetch_bitget_orders()
+            if not orders:
+                raise ValueError("재조회 결과 없음")
+            return {order_id for order_id in (_bitget_order_id(order) for order in orders) if order_id}
+        except Exception as e:
+            self.stats['refetch_failures'] += 1
+            logger.warning(f"동기화 재조회 실패 - 의심 주문 모두 보존: {e}")
+            return None
+
+    async def reconcile(self, bitget_orders: List[Dict], gate_orders: List[Dict]) -> Dict:
+        """동기화 분석 - 추가 API 호출은 의심 주문이 있을 때 재조회 1회"""
+        self.stats['syncs'] += 1
+        analysis = self.analyze(bitget_orders, gate_orders)
+        suspects = analysis.pop('suspect_orphans')
+
+        if suspects:
+            self.stats['suspects'] += len(suspects)
+            analysis['stats']['refetches'] = 1
+            current_ids = await self._refetch_bitget_order_ids()
+
+            for suspect in suspects:
+                gate_order_id = suspect['gate_order_id']
+                bitget_order_id = suspect['mapped_bitget_id']
+
+                if current_ids is None:
+                    analysis['safe_orders'].append({
+                        'gate_order_id': gate_order_id,
+                        'type': SAFE_RECHECK_FAILED,
+                        'reason': '재확인 실패로 안전상 보존'
+                    })
+                elif bitget_order_id in current_ids:
+                    analysis['safe_orders'].append({
+                        'gate_order_id': gate_order_id,
+                        'type': SAFE_UNCERTAIN,
+                        'reason': '비트겟 주문 상태 불확실: 현재 활성 주문에서 발견'
+                    })
+                else:
+                    analysis['confirmed_orphans'].append({
+                        **suspect,
+                        'type': 'confirmed_orphan',
+                        'verification': {
+                            'exists': False,
+                            'definitely_deleted': True,
+                            'found_in': 'nowhere',
+                            'reason': '현재 활성 주문에서 찾을 수 없음 (취소/체결됨)'
+                        }
+                    })
+
+        self.stats['confirmed_orphans'] += len(analysis['confirmed_orphans'])
+        analysis['total_issues'] = len(analysis['missing_mirrors']) + len(analysis['confirmed_orphans'])
+        analysis['requires_action'] = analysis['total_issues'] > 0
+        return analysis
+
+    def get_stats(self) -> Dict:
+        return dict(self.stats)
@@ -0,0 +1,147 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Optional
+
+from rate_limiter import task_priority, PRIORITY_CRITICAL, PRIORITY_NORMAL, PRIORITY_LOW
+
+logger = logging.getLogger(__name__)
+
+# 작업 차선 (앞쪽일수록 우선)
+LANE_CRITICAL = 'critical'    # 게이트 주문 생성/취소/체결 대응
+LANE_RECONCILE = 'reconcile'  # 예약 주문/포지션 동기화
+LANE_REPORTING = 'reporting'  # 상태 로그/시세 차이 안내/리포트
+LANES = (LANE_CRITICAL, LANE_RECONCILE, LANE_REPORTING)
+
+LANE_LABELS = {
+    LANE_CRITICAL: '주문 처리',
+    LANE_RECONCILE: '동기화',
+    LANE_REPORTING: '리포트/상태'
+}
+
+# 차선별 요청 우선순위 (rate_limiter 토큰 대기 순서)
+LANE_PRIORITIES = {
+    LANE_CRITICAL: PRIORITY_CRITICAL,
+    LANE_RECONCILE: PRIORITY_NORMAL,
+    LANE_REPORTING: PRIORITY_LOW
+}
+
+
+class StaleWorkDropped(Exception):
+    """대기 중 기한이 지나 실행하지 않고 폐기한 작업"""
+
+
+class MirrorWorkScheduler:
+    """미러링 작업 우선순위 스케줄러 - 차선별 동시 실행 제한, 상위 차선 작업이 실행/대기 중이면 하위 차선은 시작하지 않고,
+    기한 안에 시작하지 못한 하위 작업은 폐기"""
+
+    def __init__(self, config=None):
+        self.limits = {
+            LANE_CRITICAL: int(getattr(config, 'mirror_lane_critical_limit', 5)),
+            LANE_RECONCILE: int(getattr(config, 'mirror_lane_reconcile_limit', 1)),
+            LANE_REPORTING: int(getattr(config, 'mirror_lane_reporting_limit', 1))
+        }
+        self.active = {lane: 0 for lane in LANES}
+        self.waiting = {lane: 0 for lane in LANES}
+        # 이벤트 루프 안에서 처음 쓸 때 생성
+        self._condition: Optional[asyncio.Condition] = None
+
+        self.stats = {
+            lane: {'started': 0, 'completed': 0, 'failed': 0, 'dropped': 0, 'waited': 0, 'wait_time': 0.0, 'max_wait': 0.0}
+            for lane in LANES
+        }
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    def _can_start(self, lane: str) -> bool:
+        if self.active[lane] >= self.limits[lane]:
+            return False
+        for higher in LANES[:LANES.index(lane)]:
+            if self.active[higher] or self.waiting[higher]:
+                return False
+        return True
+
+    def is_busy(self, lane: str = LANE_CRITICAL) -> bool:
+        return bool(self.active[lane] or self.waiting[lane])
+
+    async def _admit(self, lane: str, deadline: Optional[float], name: str) -> float:
+        """실행 슬롯 획득 - 대기한 시간(초) 반환, 기한 초과 시 StaleWorkDropped"""
+        condition = self._get_condition()
+        started = time.monotonic()
+        async with condition:
+            self.waiting[lane] += 1
+            try:
+                while not self._can_start(lane):
+                    timeout = None
+                    if deadline is not None:
+                        timeout = deadline - (time.monotonic() - started)
+                        if timeout <= 0:
+                            raise StaleWorkDropped(f"{LANE_LABELS[lane]} 작업 기한 초과: {name or '-'} ({deadline:.0f}초)")
+                    try:
+                        await asyncio.wait_for(condition.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                self.active[lane] += 1
+            finally:
+                self.waiting[lane] -= 1
+                # 상위 차선 대기가 끝나면 하위 차선이 다시 확인하도록
+                condition.notify_all()
+        return time.monotonic() - started
+
+    async def _release(self, lane: str):
+        condition = self._get_condition()
+        async with condition:
+            self.active[lane] -= 1
+            condition.notify_all()
+
+    async def run(self, lane: str, job: Callable[[], Awaitable], deadline: Optional[float] = None, name: str = ''):
+        """차선에서 작업 실행 - deadline(초) 안에 시작하지 못하면 StaleWorkDropped, 작업 예외는 그대로 전달"""
+        stats = self.stats[lane]
+        try:
+            waited = await self._admit(lane, deadline, name)
+        except StaleWorkDropped as e:
+            stats['dropped'] += 1
+            logger.info(f"⏭️ 오래된 작업 폐기 - {e}")
+            raise
+
+        stats['started'] += 1
+        if waited > 0.01:
+            stats['waited'] += 1
+            stats['wait_time'] += waited
+            stats['max_wait'] = max(stats['max_wait'], waited)
+            if waited > 1.0:
+                logger.debug(f"{LANE_LABELS[lane]} 작업 대기 {waited:.2f}초: {name or '-'}")
+
+        try:
+            with task_priority(LANE_PRIORITIES[lane]):
+                result = await job()
+            stats['completed'] += 1
+            return result
+        except Exception:
+            stats['failed'] += 1
+            raise
+        finally:
+            await self._release(lane)
+
+    async def run_or_skip(self, lane: str, job: Callable[[], Awaitable], deadline: Optional[float] = None, name: str = ''):
+        """주기 작업용 - 기한이 지나 폐기되면 None (다음 주기에 새로 실행)"""
+        try:
+            return await self.run(lane, job, deadline, name)
+        except StaleWorkDropped:
+            return None
+
+    def get_stats(self) -> Dict:
+        return {
+            lane: {
+                **stats,
+                'wait_time': round(stats['wait_time'], 2),
+                'max_wait': round(stats['max_wait'], 2),
+                'active': self.active[lane],
+                'waiting': self.waiting[lane],
+                'limit': self.limits[lane]
+            }
+            for lane, stats in self.stats.items()
+        }
@@ -0,0 +1,755 @@
+"""
+오프라인 미러링 시뮬레이터 - 비트겟/게이트 REST를 프로세스 안에서 흉내 내는 가짜 거래소, 매칭 엔진, 테이프 재생
+
+실제 미러 클라이언트(BitgetMirrorClient/GateioMirrorClient)의 _request만 가짜 거래소로 연결하므로
+응답 파싱, 마진 모드/레버리지 처리, 주문 생성 코드는 운영과 같은 코드가 실행됨.
+틱은 시뮬레이터가 직접 실행하므로 같은 시드와 테이프면 같은 순서로 처리됨 (지연 0이면 완전히 재현).
+
+실행:
+    python mirror_simulator.py --orders 300 --ticks 30              # 예약 주문 300개 미러링 처리량/지연 측정
+    python mirror_simulator.py --orders 50 --save-tape tape.jsonl   # 생성한 주문/시세 테이프 저장
+    python mirror_simulator.py --replay tape.jsonl --latency 0      # 테이프 재생 (장애 재현)
+    python mirror_simulator.py --orders 100 --followers 3           # 게이트 팔로워 3개 계정으로 동시 미러링
+
+테이프 형식 (JSON Lines, t는 시작 기준 초, 같은 t의 이벤트를 적용한 뒤 틱 1회):
+    {"t": 0.0, "type": "price", "bitget": 100000.0, "gate": 100010.0}
+    {"t": 0.5, "type": "plan_order", "order": {"orderId": "1", "side": "buy", "tradeSide": "open", "triggerPrice": "99000", "size": "0.01"}}
+    {"t": 1.0, "type": "modify", "order_id": "1", "fields": {"triggerPrice": "98500"}}
+    {"t": 1.5, "type": "cancel", "order_id": "1"}
+    {"t": 2.0, "type": "fail", "venue": "gate", "endpoint": "/api/v4/futures/usdt/price_orders", "count": 2}
+    {"t": 2.5, "type": "latency", "venue": "bitget", "mean_ms": 300, "jitter_ms": 50}
+    {"t": 3.0, "type": "sync"}
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from bitget_mirror_client import BitgetMirrorClient
+from gateio_mirror_client import GateioMirrorClient
+from mirror_engine import EVENT_TICK
+from mirror_trading import MirrorTradingSystem
+
+logger = logging.getLogger(__name__)
+
+# 게이트 BTC_USDT 계약 1개 = 0.0001 BTC, 가격 단위 0.1
+GATE_CONTRACT_SIZE = 0.0001
+GATE_PRICE_TICK = 0.1
+
+
+class SimulatedExchangeError(Exception):
+    """가짜 거래소 오류 (주입된 장애 포함) - 메시지는 실제 거래소 오류와 같은 키워드 사용"""
+
+
+class SimulatorConfig:
+    """시뮬레이터용 설정 - 미러링 코드가 읽는 값만 (저널/스트림/지연 내보내기 비활성화)"""
+
+    def __init__(self, **overrides):
+        self.symbol = 'BTCUSDT'
+        self.gate_contract = 'BTC_USDT'
+        self.bitget_api_key = 'simulator'
+        self.bitget_api_secret = 'simulator'
+        self.bitget_passphrase = 'simulator'
+        self.bitget_base_url = 'http://simulator'
+        self.GATE_API_KEY = 'simulator'
+        self.GATE_API_SECRET = 'simulator'
+        self.ws_stream_enabled = False
+        self.mirror_event_engine = True
+        self.mirror_journal_db = ''
+        self.mirror_latency_export = ''
+        for key, value in overrides.items():
+            setattr(self, key, value)
+
+
+class FakeTelegram:
+    """보낸 메시지만 기록하는 텔레그램 봇"""
+
+    def __init__(self):
+        self.messages: List[str] = []
+
+    async def send_message(self, text: str, *args, **kwargs):
+        self.messages.append(text)
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _bitget_order_direction(order: Dict) -> Tuple[str, bool]:
+    """비트겟 예약 주문의 (포지션 방향, 청산 여부)"""
+    side = str(order.get('side', '')).lower()
+    if 'close_long' in side:
+        return 'long', True
+    if 'close_short' in side:
+        return 'short', True
+    is_close = (str(order.get('tradeSide', '')).lower() == 'close'
+                or str(order.get('reduceOnly', '')).lower() in ('true', 'yes'))
+    if is_close:
+        return order.get('posSide') or ('long' if side == 'sell' else 'short'), True
+    return ('long' if side == 'buy' or 'long' in side else 'short'), False
+
+
+class SimulatedExchange:
+    """비트겟/게이트 가짜 거래소 - 계정/포지션/예약 주문 상태, 트리거 매칭, 요청 지연과 장애 주입"""
+
+    def __init__(self, seed: int = 0, bitget_price: float = 100000.0, gate_price: float = None,
+                 bitget_equity: float = 10000.0, gate_equity: float = 10000.0, leverage: int = 30,
+                 latency_ms: float = 20.0, jitter_ms: float = 5.0, failure_rate: float = 0.0,
+                 symbol: str = 'BTCUSDT', contract: str = 'BTC_USDT',
+                 quanto_multiplier: float = GATE_CONTRACT_SIZE, price_tick: float = GATE_PRICE_TICK):
+        self.rng = random.Random(seed)
+        self.symbol = symbol
+        self.contract = contract
+        self.quanto_multiplier = quanto_multiplier
+        self.price_tick = price_tick
+
+        # 요청 지연 {거래소: (평균 ms, 편차 ms)}, 무작위 장애 확률, 강제 장애 [거래소, 엔드포인트 접두사, 남은 횟수, 메시지]
+        self.latency: Dict[str, Tuple[float, float]] = {'bitget': (latency_ms, jitter_ms), 'gate': (latency_ms, jitter_ms)}
+        self.failure_rate = failure_rate
+        self.forced_failures: List[List] = []
+        # 클라이언트 재시도 간격 (초) - 실제 클라이언트의 지수 백오프 대신 짧게
+        self.RETRY_BACKOFF = 0.01
+
+        self.bitget_price = bitget_price
+        self.gate_price = gate_price if gate_price is not None else bitget_price
+
+        # 비트겟: 예약 주문 {주문 ID: 주문}, 포지션 {holdSide: 포지션}, 체결 기록
+        self.bitget_equity = bitget_equity
+        self.bitget_leverage = leverage
+        self.bitget_plan_orders: Dict[str, Dict] = {}
+        self.bitget_positions: Dict[str, Dict] = {}
+        self.bitget_fills: List[Dict] = []
+
+        # 게이트: 가격 트리거 주문 {ID: 주문}, 단방향 포지션 (부호 있는 계약 수)
+        self.gate_equity = gate_equity
+        self.gate_leverage = leverage
+        self.gate_margin_mode = 'cross'
+        self.gate_position = {'size': 0, 'entry_price': 0.0}
+        self.gate_price_orders: Dict[int, Dict] = {}
+        self.gate_finished_orders: List[Dict] = []
+        self.gate_fills: List[Dict] = []
+
+        self._bitget_ids = itertools.count(1)
+        self._gate_ids = itertools.count(1)
+        self.stats = {'requests': {}, 'failures': {}, 'bitget_fills': 0, 'gate_fills': 0}
+
+    # ===== 시나리오 조작 =====
+
+    def set_price(self, bitget: float = None, gate: float = None):
+        """시세 변경 후 트리거 매칭 - gate를 생략하면 기존 시세 차이 유지"""
+        if bitget is not None:
+            spread = self.gate_price - self.bitget_price
+            self.bitget_price = float(bitget)
+            self.gate_price = float(gate) if gate is not None else self.bitget_price + spread
+        elif gate is not None:
+            self.gate_price = float(gate)
+        self.match()
+
+    def add_plan_order(self, order: Dict = None, **fields) -> str:
+        """비트겟 예약 주문 추가 - 빠진 필드는 기본값, 생성 시각은 현재 시각"""
+        order = {**(order or {}), **fields}
+        order_id = str(order.get('orderId') or f"sim{next(self._bitget_ids):08d}")
+        now = str(_now_ms())
+        order.setdefault('symbol', self.symbol)
+        order.setdefault('planType', 'normal_plan')
+        order.setdefault('side', 'buy')
+        order.setdefault('tradeSide', 'open')
+        order.setdefault('orderType', 'market')
+        order.setdefault('triggerType', 'fill_price')
+        order.setdefault('size', '0.01')
+        order.setdefault('triggerPrice', str(self.bitget_price))
+        order.update({'orderId': order_id, 'planStatus': 'live', 'cTime': now, 'uTime': now})
+        # 생성 시점 시세 기준 트리거 방향 (위로 돌파/아래로 돌파)
+        order['_rule'] = 'ge' if float(order['triggerPrice']) > self.bitget_price else 'le'
+        self.bitget_plan_orders[order_id] = order
+        return order_id
+
+    def modify_plan_order(self, order_id: str, **fields) -> bool:
+        order = self.bitget_plan_orders.get(order_id)
+        if order is None:
+            return False
+        order.update({key: str(value) for key, value in fields.items()})
+        order['uTime'] = str(_now_ms())
+        if 'triggerPrice' in fields:
+            order['_rule'] = 'ge' if float(order['triggerPrice']) > self.bitget_price else 'le'
+        return True
+
+    def cancel_plan_order(self, order_id: str) -> bool:
+        return self.bitget_plan_orders.pop(order_id, None) is not None
+
+    def fail_next(self, venue: str, endpoint: str = '', count: int = 1, error: str = None):
+        """다음 count번 요청을 실패시킴 (endpoint 접두사가 맞는 요청만)"""
+        self.forced_failures.append([venue, endpoint, count, error or 'HTTP 503: 시뮬레이터 장애 주입'])
+
+    def set_latency(self, venue: str, mean_ms: float, jitter_ms: float = 0.0):
+        self.latency[venue] = (float(mean_ms), float(jitter_ms))
+
+    def apply_event(self, event: Dict):
+        """테이프 이벤트 1건 적용"""
+        kind = event.get('type')
+        if kind == 'price':
+            self.set_price(event.get('bitget'), event.get('gate'))
+        elif kind == 'plan_order':
+            self.add_plan_order(dict(event['order']))
+        elif kind == 'modify':
+            self.modify_plan_order(str(event['order_id']), **event.get('fields', {}))
+        elif kind == 'cancel':
+            self.cancel_plan_order(str(event['order_id']))
+        elif kind == 'fail':
+            self.fail_next(event['venue'], event.get('endpoint', ''), event.get('count', 1), event.get('error'))
+        elif kind == 'latency':
+            self.set_latency(event['venue'], event.get('mean_ms', 0.0), event.get('jitter_ms', 0.0))
+        elif kind == 'failure_rate':
+            self.failure_rate = float(event.get('rate', 0.0))
+        elif kind not in ('tick', 'sync'):
+            raise ValueError(f"알 수 없는 테이프 이벤트: {kind}")
+
+    # ===== 매칭 엔진 =====
+
+    def match(self):
+        """현재 시세로 트리거된 예약 주문 체결 (비트겟 → 게이트 순)"""
+        for order_id, order in list(self.bitget_plan_orders.items()):
+            trigger = float(order['triggerPrice'])
+            if (self.bitget_price >= trigger) if order['_rule'] == 'ge' else (self.bitget_price <= trigger):
+                del self.bitget_plan_orders[order_id]
+                self._fill_bitget(order, trigger)
+
+        for order_id, order in list(self.gate_price_orders.items()):
+            trigger = float(order['trigger']['price'])
+            if (self.gate_price >= trigger) if order['trigger']['rule'] == 1 else (self.gate_price <= trigger):
+                del self.gate_price_orders[order_id]
+                fill = self._fill_gate(int(order['initial']['size']), self.gate_price, order['initial'].get('reduce_only', False))
+                order.update({'status': 'finished', 'finish_as': 'succeeded' if fill else 'failed',
+                              'finish_time': int(time.time()), 'trade_id': fill['id'] if fill else 0})
+                self.gate_finished_orders.append(order)
+
+    def _fill_bitget(self, order: Dict, price: float):
+        hold_side, is_close = _bitget_order_direction(order)
+        size = float(order['size'])
+        position = self.bitget_positions.get(hold_side)
+        if is_close:
+            if not position:
+                return
+            size = min(size, position['total'])
+            position['total'] -= size
+            if position['total'] <= 0:
+                del self.bitget_positions[hold_side]
+        elif position:
+            total = position['total'] + size
+            position['openPriceAvg'] = (position['openPriceAvg'] * position['total'] + price * size) / total
+            position['total'] = total
+        else:
+            self.bitget_positions[hold_side] = {'total': size, 'openPriceAvg': price, 'cTime': str(_now_ms())}
+
+        now = str(_now_ms())
+        self.bitget_fills.append({
+            'orderId': order['orderId'], 'symbol': self.symbol, 'size': str(size), 'baseVolume': str(size),
+            'priceAvg': str(price), 'side': order.get('side'), 'tradeSide': order.get('tradeSide'),
+            'posSide': hold_side, 'reduceOnly': 'true' if is_close else 'false',
+            'orderType': 'market', 'status': 'filled', 'cTime': now, 'uTime': now
+        })
+        self.stats['bitget_fills'] += 1
+
+    def _fill_gate(self, size: int, price: float, reduce_only: bool = False) -> Optional[Dict]:
+        position_size = self.gate_position['size']
+        if reduce_only:
+            # 포지션을 줄이는 방향으로만, 포지션 크기까지
+            if position_size == 0 or (position_size > 0) == (size > 0):
+                return None
+            size = max(size, -position_size) if position_size > 0 else min(size, -position_size)
+
+        new_size = position_size + size
+        if new_size == 0:
+            self.gate_position['entry_price'] = 0.0
+        elif position_size == 0 or (position_size > 0) != (new_size > 0):
+            # 신규 또는 방향 전환
+            self.gate_position['entry_price'] = price
+        elif (position_size > 0) == (size > 0):
+            self.gate_position['entry_price'] = (
+                self.gate_position['entry_price'] * abs(position_size) + price * abs(size)) / abs(new_size)
+        self.gate_position['size'] = new_size
+
+        fill = {
+            'id': next(self._gate_ids), 'contract': self.contract, 'size': size, 'left': 0,
+            'fill_price': str(price), 'price': '0', 'tif': 'ioc', 'is_reduce_only': bool(reduce_only),
+            'status': 'finished', 'finish_as': 'filled', 'create_time': time.time()
+        }
+        self.gate_fills.append(fill)
+        self.stats['gate_fills'] += 1
+        return fill
+
+    # ===== 요청 처리 =====
+
+    async def request(self, venue: str, method: str, endpoint: str, params: Dict = None, data: Dict = None):
+        """가짜 REST 요청 - 지연 후 장애 주입 확인, 라우팅 (비트겟은 응답의 data 부분 반환)"""
+        key = f"{venue} {method} {endpoint}"
+        self.stats['requests'][key] = self.stats['requests'].get(key, 0) + 1
+
+        mean_ms, jitter_ms = self.latency.get(venue, (0.0, 0.0))
+        delay_ms = max(0.0, self.rng.gauss(mean_ms, jitter_ms)) if jitter_ms else mean_ms
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+        error = self._injected_failure(venue, endpoint)
+        if error:
+            self.stats['failures'][key] = self.stats['failures'].get(key, 0) + 1
+            raise SimulatedExchangeError(error)
+
+        params = params or {}
+        if venue == 'bitget':
+            return self._route_bitget(method, endpoint, params, data or {})
+        return self._route_gate(method, endpoint, params, data or {})
+
+    def _injected_failure(self, venue: str, endpoint: str) -> Optional[str]:
+        for failure in self.forced_failures:
+            if failure[0] == venue and endpoint.startswith(failure[1]):
+                failure[2] -= 1
+                if failure[2] <= 0:
+                    self.forced_failures.remove(failure)
+                return failure[3]
+        if self.failure_rate and self.rng.random() < self.failure_rate:
+            return 'HTTP 502: 시뮬레이터 무작위 장애'
+        return None
+
+    # ----- 비트겟 -----
+
+    def _bitget_unrealized(self) -> float:
+        pnl = 0.0
+        for hold_side, position in self.bitget_positions.items():
+            direction = 1 if hold_side == 'long' else -1
+            pnl += direction * (self.bitget_price - position['openPriceAvg']) * position['total']
+        return pnl
+
+    def _route_bitget(self, method: str, endpoint: str, params: Dict, data: Dict):
+        # 다른 심볼 조회는 빈 결과 (가짜 거래소는 심볼 1개)
+        symbol = (params or {}).get('symbol')
+        if symbol and symbol != self.symbol and endpoint != '/api/v2/mix/account/accounts':
+            return {'entrustedList': [], 'orderList': []} if endpoint in (
+                '/api/v2/mix/order/orders-pending', '/api/v2/mix/order/orders-history') else []
+
+        if endpoint == '/api/v2/mix/account/accounts':
+            equity = self.bitget_equity + self._bitget_unrealized()
+            used = sum(p['total'] * p['openPriceAvg'] for p in self.bitget_positions.values()) / self.bitget_leverage
+            return [{
+                'marginCoin': 'USDT', 'accountEquity': str(equity), 'usdtEquity': str(equity),
+                'available': str(equity - used), 'crossedMaxAvailable': str(equity - used),
+                'unrealizedPL': str(self._bitget_unrealized()),
+                'crossMarginLeverage': str(self.bitget_leverage), 'marginMode': 'crossed'
+            }]
+
+        if endpoint == '/api/v2/mix/position/all-position':
+            return [{
+                'symbol': self.symbol, 'marginCoin': 'USDT', 'holdSide': hold_side,
+                'total': str(position['total']), 'available': str(position['total']),
+                'openPriceAvg': str(position['openPriceAvg']), 'leverage': str(self.bitget_leverage),
+                'marginMode': 'crossed', 'markPrice': str(self.bitget_price),
+                'marginSize': str(position['total'] * position['openPriceAvg'] / self.bitget_leverage),
+                'unrealizedPL': str((1 if hold_side == 'long' else -1) * (self.bitget_price - position['openPriceAvg']) * position['total']),
+                'liquidationPrice': '0', 'cTime': position['cTime']
+            } for hold_side, position in self.bitget_positions.items()]
+
+        if endpoint == '/api/v2/mix/order/orders-pending':
+            return {'entrustedList': [
+                {k: v for k, v in order.items() if not k.startswith('_')} for order in self.bitget_plan_orders.values()
+            ]}
+
+        if endpoint == '/api/mix/v1/plan/currentPlan':
+            # 시뮬레이터는 V2 조회 결과에 모든 예약 주문을 담음
+            return []
+
+        if endpoint == '/api/v2/mix/order/orders-history':
+            start = int(params.get('startTime', 0))
+            end = int(params.get('endTime', _now_ms()))
+            fills = [fill for fill in self.bitget_fills if start <= int(fill['uTime']) <= end]
+            return {'orderList': fills[-int(params.get('pageSize', 100)):]}
+
+        if endpoint == '/api/v2/mix/market/ticker':
+            return [{
+                'symbol': self.symbol, 'lastPr': str(self.bitget_price), 'markPrice': str(self.bitget_price),
+                'high24h': str(self.bitget_price * 1.01), 'low24h': str(self.bitget_price * 0.99),
+                'baseVolume': '12345.6', 'change24h': '0.0012', 'ts': str(_now_ms())
+            }]
+
+        raise SimulatedExchangeError(f"HTTP 404: 시뮬레이터 미지원 비트겟 엔드포인트 {method} {endpoint}")
+
+    # ----- 게이트 -----
+
+    def _gate_account(self) -> Dict:
+        size = self.gate_position['size']
+        unrealized = size * self.quanto_multiplier * (self.gate_price - self.gate_position['entry_price']) if size else 0.0
+        margin = abs(size) * self.quanto_multiplier * self.gate_position['entry_price'] / self.gate_leverage
+        order_margin = sum(
+            abs(int(order['initial']['size'])) * self.quanto_multiplier * float(order['trigger']['price'])
+            for order in self.gate_price_orders.values()
+        ) / self.gate_leverage
+        total = self.gate_equity + unrealized
+        return {
+            'currency': 'USDT', 'total': str(total), 'unrealised_pnl': str(unrealized),
+            'position_margin': str(margin), 'order_margin': str(order_margin),
+            'available': str(total - margin - order_margin), 'in_dual_mode': False
+        }
+
+    def _gate_position_payload(self) -> Dict:
+        size = self.gate_position['size']
+        return {
+            'contract': self.contract, 'size': size, 'leverage': str(self.gate_leverage),
+            # 미러링 코드는 mode 필드를 마진 모드로 읽음
+            'mode': self.gate_margin_mode, 'entry_price': str(self.gate_position['entry_price']),
+            'mark_price': str(self.gate_price),
+            'value': str(abs(size) * self.quanto_multiplier * self.gate_price),
+            'margin': str(abs(size) * self.quanto_multiplier * self.gate_position['entry_price'] / self.gate_leverage),
+            'unrealised_pnl': str(size * self.quanto_multiplier * (self.gate_price - self.gate_position['entry_price'])),
+            'liq_price': '0', 'cross_leverage_limit': '0'
+        }
+
+    def _route_gate(self, method: str, endpoint: str, params: Dict, data: Dict):
+        prefix = '/api/v4/futures/usdt'
+        path = endpoint[len(prefix):] if endpoint.startswith(prefix) else endpoint
+
+        if method == 'GET' and path in ('/accounts', '/account'):
+            return self._gate_account()
+
+        if method == 'GET' and path == '/tickers':
+            return [{
+                'contract': self.contract, 'last': str(self.gate_price), 'mark_price': str(self.gate_price),
+                'index_price': str(self.gate_price)
+            }]
+
+        if method == 'GET' and path == f'/contracts/{self.contract}':
+            return {
+                'name': self.contract, 'quanto_multiplier': str(self.quanto_multiplier),
+                'order_price_round': str(self.price_tick), 'leverage_min': '1', 'leverage_max': '100'
+            }
+
+        if path == f'/positions/{self.contract}' and method == 'GET':
+            return self._gate_position_payload()
+
+        if method == 'POST' and path in ('/positions/cross_mode', f'/positions/{self.contract}/margin_mode', '/account/margin_mode'):
+            self.gate_margin_mode = 'cross'
+            return self._gate_position_payload()
+
+        if method == 'POST' and path == f'/positions/{self.contract}/leverage':
+            leverage = int(float(params.get('leverage', self.gate_leverage)))
+            if leverage == self.gate_leverage:
+                raise SimulatedExchangeError('HTTP 400: leverage not changed')
+            self.gate_leverage = leverage
+            return self._gate_position_payload()
+
+        if path == '/price_orders':
+            if method == 'GET':
+                if params.get('status', 'open') == 'open':
+                    return list(self.gate_price_orders.values())
+                return list(self.gate_finished_orders)
+            if method == 'POST':
+                return self._create_gate_price_order(data)
+            if method == 'DELETE':
+                cancelled = []
+                for order_id, order in list(self.gate_price_orders.items()):
+                    if order['initial']['contract'] == params.get('contract', self.contract):
+                        del self.gate_price_orders[order_id]
+                        order.update({'status': 'finished', 'finish_as': 'cancelled', 'finish_time': int(time.time())})
+                        self.gate_finished_orders.append(order)
+                        cancelled.append(order)
+                return cancelled
+
+        if path.startswith('/price_orders/') and method in ('GET', 'DELETE'):
+            try:
+                order_id = int(path.rsplit('/', 1)[1])
+            except ValueError:
+                order_id = None
+            order = self.gate_price_orders.get(order_id)
+            if order is None:
+                raise SimulatedExchangeError('HTTP 404: {"label":"ORDER_NOT_FOUND","message":"Order not found"}')
+            if method == 'DELETE':
+                del self.gate_price_orders[order_id]
+                order.update({'status': 'finished', 'finish_as': 'cancelled', 'finish_time': int(time.time())})
+                self.gate_finished_orders.append(order)
+            return order
+
+        if method == 'POST' and path == '/orders':
+            size = int(data.get('size', 0))
+            if size == 0:
+                raise SimulatedExchangeError('HTTP 400: {"label":"INVALID_PARAM_VALUE","message":"size"}')
+            fill = self._fill_gate(size, self.gate_price, bool(data.get('reduce_only')))
+            if fill is None:
+                raise SimulatedExchangeError('HTTP 400: {"label":"REDUCE_ONLY_FAIL","message":"reduce only order failed"}')
+            return fill
+
+        raise SimulatedExchangeError(f"HTTP 404: 시뮬레이터 미지원 게이트 엔드포인트 {method} {endpoint}")
+
+    def _create_gate_price_order(self, data: Dict) -> Dict:
+        initial = dict(data.get('initial') or {})
+        trigger = dict(data.get('trigger') or {})
+        try:
+            size = int(initial.get('size', 0))
+            trigger_price = float(trigger.get('price', 0))
+        except (ValueError, TypeError):
+            size, trigger_price = 0, 0.0
+        if size == 0 or trigger_price <= 0 or trigger.get('rule') not in (1, 2):
+            raise SimulatedExchangeError('HTTP 400: {"label":"INVALID_PARAM_VALUE","message":"invalid trigger order"}')
+
+        order_id = next(self._gate_ids)
+        order = {
+            'id': order_id, 'user': 1, 'create_time': time.time(), 'status': 'open',
+            'initial': {**initial, 'size': size}, 'trigger': {**trigger, 'price': str(trigger_price)},
+            'stop_profit_price': data.get('stop_profit_price', ''), 'stop_loss_price': data.get('stop_loss_price', '')
+        }
+        self.gate_price_orders[order_id] = order
+        # 이미 조건을 만족하면 바로 트리거
+        self.match()
+        return {'id': order_id}
+
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            'request_total': sum(self.stats['requests'].values()),
+            'bitget_plan_orders': len(self.bitget_plan_orders),
+            'gate_price_orders': len(self.gate_price_orders),
+            'bitget_positions': {side: p['total'] for side, p in self.bitget_positions.items()},
+            'gate_position': self.gate_position['size']
+        }
+
+
+class _SimulatedTransportMixin:
+    """실제 클라이언트의 HTTP 요청 대신 가짜 거래소 호출 (재시도 횟수는 실제와 같고 간격만 짧게)"""
+
+    VENUE = ''
+
+    def _initialize_session(self):
+        self.session = None
+
+    async def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, data: Optional[Dict] = None,
+                       max_retries: int = 3, priority: Optional[int] = None) -> Dict:
+        for attempt in range(max_retries):
+            try:
+                return await self.exchange.request(self.VENUE, method, endpoint, params, data)
+            except SimulatedExchangeError:
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(self.exchange.RETRY_BACKOFF * 2 ** attempt)
+                    continue
+                raise
+
+
+class SimulatedBitgetMirrorClient(_SimulatedTransportMixin, BitgetMirrorClient):
+    VENUE = 'bitget'
+
+    def __init__(self, config, exchange: SimulatedExchange):
+        self.exchange = exchange
+        super().__init__(config)
+
+    async def _request(self, *args, **kwargs) -> Dict:
+        try:
+            result = await super()._request(*args, **kwargs)
+        except SimulatedExchangeError as e:
+            self._record_failure(str(e))
+            raise
+        self._record_success()
+        return result
+
+
+class SimulatedGateMirrorClient(_SimulatedTransportMixin, GateioMirrorClient):
+    VENUE = 'gate'
+
+    def __init__(self, config, exchange: SimulatedExchange):
+        self.exchange = exchange
+        super().__init__(config)
+
+
+class MirrorSimulator:
+    """가짜 거래소에 연결한 MirrorTradingSystem - 모니터링 루프 대신 틱을 직접 실행"""
+
+    def __init__(self, exchange: SimulatedExchange = None, config: SimulatorConfig = None, followers: int = 0):
+        self.exchange = exchange or SimulatedExchange()
+        self.config = config or SimulatorConfig()
+        self.telegram = FakeTelegram()
+        self.bitget = SimulatedBitgetMirrorClient(self.config, self.exchange)
+        self.gate = SimulatedGateMirrorClient(self.config, self.exchange)
+
+        # 팔로워 계정마다 별도 게이트 가짜 거래소 (비트겟 쪽은 사용하지 않음)
+        self.follower_exchanges: Dict[str, SimulatedExchange] = {}
+        follower_clients = {}
+        follower_specs = []
+        gate_latency, gate_jitter = self.exchange.latency['gate']
+        for i in range(followers):
+            name = f"sub{i + 1}"
+            follower_exchange = SimulatedExchange(
+                seed=self.exchange.rng.randrange(1 << 30), bitget_price=self.exchange.bitget_price,
+                gate_price=self.exchange.gate_price, latency_ms=gate_latency, jitter_ms=gate_jitter,
+                symbol=self.exchange.symbol, contract=self.exchange.contract
+            )
+            follower_config = SimulatorConfig(GATE_API_KEY=f"simulator-{name}")
+            self.follower_exchanges[name] = follower_exchange
+            follower_clients[name] = SimulatedGateMirrorClient(follower_config, follower_exchange)
+            follower_specs.append({'name': name, 'ratio': 1.0, 'api_key': f"simulator-{name}", 'api_secret': 'simulator'})
+        self.config.mirror_followers = follower_specs
+
+        self.system = MirrorTradingSystem(
+            self.config, self.bitget, self.gate, self.telegram,
+            bitget_mirror_client=self.bitget, gate_mirror_client=self.gate,
+            follower_gate_clients=follower_clients
+        )
+        self.system.mirror_trading_enabled = True
+
+        # 적용한 이벤트 기록 (save_tape로 저장)
+        self.tape: List[Dict] = []
+        self.started_at = 0.0
+        self.tick_count = 0
+
+    async def start(self):
+        self.started_at = time.monotonic()
+        await self.system.initialize()
+        self.system.engine = self.system._create_engine()
+
+    async def stop(self):
+        await self.system.stop()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    async def tick(self):
+        await self.system.engine.run_tick({EVENT_TICK})
+        self.tick_count += 1
+
+    async def apply(self, event: Dict, t: float = None):
+        self.tape.append({'t': round(self.elapsed() if t is None else t, 3), **event})
+        if event.get('type') == 'sync':
+            await self.system._perform_comprehensive_order_sync()
+        else:
+            self.exchange.apply_event(event)
+            if event.get('type') == 'price':
+                for follower_exchange in self.follower_exchanges.values():
+                    follower_exchange.set_price(event.get('bitget'), event.get('gate'))
+
+    async def replay(self, tape: List[Dict], speed: float = 0.0):
+        """테이프 재생 - 같은 t의 이벤트를 적용한 뒤 틱 1회, speed > 0이면 (간격 / speed)만큼 대기"""
+        previous_t = None
+        for t, group in itertools.groupby(sorted(tape, key=lambda e: float(e.get('t', 0))), key=lambda e: float(e.get('t', 0))):
+            if speed > 0 and previous_t is not None:
+                await asyncio.sleep((t - previous_t) / speed)
+            previous_t = t
+            for event in group:
+                await self.apply({k: v for k, v in event.items() if k != 't'}, t=t)
+            await self.tick()
+
+    async def run_until_mirrored(self, max_ticks: int = 30) -> int:
+        """비트겟 예약 주문이 모두 처리(미러링 또는 중복 등으로 건너뜀)될 때까지 틱 실행 - 실행한 틱 수"""
+        for ticks in range(1, max_ticks + 1):
+            await self.tick()
+            if self.pending_count() == 0:
+                return ticks
+        return max_ticks
+
+    def pending_count(self) -> int:
+        """아직 처리되지 않은 비트겟 예약 주문 수 (팔로워 계정 포함 합계)"""
+        managers = [self.system.position_manager] + [follower.position_manager for follower in self.system.followers]
+        return sum(
+            1 for pm in managers for order_id in self.exchange.bitget_plan_orders
+            if order_id not in pm.mirrored_plan_orders and order_id not in pm.processed_plan_orders
+        )
+
+    def save_tape(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            for event in self.tape:
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+    def report(self) -> Dict:
+        return {
+            'ticks': self.tick_count,
+            'elapsed_seconds': round(self.elapsed(), 3),
+            'mirrored_plan_orders': len(self.system.position_manager.mirrored_plan_orders),
+            'pending_plan_orders': self.pending_count(),
+            'daily_stats': {key: value for key, value in self.system.daily_stats.items() if value},
+            'engine': self.system.get_engine_stats(),
+            'latency': self.system.get_latency_stats(),
+            'scheduler': self.system.scheduler.get_stats(),
+            'exchange': self.exchange.get_stats(),
+            'followers': {
+                name: {**stats, 'exchange': self.follower_exchanges[name].get_stats()} if name in self.follower_exchanges else stats
+                for name, stats in self.system.get_follower_stats().items()
+            },
+            'telegram_messages': len(self.telegram.messages)
+        }
+
+
+def load_tape(path: str) -> List[Dict]:
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def generate_plan_order_tape(count: int, seed: int = 0, price: float = 100000.0) -> List[Dict]:
+    """벤치마크용 테이프 - 시세 ±1~5% 밖 예약 주문 count개 (일부 TP/SL 포함), 전부 t=0"""
+    rng = random.Random(seed)
+    tape = [{'t': 0.0, 'type': 'price', 'bitget': price, 'gate': price + 10}]
+    for i in range(count):
+        is_long = rng.random() < 0.5
+        distance = rng.uniform(0.01, 0.05)
+        trigger = round(price * (1 - distance if is_long else 1 + distance), 1)
+        order = {
+            'orderId': f"bench{i:06d}", 'side': 'buy' if is_long else 'sell', 'tradeSide': 'open',
+            'posSide': 'long' if is_long else 'short', 'triggerPrice': str(trigger),
+            'size': str(round(rng.uniform(0.001, 0.02), 4))
+        }
+        if rng.random() < 0.3:
+            order['presetStopSurplusPrice'] = str(round(trigger * (1.02 if is_long else 0.98), 1))
+            order['presetStopLossPrice'] = str(round(trigger * (0.99 if is_long else 1.01), 1))
+        tape.append({'t': 0.0, 'type': 'plan_order', 'order': order})
+    return tape
+
+
+async def run_benchmark(orders: int, max_ticks: int, seed: int, latency_ms: float, save_tape: str = None,
+                        followers: int = 0) -> Dict:
+    simulator = MirrorSimulator(SimulatedExchange(seed=seed, latency_ms=latency_ms, jitter_ms=latency_ms / 4), followers=followers)
+    await simulator.start()
+
+    tape = generate_plan_order_tape(orders, seed=seed)
+    for event in tape:
+        await simulator.apply({k: v for k, v in event.items() if k != 't'})
+
+    started = time.monotonic()
+    ticks = await simulator.run_until_mirrored(max_ticks)
+    elapsed = time.monotonic() - started
+
+    report = simulator.report()
+    report['benchmark'] = {
+        'orders': orders, 'followers': followers, 'ticks': ticks, 'seconds': round(elapsed, 3),
+        'orders_per_second': round(report['mirrored_plan_orders'] / elapsed, 1) if elapsed > 0 else 0.0
+    }
+    if save_tape:
+        simulator.save_tape(save_tape)
+    await simulator.stop()
+    return report
+
+
+async def run_replay(path: str, seed: int, latency_ms: float, speed: float) -> Dict:
+    simulator = MirrorSimulator(SimulatedExchange(seed=seed, latency_ms=latency_ms, jitter_ms=0.0))
+    await simulator.start()
+    await simulator.replay(load_tape(path), speed=speed)
+    report = simulator.report()
+    await simulator.stop()
+    return report
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='오프라인 미러링 시뮬레이터')
+    parser.add_argument('--orders', type=int, default=100, help='벤치마크 예약 주문 수')
+    parser.add_argument('--ticks', type=int, default=30, help='최대 틱 수')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--latency', type=float, default=20.0, help='요청 평균 지연(ms)')
+    parser.add_argument('--replay', default='', help='재생할 테이프 (JSON Lines)')
+    parser.add_argument('--speed', type=float, default=0.0, help='재생 배속 (0이면 대기 없이)')
+    parser.add_argument('--save-tape', default='', help='벤치마크 테이프 저장 경로')
+    parser.add_argument('--followers', type=int, default=0, help='추가 게이트 팔로워 계정 수 (벤치마크)')
+    parser.add_argument('--log-level', default='WARNING')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.WARNING))
+    if args.replay:
+        result = asyncio.run(run_replay(args.replay, args.seed, args.latency, args.speed))
+    else:
+        result = asyncio.run(run_benchmark(args.orders, args.ticks, args.seed, args.latency, args.save_tape or None,
+                                           args.followers))
+    print(json.dumps(result, ensure_ascii=False, indent=2, default=str))
@@ -1,24 +1,53 @@
 import os
 import asyncio
 import logging
-from typing import Dict, List, Optional, Set, Tuple
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 import json
 import traceback
 
 from mirror_trading_utils import MirrorTradingUtils, PositionInfo, MirrorResult
 from mirror_position_manager import MirrorPositionManager
+from mirror_engine import (
+    MirrorReconcileEngine, EVENT_PLAN_ORDER, EVENT_ORDER_FILL, EVENT_POSITION,
+    DIFF_PLAN_ORDERS, DIFF_FILLS, DIFF_POSITIONS, DIFF_LEVERAGE, DIFF_MARGIN_MODE
+)
+from mirror_reconcile import PlanOrderReconciler
+from mirror_scheduler import StaleWorkDropped, LANE_RECONCILE, LANE_REPORTING
+from mirror_followers import MirrorFollower
+from mirror_contracts import ContractSpecCache
 
 logger = logging.getLogger(__name__)
 
 class MirrorTradingSystem:
-    def __init__(self, config, bitget_client, gate_client, telegram_bot):
+    def __init__(self, config, bitget_client, gate_client, telegram_bot,
+                 bitget_mirror_client=None, gate_mirror_client=None, follower_gate_clients: Dict = None):
         self.config = config
         self.bitget = bitget_client  # 기본 수익 조회용
         self.gate = gate_client  # 기본 수익 조회용
         self.telegram = telegram_bot
         self.logger = logging.getLogger('mirror_trading')
         
+        # 공용 시장 데이터 허브 (main에서 주입, 없으면 직접 조회)
+        self.market_hub = None
+        self.MIRROR_TICKER_MAX_AGE = 2.0
+        
+        # 웹소켓 스트리밍 (선택) - 이벤트로 폴링 루프를 즉시 깨우고, 끊기면 기존 폴링으로 동작
+        self.ws_stream_enabled = getattr(config, 'ws_stream_enabled', False)
+        self.STREAM_FALLBACK_POLL_INTERVAL = getattr(config, 'ws_fallback_poll_interval', 5.0)
+        self.bitget_public_stream = None
+        self.bitget_private_stream = None
+        self.gate_stream = None
+        self.order_fill_event: Optional[asyncio.Event] = None
+        self.plan_order_event: Optional[asyncio.Event] = None
+        self.position_event: Optional[asyncio.Event] = None
+        self.stream_price_times = {'bitget': float('-inf'), 'gate': float('-inf')}
+        
+        # 조정 엔진 - 예약 주문/체결/포지션/레버리지/마진 모드 루프를 하나의 틱으로 통합 (끄면 기존 개별 루프)
+        self.event_engine_enabled = getattr(config, 'mirror_event_engine', True)
+        self.engine: Optional[MirrorReconcileEngine] = None
+        
         # 미러링 모드 텔레그램 제어
         enable_mirror = os.getenv('ENABLE_MIRROR_TRADING', '').lower()
         if enable_mirror in ['true', '1', 'yes', 'on']:
@@ -35,26 +64,32 @@ class MirrorTradingSystem:
         self.logger.info(f"미러링 모드 초기값: {'활성화' if self.mirror_trading_enabled else '비활성화'} (텔레그램 /mirror로 변경 가능)")
         self.logger.info(f"초기 복제 비율: {self.mirror_ratio_multiplier}x (텔레그램 /ratio로 변경 가능)")
         
-        # Bitget 미러링 전용 클라이언트 import
-        try:
-            from bitget_mirror_client import BitgetMirrorClient
-            self.bitget_mirror = BitgetMirrorClient(config)
-            logger.info("Bitget 미러링 전용 클라이언트 초기화")
-        except ImportError as e:
-            logger.error(f"Bitget 미러링 클라이언트 import 실패: {e}")
-            raise
+        # Bitget 미러링 전용 클라이언트 import (시뮬레이터 등에서 주입 가능)
+        if bitget_mirror_client is not None:
+            self.bitget_mirror = bitget_mirror_client
+        else:
+            try:
+                from bitget_mirror_client import BitgetMirrorClient
+                self.bitget_mirror = BitgetMirrorClient(config)
+                logger.info("Bitget 미러링 전용 클라이언트 초기화")
+            except ImportError as e:
+                logger.error(f"Bitget 미러링 클라이언트 import 실패: {e}")
+                raise
         
-        # 유틸리티 클래스 초기화
-        self.utils = MirrorTradingUtils(config, self.bitget_mirror, gate_client)
+        # Gate.io 미러링 전용 클라이언트 import (시뮬레이터 등에서 주입 가능)
+        if gate_mirror_client is not None:
+            self.gate_mirror = gate_mirror_client
+        else:
+            try:
+                from gateio_mirror_client import GateioMirrorClient
+                self.gate_mirror = GateioMirrorClient(config)
+                logger.info("Gate.io 미러링 전용 클라이언트 초기화")
+            except ImportError as e:
+                logger.error(f"Gate.io 미러링 클라이언트 import 실패: {e}")
+                raise
         
-        # Gate.io 미러링 전용 클라이언트 import
-        try:
-            from gateio_mirror_client import GateioMirrorClient
-            self.gate_mirror = GateioMirrorClient(config)
-            logger.info("Gate.io 미러링 전용 클라이언트 초기화")
-        except ImportError as e:
-            logger.error(f"Gate.io 미러링 클라이언트 import 실패: {e}")
-            raise
+        # 유틸리티 클래스 초기화 (계정 자산 스냅샷 포함)
+        self.utils = MirrorTradingUtils(config, self.bitget_mirror, gate_client, self.gate_mirror)
         
         # 포지션 관리자 초기화
         self.position_manager = MirrorPositionManager(
@@ -69,6 +104,56 @@ class MirrorTradingSystem:
         self.startup_positions = self.position_manager.startup_positions
         self.failed_mirrors = self.position_manager.failed_mirrors
         
+        # 작업 우선순위 스케줄러 - 동기화/리포트 작업은 주문 처리가 몰리면 뒤로 밀리고, 오래 밀리면 폐기
+        self.scheduler = self.position_manager.scheduler
+        
+        # 게이트 계약 명세 캐시 (계약 수/가격 단위) - 모든 미러링 단위가 공유
+        self.contract_specs = ContractSpecCache(self.gate_mirror.get_contract_spec)
+        
+        # 추가 게이트 팔로워 계정 - 비트겟은 조정 엔진이 한 번 조회하고 결과를 모든 계정에 동시에 전달
+        follower_gate_clients = follower_gate_clients or {}
+        self.followers: List[MirrorFollower] = [
+            MirrorFollower(
+                spec['name'], config, self.bitget_mirror, gate_client, telegram_bot,
+                ratio=spec.get('ratio', 1.0), api_key=spec.get('api_key', ''), api_secret=spec.get('api_secret', ''),
+                source_snapshots=self.utils.account_snapshots,
+                gate_mirror_client=follower_gate_clients.get(spec['name']),
+                contract_specs=self.contract_specs
+            )
+            for spec in getattr(config, 'mirror_followers', None) or []
+        ]
+        if self.followers:
+            self.logger.info(f"게이트 팔로워 계정: {', '.join(f'{f.name}({f.ratio}x)' for f in self.followers)}")
+        
+        # 추가 심볼 - 계정마다 계약별 미러링 단위 (상태/주문 매핑은 계약별로 분리, 계정 자산 스냅샷은 계정별로 공유)
+        self.shards: List[MirrorFollower] = []
+        for item in getattr(config, 'mirror_symbols', None) or []:
+            self.shards.append(MirrorFollower(
+                item['contract'], config, self.bitget_mirror, gate_client, telegram_bot,
+                ratio=self.mirror_ratio_multiplier,
+                gate_mirror_client=follower_gate_clients.get(item['contract']),
+                symbol=item['symbol'], contract=item['contract'],
+                account_snapshots=self.utils.account_snapshots,
+                contract_specs=self.contract_specs
+            ))
+            for follower in self.followers:
+                name = f"{follower.name}.{item['contract']}"
+                self.shards.append(MirrorFollower(
+                    name, config, self.bitget_mirror, gate_client, telegram_bot,
+                    ratio=follower.ratio, api_key=follower.config.gate_api_key, api_secret=follower.config.gate_api_secret,
+                    gate_mirror_client=follower_gate_clients.get(name),
+                    symbol=item['symbol'], contract=item['contract'],
+                    account_snapshots=follower.utils.account_snapshots,
+                    contract_specs=self.contract_specs
+                ))
+        if self.shards:
+            self.logger.info(f"추가 미러링 심볼: {', '.join(self.extra_symbols)} (미러링 단위 {len(self.shards)}개)")
+        
+        # 예약 주문 동기화 분석 (ID 인덱스 비교 + 고아 의심 주문 일괄 재조회)
+        self.plan_order_reconciler = PlanOrderReconciler(
+            self.position_manager, lambda: self.position_manager._get_all_current_plan_orders_enhanced(raise_on_error=True)
+        )
+        
         # 🔥 마진 모드 관리 강화
         self.margin_mode_check_interval = 15  # 15초마다 마진 모드 체크 (더 자주)
         self.last_margin_mode_check = datetime.min
@@ -119,6 +204,8 @@ class MirrorTradingSystem:
         self.price_diff_percent: float = 0.0
         self.last_price_update: datetime = datetime.min
         self.price_sync_threshold: float = 1000.0  # 매우 관대하게 설정
+        # 포지션 매니저의 예약 주문 처리 지연 기준 (시세 대비 비율, BTC 10만 달러 기준 1000달러)
+        self.PRICE_SYNC_THRESHOLD_RATIO = 0.01
         self.position_wait_timeout: int = 60
         
         # 시세 조회 실패 관리 강화
@@ -139,8 +226,8 @@ class MirrorTradingSystem:
         self.last_filled_order_check: datetime = datetime.min
         
         # 설정
-        self.SYMBOL = "BTCUSDT"
-        self.GATE_CONTRACT = "BTC_USDT"
+        self.SYMBOL = getattr(config, 'symbol', 'BTCUSDT')
+        self.GATE_CONTRACT = getattr(config, 'gate_contract', 'BTC_USDT')
         self.CHECK_INTERVAL = 1
         self.ORDER_CHECK_INTERVAL = 0.5
         self.PLAN_ORDER_CHECK_INTERVAL = 0.2
@@ -196,6 +283,8 @@ class MirrorTradingSystem:
             
             self.mirror_trading_enabled = enable
             self.position_manager.mirror_trading_enabled = enable
+            for unit in self.mirror_units:
+                unit.set_enabled(enable)
             
             state_change = "변경 없음"
             if old_state != enable:
@@ -227,10 +316,14 @@ class MirrorTradingSystem:
             self.logger.info("미러링 모니터링 재시작 중...")
             
             # Gate.io 마진 모드 무조건 Cross 강제 설정
-            await self.gate_mirror.force_cross_margin_mode_aggressive("BTC_USDT")
+            await self.gate_mirror.force_cross_margin_mode_aggressive(self.GATE_CONTRACT)
             
             await self._update_current_prices()
             await self.position_manager.initialize()
+            if self.mirror_units:
+                await asyncio.gather(*(
+                    unit.initialize(self.current_bitget_leverage, True) for unit in self.mirror_units
+                ))
             await self._log_mirror_status()
             
             self.logger.info("미러링 모니터링 재시작 완료")
@@ -296,6 +389,10 @@ class MirrorTradingSystem:
             self.mirror_ratio_multiplier = validated_ratio
             self.position_manager.mirror_ratio_multiplier = validated_ratio
             self.utils.current_ratio_multiplier = validated_ratio  # 유틸리티에도 반영
+            # 기본 계정의 추가 심볼 단위도 같은 비율 (팔로워 계정은 계정별 비율 유지)
+            for shard in self.shards:
+                if shard.utils.account_snapshots is self.utils.account_snapshots:
+                    shard.set_ratio(validated_ratio)
             
             ratio_description = self.utils.get_ratio_multiplier_description(validated_ratio)
             effect_analysis = self.utils.analyze_ratio_multiplier_effect(validated_ratio, 0.1, 0.1 * validated_ratio)
@@ -513,8 +610,8 @@ class MirrorTradingSystem:
             self.logger.error(f"마진 모드 체크 수행 실패: {e}")
             self.margin_mode_check_failures += 1
 
-    async def _perform_leverage_sync_check(self):
-        """비트겟 레버리지 변경 감지 및 게이트 실시간 동기화"""
+    async def _perform_leverage_sync_check(self, bitget_account: Dict = None):
+        """비트겟 레버리지 변경 감지 및 게이트 실시간 동기화 (계정 정보를 넘기면 다시 조회하지 않음)"""
         try:
             if not self.leverage_monitoring_enabled:
                 return
@@ -523,7 +620,8 @@ class MirrorTradingSystem:
             
             # 비트겟 현재 레버리지 조회
             try:
-                bitget_account = await self.bitget_mirror.get_account_info()
+                if not bitget_account:
+                    bitget_account = await self.bitget_mirror.get_account_info()
                 new_bitget_leverage = await self.utils.extract_bitget_leverage_enhanced(
                     account_data=bitget_account
                 )
@@ -610,130 +708,277 @@ class MirrorTradingSystem:
                     f"상태 확인: /mirror status"
                 )
             
-            # Bitget 미러링 클라이언트 초기화
-            await self.bitget_mirror.initialize()
+            await self.initialize()
+            
+            # 모니터링 태스크 시작
+            if self.event_engine_enabled:
+                self.engine = self._create_engine()
+                tasks = [
+                    self.engine.run(),                        # 예약 주문/체결/포지션/레버리지/마진 모드 통합
+                    self.utils.account_snapshots.run(lambda: self.monitoring),  # 주문 사이징용 계정 자산 스냅샷
+                    self.monitor_sync_status(),
+                    self.monitor_price_differences(),
+                    self.monitor_order_synchronization(),
+                    self.monitor_position_synchronization(),
+                    self.generate_daily_reports()
+                ]
+                tasks += [
+                    unit.utils.account_snapshots.run(lambda: self.monitoring)
+                    for unit in self.mirror_units if unit.owns_snapshots
+                ]
+            else:
+                tasks = [
+                    self.monitor_plan_orders(),
+                    self.monitor_order_fills(), 
+                    self.monitor_positions(),
+                    self.monitor_sync_status(),
+                    self.monitor_price_differences(),
+                    self.monitor_order_synchronization(),
+                    self.monitor_position_synchronization(),  # 포지션 동기화 모니터링
+                    self.monitor_margin_mode_enforcement(),   # 마진 모드 강제 모니터링
+                    self.monitor_leverage_sync(),             # 🔥 레버리지 실시간 동기화 모니터링
+                    self.utils.account_snapshots.run(lambda: self.monitoring),  # 주문 사이징용 계정 자산 스냅샷
+                    self.generate_daily_reports()
+                ]
             
-            # Gate.io 미러링 클라이언트 초기화 (무조건 Cross 마진 모드 강제 설정 포함)
-            await self.gate_mirror.initialize()
+            await asyncio.gather(*tasks, return_exceptions=True)
             
-            # 🔥 비트겟 실제 레버리지를 게이트에 강제 동기화
-            try:
-                self.logger.info("🔍 비트겟 실제 레버리지 조회하여 게이트에 동기화 시작")
-                
-                # 비트겟 실제 레버리지 조회
-                bitget_account = await self.bitget_mirror.get_account_info()
-                actual_bitget_leverage = await self.utils.extract_bitget_leverage_enhanced(
-                    account_data=bitget_account
+        except Exception as e:
+            self.logger.error(f"미러 트레이딩 시작 실패: {e}")
+            if self._should_send_warning('system_error'):
+                await self.telegram.send_message(
+                    f"❌ 미러 트레이딩 시작 실패\n오류: {str(e)[:200]}"
                 )
+            raise
+
+    async def initialize(self):
+        """거래소 클라이언트/레버리지/마진 모드/포지션 매니저 초기화 - 모니터링 루프는 start()에서 시작"""
+        # Bitget 미러링 클라이언트 초기화
+        await self.bitget_mirror.initialize()
+        
+        # Gate.io 미러링 클라이언트 초기화 (무조건 Cross 마진 모드 강제 설정 포함)
+        await self.gate_mirror.initialize()
+        
+        # 게이트 계약 명세 (조회 실패 시 기본값)
+        try:
+            self.position_manager.set_contract_spec(await self.contract_specs.get(self.GATE_CONTRACT, self.SYMBOL))
+        except ValueError as e:
+            self.logger.error(f"게이트 계약 명세 조회 실패: {e}")
+        
+        # 🔥 비트겟 실제 레버리지를 게이트에 강제 동기화
+        try:
+            self.logger.info("🔍 비트겟 실제 레버리지 조회하여 게이트에 동기화 시작")
+            
+            # 비트겟 실제 레버리지 조회
+            bitget_account = await self.bitget_mirror.get_account_info()
+            actual_bitget_leverage = await self.utils.extract_bitget_leverage_enhanced(
+                account_data=bitget_account
+            )
+            
+            self.logger.info(f"🔍 비트겟 실제 레버리지: {actual_bitget_leverage}x")
+            
+            # 게이트 현재 레버리지 조회
+            current_gate_leverage = await self.gate_mirror.get_current_leverage(self.GATE_CONTRACT)
+            self.logger.info(f"🔍 게이트 현재 레버리지: {current_gate_leverage}x")
+            
+            # 레버리지 동기화 필요 시 강제 설정
+            if actual_bitget_leverage != current_gate_leverage:
+                self.logger.info(f"🔄 초기 레버리지 동기화 필요: 게이트 {current_gate_leverage}x → 비트겟 {actual_bitget_leverage}x")
                 
-                self.logger.info(f"🔍 비트겟 실제 레버리지: {actual_bitget_leverage}x")
-                
-                # 게이트 현재 레버리지 조회
-                current_gate_leverage = await self.gate_mirror.get_current_leverage(self.GATE_CONTRACT)
-                self.logger.info(f"🔍 게이트 현재 레버리지: {current_gate_leverage}x")
+                sync_result = await self.gate_mirror.mirror_bitget_leverage(actual_bitget_leverage, self.GATE_CONTRACT)
                 
-                # 레버리지 동기화 필요 시 강제 설정
-                if actual_bitget_leverage != current_gate_leverage:
-                    self.logger.info(f"🔄 초기 레버리지 동기화 필요: 게이트 {current_gate_leverage}x → 비트겟 {actual_bitget_leverage}x")
-                    
-                    sync_result = await self.gate_mirror.mirror_bitget_leverage(actual_bitget_leverage, self.GATE_CONTRACT)
-                    
-                    if sync_result:
-                        self.logger.info(f"✅ 초기 레버리지 동기화 완료: {actual_bitget_leverage}x")
-                        # 캐시 업데이트
-                        self.current_bitget_leverage = actual_bitget_leverage
-                        self.current_gate_leverage = actual_bitget_leverage
-                        
-                        # 텔레그램 알림
-                        await self.telegram.send_message(
-                            f"🔄 초기 레버리지 동기화 완료\n"
-                            f"비트겟: {actual_bitget_leverage}x\n"
-                            f"게이트: {actual_bitget_leverage}x\n"
-                            f"✅ 시스템 시작 시 동기화 완료"
-                        )
-                    else:
-                        self.logger.error(f"❌ 초기 레버리지 동기화 실패: {actual_bitget_leverage}x")
-                        
-                        # 실패 알림
-                        await self.telegram.send_message(
-                            f"⚠️ 초기 레버리지 동기화 실패\n"
-                            f"비트겟: {actual_bitget_leverage}x\n"
-                            f"게이트: {current_gate_leverage}x\n"
-                            f"수동으로 게이트 레버리지를 {actual_bitget_leverage}x로 설정해주세요"
-                        )
-                else:
-                    self.logger.info(f"✅ 레버리지 이미 동기화됨: {actual_bitget_leverage}x")
+                if sync_result:
+                    self.logger.info(f"✅ 초기 레버리지 동기화 완료: {actual_bitget_leverage}x")
                     # 캐시 업데이트
                     self.current_bitget_leverage = actual_bitget_leverage
                     self.current_gate_leverage = actual_bitget_leverage
                     
-            except Exception as e:
-                self.logger.error(f"초기 레버리지 동기화 실패: {e}")
-            
-            # 🔥 추가 마진 모드 강제 설정 확인 (Isolated 관련 코드 완전 제거)
-            self.logger.info("🔥 Gate.io 마진 모드 최종 확인 및 강제 설정 (Isolated 지원 안 함)")
-            
-            # 실제 마진 모드 상태 확인
-            actual_margin_mode = await self.gate_mirror.get_current_margin_mode(self.GATE_CONTRACT)
-            self.logger.info(f"🔍 실제 마진 모드 상태: {actual_margin_mode}")
-            
-            if actual_margin_mode == "isolated":
-                self.logger.error("❌ 마진 모드가 ISOLATED로 확인됨! 강제 변경 시도")
-                
-                # 텔레그램 알림
-                await self.telegram.send_message(
-                    f"⚠️ Gate.io 마진 모드 ISOLATED 발견\n"
-                    f"현재 모드: {actual_margin_mode.upper()}\n"
-                    f"Cross 모드로 강제 변경 시도 중..."
-                )
-            
-            final_margin_success = await self.gate_mirror.force_cross_margin_mode_aggressive(self.GATE_CONTRACT)
-            
-            if final_margin_success:
-                self.logger.info("✅ Gate.io Cross 마진 모드 최종 확인 완료 (Isolated 지원 안 함)")
+                    # 텔레그램 알림
+                    await self.telegram.send_message(
+                        f"🔄 초기 레버리지 동기화 완료\n"
+                        f"비트겟: {actual_bitget_leverage}x\n"
+                        f"게이트: {actual_bitget_leverage}x\n"
+                        f"✅ 시스템 시작 시 동기화 완료"
+                    )
+                else:
+                    self.logger.error(f"❌ 초기 레버리지 동기화 실패: {actual_bitget_leverage}x")
+                    
+                    # 실패 알림
+                    await self.telegram.send_message(
+                        f"⚠️ 초기 레버리지 동기화 실패\n"
+                        f"비트겟: {actual_bitget_leverage}x\n"
+                        f"게이트: {current_gate_leverage}x\n"
+                        f"수동으로 게이트 레버리지를 {actual_bitget_leverage}x로 설정해주세요"
+                    )
             else:
-                self.logger.warning("⚠️ Gate.io Cross 마진 모드 자동 설정 실패 - 수동 설정 필요 (Isolated 지원 안 함)")
+                self.logger.info(f"✅ 레버리지 이미 동기화됨: {actual_bitget_leverage}x")
+                # 캐시 업데이트
+                self.current_bitget_leverage = actual_bitget_leverage
+                self.current_gate_leverage = actual_bitget_leverage
                 
-                # 실패 알림
-                await self.telegram.send_message(
-                    f"⚠️ Gate.io Cross 마진 모드 자동 설정 실패\n"
-                    f"수동으로 Gate.io 웹/앱에서 Cross 마진 모드로 설정해주세요\n"
-                    f"🔥 Isolated 모드는 지원하지 않습니다"
-                )
-            
-            await self._update_current_prices()
-            
-            # 포지션 매니저 초기화
-            self.position_manager.price_sync_threshold = self.price_sync_threshold
-            self.position_manager.position_wait_timeout = self.position_wait_timeout
-            self.position_manager.mirror_trading_enabled = self.mirror_trading_enabled  # 상태 동기화
-            await self.position_manager.initialize()
-            
-            await self._log_account_status()
-            
-            # 모니터링 태스크 시작
-            tasks = [
-                self.monitor_plan_orders(),
-                self.monitor_order_fills(), 
-                self.monitor_positions(),
-                self.monitor_sync_status(),
-                self.monitor_price_differences(),
-                self.monitor_order_synchronization(),
-                self.monitor_position_synchronization(),  # 포지션 동기화 모니터링
-                self.monitor_margin_mode_enforcement(),   # 마진 모드 강제 모니터링
-                self.monitor_leverage_sync(),             # 🔥 레버리지 실시간 동기화 모니터링
-                self.generate_daily_reports()
-            ]
+        except Exception as e:
+            self.logger.error(f"초기 레버리지 동기화 실패: {e}")
+        
+        # 🔥 추가 마진 모드 강제 설정 확인 (Isolated 관련 코드 완전 제거)
+        self.logger.info("🔥 Gate.io 마진 모드 최종 확인 및 강제 설정 (Isolated 지원 안 함)")
+        
+        # 실제 마진 모드 상태 확인
+        actual_margin_mode = await self.gate_mirror.get_current_margin_mode(self.GATE_CONTRACT)
+        self.logger.info(f"🔍 실제 마진 모드 상태: {actual_margin_mode}")
+        
+        if actual_margin_mode == "isolated":
+            self.logger.error("❌ 마진 모드가 ISOLATED로 확인됨! 강제 변경 시도")
             
-            await asyncio.gather(*tasks, return_exceptions=True)
+            # 텔레그램 알림
+            await self.telegram.send_message(
+                f"⚠️ Gate.io 마진 모드 ISOLATED 발견\n"
+                f"현재 모드: {actual_margin_mode.upper()}\n"
+                f"Cross 모드로 강제 변경 시도 중..."
+            )
+        
+        final_margin_success = await self.gate_mirror.force_cross_margin_mode_aggressive(self.GATE_CONTRACT)
+        
+        if final_margin_success:
+            self.logger.info("✅ Gate.io Cross 마진 모드 최종 확인 완료 (Isolated 지원 안 함)")
+        else:
+            self.logger.warning("⚠️ Gate.io Cross 마진 모드 자동 설정 실패 - 수동 설정 필요 (Isolated 지원 안 함)")
             
-        except Exception as e:
-            self.logger.error(f"미러 트레이딩 시작 실패: {e}")
-            if self._should_send_warning('system_error'):
-                await self.telegram.send_message(
-                    f"❌ 미러 트레이딩 시작 실패\n오류: {str(e)[:200]}"
-                )
-            raise
+            # 실패 알림
+            await self.telegram.send_message(
+                f"⚠️ Gate.io Cross 마진 모드 자동 설정 실패\n"
+                f"수동으로 Gate.io 웹/앱에서 Cross 마진 모드로 설정해주세요\n"
+                f"🔥 Isolated 모드는 지원하지 않습니다"
+            )
+        
+        await self._update_current_prices()
+        
+        # 포지션 매니저 초기화
+        self.position_manager.PRICE_SYNC_THRESHOLD_RATIO = self.PRICE_SYNC_THRESHOLD_RATIO
+        self.position_manager._apply_price_thresholds()
+        self.position_manager.position_wait_timeout = self.position_wait_timeout
+        self.position_manager.mirror_trading_enabled = self.mirror_trading_enabled  # 상태 동기화
+        await self.position_manager.initialize()
+        
+        # 팔로워 계정/추가 심볼 단위 초기화 (동시에)
+        if self.mirror_units:
+            if not self.event_engine_enabled:
+                self.logger.warning("게이트 팔로워 계정/추가 심볼은 조정 엔진 모드에서만 미러링됩니다 (MIRROR_EVENT_ENGINE)")
+            # 추가 심볼 단위는 시세를 먼저 받아야 계약 가격대에 맞는 임계값으로 시작
+            await self._update_symbol_prices()
+            await asyncio.gather(*(
+                unit.initialize(self.current_bitget_leverage, self.mirror_trading_enabled)
+                for unit in self.mirror_units
+            ))
+        
+        await self.scheduler.run_or_skip(LANE_REPORTING, self._log_account_status, deadline=60, name='계정 상태 로그')
+        
+        # 웹소켓 스트림 시작 (설정 시)
+        await self._start_streams()
+
+    # ===== 조정 엔진 핸들러 =====
+
+    def _create_engine(self) -> MirrorReconcileEngine:
+        engine = MirrorReconcileEngine(self)
+        engine.on(DIFF_FILLS, self._on_engine_fills)
+        engine.on(DIFF_PLAN_ORDERS, self._on_engine_plan_orders)
+        engine.on(DIFF_POSITIONS, self._on_engine_positions)
+        engine.on(DIFF_LEVERAGE, self._on_engine_leverage)
+        engine.on(DIFF_MARGIN_MODE, self._on_engine_margin_mode)
+        return engine
+
+    @property
+    def extra_symbols(self) -> List[str]:
+        """조정 엔진이 함께 조회할 추가 심볼 (계약 명세가 없어 제외된 심볼은 빼고)"""
+        return list(dict.fromkeys(shard.SYMBOL for shard in self.shards if not shard.disabled))
+
+    @property
+    def mirror_units(self) -> List[MirrorFollower]:
+        """기본 계정/기본 심볼 외 미러링 단위 (팔로워 계정 + 추가 심볼)"""
+        return self.followers + self.shards
+
+    async def _fan_out(self, primary, follower_call: Callable[[MirrorFollower], Awaitable]):
+        """기본 단위 처리와 팔로워/추가 심볼 단위 처리를 동시에 실행 (단위별 오류는 단위별로 기록)"""
+        units = self.mirror_units
+        if not units:
+            await primary
+            return
+        await asyncio.gather(primary, *(follower_call(unit) for unit in units))
+
+    async def _on_engine_fills(self, diff: Dict):
+        await self._fan_out(self._process_engine_fills(diff), lambda follower: follower.on_fills(diff))
+
+    async def _process_engine_fills(self, diff: Dict):
+        """신규 체결 → 게이트 반영"""
+        for order in diff['new']:
+            order_id = order.get('orderId', order.get('id', ''))
+            reduce_only = order.get('reduceOnly', 'false')
+            if reduce_only == 'true' or reduce_only is True:
+                continue
+            
+            await self.position_manager.process_filled_order(order)
+            self.position_manager.processed_orders.add(order_id)
+        
+        # 오래된 주문 ID 정리
+        if len(self.position_manager.processed_orders) > 1000:
+            recent_orders = list(self.position_manager.processed_orders)[-500:]
+            self.position_manager.processed_orders = set(recent_orders)
+
+    async def _on_engine_plan_orders(self, diff: Dict):
+        """예약 주문 신규/취소 처리 - 이번 틱 조회 결과를 그대로 사용"""
+        if diff['new_ids'] or diff['removed_ids']:
+            self.logger.debug(f"예약 주문 변화: 신규 {len(diff['new_ids'])}개, 사라짐 {len(diff['removed_ids'])}개")
+        await self._fan_out(
+            self.position_manager.monitor_plan_orders_cycle(
+                plan_orders=diff['orders'],
+                filled_orders=diff['filled_orders']
+            ),
+            lambda follower: follower.on_plan_orders(diff)
+        )
+
+    async def _on_engine_positions(self, diff: Dict):
+        await self._fan_out(
+            self._process_engine_positions(diff),
+            lambda follower: follower.on_positions(diff)
+        )
+
+    async def _process_engine_positions(self, diff: Dict):
+        """신규/변경 포지션 처리, 사라진 포지션 종료 처리"""
+        for pos in diff['changed']:
+            await self.position_manager.process_position(pos)
+        for pos_id in diff['closed']:
+            await self.position_manager.handle_position_close(pos_id)
+
+    async def _on_engine_leverage(self, diff: Dict):
+        if diff['changed']:
+            self.logger.debug(f"엔진 레버리지 변경 감지: {diff['old']}x → {diff['new']}x")
+        await self._fan_out(
+            self._perform_leverage_sync_check(bitget_account=diff['account']),
+            lambda follower: follower.sync_leverage(diff['new'])
+        )
+        self.last_leverage_check = datetime.now()
+
+    async def _on_engine_margin_mode(self, diff: Dict):
+        await self._fan_out(self._perform_margin_mode_check(), lambda follower: follower.ensure_cross_margin())
+        self.last_margin_mode_check = datetime.now()
+
+    async def notify_engine_failure(self, consecutive_errors: int, error: Exception):
+        if self._should_send_warning('system_error'):
+            await self.telegram.send_message(
+                f"⚠️ 미러 조정 엔진 오류\n연속 {consecutive_errors}회 실패\n오류: {str(error)[:200]}"
+            )
+
+    def get_engine_stats(self) -> Dict:
+        return self.engine.get_stats() if self.engine else {}
+
+    def get_follower_stats(self) -> Dict[str, Dict]:
+        return {unit.name: unit.get_stats() for unit in self.mirror_units}
+
+    def get_latency_stats(self) -> Dict:
+        """미러링 단계별 지연 시간 {단계: count/avg/p50/p95/p99/max}"""
+        return self.position_manager.latency.summary()
+
+    def get_latency_report(self) -> str:
+        return self.position_manager.latency.format_report()
 
     async def monitor_position_synchronization(self):
         try:
@@ -752,8 +997,15 @@ class MirrorTradingSystem:
                     current_time = datetime.now()
                     
                     if (current_time - self.last_position_sync_time).total_seconds() >= self.position_sync_interval:
-                        await self._perform_position_synchronization()
-                        self.last_position_sync_time = current_time
+                        try:
+                            await self.scheduler.run(
+                                LANE_RECONCILE, self._perform_position_synchronization,
+                                deadline=self.position_sync_interval, name='포지션 동기화'
+                            )
+                            self.last_position_sync_time = current_time
+                        except StaleWorkDropped:
+                            # 주문 처리가 몰린 동안 밀린 동기화는 건너뛰고 다음 확인 때 다시 시도
+                            pass
                     
                     await asyncio.sleep(10)  # 10초마다 체크
                     
@@ -774,10 +1026,42 @@ class MirrorTradingSystem:
             
             # 비트겟 현재 포지션 조회
             bitget_positions = await self.bitget_mirror.get_positions(self.SYMBOL)
+        except Exception as e:
+            self.logger.error(f"포지션 동기화 수행 실패: {e}")
+            bitget_positions = None
+        
+        if bitget_positions is not None:
+            await self._sync_positions(bitget_positions)
+        await self._sync_units(
+            bitget_positions, lambda unit: self.bitget_mirror.get_positions(unit.SYMBOL), self._sync_positions
+        )
+
+    async def _sync_units(self, primary_data, fetch: Callable[[MirrorFollower], Awaitable], sync: Callable):
+        """미러링 단위별 동기화 - 비트겟 조회는 심볼당 한 번 (기본 심볼 단위는 기본 계정 조회 결과를 그대로 사용)"""
+        fetched = {self.SYMBOL: primary_data}
+        for unit in self.mirror_units:
+            if unit.disabled or not unit.position_manager.mirror_trading_enabled:
+                continue
+            if unit.SYMBOL not in fetched:
+                try:
+                    fetched[unit.SYMBOL] = await fetch(unit)
+                except Exception as e:
+                    fetched[unit.SYMBOL] = None
+                    self.logger.error(f"미러링 단위 동기화용 비트겟 조회 실패: {unit.SYMBOL} - {e}")
+            # 조회 실패한 심볼은 이번 동기화에서 제외 (빈 결과로 보고 정리하지 않도록)
+            if fetched[unit.SYMBOL] is not None:
+                await sync(fetched[unit.SYMBOL], unit)
+
+    async def _sync_positions(self, bitget_positions: List[Dict], unit: Optional[MirrorFollower] = None):
+        """포지션 동기화 (unit 생략 시 기본 계정)"""
+        pm = unit.position_manager if unit else self.position_manager
+        gate_mirror = unit.gate_mirror if unit else self.gate_mirror
+        gate_contract = unit.GATE_CONTRACT if unit else self.GATE_CONTRACT
+        try:
             bitget_active_positions = [pos for pos in bitget_positions if float(pos.get('total', 0)) > 0]
             
             # 게이트 현재 포지션 조회
-            gate_positions = await self.gate_mirror.get_positions(self.GATE_CONTRACT)
+            gate_positions = await gate_mirror.get_positions(gate_contract)
             gate_active_positions = [pos for pos in gate_positions if pos.get('size', 0) != 0]
             
             # 동기화 분석
@@ -787,7 +1071,7 @@ class MirrorTradingSystem:
             if not bitget_active_positions and gate_active_positions:
                 for gate_pos in gate_active_positions:
                     gate_pos_id = self._generate_gate_position_id(gate_pos)
-                    if gate_pos_id not in self.position_manager.startup_gate_positions:
+                    if gate_pos_id not in pm.startup_gate_positions:
                         sync_issues.append({
                             'type': 'orphan_gate_position',
                             'gate_position': gate_pos,
@@ -813,14 +1097,19 @@ class MirrorTradingSystem:
             
             # 동기화 문제 해결
             if sync_issues:
-                await self._fix_position_sync_issues(sync_issues)
+                await self._fix_position_sync_issues(sync_issues, unit)
             else:
-                self.logger.debug(f"포지션 동기화 상태 양호: 비트겟 {len(bitget_active_positions)}개, 게이트 {len(gate_active_positions)}개")
+                self.logger.debug(f"포지션 동기화 상태 양호 ({gate_contract}): 비트겟 {len(bitget_active_positions)}개, 게이트 {len(gate_active_positions)}개")
             
         except Exception as e:
-            self.logger.error(f"포지션 동기화 수행 실패: {e}")
+            self.logger.error(f"포지션 동기화 수행 실패 ({unit.name if unit else gate_contract}): {e}")
 
-    async def _fix_position_sync_issues(self, sync_issues: List[Dict]):
+    async def _fix_position_sync_issues(self, sync_issues: List[Dict], unit: Optional[MirrorFollower] = None):
+        gate_mirror = unit.gate_mirror if unit else self.gate_mirror
+        gate_contract = unit.GATE_CONTRACT if unit else self.GATE_CONTRACT
+        daily_stats = unit.position_manager.daily_stats if unit else self.daily_stats
+        ratio = unit.ratio if unit else self.mirror_ratio_multiplier
+        telegram = unit.position_manager.telegram if unit else self.telegram
         try:
             cleaned_positions = 0
             
@@ -830,13 +1119,13 @@ class MirrorTradingSystem:
                     
                     # 🔥 포지션 정리 전 마진 모드 강제 체크
                     try:
-                        current_margin_mode = await self.gate_mirror.get_current_margin_mode(self.GATE_CONTRACT)
+                        current_margin_mode = await gate_mirror.get_current_margin_mode(gate_contract)
                         if current_margin_mode != 'cross':
                             self.logger.warning(f"포지션 정리 전 마진 모드가 Cross가 아님: {current_margin_mode} → 강제 변경 시도")
                             
-                            force_result = await self.gate_mirror.force_cross_margin_mode_aggressive(self.GATE_CONTRACT)
+                            force_result = await gate_mirror.force_cross_margin_mode_aggressive(gate_contract)
                             if force_result:
-                                self.daily_stats['margin_mode_enforcements'] += 1
+                                daily_stats['margin_mode_enforcements'] += 1
                                 self.logger.info(f"포지션 정리 전 마진 모드 강제 변경 성공: {current_margin_mode} → Cross")
                             else:
                                 self.logger.error(f"포지션 정리 전 마진 모드 강제 변경 실패: {current_margin_mode}")
@@ -850,17 +1139,17 @@ class MirrorTradingSystem:
                         gate_size = int(gate_position.get('size', 0))
                         
                         if gate_size != 0:
-                            result = await self.gate_mirror.close_position(self.GATE_CONTRACT)
+                            result = await gate_mirror.close_position(gate_contract)
                             cleaned_positions += 1
                             
-                            self.daily_stats['position_closed_cleanups'] = self.daily_stats.get('position_closed_cleanups', 0) + 1
+                            daily_stats['position_closed_cleanups'] = daily_stats.get('position_closed_cleanups', 0) + 1
                             
                             self.logger.info(f"고아 게이트 포지션 정리 완료: 크기={gate_size}")
                     
                     elif issue_type == 'position_direction_mismatch':
                         gate_position = issue['gate_position']
                         
-                        await self.gate_mirror.close_position(self.GATE_CONTRACT)
+                        await gate_mirror.close_position(gate_contract)
                         cleaned_positions += 1
                         
                         await asyncio.sleep(2)
@@ -872,10 +1161,10 @@ class MirrorTradingSystem:
             
             # 결과 알림
             if cleaned_positions > 0:
-                ratio_info = f" (복제비율: {self.mirror_ratio_multiplier}x)" if self.mirror_ratio_multiplier != 1.0 else ""
+                ratio_info = f" (복제비율: {ratio}x)" if ratio != 1.0 else ""
                 
                 if self._should_send_warning('position_cleanup'):
-                    await self.telegram.send_message(
+                    await telegram.send_message(
                         f"포지션 동기화 완료{ratio_info}\n"
                         f"정리된 포지션: {cleaned_positions}개\n"
                         f"비트겟에서 취소된 포지션을 게이트에서도 정리했습니다.\n"
@@ -883,7 +1172,7 @@ class MirrorTradingSystem:
                         f"💳 마진 모드: Cross 자동 유지"
                     )
                 
-                self.logger.info(f"포지션 동기화 완료: {cleaned_positions}개 포지션 정리")
+                self.logger.info(f"포지션 동기화 완료 ({gate_contract}): {cleaned_positions}개 포지션 정리")
             
         except Exception as e:
             self.logger.error(f"포지션 동기화 문제 해결 중 오류: {e}")
@@ -923,8 +1212,15 @@ class MirrorTradingSystem:
                     current_time = datetime.now()
                     
                     if (current_time - self.last_order_sync_time).total_seconds() >= self.order_sync_interval:
-                        await self._perform_comprehensive_order_sync()
-                        self.last_order_sync_time = current_time
+                        try:
+                            await self.scheduler.run(
+                                LANE_RECONCILE, self._perform_comprehensive_order_sync,
+                                deadline=self.order_sync_interval, name='예약 주문 동기화'
+                            )
+                            self.last_order_sync_time = current_time
+                        except StaleWorkDropped:
+                            # 주문 처리가 몰린 동안 밀린 동기화는 건너뛰고 다음 확인 때 다시 시도
+                            pass
                     
                     await asyncio.sleep(10)
                     
@@ -943,129 +1239,44 @@ class MirrorTradingSystem:
         try:
             self.logger.debug("종합 예약 주문 동기화 시작 (개선된 버전)")
             
-            all_bitget_orders = await self.position_manager._get_all_current_plan_orders_enhanced()
-            gate_orders = await self.gate_mirror.get_price_triggered_orders(self.GATE_CONTRACT, "open")
+            all_bitget_orders = await self.position_manager._get_all_current_plan_orders_enhanced(raise_on_error=True)
+        except Exception as e:
+            self.logger.error(f"종합 예약 주문 동기화 실패: {e}")
+            all_bitget_orders = None
+        
+        if all_bitget_orders is not None:
+            await self._sync_plan_orders(all_bitget_orders)
+        await self._sync_units(
+            all_bitget_orders,
+            lambda unit: unit.position_manager._get_all_current_plan_orders_enhanced(raise_on_error=True),
+            self._sync_plan_orders
+        )
+
+    async def _sync_plan_orders(self, bitget_orders: List[Dict], unit: Optional[MirrorFollower] = None):
+        """예약 주문 동기화 (unit 생략 시 기본 계정)"""
+        gate_mirror = unit.gate_mirror if unit else self.gate_mirror
+        gate_contract = unit.GATE_CONTRACT if unit else self.GATE_CONTRACT
+        try:
+            gate_orders = await gate_mirror.get_price_triggered_orders(gate_contract, "open")
             
-            sync_analysis = await self._analyze_comprehensive_sync_improved(all_bitget_orders, gate_orders)
+            sync_analysis = await self._analyze_comprehensive_sync_improved(bitget_orders, gate_orders, unit)
             
             if sync_analysis['requires_action']:
-                await self._fix_sync_issues_improved(sync_analysis)
+                await self._fix_sync_issues_improved(sync_analysis, unit)
             else:
-                self.logger.debug(f"예약 주문 동기화 상태 양호: 비트겟 {len(all_bitget_orders)}개, 게이트 {len(gate_orders)}개")
+                self.logger.debug(f"예약 주문 동기화 상태 양호 ({gate_contract}): 비트겟 {len(bitget_orders)}개, 게이트 {len(gate_orders)}개")
             
         except Exception as e:
-            self.logger.error(f"종합 예약 주문 동기화 실패: {e}")
+            self.logger.error(f"종합 예약 주문 동기화 실패 ({unit.name if unit else gate_contract}): {e}")
 
-    async def _analyze_comprehensive_sync_improved(self, bitget_orders: List[Dict], gate_orders: List[Dict]) -> Dict:
+    async def _analyze_comprehensive_sync_improved(self, bitget_orders: List[Dict], gate_orders: List[Dict],
+                                                   unit: Optional[MirrorFollower] = None) -> Dict:
+        reconciler = unit.plan_order_reconciler if unit else self.plan_order_reconciler
         try:
-            analysis = {
-                'requires_action': False,
-                'missing_mirrors': [],
-                'confirmed_orphans': [],
-                'safe_orders': [],
-                'total_issues': 0
-            }
-            
-            # 비트겟 주문 분석 - 누락된 미러링 찾기
-            for bitget_order in bitget_orders:
-                bitget_order_id = bitget_order.get('orderId', bitget_order.get('planOrderId', ''))
-                if not bitget_order_id:
-                    continue
-                
-                if bitget_order_id in self.position_manager.startup_plan_orders:
-                    continue
-                
-                if bitget_order_id in self.position_manager.processed_plan_orders:
-                    continue
-                
-                if bitget_order_id in self.position_manager.mirrored_plan_orders:
-                    mirror_info = self.position_manager.mirrored_plan_orders[bitget_order_id]
-                    expected_gate_id = mirror_info.get('gate_order_id')
-                    
-                    if expected_gate_id:
-                        gate_order_found = any(order.get('id') == expected_gate_id for order in gate_orders)
-                        if not gate_order_found:
-                            analysis['missing_mirrors'].append({
-                                'bitget_order_id': bitget_order_id,
-                                'bitget_order': bitget_order,
-                                'expected_gate_id': expected_gate_id,
-                                'type': 'missing_mirror'
-                            })
-                else:
-                    analysis['missing_mirrors'].append({
-                        'bitget_order_id': bitget_order_id,
-                        'bitget_order': bitget_order,
-                        'expected_gate_id': None,
-                        'type': 'unmirrored'
-                    })
-            
-            # 게이트 고아 주문 찾기 - 매우 보수적인 접근
-            bitget_order_ids = set()
-            for order in bitget_orders:
-                order_id = order.get('orderId', order.get('planOrderId', ''))
-                if order_id:
-                    bitget_order_ids.add(order_id)
-            
-            for gate_order in gate_orders:
-                gate_order_id = gate_order.get('id', '')
-                if not gate_order_id:
-                    continue
-                
-                bitget_order_id = self.position_manager.gate_to_bitget_order_mapping.get(gate_order_id)
-                
-                if not bitget_order_id:
-                    if gate_order_id in self.position_manager.gate_existing_orders_detailed:
-                        analysis['safe_orders'].append({
-                            'gate_order_id': gate_order_id,
-                            'type': 'existing_gate_order',
-                            'reason': '시작 시 존재했던 게이트 주문'
-                        })
-                        continue
-                    else:
-                        analysis['safe_orders'].append({
-                            'gate_order_id': gate_order_id,
-                            'type': 'unmapped_unknown',
-                            'reason': '매핑 없는 미지의 주문 - 안전상 보존'
-                        })
-                        continue
-                
-                bitget_exists = bitget_order_id in bitget_order_ids
-                
-                if not bitget_exists:
-                    try:
-                        recheck_result = await self._recheck_bitget_order_exists_simple(bitget_order_id)
-                        
-                        if recheck_result['definitely_deleted']:
-                            analysis['confirmed_orphans'].append({
-                                'gate_order_id': gate_order_id,
-                                'gate_order': gate_order,
-                                'mapped_bitget_id': bitget_order_id,
-                                'type': 'confirmed_orphan',
-                                'verification': recheck_result
-                            })
-                        else:
-                            analysis['safe_orders'].append({
-                                'gate_order_id': gate_order_id,
-                                'type': 'uncertain_status',
-                                'reason': f"비트겟 주문 상태 불확실: {recheck_result.get('reason', '알 수 없음')}"
-                            })
-                            
-                    except Exception as recheck_error:
-                        analysis['safe_orders'].append({
-                            'gate_order_id': gate_order_id,
-                            'type': 'recheck_failed',
-                            'reason': f'재확인 실패로 안전상 보존: {recheck_error}'
-                        })
-            
-            analysis['total_issues'] = (
-                len(analysis['missing_mirrors']) + 
-                len(analysis['confirmed_orphans'])
-            )
-            
-            analysis['requires_action'] = analysis['total_issues'] > 0
+            analysis = await reconciler.reconcile(bitget_orders, gate_orders)
             
             if analysis['requires_action']:
-                self.logger.info(f"동기화 문제 발견: {analysis['total_issues']}건 (확실한 것만)")
+                self.logger.info(f"동기화 문제 발견{f' ({unit.name})' if unit else ''}: {analysis['total_issues']}건 (확실한 것만)")
             
             return analysis
             
@@ -1079,48 +1290,26 @@ class MirrorTradingSystem:
                 'safe_orders': []
             }
 
-    async def _recheck_bitget_order_exists_simple(self, bitget_order_id: str) -> Dict:
-        try:
-            all_current_orders = await self.position_manager._get_all_current_plan_orders_enhanced()
-            
-            for order in all_current_orders:
-                order_id = order.get('orderId', order.get('planOrderId', ''))
-                if order_id == bitget_order_id:
-                    return {
-                        'exists': True,
-                        'definitely_deleted': False,
-                        'found_in': 'current_orders',
-                        'reason': '현재 활성 주문에서 발견'
-                    }
-            
-            return {
-                'exists': False,
-                'definitely_deleted': True,
-                'found_in': 'nowhere',
-                'reason': '현재 활성 주문에서 찾을 수 없음 (취소/체결됨)'
-            }
-            
-        except Exception as e:
-            return {
-                'exists': False,
-                'definitely_deleted': False,
-                'found_in': 'error',
-                'reason': f'재확인 오류: {str(e)}'
-            }
-
-    async def _fix_sync_issues_improved(self, sync_analysis: Dict):
+    async def _fix_sync_issues_improved(self, sync_analysis: Dict, unit: Optional[MirrorFollower] = None):
+        pm = unit.position_manager if unit else self.position_manager
+        gate_mirror = unit.gate_mirror if unit else self.gate_mirror
+        gate_contract = unit.GATE_CONTRACT if unit else self.GATE_CONTRACT
+        utils = unit.utils if unit else self.utils
+        daily_stats = pm.daily_stats if unit else self.daily_stats
+        ratio = unit.ratio if unit else self.mirror_ratio_multiplier
+        telegram = pm.telegram if unit else self.telegram
         try:
             fixed_count = 0
             
             # 🔥 동기화 수정 전 마진 모드 강제 체크
             try:
-                current_margin_mode = await self.gate_mirror.get_current_margin_mode(self.GATE_CONTRACT)
+                current_margin_mode = await gate_mirror.get_current_margin_mode(gate_contract)
                 if current_margin_mode != 'cross':
                     self.logger.warning(f"동기화 수정 전 마진 모드가 Cross가 아님: {current_margin_mode} → 강제 변경 시도")
                     
-                    force_result = await self.gate_mirror.force_cross_margin_mode_aggressive(self.GATE_CONTRACT)
+                    force_result = await gate_mirror.force_cross_margin_mode_aggressive(gate_contract)
                     if force_result:
-                        self.daily_stats['margin_mode_enforcements'] += 1
+                        daily_stats['margin_mode_enforcements'] += 1
                         self.logger.info(f"동기화 수정 전 마진 모드 강제 변경 성공: {current_margin_mode} → Cross")
                     else:
                         self.logger.error(f"동기화 수정 전 마진 모드 강제 변경 실패: {current_margin_mode}")
@@ -1138,14 +1327,14 @@ class MirrorTradingSystem:
                     
                     self.logger.info(f"누락된 미러링 복제: {bitget_order_id}")
                     
-                    if bitget_order_id not in self.position_manager.processed_plan_orders:
-                        close_details = await self.utils.determine_close_order_details_enhanced(bitget_order)
-                        task = self.position_manager._process_perfect_mirror_order_with_price_diff_handling(
-                            bitget_order, close_details, self.mirror_ratio_multiplier
+                    if bitget_order_id not in pm.processed_plan_orders:
+                        close_details = await utils.determine_close_order_details_enhanced(bitget_order)
+                        task = pm._process_perfect_mirror_order_with_price_diff_handling(
+                            bitget_order, close_details, ratio
                         )
                         missing_tasks.append((bitget_order_id, task))
                         
-                        self.position_manager.processed_plan_orders.add(bitget_order_id)
+                        pm.processed_plan_orders.add(bitget_order_id)
                     
                 except Exception as e:
                     self.logger.error(f"누락 미러링 태스크 생성 실패: {missing['bitget_order_id']} - {e}")
@@ -1161,7 +1350,7 @@ class MirrorTradingSystem:
                             self.logger.error(f"누락 미러링 실행 실패: {order_id} - {result}")
                         elif result in ["perfect_success", "partial_success", "force_success", "close_order_forced"]:
                             fixed_count += 1
-                            self.daily_stats['sync_corrections'] += 1
+                            daily_stats['sync_corrections'] += 1
                             self.logger.info(f"누락 미러링 완료: {order_id}")
                     except Exception as e:
                         self.logger.error(f"누락 미러링 결과 처리 실패: {order_id} - {e}")
@@ -1173,50 +1362,41 @@ class MirrorTradingSystem:
             if confirmed_orphans:
                 self.logger.info(f"확실한 고아 주문 {len(confirmed_orphans)}개 처리 시작")
                 
+                orphan_ids = []
                 for orphaned in confirmed_orphans[:3]:
-                    try:
-                        gate_order_id = orphaned['gate_order_id']
-                        verification = orphaned.get('verification', {})
-                        
-                        if verification.get('definitely_deleted'):
-                            self.logger.info(f"확실한 고아 주문 삭제: {gate_order_id}")
-                            
-                            try:
-                                await self.gate_mirror.cancel_price_triggered_order(gate_order_id)
-                                fixed_count += 1
-                                self.daily_stats['sync_deletions'] += 1
-                                
-                                # 매핑에서도 제거
-                                if gate_order_id in self.position_manager.gate_to_bitget_order_mapping:
-                                    bitget_id = self.position_manager.gate_to_bitget_order_mapping[gate_order_id]
-                                    del self.position_manager.gate_to_bitget_order_mapping[gate_order_id]
-                                    if bitget_id in self.position_manager.bitget_to_gate_order_mapping:
-                                        del self.position_manager.bitget_to_gate_order_mapping[bitget_id]
-                                
-                                self.logger.info(f"확실한 고아 주문 삭제 완료: {gate_order_id}")
-                                
-                            except Exception as delete_error:
-                                error_msg = str(delete_error).lower()
-                                if any(keyword in error_msg for keyword in [
-                                    "not found", "order not exist", "invalid order"
-                                ]):
-                                    fixed_count += 1
-                                    self.logger.info(f"고아 주문이 이미 처리됨: {gate_order_id}")
-                                else:
-                                    self.logger.error(f"고아 주문 삭제 실패: {gate_order_id} - {delete_error}")
-                        else:
-                            self.logger.info(f"확실하지 않은 주문은 보존: {gate_order_id}")
-                            
-                    except Exception as e:
-                        self.logger.error(f"고아 주문 처리 실패: {orphaned['gate_order_id']} - {e}")
+                    gate_order_id = orphaned['gate_order_id']
+                    if orphaned.get('verification', {}).get('definitely_deleted'):
+                        self.logger.info(f"확실한 고아 주문 삭제: {gate_order_id}")
+                        orphan_ids.append(gate_order_id)
+                    else:
+                        self.logger.info(f"확실하지 않은 주문은 보존: {gate_order_id}")
+                
+                # 동시 취소
+                cancel_results = await gate_mirror.cancel_price_triggered_orders(orphan_ids)
+                for gate_order_id, result in cancel_results.items():
+                    if not result['success']:
+                        self.logger.error(f"고아 주문 삭제 실패: {gate_order_id} - {result.get('error')}")
+                        continue
+                    
+                    fixed_count += 1
+                    if result.get('already_gone'):
+                        self.logger.info(f"고아 주문이 이미 처리됨: {gate_order_id}")
+                        continue
+                    
+                    daily_stats['sync_deletions'] += 1
+                    
+                    # 매핑에서도 제거
+                    pm.order_state.unlink_gate(gate_order_id)
+                    
+                    self.logger.info(f"확실한 고아 주문 삭제 완료: {gate_order_id}")
             
             # 동기화 결과 알림 (3개 이상 문제가 해결되었을 때만)
             if fixed_count >= 3:
-                price_diff = abs(self.bitget_current_price - self.gate_current_price)
-                ratio_info = f" (복제비율: {self.mirror_ratio_multiplier}x)" if self.mirror_ratio_multiplier != 1.0 else ""
+                price_diff = abs(pm.bitget_current_price - pm.gate_current_price)
+                ratio_info = f" (복제비율: {ratio}x)" if ratio != 1.0 else ""
                 
                 if self._should_send_warning('order_synchronization'):
-                    await self.telegram.send_message(
+                    await telegram.send_message(
                         f"예약 주문 안전한 동기화 완료{ratio_info}\n"
                         f"해결된 문제: {fixed_count}건\n"
                         f"- 누락 미러링 복제: {len(sync_analysis['missing_mirrors'])}건\n"
@@ -1242,7 +1422,7 @@ class MirrorTradingSystem:
                     continue
                     
                 await self.position_manager.monitor_plan_orders_cycle()
-                await asyncio.sleep(self.PLAN_ORDER_CHECK_INTERVAL)
+                await self._wait_for_stream_event(self.plan_order_event, self.PLAN_ORDER_CHECK_INTERVAL, self.bitget_private_stream)
                 
             except Exception as e:
                 self.logger.error(f"예약 주문 모니터링 중 오류: {e}")
@@ -1302,7 +1482,7 @@ class MirrorTradingSystem:
                     self.position_manager.processed_orders = set(recent_orders)
                 
                 consecutive_errors = 0
-                await asyncio.sleep(self.ORDER_CHECK_INTERVAL)
+                await self._wait_for_stream_event(self.order_fill_event, self.ORDER_CHECK_INTERVAL, self.bitget_private_stream)
                 
             except Exception as e:
                 consecutive_errors += 1
@@ -1345,7 +1525,7 @@ class MirrorTradingSystem:
                         await self.position_manager.handle_position_close(pos_id)
                 
                 consecutive_errors = 0
-                await asyncio.sleep(self.CHECK_INTERVAL)
+                await self._wait_for_stream_event(self.position_event, self.CHECK_INTERVAL, self.bitget_private_stream)
                 
             except Exception as e:
                 consecutive_errors += 1
@@ -1358,11 +1538,131 @@ class MirrorTradingSystem:
                 
                 await asyncio.sleep(self.CHECK_INTERVAL * 2)
 
+    async def _start_streams(self):
+        """웹소켓 스트림 시작 - 실패해도 폴링으로 계속 동작"""
+        if not self.ws_stream_enabled:
+            return
+        
+        try:
+            from exchange_stream import (
+                BitgetStreamClient, GateStreamClient,
+                TOPIC_TICKER, TOPIC_ORDER, TOPIC_PLAN_ORDER, TOPIC_POSITION
+            )
+        except ImportError as e:
+            self.logger.warning(f"웹소켓 스트림 모듈 로드 실패, 폴링만 사용: {e}")
+            return
+        
+        self.order_fill_event = asyncio.Event()
+        self.plan_order_event = asyncio.Event()
+        self.position_event = asyncio.Event()
+        
+        self.bitget_public_stream = BitgetStreamClient(self.config, self.config.bitget_ws_public_url, private=False, symbol=self.SYMBOL)
+        self.bitget_public_stream.on(TOPIC_TICKER, self._on_bitget_stream_ticker)
+        
+        self.bitget_private_stream = BitgetStreamClient(self.config, self.config.bitget_ws_private_url, private=True, symbol=self.SYMBOL)
+        self.bitget_private_stream.on(TOPIC_ORDER, self._on_bitget_stream_order)
+        self.bitget_private_stream.on(TOPIC_PLAN_ORDER, lambda data: self._signal_stream_event(self.plan_order_event, EVENT_PLAN_ORDER))
+        self.bitget_private_stream.on(TOPIC_POSITION, lambda data: self._signal_stream_event(self.position_event, EVENT_POSITION))
+        
+        # 게이트 비공개 채널은 user id가 필요
+        gate_user_id = None
+        try:
+            gate_account = await self.gate_mirror.get_account_balance()
+            gate_user_id = gate_account.get('user')
+        except Exception as e:
+            self.logger.warning(f"게이트 user id 조회 실패, 게이트는 티커만 구독: {e}")
+        
+        self.gate_stream = GateStreamClient(self.config, self.config.gate_ws_url, self.GATE_CONTRACT, gate_user_id)
+        self.gate_stream.on(TOPIC_TICKER, self._on_gate_stream_ticker)
+        self.gate_stream.on(TOPIC_PLAN_ORDER, lambda data: self._signal_stream_event(self.plan_order_event, EVENT_PLAN_ORDER))
+        self.gate_stream.on(TOPIC_POSITION, self._on_gate_stream_position)
+        
+        for stream in (self.bitget_public_stream, self.bitget_private_stream, self.gate_stream):
+            await stream.start()
+        
+        self.logger.info(f"📡 웹소켓 스트림 시작 (폴백 폴링 {self.STREAM_FALLBACK_POLL_INTERVAL}초)")
+    
+    async def _stop_streams(self):
+        for stream in (self.bitget_public_stream, self.bitget_private_stream, self.gate_stream):
+            if stream:
+                try:
+                    await stream.stop()
+                except Exception as e:
+                    self.logger.debug(f"스트림 종료 실패: {e}")
+    
+    def _on_bitget_stream_ticker(self, ticker: Dict):
+        price = float(ticker.get('last', 0) or 0)
+        if price <= 0:
+            return
+        self.bitget_current_price = price
+        self.last_valid_bitget_price = price
+        self.bitget_price_failures = 0
+        self.stream_price_times['bitget'] = time.monotonic()
+        if self.market_hub:
+            self.market_hub.publish(self.market_hub.TOPIC_TICKER, ticker, self.SYMBOL)
+    
+    def _on_gate_stream_ticker(self, ticker: Dict):
+        if ticker.get('contract', self.GATE_CONTRACT) != self.GATE_CONTRACT:
+            return
+        try:
+            price = float(ticker.get('last', 0) or 0)
+        except (ValueError, TypeError):
+            return
+        if price <= 0:
+            return
+        self.gate_current_price = price
+        self.last_valid_gate_price = price
+        self.gate_price_failures = 0
+        self.stream_price_times['gate'] = time.monotonic()
+    
+    def _on_bitget_stream_order(self, order: Dict):
+        status = str(order.get('status', '')).lower()
+        if status in ('filled', 'partially_filled', 'partial-fill', 'full-fill'):
+            self._signal_stream_event(self.order_fill_event, EVENT_ORDER_FILL)
+    
+    def _on_gate_stream_position(self, data):
+        # 게이트 포지션 변경 시 캐시된 레버리지/마진 모드와 계정 자산은 다시 확인
+        self.gate_mirror.invalidate_account_state(self.GATE_CONTRACT)
+        self.utils.account_snapshots.invalidate()
+        self._signal_stream_event(self.position_event, EVENT_POSITION)
+    
+    def _signal_stream_event(self, event: Optional[asyncio.Event], engine_event: str):
+        """스트림 이벤트 전달 - 조정 엔진 사용 시 엔진 큐로, 아니면 해당 루프를 깨움"""
+        if self.engine and self.engine.running:
+            self.engine.notify(engine_event)
+        elif event is not None:
+            event.set()
+    
+    def _is_stream_price_fresh(self, exchange: str) -> bool:
+        return time.monotonic() - self.stream_price_times.get(exchange, float('-inf')) <= self.MIRROR_TICKER_MAX_AGE
+    
+    async def _wait_for_stream_event(self, event: Optional[asyncio.Event], interval: float, stream):
+        """스트림이 정상이면 이벤트 또는 폴백 주기까지 대기, 아니면 기존 주기로 폴링"""
+        if event is None or stream is None or not stream.is_healthy():
+            await asyncio.sleep(interval)
+            return
+        
+        try:
+            await asyncio.wait_for(event.wait(), timeout=max(interval, self.STREAM_FALLBACK_POLL_INTERVAL))
+        except asyncio.TimeoutError:
+            pass
+        event.clear()
+
+    def set_market_hub(self, market_hub):
+        """공용 시장 데이터 허브 설정"""
+        self.market_hub = market_hub
+        self.logger.info("✅ 미러 트레이딩에 시장 데이터 허브 설정 완료")
+
     async def _update_current_prices(self):
         try:
             # 비트겟 현재가 조회
             try:
-                bitget_ticker = await self.bitget_mirror.get_ticker(self.SYMBOL)
+                if self._is_stream_price_fresh('bitget'):
+                    bitget_ticker = {'last': self.bitget_current_price}
+                elif self.market_hub:
+                    bitget_ticker = await self.market_hub.get_ticker(self.SYMBOL, max_age=self.MIRROR_TICKER_MAX_AGE)
+                else:
+                    bitget_ticker = await self.bitget_mirror.get_ticker(self.SYMBOL)
                 if bitget_ticker and bitget_ticker.get('last'):
                     new_bitget_price = float(bitget_ticker.get('last', 0))
                     if new_bitget_price > 0:
@@ -1385,7 +1685,10 @@ class MirrorTradingSystem:
             
             # 게이트 현재가 조회
             try:
-                new_gate_price = await self.gate_mirror.get_current_price(self.GATE_CONTRACT)
+                if self._is_stream_price_fresh('gate'):
+                    new_gate_price = self.gate_current_price
+                else:
+                    new_gate_price = await self.gate_mirror.get_current_price(self.GATE_CONTRACT)
                 if new_gate_price > 0:
                     self.gate_current_price = new_gate_price
                     self.last_valid_gate_price = new_gate_price
@@ -1426,10 +1729,38 @@ class MirrorTradingSystem:
                 self.gate_current_price, 
                 self.price_diff_percent
             )
+            for follower in self.followers:
+                follower.update_prices(self.bitget_current_price, self.gate_current_price, self.price_diff_percent)
             
         except Exception as e:
             self.logger.error(f"시세 업데이트 실패: {e}")
 
+    async def _update_symbol_prices(self):
+        """추가 심볼 시세 - 심볼마다 비트겟/게이트 티커를 한 번씩 조회해 해당 심볼 단위 전체에 전달"""
+        if not self.shards:
+            return
+        
+        async def update(symbol: str, units: List[MirrorFollower]):
+            try:
+                bitget_ticker, gate_price = await asyncio.gather(
+                    self.bitget_mirror.get_ticker(symbol),
+                    units[0].gate_mirror.get_current_price(units[0].GATE_CONTRACT)
+                )
+                bitget_price = float((bitget_ticker or {}).get('last', 0) or 0)
+                if bitget_price <= 0 or gate_price <= 0:
+                    raise ValueError(f"비트겟={bitget_price}, 게이트={gate_price}")
+                price_diff_percent = abs(bitget_price - gate_price) / bitget_price * 100
+                for unit in units:
+                    unit.update_prices(bitget_price, gate_price, price_diff_percent)
+            except Exception as e:
+                self.logger.warning(f"{symbol} 시세 조회 실패, 이전 시세 유지: {e}")
+        
+        units_by_symbol: Dict[str, List[MirrorFollower]] = {}
+        for shard in self.shards:
+            if not shard.disabled:
+                units_by_symbol.setdefault(shard.SYMBOL, []).append(shard)
+        await asyncio.gather(*(update(symbol, units) for symbol, units in units_by_symbol.items()))
+
     def _get_valid_price_difference(self) -> Optional[float]:
         try:
             if self.bitget_current_price <= 0 or self.gate_current_price <= 0:
@@ -1453,7 +1784,12 @@ class MirrorTradingSystem:
         
         while self.monitoring:
             try:
-                await self._update_current_prices()
+                # 조정 엔진이 매 틱 시세를 갱신하면 그대로 사용
+                if not (self.engine and self.engine.running and
+                        (datetime.now() - self.last_price_update).total_seconds() < 10):
+                    await self.scheduler.run_or_skip(
+                        LANE_REPORTING, self._update_current_prices, deadline=30, name='시세 차이 확인용 시세 조회'
+                    )
                 
                 valid_price_diff = self._get_valid_price_difference()
                 
@@ -1532,7 +1868,12 @@ class MirrorTradingSystem:
                 if not self.mirror_trading_enabled:
                     continue
                 
-                sync_status = await self.position_manager.check_sync_status()
+                sync_status = await self.scheduler.run_or_skip(
+                    LANE_REPORTING, self.position_manager.check_sync_status,
+                    deadline=self.SYNC_CHECK_INTERVAL, name='동기화 상태 확인'
+                )
+                if sync_status is None:
+                    continue
                 
                 if not sync_status['is_synced']:
                     sync_retry_count += 1
@@ -1607,10 +1948,12 @@ class MirrorTradingSystem:
                 now = datetime.now()
                 
                 if now.hour == self.DAILY_REPORT_HOUR and now > self.last_report_time + timedelta(hours=23):
-                    report = await self._create_daily_report()
+                    # 일일 리포트는 폐기하지 않음 (주문 처리가 끝날 때까지 대기)
+                    report = await self.scheduler.run(LANE_REPORTING, self._create_daily_report, name='일일 리포트')
                     await self.telegram.send_message(report)
                     
                     self._reset_daily_stats()
+                    self.position_manager.latency.reset()
                     self.last_report_time = now
                 
                 await asyncio.sleep(3600)
@@ -1771,6 +2114,9 @@ class MirrorTradingSystem:
 - 완벽한 TP/SL 주문: {len([o for o in self.position_manager.mirrored_plan_orders.values() if o.get('perfect_mirror')])}개
 - 실패 기록: {len(self.failed_mirrors)}건
 
+⏱️ 미러링 지연 시간 (p50 / p95 / p99):
+{self.get_latency_report()}
+
 강화된 안전장치:
 - 미러링 모드: 텔레그램 실시간 제어 (/mirror on/off)
 - 마진 모드: 무조건 Cross 강제 설정 ({self.margin_mode_check_interval}초마다 체크)
@@ -1892,7 +2238,7 @@ class MirrorTradingSystem:
             
             # Gate 마진 모드 강제 확인 및 설정
             try:
-                gate_margin_mode = await self.gate_mirror.get_current_margin_mode("BTC_USDT")
+                gate_margin_mode = await self.gate_mirror.get_current_margin_mode(self.GATE_CONTRACT)
                 
                 if gate_margin_mode == 'cross':
                     margin_mode_info = f"💳 게이트 마진 모드: {gate_margin_mode.upper()} ✅ (완벽)"
@@ -1901,7 +2247,7 @@ class MirrorTradingSystem:
                     
                     # 즉시 강제 설정 시도
                     self.logger.info(f"마진 모드가 Cross가 아님: {gate_margin_mode} → 즉시 강제 변경 시도")
-                    force_result = await self.gate_mirror.force_cross_margin_mode_aggressive("BTC_USDT")
+                    force_result = await self.gate_mirror.force_cross_margin_mode_aggressive(self.GATE_CONTRACT)
                     
                     if force_result:
                         margin_mode_info = f"💳 게이트 마진 모드: {gate_margin_mode.upper()} → CROSS ✅ (강제 변경 완료)"
@@ -1975,6 +2321,43 @@ class MirrorTradingSystem:
         self.monitoring = False
         
         try:
+            # 웹소켓 스트림 종료
+            await self._stop_streams()
+            
+            if self.engine:
+                engine_stats = self.engine.get_stats()
+                self.logger.info(
+                    f"📊 조정 엔진 통계: 틱 {engine_stats['ticks']}회, "
+                    f"평균 {engine_stats['avg_cycle_ms']}ms, p95 {engine_stats['p95_cycle_ms']}ms, "
+                    f"최대 {engine_stats['max_cycle_ms']:.0f}ms"
+                )
+            
+            account_state_stats = self.gate_mirror.get_account_state_stats()
+            self.logger.info(
+                f"📊 게이트 계정 설정 캐시: 적중 {account_state_stats['cache_hits']}회, "
+                f"실제 조회 {account_state_stats['probes']}회, 무효화 {account_state_stats['invalidations']}회"
+            )
+            
+            reconcile_stats = self.plan_order_reconciler.get_stats()
+            self.logger.info(
+                f"📊 예약 주문 동기화: {reconcile_stats['syncs']}회, 재조회 {reconcile_stats['refetches']}회, "
+                f"확인된 고아 주문 {reconcile_stats['confirmed_orphans']}건"
+            )
+            
+            for lane, lane_stats in self.scheduler.get_stats().items():
+                self.logger.info(
+                    f"📊 작업 스케줄러 ({lane}): 실행 {lane_stats['started']}건, 폐기 {lane_stats['dropped']}건, "
+                    f"대기 {lane_stats['waited']}건 (최대 {lane_stats['max_wait']}초)"
+                )
+            
+            for unit in self.mirror_units:
+                unit_stats = unit.get_stats()
+                self.logger.info(
+                    f"📊 미러링 단위 {unit.name} ({unit_stats['contract']}): 복제 비율 {unit_stats['ratio']}x, "
+                    f"미러링 예약 주문 {unit_stats['mirrored_plan_orders']}개, 오류 {unit_stats['errors']}회"
+                )
+                await unit.stop()
+            
             # 포지션 매니저 중지
             await self.position_manager.stop()
             
@@ -1,8 +1,12 @@
+import asyncio
 import logging
-from typing import Dict, List, Optional, Tuple
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
 
+from mirror_contracts import ContractSpec, default_contract_spec
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -29,16 +33,124 @@ class MirrorResult:
     error: Optional[str] = None
     timestamp: datetime = field(default_factory=datetime.now)
 
+@dataclass
+class AccountSnapshot:
+    version: int
+    bitget_account: Dict
+    gate_account: Dict
+    bitget_equity: float
+    gate_equity: float
+    gate_available: float
+    equity_ratio: float  # 게이트 총 자산 / 비트겟 총 자산
+    fetched_at: float = field(default_factory=time.monotonic)
+    
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+class AccountSnapshotService:
+    """비트겟/게이트 계정 자산 스냅샷 - 주기 갱신, 버전으로 신선도 구분, 동시에 요청하면 조회는 한 번"""
+    
+    def __init__(self, bitget_client, gate_client, max_age: float = 10.0, refresh_interval: float = 5.0):
+        self.bitget = bitget_client
+        self.gate = gate_client
+        self.MAX_AGE = max_age
+        self.REFRESH_INTERVAL = refresh_interval
+        
+        self.snapshot: Optional[AccountSnapshot] = None
+        self.version = 0
+        # 무효화될 때마다 증가 - 이전 세대에 조회한 스냅샷은 오래된 것으로 취급
+        self._generation = 0
+        self._snapshot_generation = -1
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.stats = {'hits': 0, 'refreshes': 0, 'refresh_failures': 0, 'invalidations': 0}
+    
+    def is_fresh(self, max_age: float = None) -> bool:
+        max_age = self.MAX_AGE if max_age is None else max_age
+        return (self.snapshot is not None and self._snapshot_generation == self._generation
+                and self.snapshot.age() <= max_age)
+    
+    async def get(self, max_age: float = None) -> AccountSnapshot:
+        """max_age(초) 이내 스냅샷 - 오래되었거나 무효화되었으면 새로 조회"""
+        if self.is_fresh(max_age):
+            self.stats['hits'] += 1
+            return self.snapshot
+        return await self.refresh()
+    
+    async def refresh(self) -> AccountSnapshot:
+        # 진행 중인 조회가 있으면 같은 결과를 기다림 (같은 초의 사다리 주문 → 조회 1회)
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._fetch())
+        return await asyncio.shield(self._refresh_task)
+    
+    async def _fetch(self) -> AccountSnapshot:
+        generation = self._generation
+        try:
+            bitget_account, gate_account = await asyncio.gather(
+                self.bitget.get_account_info(), self.gate.get_account_balance()
+            )
+        except Exception:
+            self.stats['refresh_failures'] += 1
+            raise
+        
+        bitget_equity = float(bitget_account.get('accountEquity', bitget_account.get('usdtEquity', 0)) or 0)
+        gate_equity = float(gate_account.get('total', 0) or 0)
+        
+        self.version += 1
+        self.stats['refreshes'] += 1
+        self.snapshot = AccountSnapshot(
+            version=self.version,
+            bitget_account=bitget_account,
+            gate_account=gate_account,
+            bitget_equity=bitget_equity,
+            gate_equity=gate_equity,
+            gate_available=float(gate_account.get('available', 0) or 0),
+            equity_ratio=gate_equity / bitget_equity if bitget_equity > 0 else 0.0
+        )
+        self._snapshot_generation = generation
+        return self.snapshot
+    
+    def invalidate(self):
+        """체결/포지션 변경 후 호출 - 다음 get은 새로 조회"""
+        self._generation += 1
+        self.stats['invalidations'] += 1
+    
+    async def run(self, is_running: Callable[[], bool]):
+        """주기 갱신 루프 - 주문 사이징은 대부분 이 스냅샷을 그대로 사용"""
+        while is_running():
+            try:
+                if not self.is_fresh(self.REFRESH_INTERVAL):
+                    await self.refresh()
+            except Exception as e:
+                logger.warning(f"계정 스냅샷 갱신 실패: {e}")
+            await asyncio.sleep(self.REFRESH_INTERVAL)
+    
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            'version': self.version,
+            'age': round(self.snapshot.age(), 1) if self.snapshot else None
+        }
+
 class MirrorTradingUtils:
-    def __init__(self, config, bitget_client, gate_client):
+    def __init__(self, config, bitget_client, gate_client, gate_mirror_client=None):
         self.config = config
         self.bitget = bitget_client
         self.gate = gate_client
         self.logger = logging.getLogger('mirror_trading_utils')
         
+        # 계정 자산 스냅샷 (게이트 미러 클라이언트가 있을 때) - 주문 사이징 시 계정 조회 생략
+        self.account_snapshots: Optional[AccountSnapshotService] = None
+        if gate_mirror_client is not None:
+            self.account_snapshots = AccountSnapshotService(
+                bitget_client, gate_mirror_client,
+                max_age=getattr(config, 'mirror_account_snapshot_max_age', 10.0),
+                refresh_interval=getattr(config, 'mirror_account_snapshot_interval', 5.0)
+            )
+        
         # 기본 설정
-        self.SYMBOL = "BTCUSDT"
-        self.GATE_CONTRACT = "BTC_USDT"
+        self.SYMBOL = getattr(config, 'symbol', 'BTCUSDT')
+        self.GATE_CONTRACT = getattr(config, 'gate_contract', 'BTC_USDT')
+        self.contract_spec: Optional[ContractSpec] = default_contract_spec(self.GATE_CONTRACT, self.SYMBOL)
         self.MIN_MARGIN = 1.0
         self.MAX_PRICE_DIFF_PERCENT = 50.0
         
@@ -84,7 +196,9 @@ class MirrorTradingUtils:
         self.logger.info("미러 트레이딩 유틸리티 초기화 완료 - 복제 비율 지원")
     
     async def calculate_dynamic_margin_ratio_with_multiplier(self, size: float, trigger_price: float, 
-                                                           bitget_order: Dict, ratio_multiplier: float = 1.0) -> Dict:
+                                                           bitget_order: Dict, ratio_multiplier: float = 1.0,
+                                                           snapshot: AccountSnapshot = None) -> Dict:
+        """복제 비율 적용 마진 비율 - 계정 스냅샷이 있으면 계정 조회 없이 계산 (결과에 스냅샷 버전/게이트 자산 포함)"""
         try:
             if size is None or trigger_price is None:
                 return {'success': False, 'error': 'size나 trigger_price가 None입니다'}
@@ -97,8 +211,12 @@ class MirrorTradingUtils:
             
             self.logger.info(f"복제 비율 적용 마진 계산: size={size}, ratio={ratio_multiplier}x")
             
+            # 계정 정보 (스냅샷 우선)
+            if snapshot is None and self.account_snapshots is not None:
+                snapshot = await self.account_snapshots.get()
+            bitget_account = snapshot.bitget_account if snapshot else await self.bitget.get_account_info()
+            
             # 레버리지 추출
-            bitget_account = await self.bitget.get_account_info()
             extracted_leverage = await self.extract_bitget_leverage_enhanced(
                 order_data=bitget_order, position_data=None, account_data=bitget_account
             )
@@ -144,6 +262,11 @@ class MirrorTradingUtils:
                 'base_notional_value': bitget_notional_value, 'ratio_effect': ratio_effect,
                 'ratio_description': self.get_ratio_multiplier_description(ratio_multiplier)
             }
+            if snapshot:
+                result.update({
+                    'snapshot_version': snapshot.version, 'gate_total_equity': snapshot.gate_equity,
+                    'gate_available': snapshot.gate_available, 'equity_ratio': snapshot.equity_ratio
+                })
             
             self.logger.info(f"마진 계산 성공: 기본 {base_margin_ratio*100:.3f}% → 최종 {adjusted_margin_ratio*100:.3f}% (비율: {ratio_multiplier}x, 레버리지: {extracted_leverage}x)")
             
@@ -884,7 +1007,7 @@ class MirrorTradingUtils:
                     bitget_size = 1
                 
                 # 최소 크기로 클로즈 주문 생성
-                base_gate_size = max(int(bitget_size * 10000), 1)  # BTC를 계약으로 변환
+                base_gate_size = max(self.contract_spec.contracts_for(bitget_size), 1)  # 기초 자산 수량을 계약으로 변환
                 
                 # 포지션 사이드에 따라 클로즈 방향 결정
                 if position_side == 'long':
@@ -970,7 +1093,7 @@ class MirrorTradingUtils:
             self.logger.error(f"강화된 클로즈 주문 크기 계산 실패: {e}")
             # 실패 시에도 기본 크기로 클로즈 주문 생성
             bitget_size = float(bitget_order.get('size', 1))
-            base_size = max(int(bitget_size * 10000), 1)
+            base_size = max(self.contract_spec.contracts_for(bitget_size), 1)
             
             position_side = close_order_details.get('position_side', 'long')
             if position_side == 'long':
@@ -0,0 +1,316 @@
+import bisect
+import heapq
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+# 시간 제한 기록 종류
+MARK_PROCESSED = 'processed'      # 최근 처리한 비트겟 주문 ID
+MARK_ORDER_HASH = 'order_hash'    # 최근 처리한 주문 내용 해시
+MARK_FILLED = 'filled'            # 최근 체결된 비트겟 주문 ID
+MARK_TRIGGER_PRICE = 'trigger_price'  # 트리거 가격 보유 기간 (만료 시 가격 인덱스에서 제거)
+
+# 만료 없는 내용 해시 종류
+HASH_GATE_EXISTING = 'gate_existing'  # 시작 시 게이트에 이미 있던 주문
+
+
+class PriceIndex:
+    """정렬된 트리거 가격 인덱스 - 소유자(주문 ID)별 1개 가격, 구간 조회는 이진 탐색
+
+    가격은 계약 가격 단위의 소수 자릿수(decimals)로 반올림해 저장/조회
+    """
+
+    def __init__(self, decimals: int = 2):
+        self.decimals = decimals
+        self._prices: List[float] = []
+        self._counts: Dict[float, int] = {}
+        self._owners: Dict[str, float] = {}
+        # 반올림 전 가격 (자릿수 변경 시 다시 인덱싱용)
+        self._raw: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def set_decimals(self, decimals: int):
+        """반올림 자릿수 변경 - 기록된 가격은 새 자릿수로 다시 인덱싱"""
+        if decimals == self.decimals:
+            return
+        raw = dict(self._raw)
+        self.decimals = decimals
+        self._prices, self._counts, self._owners, self._raw = [], {}, {}, {}
+        for owner, price in raw.items():
+            self.add(owner, price)
+
+    def add(self, owner: str, price: float):
+        rounded = round(price, self.decimals)
+        if self._owners.get(owner) != rounded:
+            self.remove(owner)
+            self._owners[owner] = rounded
+            if rounded in self._counts:
+                self._counts[rounded] += 1
+            else:
+                self._counts[rounded] = 1
+                bisect.insort(self._prices, rounded)
+        self._raw[owner] = price
+
+    def remove(self, owner: str) -> bool:
+        price = self._owners.pop(owner, None)
+        if price is None:
+            return False
+        self._raw.pop(owner, None)
+        self._counts[price] -= 1
+        if self._counts[price] == 0:
+            del self._counts[price]
+            i = bisect.bisect_left(self._prices, price)
+            if i < len(self._prices) and self._prices[i] == price:
+                del self._prices[i]
+        return True
+
+    def in_range(self, low: float, high: float) -> List[float]:
+        """[low, high] 안의 가격 (오름차순)"""
+        return self._prices[bisect.bisect_left(self._prices, low):bisect.bisect_right(self._prices, high)]
+
+    def has_near(self, price: float, tolerance: float) -> bool:
+        price = round(price, self.decimals)
+        i = bisect.bisect_left(self._prices, price - tolerance)
+        return i < len(self._prices) and self._prices[i] <= price + tolerance
+
+
+class OrderStateStore:
+    """미러링 주문 상태 저장소 - 비트겟/게이트 ID, 정렬된 트리거 가격, 내용 해시 인덱스와 힙 기반 만료"""
+
+    def __init__(self):
+        # 비트겟 주문 ID -> 미러링 정보
+        self.plan_orders: Dict[str, Dict] = {}
+        # 비트겟 <-> 게이트 주문 ID
+        self.gate_by_bitget: Dict[str, str] = {}
+        self.bitget_by_gate: Dict[str, str] = {}
+
+        # 미러링한/게이트에 있던 주문의 트리거 가격
+        self.trigger_prices = PriceIndex()
+
+        self._hashes: Dict[str, Set[str]] = {}
+
+        # 종류 -> {키: 만료 시각}, 만료 힙 (만료 시각, 종류, 키)
+        self._marks: Dict[str, Dict[str, float]] = {}
+        self._expiry_heap: List[Tuple[float, str, str]] = []
+
+    # ===== 비트겟/게이트 주문 =====
+
+    def link(self, bitget_id: str, gate_id: str):
+        self.gate_by_bitget[bitget_id] = gate_id
+        self.bitget_by_gate[gate_id] = bitget_id
+
+    def get_gate_id(self, bitget_id: str) -> Optional[str]:
+        return self.gate_by_bitget.get(bitget_id)
+
+    def get_bitget_id(self, gate_id: str) -> Optional[str]:
+        return self.bitget_by_gate.get(gate_id)
+
+    def unlink_gate(self, gate_id: str) -> Optional[str]:
+        """게이트 주문 ID 연결만 제거 (미러링 기록은 유지) - 연결되어 있던 비트겟 ID 반환"""
+        bitget_id = self.bitget_by_gate.pop(gate_id, None)
+        if bitget_id is not None and self.gate_by_bitget.get(bitget_id) == gate_id:
+            del self.gate_by_bitget[bitget_id]
+        return bitget_id
+
+    def remove_order(self, bitget_id: str = None, gate_id: str = None) -> Optional[Dict]:
+        """미러링 기록과 양방향 ID 연결 제거 - 한쪽 ID만 알아도 됨"""
+        if bitget_id is None and gate_id is not None:
+            bitget_id = self.bitget_by_gate.get(gate_id)
+        if gate_id is None and bitget_id is not None:
+            gate_id = self.gate_by_bitget.get(bitget_id)
+
+        record = self.plan_orders.pop(bitget_id, None) if bitget_id is not None else None
+        if record and not gate_id:
+            gate_id = record.get('gate_order_id')
+
+        if bitget_id is not None and self.gate_by_bitget.get(bitget_id) in (gate_id, None):
+            self.gate_by_bitget.pop(bitget_id, None)
+        if gate_id is not None and self.bitget_by_gate.get(gate_id) in (bitget_id, None):
+            self.bitget_by_gate.pop(gate_id, None)
+        return record
+
+    # ===== 트리거 가격 =====
+
+    def add_trigger_price(self, owner: str, price: float, ttl: float = None):
+        """주문(owner)의 트리거 가격 기록 - ttl이 있으면 만료 시 제거"""
+        self.trigger_prices.add(owner, price)
+        if ttl:
+            self.mark(MARK_TRIGGER_PRICE, owner, ttl)
+
+    def remove_trigger_price(self, owner: str) -> bool:
+        self.unmark(MARK_TRIGGER_PRICE, owner)
+        return self.trigger_prices.remove(owner)
+
+    def set_price_decimals(self, decimals: int):
+        self.trigger_prices.set_decimals(decimals)
+
+    def has_trigger_price_near(self, price: float, tolerance: float) -> bool:
+        """price ± tolerance 안에 기록된 트리거 가격이 있는지"""
+        return self.trigger_prices.has_near(price, tolerance)
+
+    # ===== 내용 해시 =====
+
+    def add_hash(self, kind: str, order_hash: str):
+        self._hashes.setdefault(kind, set()).add(order_hash)
+
+    def remove_hash(self, kind: str, order_hash: str):
+        self._hashes.get(kind, set()).discard(order_hash)
+
+    def has_hash(self, kind: str, order_hash: str) -> bool:
+        return order_hash in self._hashes.get(kind, ())
+
+    # ===== 시간 제한 기록 =====
+
+    def mark(self, kind: str, key: str, ttl: float, now: float = None):
+        """ttl초 동안 유지되는 기록 - 다시 기록하면 만료 시각 연장"""
+        expires_at = (now if now is not None else time.monotonic()) + ttl
+        self._marks.setdefault(kind, {})[key] = expires_at
+        heapq.heappush(self._expiry_heap, (expires_at, kind, key))
+
+    def is_marked(self, kind: str, key: str, now: float = None) -> bool:
+        expires_at = self._marks.get(kind, {}).get(key)
+        if expires_at is None:
+            return False
+        return expires_at > (now if now is not None else time.monotonic())
+
+    def unmark(self, kind: str, key: str):
+        # 힙 항목은 만료 시 만료 시각 불일치로 무시됨
+        self._marks.get(kind, {}).pop(key, None)
+
+    def expire(self, now: float = None) -> Dict[str, List[str]]:
+        """만료된 기록 제거 - 힙 앞부분만 보므로 만료된 개수에 비례, {종류: [키]} 반환"""
+        now = now if now is not None else time.monotonic()
+        expired: Dict[str, List[str]] = {}
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, kind, key = heapq.heappop(heap)
+            marks = self._marks.get(kind)
+            # 연장되었거나 이미 지운 기록의 예전 힙 항목은 건너뜀
+            if marks is None or marks.get(key) != expires_at:
+                continue
+            del marks[key]
+            if kind == MARK_TRIGGER_PRICE:
+                self.trigger_prices.remove(key)
+            expired.setdefault(kind, []).append(key)
+        return expired
+
+    # ===== 저장/복원 =====
+
+    def export_state(self) -> Dict:
+        """재시작 후 복원할 상태 - 만료 시각은 벽시계 기준, 게이트 기존 주문 해시는 시작 시 다시 기록하므로 제외"""
+        now = time.monotonic()
+        wall_now = time.time()
+        return {
+            'marks': {
+                kind: {key: wall_now + (expires_at - now) for key, expires_at in marks.items() if expires_at > now}
+                for kind, marks in self._marks.items()
+            },
+            'trigger_prices': dict(self.trigger_prices._owners),
+            'hashes': {kind: list(hashes) for kind, hashes in self._hashes.items() if kind != HASH_GATE_EXISTING}
+        }
+
+    def restore_state(self, state: Dict):
+        wall_now = time.time()
+        for owner, price in (state.get('trigger_prices') or {}).items():
+            self.trigger_prices.add(owner, float(price))
+        for kind, hashes in (state.get('hashes') or {}).items():
+            # 예전 스냅샷 호환 - 게이트 기존 주문 해시는 더 이상 저장하지 않음 (시작 시 다시 기록)
+            if kind == HASH_GATE_EXISTING:
+                continue
+            for order_hash in hashes:
+                self.add_hash(kind, order_hash)
+        for kind, marks in (state.get('marks') or {}).items():
+            for key, wall_expires in marks.items():
+                remaining = float(wall_expires) - wall_now
+                if remaining > 0:
+                    self.mark(kind, key, remaining)
+                elif kind == MARK_TRIGGER_PRICE:
+                    self.trigger_prices.remove(key)
+
+    def get_stats(self) -> Dict:
+        return {
+            'plan_orders': len(self.plan_orders),
+            'links': len(self.gate_by_bitget),
+            'trigger_prices': len(self.trigger_prices),
+            'hashes': {kind: len(hashes) for kind, hashes in self._hashes.items()},
+            'marks': {kind: len(marks) for kind, marks in self._marks.items()},
+            'expiry_heap': len(self._expiry_heap)
+        }
+
+
+# 예약 주문 변경 비교에 쓰는 필드 (조회 시각 등 매번 바뀌는 필드 제외)
+PLAN_ORDER_FINGERPRINT_FIELDS = (
+    'triggerPrice', 'executePrice', 'price', 'size', 'side', 'tradeSide', 'posSide', 'reduceOnly',
+    'planType', 'triggerType', 'orderType',
+    'presetStopSurplusPrice', 'presetStopLossPrice',
+    'stopSurplusTriggerPrice', 'stopLossTriggerPrice',
+    'stopSurplusExecutePrice', 'stopLossExecutePrice'
+)
+
+
+def plan_order_fingerprint(order: Dict) -> Tuple[str, ...]:
+    return tuple(str(order.get(field) or '') for field in PLAN_ORDER_FINGERPRINT_FIELDS)
+
+
+class PlanOrderSnapshot:
+    """비트겟 예약 주문 스냅샷 - 주문별 지문으로 추가/삭제/변경 비교, 변경 없는 주문은 기존 것을 그대로 유지"""
+
+    def __init__(self):
+        self.orders: Dict[str, Dict] = {}
+        self.fingerprints: Dict[str, Tuple[str, ...]] = {}
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self.orders
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def get(self, order_id: str) -> Optional[Dict]:
+        return self.orders.get(order_id)
+
+    def ids(self) -> Set[str]:
+        return set(self.orders)
+
+    def diff(self, orders: List[Dict]) -> Dict:
+        """현재 주문 목록과 비교 - 반영은 commit() 호출 시 (처리 중 오류가 나면 다음 사이클에 다시 감지)"""
+        current_orders: Dict[str, Dict] = {}
+        current_fingerprints: Dict[str, Tuple[str, ...]] = {}
+        added, modified = [], []
+
+        for order in orders:
+            order_id = order.get('orderId', order.get('planOrderId', ''))
+            if not order_id:
+                continue
+            fingerprint = plan_order_fingerprint(order)
+            previous = self.fingerprints.get(order_id)
+            if previous is None:
+                added.append(order_id)
+                current_orders[order_id] = order
+            elif previous != fingerprint:
+                modified.append(order_id)
+                current_orders[order_id] = order
+            else:
+                current_orders[order_id] = self.orders[order_id]
+            current_fingerprints[order_id] = fingerprint
+
+        removed = [order_id for order_id in self.fingerprints if order_id not in current_fingerprints]
+        return {
+            'added': added,
+            'removed': removed,
+            'modified': modified,
+            'orders': current_orders,
+            'fingerprints': current_fingerprints
+        }
+
+    def defer(self, diff: Dict, order_id: str):
+        """변경 처리 실패 - 이전 지문을 유지해 다음 비교에서 다시 변경으로 감지"""
+        if order_id in self.fingerprints and order_id in diff['fingerprints']:
+            diff['fingerprints'][order_id] = self.fingerprints[order_id]
+
+    def commit(self, diff: Dict):
+        self.orders = diff['orders']
+        self.fingerprints = diff['fingerprints']
+
+    def reset(self, orders: List[Dict]):
+        self.commit(self.diff(orders))
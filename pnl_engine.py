@@ -0,0 +1,175 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 체결 원본에서 값을 찾는 필드 순서 (처음으로 0이 아닌 값 사용)
+PNL_FIELDS = ('pnl', 'profit', 'realizedPnl', 'closedPnl')
+FEE_FIELDS = ('fee', 'tradingFee', 'totalFee')
+FUNDING_FIELDS = ('fundingFee', 'funding', 'fundFee')
+
+FILL_DTYPE = np.dtype([
+    ('ts', 'i8'),
+    ('symbol', 'U20'),
+    ('pnl', 'f8'),
+    ('fee', 'f8'),
+    ('funding', 'f8')
+])
+
+
+def _first_nonzero(fill: Dict, fields) -> float:
+    for field in fields:
+        value = fill.get(field)
+        if value is None:
+            continue
+        try:
+            number = float(value)
+        except (ValueError, TypeError):
+            continue
+        if number != 0:
+            return number
+    return 0.0
+
+
+def _fee_detail_total(fill: Dict) -> float:
+    total = 0.0
+    fee_detail = fill.get('feeDetail')
+    if isinstance(fee_detail, list):
+        for fee_info in fee_detail:
+            if isinstance(fee_info, dict):
+                try:
+                    total += abs(float(fee_info.get('totalFee', 0) or 0))
+                except (ValueError, TypeError):
+                    continue
+    return total
+
+
+def normalize_fill(fill: Dict, default_symbol: str = '') -> tuple:
+    """체결 1건을 (ts, symbol, pnl, fee, funding) 행으로 변환"""
+    try:
+        ts = int(fill.get('cTime') or fill.get('uTime') or 0)
+    except (ValueError, TypeError):
+        ts = 0
+    fee = abs(_first_nonzero(fill, FEE_FIELDS)) or _fee_detail_total(fill)
+    return (
+        ts,
+        str(fill.get('symbol') or default_symbol).upper(),
+        _first_nonzero(fill, PNL_FIELDS),
+        fee,
+        _first_nonzero(fill, FUNDING_FIELDS)
+    )
+
+
+class PnlEngine:
+    """체결 내역 손익 집계 - 원본은 한 번만 정규화해 배열로 보관하고 구간/일별/심볼별 합계는 벡터 연산"""
+
+    def __init__(self, tz_offset_hours: int = 9):
+        # 일별 집계 기준 시간대 (기본 KST)
+        self.tz_offset_ms = tz_offset_hours * 60 * 60 * 1000
+
+        self._table = np.empty(0, dtype=FILL_DTYPE)
+        self._known_ids = set()
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def update(self, fills: List[Dict], default_symbol: str = '') -> int:
+        """새 체결만 정규화해 추가 - 추가된 건수 반환"""
+        rows = []
+        for fill in fills:
+            if not isinstance(fill, dict):
+                continue
+            fill_id = fill.get('tradeId') or fill.get('fillId')
+            key = fill_id or (fill.get('cTime'), fill.get('orderId'), fill.get('price'), fill.get('baseVolume'))
+            if key in self._known_ids:
+                continue
+            self._known_ids.add(key)
+            rows.append(normalize_fill(fill, default_symbol))
+
+        if rows:
+            added = np.array(rows, dtype=FILL_DTYPE)
+            table = np.concatenate([self._table, added])
+            self._table = table[np.argsort(table['ts'], kind='stable')]
+        return len(rows)
+
+    def _select(self, start_time: Optional[int], end_time: Optional[int], symbol: Optional[str]) -> np.ndarray:
+        table = self._table
+        ts = table['ts']
+        lo = 0 if start_time is None else np.searchsorted(ts, start_time, side='left')
+        hi = len(ts) if end_time is None else np.searchsorted(ts, end_time, side='right')
+        selected = table[lo:hi]
+        if symbol:
+            selected = selected[selected['symbol'] == symbol.upper()]
+        # 손익/수수료/펀딩이 모두 0인 체결은 집계에서 제외
+        active = (selected['pnl'] != 0) | (selected['fee'] != 0) | (selected['funding'] != 0)
+        return selected[active]
+
+    def summarize(self, start_time: int = None, end_time: int = None, symbol: str = None) -> Dict:
+        """구간 합계"""
+        selected = self._select(start_time, end_time, symbol)
+        position_pnl = float(selected['pnl'].sum())
+        trading_fees = float(selected['fee'].sum())
+        funding_fees = float(selected['funding'].sum())
+        return {
+            'position_pnl': position_pnl,
+            'trading_fees': trading_fees,
+            'funding_fees': funding_fees,
+            'net_profit': position_pnl + funding_fees - trading_fees,
+            'trade_count': int(len(selected))
+        }
+
+    def daily(self, start_time: int = None, end_time: int = None, symbol: str = None) -> Dict[str, Dict]:
+        """일별 합계 {'YYYY-MM-DD': {...}} (기준 시간대 자정 기준)"""
+        selected = self._select(start_time, end_time, symbol)
+        if len(selected) == 0:
+            return {}
+
+        day_index = (selected['ts'] + self.tz_offset_ms) // 86400000
+        days, inverse = np.unique(day_index, return_inverse=True)
+        pnl = np.bincount(inverse, weights=selected['pnl'])
+        fees = np.bincount(inverse, weights=selected['fee'])
+        funding = np.bincount(inverse, weights=selected['funding'])
+        counts = np.bincount(inverse)
+
+        epoch = datetime(1970, 1, 1)
+        result = {}
+        for i, day in enumerate(days):
+            date = (epoch + timedelta(days=int(day))).strftime('%Y-%m-%d')
+            result[date] = {
+                'pnl': float(pnl[i]),
+                'fees': float(fees[i]),
+                'funding': float(funding[i]),
+                'net': float(pnl[i] + funding[i] - fees[i]),
+                'trade_count': int(counts[i])
+            }
+        return result
+
+    def by_symbol(self, start_time: int = None, end_time: int = None) -> Dict[str, Dict]:
+        """심볼별 합계"""
+        selected = self._select(start_time, end_time, None)
+        if len(selected) == 0:
+            return {}
+
+        symbols, inverse = np.unique(selected['symbol'], return_inverse=True)
+        pnl = np.bincount(inverse, weights=selected['pnl'])
+        fees = np.bincount(inverse, weights=selected['fee'])
+        funding = np.bincount(inverse, weights=selected['funding'])
+        counts = np.bincount(inverse)
+
+        return {
+            str(symbol): {
+                'pnl': float(pnl[i]),
+                'fees': float(fees[i]),
+                'funding': float(funding[i]),
+                'net': float(pnl[i] + funding[i] - fees[i]),
+                'trade_count': int(counts[i])
+            }
+            for i, symbol in enumerate(symbols)
+        }
+
+    def cumulative(self, symbol: str = None) -> Dict:
+        """보관 중인 전체 체결 합계"""
+        return self.summarize(None, None, symbol)
@@ -0,0 +1,246 @@
+import asyncio
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 우선순위 (숫자가 작을수록 우선)
+PRIORITY_CRITICAL = 0  # 주문 생성/취소
+PRIORITY_NORMAL = 1    # 미러링 조회
+PRIORITY_LOW = 2       # 리포트/분석 조회
+
+PRIORITY_NAMES = {PRIORITY_CRITICAL: 'critical', PRIORITY_NORMAL: 'normal', PRIORITY_LOW: 'low'}
+
+# 현재 작업의 요청 우선순위 (작업 스케줄러가 설정) - 클라이언트 기본 우선순위보다 우선
+_task_priority: ContextVar[Optional[int]] = ContextVar('task_priority', default=None)
+
+
+@contextmanager
+def task_priority(priority: int):
+    """with 블록 안에서 보내는 요청의 기본 우선순위 지정"""
+    token = _task_priority.set(priority)
+    try:
+        yield
+    finally:
+        _task_priority.reset(token)
+
+
+def current_priority(default: int) -> int:
+    priority = _task_priority.get()
+    return default if priority is None else priority
+
+
+class TokenBucket:
+    """우선순위 대기 + 429 차단을 지원하는 토큰 버킷"""
+
+    def __init__(self, name: str, rate: float, capacity: float):
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+        # 낮은 우선순위는 용량의 일부를 상위 우선순위용으로 남겨둠
+        self.LOW_PRIORITY_RESERVE = 0.3
+        self.MIN_SLEEP = 0.01
+
+        # 429 백오프
+        self.BACKOFF_BASE = 1.0
+        self.BACKOFF_MAX = 30.0
+        self.blocked_until = 0.0
+        self.consecutive_throttles = 0
+
+        self.waiting = {PRIORITY_CRITICAL: 0, PRIORITY_NORMAL: 0, PRIORITY_LOW: 0}
+        self.stats = {'acquired': 0, 'waited': 0, 'wait_time': 0.0, 'throttled': 0}
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def _reserve_for(self, priority: int) -> float:
+        if priority == PRIORITY_LOW:
+            return self.capacity * self.LOW_PRIORITY_RESERVE
+        return 0.0
+
+    async def acquire(self, priority: int = PRIORITY_NORMAL) -> float:
+        """토큰 1개 획득 - 대기한 시간(초) 반환"""
+        started = time.monotonic()
+        self.waiting[priority] += 1
+        try:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+
+                self._refill()
+                higher_waiting = any(self.waiting[p] > 0 for p in self.waiting if p < priority)
+                needed = 1.0 + self._reserve_for(priority)
+
+                if not higher_waiting and self.tokens >= needed:
+                    self.tokens -= 1.0
+                    break
+
+                shortage = max(needed - self.tokens, 1.0 if higher_waiting else 0.0)
+                await asyncio.sleep(max(shortage / self.rate, self.MIN_SLEEP))
+        finally:
+            self.waiting[priority] -= 1
+
+        waited = time.monotonic() - started
+        self.stats['acquired'] += 1
+        if waited > self.MIN_SLEEP:
+            self.stats['waited'] += 1
+            self.stats['wait_time'] += waited
+        return waited
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> float:
+        """429 응답 처리 - 버킷을 비우고 지터가 섞인 백오프 시간만큼 차단"""
+        self.consecutive_throttles += 1
+        self.stats['throttled'] += 1
+
+        if retry_after and retry_after > 0:
+            base = min(retry_after, self.BACKOFF_MAX)
+        else:
+            base = min(self.BACKOFF_BASE * (2 ** (self.consecutive_throttles - 1)), self.BACKOFF_MAX)
+        delay = random.uniform(base / 2, base)
+
+        self.tokens = 0.0
+        self.updated = time.monotonic()
+        self.blocked_until = max(self.blocked_until, self.updated + delay)
+        return delay
+
+    def on_success(self):
+        self.consecutive_throttles = 0
+
+    def block_until(self, until: float):
+        self.tokens = 0.0
+        self.updated = time.monotonic()
+        self.blocked_until = max(self.blocked_until, until)
+
+
+class RateLimiter:
+    """거래소 계정 단위 요청 예산 - 엔드포인트 그룹별 토큰 버킷"""
+
+    def __init__(self, name: str, groups: Dict[str, Tuple[float, float]],
+                 classifier: Callable[[str, str], str]):
+        self.name = name
+        self.classifier = classifier
+        self.buckets = {group: TokenBucket(f"{name}:{group}", rate, capacity)
+                        for group, (rate, capacity) in groups.items()}
+        if 'default' not in self.buckets:
+            self.buckets['default'] = TokenBucket(f"{name}:default", 10, 10)
+
+    def group_for(self, method: str, endpoint: str) -> str:
+        group = self.classifier(method.upper(), endpoint)
+        return group if group in self.buckets else 'default'
+
+    def priority_for(self, method: str, default_priority: int) -> int:
+        # 주문 생성/취소는 항상 최우선
+        if method.upper() != 'GET':
+            return PRIORITY_CRITICAL
+        return default_priority
+
+    async def acquire(self, method: str, endpoint: str, priority: int = PRIORITY_NORMAL) -> str:
+        group = self.group_for(method, endpoint)
+        waited = await self.buckets[group].acquire(priority)
+        if waited > 1.0:
+            logger.debug(f"{self.name} 요청 대기 {waited:.2f}초 ({group}, {PRIORITY_NAMES.get(priority)})")
+        return group
+
+    def on_throttled(self, group: str, headers=None) -> float:
+        retry_after = self._parse_retry_after(headers)
+        delay = self.buckets[group].on_throttled(retry_after)
+        logger.warning(f"⚠️ {self.name} 요청 제한(429) - {group} 그룹 {delay:.1f}초 대기")
+        return delay
+
+    def on_success(self, group: str, headers=None):
+        bucket = self.buckets[group]
+        bucket.on_success()
+        if headers:
+            self._observe_headers(bucket, headers)
+
+    @staticmethod
+    def _parse_retry_after(headers) -> Optional[float]:
+        if not headers:
+            return None
+        try:
+            value = headers.get('Retry-After')
+            return float(value) if value else None
+        except (ValueError, TypeError):
+            return None
+
+    @staticmethod
+    def _observe_headers(bucket: TokenBucket, headers):
+        """남은 요청 수가 0이면 리셋 시각까지 선제 차단 (Gate.io 헤더 형식)"""
+        try:
+            remain = headers.get('X-Gate-RateLimit-Requests-Remain')
+            reset_ms = headers.get('X-Gate-RateLimit-Reset-Timestamp')
+            if remain is None or reset_ms is None or int(remain) > 0:
+                return
+            wait = int(reset_ms) / 1000 - time.time()
+            if 0 < wait <= bucket.BACKOFF_MAX:
+                bucket.block_until(time.monotonic() + wait)
+        except (ValueError, TypeError):
+            return
+
+    def get_stats(self) -> Dict:
+        return {group: dict(bucket.stats, tokens=round(bucket.tokens, 2)) for group, bucket in self.buckets.items()}
+
+
+def classify_bitget_endpoint(method: str, endpoint: str) -> str:
+    if '/order/' in endpoint or '/plan/' in endpoint:
+        return 'trade' if method != 'GET' else 'order_query'
+    if '/account' in endpoint or '/position' in endpoint:
+        return 'account'
+    if '/market/' in endpoint:
+        return 'market'
+    return 'default'
+
+
+def classify_gate_endpoint(method: str, endpoint: str) -> str:
+    if method != 'GET' and ('/orders' in endpoint or '/price_orders' in endpoint):
+        return 'trade'
+    if any(path in endpoint for path in ('/tickers', '/contracts', '/candlesticks', '/order_book', '/trades', '/funding_rate')):
+        return 'public'
+    return 'private'
+
+
+# 엔드포인트 그룹별 (초당 요청 수, 버스트 용량)
+BITGET_RATE_GROUPS = {
+    'trade': (10, 10),
+    'order_query': (10, 10),
+    'account': (10, 10),
+    'market': (20, 20),
+    'default': (10, 10)
+}
+
+GATE_RATE_GROUPS = {
+    'trade': (50, 50),
+    'private': (20, 20),
+    'public': (20, 20),
+    'default': (20, 20)
+}
+
+_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+
+
+def get_rate_limiter(exchange: str, account_key: str = '') -> RateLimiter:
+    """같은 거래소 계정(API 키)을 쓰는 모든 클라이언트가 하나의 리미터를 공유"""
+    key = (exchange, account_key or '')
+    limiter = _limiters.get(key)
+    if limiter is None:
+        if exchange == 'bitget':
+            limiter = RateLimiter('Bitget', BITGET_RATE_GROUPS, classify_bitget_endpoint)
+        elif exchange == 'gate':
+            limiter = RateLimiter('Gate.io', GATE_RATE_GROUPS, classify_gate_endpoint)
+        else:
+            raise ValueError(f"알 수 없는 거래소: {exchange}")
+        _limiters[key] = limiter
+    return limiter
@@ -13,6 +13,8 @@ import re
 import json
 import random
 
+from http_pool import get_http_pool
+
 logger = logging.getLogger(__name__)
 
 class RealisticNewsCollector:
@@ -639,10 +641,7 @@ class RealisticNewsCollector:
     async def start_monitoring(self):
         """🔥🔥 모니터링 시작 (403 오류 해결 버전)"""
         if not self.session:
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=20),
-                connector=aiohttp.TCPConnector(limit=100, limit_per_host=30)
-            )
+            self.session = get_http_pool().get_session('news', timeout=aiohttp.ClientTimeout(total=20))
         
         logger.info("🔥🔥 뉴스 모니터링 시작 (403 오류 해결 + 기준 완화)")
         logger.info(f"🧠 GPT API: {'활성화' if self.openai_client else '비활성화'}")
@@ -79,6 +79,19 @@ class ReportGeneratorManager:
         for generator in generators:
             generator.set_bitget_client(bitget_client)
     
+    def set_market_hub(self, market_hub):
+        """모든 생성기에 시장 데이터 허브 설정"""
+        generators = [
+            self.regular_generator,
+            self.profit_generator,
+            self.forecast_generator,
+            self.schedule_generator,
+            self.exception_generator
+        ]
+        
+        for generator in generators:
+            generator.set_market_hub(market_hub)
+    
     def set_gateio_client(self, gateio_client):
         """Gate.io 클라이언트 설정"""
         self.gateio_client = gateio_client
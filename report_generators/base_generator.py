@@ -16,6 +16,7 @@ class BaseReportGenerator:
         self.data_collector = data_collector
         self.indicator_system = indicator_system
         self.bitget_client = bitget_client
+        self.market_hub = None
         self.logger = logging.getLogger(self.__class__.__name__)
         self.kst = pytz.timezone('Asia/Seoul')
         self.processed_news_hashes: Set[str] = set()  # 처리된 뉴스 해시
@@ -32,6 +33,22 @@ class BaseReportGenerator:
         self.bitget_client = bitget_client
         self.logger.info("✅ Bitget 클라이언트 설정 완료")
     
+    def set_market_hub(self, market_hub):
+        """시장 데이터 허브 설정"""
+        self.market_hub = market_hub
+    
+    async def _get_ticker(self, symbol: str = 'BTCUSDT', max_age: float = 10) -> Dict:
+        """티커 조회 - 시장 데이터 허브가 있으면 공유 캐시 사용"""
+        if self.market_hub:
+            return await self.market_hub.get_ticker(symbol, max_age=max_age)
+        return await self.bitget_client.get_ticker(symbol)
+    
+    async def _get_funding_rate(self, symbol: str = 'BTCUSDT', max_age: float = 300) -> Dict:
+        """펀딩비 조회 - 시장 데이터 허브가 있으면 공유 캐시 사용"""
+        if self.market_hub:
+            return await self.market_hub.get_funding_rate(symbol, max_age=max_age)
+        return await self.bitget_client.get_funding_rate(symbol)
+    
     def _generate_news_hash(self, title: str, source: str = "") -> str:
         """뉴스 제목과 소스로 해시 생성 - 더 강력한 중복 체크"""
         # 제목에서 숫자와 특수문자 제거
@@ -522,7 +539,7 @@ class BaseReportGenerator:
             if not self.bitget_client:
                 return {}
             
-            ticker = await self.bitget_client.get_ticker('BTCUSDT')
+            ticker = await self._get_ticker('BTCUSDT')
             
             # 안전한 데이터 추출
             current_price = float(ticker.get('last', ticker.get('lastPr', 0)))
@@ -536,7 +553,7 @@ class BaseReportGenerator:
             
             # 펀딩비
             try:
-                funding_data = await self.bitget_client.get_funding_rate('BTCUSDT')
+                funding_data = await self._get_funding_rate('BTCUSDT')
                 funding_rate = float(funding_data.get('fundingRate', 0)) if isinstance(funding_data, dict) else 0
             except:
                 funding_rate = 0
@@ -578,7 +595,7 @@ class BaseReportGenerator:
                 return {'has_position': False}
             
             # 현재가 조회
-            ticker = await self.bitget_client.get_ticker('BTCUSDT')
+            ticker = await self._get_ticker('BTCUSDT')
             current_price = float(ticker.get('last', ticker.get('lastPr', 0)))
             
             # 포지션 상세 정보 - API에서 제공하는 값만 사용
@@ -657,7 +674,7 @@ class BaseReportGenerator:
             end_time = int(now.timestamp() * 1000)
             
             # 거래 내역 조회
-            fills = await self.bitget_client.get_trade_fills('BTCUSDT', start_time, end_time, 500)
+            fills = await self.bitget_client.get_fill_history('BTCUSDT', start_time, end_time)
             
             if not fills:
                 return 0.0
@@ -515,7 +515,7 @@ class ExceptionReportGenerator(BaseReportGenerator):
                 return ""
             
             # 현재 시장 데이터 조회 (Bitget 선물)
-            current_ticker = await self.bitget_client.get_ticker('BTCUSDT')
+            current_ticker = await self._get_ticker('BTCUSDT')
             if not current_ticker:
                 return ""
             
@@ -536,6 +536,18 @@ class ExceptionReportGenerator(BaseReportGenerator):
             # 뉴스 해시 생성 (더 고유하게)
             news_hash = f"news_{int(news_pub_time.timestamp())}"
             
+            # 뉴스 발표 시점 가격이 허브 이력에 남아있으면 바로 사용
+            if news_hash not in self.news_initial_data and self.market_hub:
+                snapshot = self.market_hub.get_price_at(news_pub_time, 'BTCUSDT')
+                if snapshot:
+                    self.news_initial_data[news_hash] = {
+                        'price': snapshot['price'],
+                        'volume': snapshot['volume'],
+                        'time': news_pub_time,
+                        'created_at': current_time
+                    }
+                    self._save_news_data()
+            
             # 🔥🔥 뉴스 발표 시점의 가격 데이터가 있는지 확인
             if news_hash in self.news_initial_data:
                 initial_data = self.news_initial_data[news_hash]
@@ -627,7 +639,7 @@ class ExceptionReportGenerator(BaseReportGenerator):
                 return ""
             
             # 현재 시장 데이터 조회
-            ticker = await self.bitget_client.get_ticker('BTCUSDT')
+            ticker = await self._get_ticker('BTCUSDT')
             if not ticker:
                 return ""
             
@@ -646,7 +658,7 @@ class ExceptionReportGenerator(BaseReportGenerator):
                 price_change_info = await self._get_price_change_since_news(news_time)
             
             # 펀딩비 조회
-            funding_data = await self.bitget_client.get_funding_rate('BTCUSDT')
+            funding_data = await self._get_funding_rate('BTCUSDT')
             funding_rate = 0.0
             if funding_data:
                 if isinstance(funding_data, list) and len(funding_data) > 0:
@@ -11,6 +11,8 @@ import asyncio
 import aiohttp
 import numpy as np
 
+from http_pool import get_http_pool
+
 logger = logging.getLogger(__name__)
 
 class RegularReportGenerator(BaseReportGenerator):
@@ -32,6 +34,9 @@ class RegularReportGenerator(BaseReportGenerator):
         self.news_cache = []
         self.analysis_cache = {}
         
+        # 외부 API 백업용 세션 (공용 연결 풀 사용, 리포트마다 새로 만들지 않음)
+        self.external_session = None
+        
         logger.info("정기 리포트 생성기 초기화 완료 - 실전 매매 특화 (완전한 버전)")
     
     def _load_prediction_history(self):
@@ -108,6 +113,12 @@ class RegularReportGenerator(BaseReportGenerator):
             logger.error(f"상세 오류: {traceback.format_exc()}")
             return f"❌ 리포트 생성 중 오류가 발생했습니다: {str(e)}"
 
+    def _get_external_session(self):
+        """외부 API 세션 (공용 연결 풀)"""
+        if self.external_session is None or self.external_session.closed:
+            self.external_session = get_http_pool().get_session('regular_report')
+        return self.external_session
+    
     async def _collect_enhanced_market_data(self) -> dict:
         """강화된 시장 데이터 수집 (실시간 데이터 우선)"""
         try:
@@ -224,24 +235,24 @@ class RegularReportGenerator(BaseReportGenerator):
             if not market_data.get('price_valid', False):
                 logger.info("🔄 외부 API에서 가격 데이터 백업 수집 시도...")
                 try:
-                    async with aiohttp.ClientSession() as session:
-                        # CoinGecko API 시도
-                        async with session.get('https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd&include_24hr_change=true') as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                btc_price = float(data['bitcoin']['usd'])
-                                btc_change = float(data['bitcoin']['usd_24h_change']) / 100
-                                
-                                market_data.update({
-                                    'current_price': btc_price,
-                                    'change_24h': btc_change,
-                                    'change_24h_pct': btc_change * 100,
-                                    'high_24h': btc_price * (1 + abs(btc_change)),
-                                    'low_24h': btc_price * (1 - abs(btc_change)),
-                                    'volume_24h': 60000,  # 추정값
-                                    'price_valid': True
-                                })
-                                logger.info(f"✅ 외부 API BTC: ${btc_price:,.0f} ({btc_change:+.2%})")
+                    session = self._get_external_session()
+                    # CoinGecko API 시도
+                    async with session.get('https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd&include_24hr_change=true') as response:
+                        if response.status == 200:
+                            data = await response.json()
+                            btc_price = float(data['bitcoin']['usd'])
+                            btc_change = float(data['bitcoin']['usd_24h_change']) / 100
+                            
+                            market_data.update({
+                                'current_price': btc_price,
+                                'change_24h': btc_change,
+                                'change_24h_pct': btc_change * 100,
+                                'high_24h': btc_price * (1 + abs(btc_change)),
+                                'low_24h': btc_price * (1 - abs(btc_change)),
+                                'volume_24h': 60000,  # 추정값
+                                'price_valid': True
+                            })
+                            logger.info(f"✅ 외부 API BTC: ${btc_price:,.0f} ({btc_change:+.2%})")
                 except Exception as e:
                     logger.warning(f"외부 API 백업 실패: {e}")
                     
@@ -6,6 +6,8 @@ import aiohttp
 from bs4 import BeautifulSoup
 import logging
 
+from http_pool import get_http_pool
+
 class ScheduleReportGenerator(BaseReportGenerator):
     """일정 리포트 전담 생성기"""
     
@@ -85,7 +87,7 @@ class ScheduleReportGenerator(BaseReportGenerator):
         
         try:
             if not self.session:
-                self.session = aiohttp.ClientSession()
+                self.session = get_http_pool().get_session('schedule_report')
             
             # Investing.com 경제 캘린더 스크래핑
             url = "https://www.investing.com/economic-calendar/"
@@ -0,0 +1,189 @@
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기록 종류별 (고유 ID 필드, 시각 필드)
+LEDGER_KINDS = {
+    'fill': ('tradeId', 'cTime'),
+    'bill': ('billId', 'cTime'),
+    'deposit': ('orderId', 'cTime'),
+    'withdrawal': ('orderId', 'cTime')
+}
+
+
+class TradeLedger:
+    """체결/계정 변동/입출금 로컬 원장 (SQLite) - 이미 받은 구간은 다시 조회하지 않음"""
+
+    def __init__(self, db_path: str = 'trade_ledger.db'):
+        self.db_path = db_path
+
+        # 최근 구간은 늦게 반영되는 기록이 있을 수 있어 겹쳐서 재조회 (ms)
+        self.SYNC_OVERLAP_MS = {
+            'fill': 60 * 1000,
+            'bill': 60 * 1000,
+            'deposit': 24 * 60 * 60 * 1000,   # 입출금은 상태(pending→success)가 바뀜
+            'withdrawal': 24 * 60 * 60 * 1000
+        }
+        # 마지막 동기화 후 이 시간(ms) 이내 요청은 저장된 기록으로 응답
+        self.MIN_REFRESH_MS = 5 * 1000
+
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self.stats = {'syncs': 0, 'fetched_ranges': 0, 'fetched_records': 0, 'skipped_syncs': 0}
+
+        self._conn = sqlite3.connect(db_path)
+        self._conn.row_factory = sqlite3.Row
+        self._create_tables()
+
+    def _create_tables(self):
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS ledger_records (
+                    kind TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    record_id TEXT NOT NULL,
+                    ts INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (kind, scope, record_id)
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ledger_kind_ts ON ledger_records (kind, scope, ts)"
+            )
+            # 연속으로 동기화된 구간 [synced_from, synced_until]
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS ledger_cursors (
+                    kind TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    synced_from INTEGER NOT NULL,
+                    synced_until INTEGER NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (kind, scope)
+                )
+            """)
+
+    # ===== 커서 =====
+
+    def get_cursor(self, kind: str, scope: str) -> Optional[Tuple[int, int]]:
+        row = self._conn.execute(
+            "SELECT synced_from, synced_until FROM ledger_cursors WHERE kind = ? AND scope = ?",
+            (kind, scope)
+        ).fetchone()
+        return (row['synced_from'], row['synced_until']) if row else None
+
+    def _set_cursor(self, kind: str, scope: str, synced_from: int, synced_until: int):
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ledger_cursors (kind, scope, synced_from, synced_until, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (kind, scope, synced_from, synced_until, time.time())
+            )
+
+    def _plan_sync(self, kind: str, scope: str, start: int, end: int) -> Tuple[List[Tuple[int, int]], int, int]:
+        """요청 구간 중 아직 받지 않은 구간 (앞/뒤)과 동기화 후 커서"""
+        cursor = self.get_cursor(kind, scope)
+        if cursor is None:
+            return [(start, end)], start, end
+
+        synced_from, synced_until = cursor
+        # 기존 구간과 떨어져 있으면 새 구간으로 다시 시작 (저장된 기록은 유지)
+        if start > synced_until or end < synced_from:
+            return [(start, end)], start, end
+
+        overlap = self.SYNC_OVERLAP_MS.get(kind, 0)
+        ranges = []
+        if start < synced_from:
+            ranges.append((start, synced_from))
+        if end - synced_until > self.MIN_REFRESH_MS:
+            ranges.append((max(start, synced_until - overlap), end))
+        return ranges, min(start, synced_from), max(end, synced_until)
+
+    # ===== 저장/조회 =====
+
+    def add_records(self, kind: str, scope: str, records: List[Dict]) -> int:
+        """기록 저장 - 같은 ID는 최신 내용으로 덮어씀"""
+        id_field, ts_field = LEDGER_KINDS[kind]
+        rows = []
+        for record in records:
+            if not isinstance(record, dict):
+                continue
+            try:
+                ts = int(record.get(ts_field) or record.get('uTime') or 0)
+            except (ValueError, TypeError):
+                ts = 0
+            record_id = record.get(id_field)
+            if not record_id:
+                record_id = hashlib.md5(json.dumps(record, sort_keys=True).encode()).hexdigest()
+            rows.append((kind, scope, str(record_id), ts, json.dumps(record)))
+
+        if rows:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO ledger_records (kind, scope, record_id, ts, payload) VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+        return len(rows)
+
+    def query(self, kind: str, scope: str, start: int = None, end: int = None) -> List[Dict]:
+        """구간 내 기록 (최신순)"""
+        sql = "SELECT payload FROM ledger_records WHERE kind = ? AND scope = ?"
+        args = [kind, scope]
+        if start is not None:
+            sql += " AND ts >= ?"
+            args.append(start)
+        if end is not None:
+            sql += " AND ts <= ?"
+            args.append(end)
+        sql += " ORDER BY ts DESC"
+        return [json.loads(row['payload']) for row in self._conn.execute(sql, args)]
+
+    # ===== 증분 동기화 =====
+
+    async def sync(self, kind: str, scope: str, start: int, end: int,
+                   fetch_range: Callable[[int, int], Awaitable[Optional[List[Dict]]]]) -> bool:
+        """받지 않은 구간만 fetch_range(start, end)로 가져와 저장 - fetch_range가 None이면 실패로 보고 커서 유지"""
+        now_ms = int(time.time() * 1000)
+        end = min(end, now_ms)
+        if start >= end:
+            return True
+
+        lock = self._locks.setdefault((kind, scope), asyncio.Lock())
+        async with lock:
+            self.stats['syncs'] += 1
+            ranges, new_from, new_until = self._plan_sync(kind, scope, start, end)
+            if not ranges:
+                self.stats['skipped_syncs'] += 1
+                return True
+
+            for range_start, range_end in ranges:
+                records = await fetch_range(range_start, range_end)
+                if records is None:
+                    logger.warning(f"원장 동기화 실패 ({kind}/{scope}): {range_start} ~ {range_end}")
+                    return False
+
+                self.add_records(kind, scope, records)
+                self.stats['fetched_ranges'] += 1
+                self.stats['fetched_records'] += len(records)
+
+            self._set_cursor(kind, scope, new_from, new_until)
+            logger.debug(f"원장 동기화 완료 ({kind}/{scope}): {len(ranges)}개 구간")
+            return True
+
+    def get_stats(self) -> Dict:
+        counts = {
+            row['kind']: row['cnt'] for row in self._conn.execute(
+                "SELECT kind, COUNT(*) AS cnt FROM ledger_records GROUP BY kind"
+            )
+        }
+        return {**self.stats, 'records': counts}
+
+    def close(self):
+        try:
+            self._conn.close()
+        except Exception:
+            pass
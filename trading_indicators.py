@@ -18,9 +18,25 @@ class AdvancedTradingIndicators:
         """Bitget 클라이언트 설정"""
         self.bitget_client = bitget_client
         
+    async def _get_derivatives_summary(self) -> Dict:
+        """저장된 미결제약정/롱숏/테이커 시계열 요약 - 아직 없으면 한 번 갱신"""
+        if not self.bitget_client or not hasattr(self.bitget_client, 'get_derivatives_summary'):
+            return {}
+        try:
+            summary = self.bitget_client.get_derivatives_summary()
+            if not summary:
+                summary = await self.bitget_client.update_derivatives_data()
+            return summary or {}
+        except Exception as e:
+            self.logger.warning(f"파생상품 데이터 요약 실패: {e}")
+            return {}
+    
     async def calculate_all_indicators(self, market_data: Dict) -> Dict:
         """모든 지표 계산 및 종합 분석"""
         try:
+            if 'derivatives' not in market_data:
+                market_data = {**market_data, 'derivatives': await self._get_derivatives_summary()}
+            
             # 병렬로 지표 계산
             tasks = [
                 self.analyze_funding_rate(market_data),
@@ -93,9 +109,13 @@ class AdvancedTradingIndicators:
     async def analyze_open_interest(self, market_data: Dict) -> Dict:
         """미결제약정(OI) 분석"""
         try:
-            # 실제로는 Bitget API에서 OI 데이터를 가져와야 함
-            # 여기서는 시뮬레이션
-            oi_change = np.random.uniform(-5, 5)  # 실제로는 API 데이터
+            oi_data = market_data.get('derivatives', {}).get('open_interest', {})
+            oi_change = oi_data.get('change_24h')
+            if oi_change is None:
+                # 24시간 이력이 아직 없으면 짧은 구간 → 리포트 수집값 순
+                oi_change = oi_data.get('change_4h')
+            if oi_change is None:
+                oi_change = market_data.get('oi_change_24h', 0) or 0
             price_change = market_data.get('change_24h', 0) * 100
             
             # OI와 가격 관계 분석
@@ -113,6 +133,9 @@ class AdvancedTradingIndicators:
                 divergence = "중립"
             
             return {
+                'open_interest': oi_data.get('current', market_data.get('open_interest', 0)),
+                'oi_change_1h': oi_data.get('change_1h'),
+                'oi_change_4h': oi_data.get('change_4h'),
                 'oi_change_percent': oi_change,
                 'price_change_percent': price_change,
                 'signal': signal,
@@ -127,19 +150,24 @@ class AdvancedTradingIndicators:
     async def calculate_volume_delta(self, market_data: Dict) -> Dict:
         """누적 거래량 델타(CVD) 계산"""
         try:
-            # 실제로는 틱 데이터에서 계산
-            # 여기서는 간단한 추정
-            volume = market_data.get('volume_24h', 0)
-            price_change = market_data.get('change_24h', 0)
-            
-            # 매수/매도 거래량 추정
-            if price_change > 0:
-                buy_ratio = 0.5 + min(0.3, abs(price_change))
+            taker_24h = market_data.get('derivatives', {}).get('taker_volume', {}).get('24h', {})
+            if taker_24h.get('buy', 0) + taker_24h.get('sell', 0) > 0:
+                # 테이커 매수/매도 거래량 실측값
+                buy_volume = taker_24h['buy']
+                sell_volume = taker_24h['sell']
+                volume = buy_volume + sell_volume
             else:
-                buy_ratio = 0.5 - min(0.3, abs(price_change))
-            
-            buy_volume = volume * buy_ratio
-            sell_volume = volume * (1 - buy_ratio)
+                # 데이터가 없으면 가격 변화로 추정
+                volume = market_data.get('volume_24h', 0)
+                price_change = market_data.get('change_24h', 0)
+                
+                if price_change > 0:
+                    buy_ratio = 0.5 + min(0.3, abs(price_change))
+                else:
+                    buy_ratio = 0.5 - min(0.3, abs(price_change))
+                
+                buy_volume = volume * buy_ratio
+                sell_volume = volume * (1 - buy_ratio)
             cvd = buy_volume - sell_volume
             cvd_ratio = (cvd / volume * 100) if volume > 0 else 0
             
@@ -196,7 +224,17 @@ class AdvancedTradingIndicators:
             long_distance = (current_price - nearest_long_liq) / current_price
             short_distance = (nearest_short_liq - current_price) / current_price
             
-            if long_distance < 0.03:  # 3% 이내
+            # 최근 1시간 미결제약정 급감 + 테이커 한쪽 쏠림 = 실제 청산 진행
+            derivatives = market_data.get('derivatives', {})
+            oi_change_1h = derivatives.get('open_interest', {}).get('change_1h')
+            taker_1h = derivatives.get('taker_volume', {}).get('1h', {})
+            buy_ratio_1h = taker_1h.get('buy_ratio', 0.5)
+            
+            if oi_change_1h is not None and oi_change_1h < -2 and buy_ratio_1h < 0.4:
+                liquidation_pressure = "롱 청산 진행 중"
+            elif oi_change_1h is not None and oi_change_1h < -2 and buy_ratio_1h > 0.6:
+                liquidation_pressure = "숏 청산 진행 중"
+            elif long_distance < 0.03:  # 3% 이내
                 liquidation_pressure = "롱 청산 임박"
             elif short_distance < 0.03:  # 3% 이내
                 liquidation_pressure = "숏 청산 임박"
@@ -210,6 +248,8 @@ class AdvancedTradingIndicators:
                 'nearest_short_liq': nearest_short_liq,
                 'long_distance_percent': long_distance * 100,
                 'short_distance_percent': short_distance * 100,
+                'oi_change_1h': oi_change_1h,
+                'taker_buy_ratio_1h': buy_ratio_1h,
                 'liquidation_pressure': liquidation_pressure
             }
             
@@ -251,9 +291,12 @@ class AdvancedTradingIndicators:
     async def analyze_long_short_ratio(self, market_data: Dict) -> Dict:
         """롱/숏 비율 분석"""
         try:
-            # 실제로는 거래소 API에서 데이터 조회
-            # 여기서는 시뮬레이션
-            long_ratio = np.random.uniform(45, 55)
+            ls_data = market_data.get('derivatives', {}).get('long_short', {})
+            if ls_data.get('long_ratio'):
+                # 거래소 계정 롱/숏 비율 (0~1 또는 % 단위 모두 처리)
+                long_ratio = ls_data['long_ratio'] * 100 if ls_data['long_ratio'] <= 1 else ls_data['long_ratio']
+            else:
+                long_ratio = 50.0
             short_ratio = 100 - long_ratio
             
             if long_ratio > 60:
@@ -266,7 +309,8 @@ class AdvancedTradingIndicators:
             return {
                 'long_ratio': long_ratio,
                 'short_ratio': short_ratio,
-                'ratio': long_ratio / short_ratio,
+                'ratio': long_ratio / short_ratio if short_ratio > 0 else 0,
+                'ratio_change_24h': ls_data.get('ratio_change_24h'),
                 'signal': signal
             }
             